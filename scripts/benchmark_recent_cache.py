@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""Benchmark indexed vs linear RecentContentCache.check_similarity.
+
+Writes a synthetic archive of recent posts (titles, summaries and tags drawn
+from Zipf-weighted vocabularies) to a temporary directory, then checks candidates
+(near-copies of cached posts plus unrelated titles) with both strategies,
+timing them and checking that they return identical matches.
+
+Usage:
+    python scripts/benchmark_recent_cache.py                  # 100, 500, 1k posts
+    python scripts/benchmark_recent_cache.py --sizes 500 --candidates 500
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.deduplication.recent_content_cache import RecentContentCache
+
+
+def make_vocabulary(rng: random.Random, size: int = 5000) -> list[str]:
+    return [
+        "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(7))
+        for _ in range(size)
+    ]
+
+
+class Corpus:
+    """Zipf-weighted words and tags, so some are common as in real posts."""
+
+    def __init__(self, rng: random.Random) -> None:
+        self.rng = rng
+        self.words = make_vocabulary(rng)
+        self.word_weights = [1 / (rank + 1) for rank in range(len(self.words))]
+        # Flatter than the words: the most common tag is on ~5% of posts
+        self.tags = [f"tag-{i}" for i in range(1000)]
+        self.tag_weights = [1 / (rank + 20) for rank in range(len(self.tags))]
+
+    def text(self, count: int) -> str:
+        return " ".join(self.rng.choices(self.words, self.word_weights, k=count))
+
+    def title(self) -> str:
+        return self.text(self.rng.randint(4, 8)).title()
+
+    def tag_list(self) -> list[str]:
+        return sorted(set(self.rng.choices(self.tags, self.tag_weights, k=3)))
+
+    def mutate(self, title: str) -> str:
+        words = title.split()
+        words[self.rng.randrange(len(words))] = self.text(1).title()
+        return " ".join(words)
+
+
+def write_archive(content_dir: Path, size: int, corpus: Corpus) -> list[dict]:
+    now = datetime.now(UTC)
+    posts = []
+    for i in range(size):
+        post = {
+            "title": corpus.title(),
+            "summary": corpus.text(25),
+            "tags": corpus.tag_list(),
+        }
+        generated = (now - timedelta(days=corpus.rng.randint(0, 89))).isoformat()
+        (content_dir / f"post-{i}.md").write_text(
+            f"---\ntitle: {post['title']}\nsummary: {post['summary']}\n"
+            f"tags: [{', '.join(post['tags'])}]\ngenerated_at: '{generated}'\n"
+            f"---\nBody.\n",
+            encoding="utf-8",
+        )
+        posts.append(post)
+    return posts
+
+
+def make_candidates(
+    corpus: Corpus, posts: list[dict], count: int
+) -> list[tuple[str, str, list[str]]]:
+    """About 30% near-copies of posts (half without tags), the rest new."""
+    rng = corpus.rng
+    candidates = []
+    for _ in range(count):
+        if rng.random() < 0.3:
+            post = rng.choice(posts)
+            tags = post["tags"] if rng.random() < 0.5 else []
+            candidates.append((corpus.mutate(post["title"]), post["summary"], tags))
+        else:
+            candidates.append((corpus.title(), corpus.text(25), corpus.tag_list()))
+    return candidates
+
+
+def time_it(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 1000])
+    parser.add_argument("--candidates", type=int, default=50)
+    args = parser.parse_args()
+
+    print(f"{'posts':>7} {'load':>8} {'indexed':>9} {'linear':>9} {'matches':>8} same")
+    for size in args.sizes:
+        corpus = Corpus(random.Random(size))
+        with tempfile.TemporaryDirectory() as tmp:
+            content_dir = Path(tmp)
+            posts = write_archive(content_dir, size, corpus)
+            cache, load_s = time_it(
+                lambda content_dir=content_dir: RecentContentCache(
+                    content_dir, cache_days=90
+                )
+            )
+            candidates = make_candidates(corpus, posts, args.candidates)
+            indexed, indexed_s = time_it(
+                lambda cache=cache, candidates=candidates: [
+                    cache.check_similarity(*c) for c in candidates
+                ]
+            )
+            linear, linear_s = time_it(
+                lambda cache=cache, candidates=candidates: [
+                    cache.check_similarity(*c, indexed=False) for c in candidates
+                ]
+            )
+        same = "yes" if indexed == linear else "NO"
+        matches = sum(match is not None for match in linear)
+        print(
+            f"{size:>7} {load_s:7.3f}s {indexed_s:8.3f}s {linear_s:8.3f}s "
+            f"{matches:>8} {same}"
+        )
+        if same == "NO":
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""Benchmark blocked vs exhaustive grouping in SemanticDeduplicator.
+
+Generates a synthetic corpus of tech posts (clusters of near-duplicates plus
+unrelated noise), then times feature extraction and both grouping strategies
+and checks that they produce identical groups.
+
+Usage:
+    python scripts/benchmark_semantic_dedup.py                 # 100, 1k, 10k items
+    python scripts/benchmark_semantic_dedup.py --sizes 100 1000
+    python scripts/benchmark_semantic_dedup.py --max-exhaustive 10000
+
+The exhaustive scan is quadratic, so by default it is skipped above 1k items.
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.deduplication.semantic_dedup import SemanticDeduplicator
+
+ENTITIES = [
+    "OpenAI",
+    "Microsoft",
+    "Google",
+    "Nvidia",
+    "Docker",
+    "Kubernetes",
+    "React",
+    "Django",
+    "PyTorch",
+    "Python",
+    "Rust",
+    "TypeScript",
+    "Mozilla",
+    "CNCF",
+    "ChatGPT",
+    "Copilot",
+    "Jupyter",
+]
+
+
+def make_corpus(size: int, seed: int = 42) -> list[str]:
+    """Build a synthetic corpus where roughly a third of items are near-dupes.
+
+    Keywords are drawn from a large vocabulary with a skewed (Zipf-like)
+    distribution so that some tokens are common, like in real collections.
+    """
+    rng = random.Random(seed)
+    vocabulary = [
+        "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(7))
+        for _ in range(5000)
+    ]
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+
+    corpus: list[str] = []
+    while len(corpus) < size:
+        entities = rng.sample(ENTITIES, rng.choice([0, 1, 1, 2]))
+        words = rng.choices(vocabulary, weights=weights, k=10)
+        copies = rng.choice([1, 1, 2, 3])
+        for _ in range(copies):
+            extra = rng.choices(vocabulary, weights=weights, k=2)
+            corpus.append(" ".join([*entities, *words, *extra]))
+    return corpus[:size]
+
+
+def time_it(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--threshold", type=float, default=0.6)
+    parser.add_argument("--max-exhaustive", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dedup = SemanticDeduplicator(Path(tmp) / "patterns.json")
+
+        print(f"{'items':>7} {'extract':>9} {'blocked':>9} {'exhaustive':>11} match")
+        for size in args.sizes:
+            corpus = make_corpus(size)
+            features, extract_s = time_it(
+                lambda corpus=corpus: [dedup.extract_features(c) for c in corpus]
+            )
+            blocked, blocked_s = time_it(
+                lambda features=features: dedup._group_blocked(features, args.threshold)
+            )
+            if size <= args.max_exhaustive:
+                exhaustive, exhaustive_s = time_it(
+                    lambda features=features: dedup._group_exhaustive(
+                        features, args.threshold
+                    )
+                )
+                match = "yes" if blocked == exhaustive else "NO"
+                exhaustive_col = f"{exhaustive_s:10.3f}s"
+            else:
+                match = "-"
+                exhaustive_col = f"{'skipped':>11}"
+            print(
+                f"{size:>7} {extract_s:8.3f}s {blocked_s:8.3f}s {exhaustive_col} {match}"
+            )
+            if match == "NO":
+                return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
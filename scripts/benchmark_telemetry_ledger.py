@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Benchmark telemetry recording: rewrite-per-call JSON vs append-only ledger.
+
+Simulates the per-call telemetry writes openai_wrapper makes (one run-level
+entry plus one article ledger entry) and reports the cost per 1,000 calls
+for the old read-modify-write JSON files and the buffered NDJSON ledger,
+including the final export to model_usage.json.
+
+Usage:
+    python scripts/benchmark_telemetry_ledger.py                  # 500, 1k, 2k calls
+    python scripts/benchmark_telemetry_ledger.py --calls 1000 4000
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.telemetry_ledger import TelemetryLedger
+
+ARTICLES = 10
+
+
+def make_entry(n: int) -> dict:
+    return {
+        "timestamp": "2025-01-01T00:00:00+00:00",
+        "stage": "enrichment",
+        "model": "gpt-4o-mini",
+        "call_type": "chat_completion",
+        "cost": 0.00042,
+        "run_id": "bench",
+        "article_id": f"article-{n % ARTICLES}",
+        "context": {"operation": "quality_analysis"},
+        "prompt_tokens": 812,
+        "completion_tokens": 64,
+        "total_tokens": 876,
+    }
+
+
+def _rewrite(file_path: Path, entry: dict, root_key: str, defaults: dict) -> None:
+    """The previous per-call strategy: load, append, rewrite the whole file."""
+    if file_path.exists():
+        data = json.loads(file_path.read_text(encoding="utf-8"))
+    else:
+        data = dict(defaults)
+    data.setdefault(root_key, []).append(entry)
+    file_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def bench_rewrite(run_dir: Path, calls: int) -> float:
+    articles_dir = run_dir / "articles"
+    articles_dir.mkdir(parents=True)
+    start = time.perf_counter()
+    for n in range(calls):
+        entry = make_entry(n)
+        _rewrite(run_dir / "model_usage.json", entry, "calls", {"run_id": "bench"})
+        _rewrite(
+            articles_dir / f"{entry['article_id']}.json",
+            entry,
+            "entries",
+            {"article_id": entry["article_id"]},
+        )
+    return time.perf_counter() - start
+
+
+def bench_ledger(run_dir: Path, calls: int) -> float:
+    ledger = TelemetryLedger(run_dir, "bench", export_at_exit=False)
+    start = time.perf_counter()
+    for n in range(calls):
+        entry = make_entry(n)
+        ledger.record(entry, article_id=entry["article_id"])
+    ledger.export()
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, nargs="+", default=[500, 1000, 2000])
+    args = parser.parse_args()
+
+    print(f"{'calls':>8} {'rewrite ms/1k':>15} {'ledger ms/1k':>14} {'speedup':>9}")
+    for calls in args.calls:
+        with tempfile.TemporaryDirectory() as tmp:
+            rewrite = bench_rewrite(Path(tmp) / "rewrite", calls)
+            ledger = bench_ledger(Path(tmp) / "ledger", calls)
+        per_k = 1000 / calls
+        print(
+            f"{calls:>8} {rewrite * per_k * 1000:>15.1f} "
+            f"{ledger * per_k * 1000:>14.1f} {rewrite / ledger:>8.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
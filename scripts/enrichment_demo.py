@@ -11,6 +11,7 @@ from rich.console import Console
 
 from src.config import get_config, get_data_dir
 from src.enrichment import enrich_single_item, load_collected_items
+from src.utils.ndjson import find_item_files
 
 console = Console()
 
@@ -66,7 +67,7 @@ def run_demo() -> None:
     console.print("[bold]Enrichment Pipeline Demo (Mock Mode)[/bold]\n")
 
     data_dir = get_data_dir()
-    collected_files = list(data_dir.glob("collected_*.json"))
+    collected_files = find_item_files(data_dir, "collected")
     if not collected_files:
         console.print("[red]No collected data found. Run collection first![/red]")
         return
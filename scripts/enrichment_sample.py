@@ -3,10 +3,13 @@
 Run a small enrichment sample using real OpenAI (requires API key).
 """
 
+from itertools import islice
+
 from rich.console import Console
 
 from src.config import get_config, get_data_dir
-from src.enrichment import enrich_single_item, load_collected_items
+from src.enrichment import enrich_single_item, iter_collected_items
+from src.utils.ndjson import find_item_files
 
 console = Console()
 
@@ -15,7 +18,7 @@ def run_sample() -> None:
     console.print("[bold]AI Enrichment (Real OpenAI)[/bold]\n")
 
     data_dir = get_data_dir()
-    collected_files = list(data_dir.glob("collected_*.json"))
+    collected_files = find_item_files(data_dir, "collected")
     if not collected_files:
         console.print("[red]No collected data found![/red]")
         return
@@ -23,12 +26,12 @@ def run_sample() -> None:
     latest_file = max(collected_files, key=lambda f: f.stat().st_mtime)
     console.print(f"[blue]Loading from {latest_file.name}...[/blue]")
 
-    items = load_collected_items(latest_file)
-    if not items:
+    # Only the first two items are needed, so don't parse the rest
+    test_items = list(islice(iter_collected_items(latest_file), 2))
+    if not test_items:
         console.print("[red]No items to enrich![/red]")
         return
 
-    test_items = items[:2]
     config = get_config()
 
     console.print(f"[blue]Testing enrichment on {len(test_items)} items...[/blue]\n")
@@ -12,6 +12,7 @@ Usage:
     python scripts/test_dedup.py              # Check all articles
     python scripts/test_dedup.py --verbose    # Show detailed metrics
     python scripts/test_dedup.py --remove     # Actually remove duplicates (careful!)
+    python scripts/test_dedup.py --exhaustive # Score every pair, not just LSH candidates
 """
 
 import argparse
@@ -81,6 +82,11 @@ def main():
     parser.add_argument(
         "--dry-run", action="store_true", help="Show what would be removed (no action)"
     )
+    parser.add_argument(
+        "--exhaustive",
+        action="store_true",
+        help="Score every pair instead of MinHash LSH candidates only",
+    )
     args = parser.parse_args()
 
     # Load all articles
@@ -105,7 +111,7 @@ def main():
 
     # Find duplicates
     console.print("[yellow]Checking for duplicates...[/yellow]\n")
-    duplicates = find_duplicate_articles(articles)
+    duplicates = find_duplicate_articles(articles, exhaustive=args.exhaustive)
 
     if not duplicates:
         console.print("[green]✓ No duplicates found![/green]")
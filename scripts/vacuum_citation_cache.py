@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Drop expired citation cache entries and compact the database.
+
+Expired entries are also skipped (and deleted) lazily on lookup; this keeps
+data/citations_cache.sqlite3 from growing with entries nobody asks for again.
+
+Usage:
+    python scripts/vacuum_citation_cache.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rich.console import Console
+
+from src.citations.cache import CitationCache
+
+
+def main() -> None:
+    console = Console()
+    cache = CitationCache()
+    removed = cache.vacuum()
+    console.print(
+        f"[green]✓[/green] Removed {removed} expired citation(s); "
+        f"{len(cache)} remain in {cache.db_file}"
+    )
+    cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""Prune unused and excess responses from the HTTP cache.
+
+Entries not used for HTTP_CACHE_MAX_AGE_DAYS, then the least recently used
+beyond HTTP_CACHE_MAX_ENTRIES, are deleted. The pipeline also prunes when the
+cache is first used and periodically while storing; this keeps
+data/http_cache/ bounded between runs.
+
+Usage:
+    python scripts/vacuum_http_cache.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rich.console import Console
+
+from src.utils.http_cache import build_http_cache
+
+
+def main() -> None:
+    console = Console()
+    cache = build_http_cache()
+    removed = cache.prune()
+    console.print(
+        f"[green]✓[/green] Removed {removed} cached response(s); "
+        f"{len(cache)} remain in {cache.cache_dir}"
+    )
+
+
+if __name__ == "__main__":
+    main()
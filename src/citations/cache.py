@@ -1,143 +1,307 @@
 """Cache citation resolutions to avoid repeated API queries.
 
-Implements a JSON-based cache with 30-day TTL (time-to-live).
-Stores resolved DOIs and URLs keyed by "author_year" combination.
-
-Cache is stored in data/citations_cache.json and automatically:
-- Loads on initialization
-- Saves after each new resolution
-- Validates freshness (30-day TTL)
+Stores resolved DOIs and URLs keyed by "author_year" combination in a SQLite
+file (data/citations_cache.sqlite3):
+- Point lookups: opening the cache reads nothing, each get() is one indexed
+  query, and each put() writes one row
+- Saves after each new resolution (or once per ``flush()`` with
+  ``autosave=False``, so an article's citations cost a single commit)
+- Validates freshness lazily on get() (30-day TTL by default, from
+  ``citations_cache_ttl_days``; 7 days for citations that could not be
+  resolved, so they are retried sooner but not on every article)
+- ``vacuum()`` (scripts/vacuum_citation_cache.py) drops expired entries and
+  compacts the file
+- Usable as a context manager that ``close()``s the database on exit
+- Imports the legacy data/citations_cache.json when it is new or changed
 """
 
 import json
-from datetime import datetime, timedelta
+import sqlite3
+import threading
+import time
+from datetime import datetime
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+_COLUMNS = ("authors", "year", "doi", "url", "arxiv_id", "confidence", "resolved_at")
+
 
 class CitationCache:
-    """JSON-based cache for citation resolutions with 30-day TTL.
+    """SQLite-backed cache for citation resolutions with TTL.
 
     Prevents duplicate API calls for the same author/year combination.
-    Automatically manages cache file on disk.
+    One connection is shared between threads and serialised with a lock.
     """
 
-    TTL_DAYS = 30
+    NEGATIVE_TTL_DAYS = 7
 
-    def __init__(self, cache_file: str = "data/citations_cache.json") -> None:
+    def __init__(
+        self,
+        cache_file: str = "data/citations_cache.json",
+        autosave: bool = True,
+        ttl_days: int | None = None,
+    ) -> None:
         """Initialize the cache.
 
-        Creates data directory if needed and loads existing cache.
+        Creates data directory if needed. The database is opened on first
+        use, importing a legacy JSON cache if one exists.
 
         Args:
-            cache_file: Path to cache file (relative to project root)
+            cache_file: Path to the legacy JSON cache (relative to project
+                root); the database lives next to it with a ``.sqlite3``
+                suffix
+            autosave: Commit after every change; when False, changes are
+                committed by ``flush()``
+            ttl_days: TTL for resolved citations (defaults to
+                ``citations_cache_ttl_days`` from config)
         """
         self.cache_file = Path(cache_file)
+        self.db_file = self.cache_file.with_suffix(".sqlite3")
         self.cache_file.parent.mkdir(parents=True, exist_ok=True)
-        self.data: dict[str, dict] = {}
-        self._load()
+        self.autosave = autosave
+        if ttl_days is None:
+            from ..config import get_config
+
+            ttl_days = get_config().citations_cache_ttl_days
+        self.ttl_days = ttl_days
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
 
     def get(self, authors: str, year: int) -> dict | None:
         """Get cached resolution for author/year pair.
 
-        Checks cache freshness (30-day TTL) and returns None if expired.
+        Checks cache freshness (TTL) and returns None if expired; expired
+        entries are deleted.
 
         Args:
             authors: Author string (e.g., "Smith et al.")
             year: Publication year
 
         Returns:
-            Dict with doi/url/timestamp if cached and fresh, None otherwise
+            Dict with doi/url/arxiv_id/confidence/timestamp if cached and
+            fresh, None otherwise
         """
         key = self._make_key(authors, year)
-
-        if key in self.data:
-            entry = self.data[key]
-            # Check if cache entry is still fresh
-            if self._is_fresh(entry["timestamp"]):
-                logger.debug(f"Cache hit: {authors} ({year})")
-                return entry
-            else:
-                # Expired, remove from cache
-                logger.debug(f"Cache expired: {authors} ({year})")
-                del self.data[key]
-                self._save()
-
-        logger.debug(f"Cache miss: {authors} ({year})")
-        return None
-
-    def put(self, authors: str, year: int, doi: str | None, url: str | None) -> None:
+        with self._lock:
+            try:
+                conn = self._connect()
+                row = conn.execute(
+                    f"SELECT {', '.join(_COLUMNS)} FROM citations WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None and not self._is_fresh(
+                    dict(zip(_COLUMNS, row, strict=True))
+                ):
+                    # Expired, remove from cache
+                    logger.debug(f"Cache expired: {authors} ({year})")
+                    conn.execute("DELETE FROM citations WHERE key = ?", (key,))
+                    self._changed(conn)
+                    row = None
+            except sqlite3.Error as e:
+                logger.warning(f"Citation cache lookup failed: {e}")
+                row = None
+
+        if row is None:
+            logger.debug(f"Cache miss: {authors} ({year})")
+            return None
+
+        logger.debug(f"Cache hit: {authors} ({year})")
+        entry = dict(zip(_COLUMNS, row, strict=True))
+        entry["timestamp"] = datetime.fromtimestamp(entry["resolved_at"]).isoformat()
+        return entry
+
+    def put(
+        self,
+        authors: str,
+        year: int,
+        doi: str | None,
+        url: str | None,
+        arxiv_id: str | None = None,
+        confidence: float | None = None,
+    ) -> None:
         """Cache a citation resolution.
 
         Stores the resolution with current timestamp for TTL tracking.
-        Automatically persists to disk.
+        Unresolved citations (no doi/url) are cached too, as negative
+        entries. Commits unless ``autosave`` is off.
 
         Args:
             authors: Author string
             year: Publication year
             doi: Digital Object Identifier (if found)
             url: Full URL to paper (if found)
+            arxiv_id: arXiv preprint ID (if found)
+            confidence: Resolution confidence (0-1)
         """
-        key = self._make_key(authors, year)
-        self.data[key] = {
-            "authors": authors,
-            "year": year,
-            "doi": doi,
-            "url": url,
-            "timestamp": datetime.now().isoformat(),
-        }
+        row = (authors, year, doi, url, arxiv_id, confidence, time.time())
+        with self._lock:
+            try:
+                conn = self._connect()
+                self._insert(conn, self._make_key(authors, year), row)
+                self._changed(conn)
+            except sqlite3.Error as e:
+                logger.warning(f"Citation cache write failed: {e}")
+                return
         logger.debug(
             f"Cached citation: {authors} ({year}) -> {url or doi or 'no resolution'}"
         )
-        self._save()
+
+    def flush(self) -> None:
+        """Commit pending changes (one commit for any number of puts)."""
+        with self._lock:
+            if self._conn is not None and self._conn.in_transaction:
+                try:
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Citation cache commit failed: {e}")
+
+    def vacuum(self) -> int:
+        """Delete expired entries and compact the database.
+
+        Returns:
+            Number of entries removed
+        """
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.commit()
+            removed = conn.execute(
+                "DELETE FROM citations WHERE resolved_at < ? "
+                "OR ((doi IS NULL AND url IS NULL) AND resolved_at < ?)",
+                (
+                    now - self.ttl_days * 86400,
+                    now - min(self.ttl_days, self.NEGATIVE_TTL_DAYS) * 86400,
+                ),
+            ).rowcount
+            conn.commit()
+            conn.execute("VACUUM")
+        logger.info(f"Citation cache vacuumed: {removed} expired entries removed")
+        return removed
 
     def clear(self) -> None:
-        """Clear all cache entries and remove cache file."""
-        self.data = {}
-        if self.cache_file.exists():
-            self.cache_file.unlink()
+        """Clear all cache entries and remove cache files."""
+        self.close()
+        for path in (
+            self.db_file,
+            self.db_file.with_name(self.db_file.name + "-wal"),
+            self.db_file.with_name(self.db_file.name + "-shm"),
+            self.cache_file,
+        ):
+            if path.exists():
+                path.unlink()
+
+    def close(self) -> None:
+        """Commit pending changes and close the database."""
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.commit()
+                finally:
+                    self._conn.close()
+                    self._conn = None
+
+    def __enter__(self) -> CitationCache:
+        """Enter context manager - return self for use in with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit context manager - commit and close the database."""
+        self.close()
+        return False  # Don't suppress exceptions
+
+    def __len__(self) -> int:
+        with self._lock:
+            return (
+                self._connect().execute("SELECT COUNT(*) FROM citations").fetchone()[0]
+            )
 
-    def _load(self) -> None:
-        """Load cache from disk.
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.db_file, check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS citations ("
+                "key TEXT PRIMARY KEY, authors TEXT NOT NULL, year INTEGER NOT NULL, "
+                "doi TEXT, url TEXT, arxiv_id TEXT, confidence REAL, "
+                "resolved_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)"
+            )
+            conn.commit()
+            self._conn = conn
+            self._migrate_json(conn)
+        return self._conn
+
+    def _changed(self, conn: sqlite3.Connection) -> None:
+        if self.autosave:
+            conn.commit()
 
-        If cache file doesn't exist, initializes empty cache.
+    @staticmethod
+    def _insert(
+        conn: sqlite3.Connection, key: str, row: tuple, replace: bool = True
+    ) -> None:
+        conn.execute(
+            f"INSERT OR {'REPLACE' if replace else 'IGNORE'} INTO citations "
+            f"(key, {', '.join(_COLUMNS)}) "
+            f"VALUES (?, {', '.join('?' for _ in _COLUMNS)})",
+            (key, *row),
+        )
+
+    def _migrate_json(self, conn: sqlite3.Connection) -> None:
+        """Import the legacy JSON cache whenever the file has changed.
+
+        The JSON file is left in place (it may be tracked in git); its
+        modification time is recorded so unchanged files are skipped.
         """
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, encoding="utf-8") as f:
-                    self.data = json.load(f)
-            except (OSError, json.JSONDecodeError) as e:
-                # Corrupted or unreadable cache, preserve and start fresh
-                self._preserve_corrupt_cache(e)
-                self.data = {}
-
-    def _save(self) -> None:
-        """Persist cache to disk as formatted JSON (atomically)."""
+        if not self.cache_file.exists():
+            return
+        mtime = str(self.cache_file.stat().st_mtime_ns)
+        row = conn.execute(
+            "SELECT value FROM meta WHERE name = 'json_imported_mtime'"
+        ).fetchone()
+        if row is not None and row[0] == mtime:
+            return
+
         try:
-            with NamedTemporaryFile(
-                mode="w",
-                encoding="utf-8",
-                dir=self.cache_file.parent,
-                prefix=f".{self.cache_file.name}.",
-                suffix=".tmp",
-                delete=False,
-            ) as tmp:
-                json.dump(self.data, tmp, indent=2)
-                tmp_path = Path(tmp.name)
-
-            tmp_path.replace(self.cache_file)
-        except OSError:
-            logger.exception("Failed to persist citation cache")
-            # Best-effort cleanup
+            with open(self.cache_file, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            # Corrupted or unreadable cache, preserve and start fresh
+            self._preserve_corrupt_cache(e)
+            return
+
+        imported = 0
+        for key, entry in data.items():
             try:
-                if "tmp_path" in locals() and tmp_path.exists():
-                    tmp_path.unlink()
-            except OSError:
-                pass
+                resolved_at = datetime.fromisoformat(entry["timestamp"]).timestamp()
+                values = (
+                    entry["authors"],
+                    int(entry["year"]),
+                    entry.get("doi"),
+                    entry.get("url"),
+                    entry.get("arxiv_id"),
+                    entry.get("confidence"),
+                    resolved_at,
+                )
+            except KeyError, TypeError, ValueError:
+                continue
+            # Keep resolutions already in the database (they are newer)
+            self._insert(conn, key, values, replace=False)
+            imported += 1
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (name, value) "
+            "VALUES ('json_imported_mtime', ?)",
+            (mtime,),
+        )
+        conn.commit()
+        logger.info(
+            f"Imported {imported} citation cache entries from {self.cache_file} "
+            f"into {self.db_file}"
+        )
 
     def _preserve_corrupt_cache(self, error: Exception) -> None:
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -157,22 +321,22 @@ class CitationCache:
                 type(error).__name__,
             )
 
-    def _is_fresh(self, timestamp_str: str) -> bool:
-        """Check if timestamp is within TTL window.
+    def _is_fresh(self, entry: dict) -> bool:
+        """Check if an entry is within its TTL window.
 
         Args:
-            timestamp_str: ISO format timestamp string
+            entry: Row with ``resolved_at`` and the resolution columns
 
         Returns:
-            True if less than 30 days old
+            True if younger than ``ttl_days`` (``NEGATIVE_TTL_DAYS`` for
+            unresolved citations, if shorter)
         """
-        try:
-            cached_time = datetime.fromisoformat(timestamp_str)
-            age = datetime.now() - cached_time
-            return age < timedelta(days=self.TTL_DAYS)
-        except (ValueError, TypeError):
-            # Invalid timestamp, treat as expired
-            return False
+        ttl_days = (
+            self.ttl_days
+            if entry["url"] or entry["doi"]
+            else min(self.ttl_days, self.NEGATIVE_TTL_DAYS)
+        )
+        return time.time() - entry["resolved_at"] < ttl_days * 86400
 
     @staticmethod
     def _make_key(authors: str, year: int) -> str:
@@ -5,8 +5,12 @@ Uses two free APIs with no authentication required:
 2. arXiv (https://arxiv.org/api) - for preprints and research papers
 
 Both APIs have generous rate limits and no authentication requirements.
+Each citation queries both in parallel (first confident answer wins), and
+``resolve_many()`` resolves several citations concurrently.
 """
 
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 
 import httpx
@@ -44,8 +48,10 @@ class CitationResolver:
     """Look up academic citations via free public APIs.
 
     Strategy:
-    1. Try CrossRef first (covers most published journals)
-    2. Fall back to arXiv (covers preprints and CS papers)
+    1. Query CrossRef (covers most published journals) and arXiv (covers
+       preprints and CS papers) in parallel, each retrying with the first
+       author only
+    2. Return the first confident answer
     3. Return unresolved if both fail
 
     All APIs are free and don't require authentication.
@@ -72,6 +78,12 @@ class CitationResolver:
         self.timeout = timeout
         # Create httpx client with redirect handling enabled by default
         self.client = httpx.Client(follow_redirects=True, timeout=timeout)
+        # CrossRef and arXiv lookups; slower lookups finish here after a
+        # faster one already answered
+        self._lookups = ThreadPoolExecutor(
+            max_workers=2 * max(1, get_config().citation_max_concurrency),
+            thread_name_prefix="citation-lookup",
+        )
 
     def __enter__(self) -> CitationResolver:
         """Enter context manager - return self for use in with statement."""
@@ -85,10 +97,10 @@ class CitationResolver:
     def resolve(self, authors: str, year: int) -> ResolvedCitation:
         """Resolve a citation to DOI or arXiv link.
 
-        Tries multiple strategies:
-        1. Direct CrossRef lookup with original authors
-        2. CrossRef with first author only (handles et al. variations)
-        3. arXiv lookup
+        CrossRef and arXiv are queried in parallel, each first with the
+        original authors and then with the first author only (handles
+        "et al." variations). The first confident answer is returned without
+        waiting for the other service.
 
         Args:
             authors: Author string (e.g., "Smith et al.")
@@ -99,37 +111,25 @@ class CitationResolver:
         """
         logger.debug(f"Resolving citation: {authors} ({year})")
 
-        # Try CrossRef (most comprehensive for journal articles)
-        result = self._search_crossref(authors, year)
-        if result:
-            logger.info(f"Resolved via CrossRef: {authors} ({year}) -> {result.url}")
-            return result
-
-        # Try with first author only (handles "et al." variations)
         first_author = self._extract_first_author(authors)
-        if first_author and first_author != authors:
-            logger.debug(f"Trying first author only: {first_author}")
-            result = self._search_crossref(first_author, year)
-            if result:
-                logger.info(
-                    f"Resolved via CrossRef (first author): {first_author} ({year}) -> {result.url}"
-                )
-                return result
+        if first_author == authors:
+            first_author = None
 
-        # Try arXiv (good for preprints and CS papers)
-        result = self._search_arxiv(authors, year)
-        if result:
-            logger.info(f"Resolved via arXiv: {authors} ({year}) -> {result.url}")
-            return result
-
-        # Try arXiv with first author only
-        if first_author and first_author != authors:
-            result = self._search_arxiv(first_author, year)
-            if result:
-                logger.info(
-                    f"Resolved via arXiv (first author): {first_author} ({year}) -> {result.url}"
-                )
-                return result
+        pending = {
+            self._lookups.submit(
+                self._lookup, service, search, authors, first_author, year
+            )
+            for service, search in (
+                ("CrossRef", self._search_crossref),
+                ("arXiv", self._search_arxiv),
+            )
+        }
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if result:
+                    return result
 
         # No match found
         logger.debug(f"Could not resolve citation: {authors} ({year})")
@@ -145,6 +145,52 @@ class CitationResolver:
             source_uri=None,
         )
 
+    def resolve_many(self, citations: list[tuple[str, int]]) -> list[ResolvedCitation]:
+        """Resolve several (authors, year) citations concurrently.
+
+        At most ``citation_max_concurrency`` citations are resolved at once.
+
+        Args:
+            citations: (authors, year) pairs
+
+        Returns:
+            ResolvedCitation for each pair, in order
+        """
+        if len(citations) <= 1:
+            return [self.resolve(authors, year) for authors, year in citations]
+
+        from ..config import get_config
+
+        workers = min(get_config().citation_max_concurrency, len(citations))
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="citation-resolve"
+        ) as executor:
+            return list(executor.map(lambda pair: self.resolve(*pair), citations))
+
+    def _lookup(
+        self,
+        service: str,
+        search: Callable[[str, int], ResolvedCitation | None],
+        authors: str,
+        first_author: str | None,
+        year: int,
+    ) -> ResolvedCitation | None:
+        """Search one service with the full authors, then the first author."""
+        result = search(authors, year)
+        if result:
+            logger.info(f"Resolved via {service}: {authors} ({year}) -> {result.url}")
+            return result
+
+        if first_author:
+            logger.debug(f"Trying first author only on {service}: {first_author}")
+            result = search(first_author, year)
+            if result:
+                logger.info(
+                    f"Resolved via {service} (first author): {first_author} ({year}) -> {result.url}"
+                )
+                return result
+        return None
+
     def _extract_first_author(self, authors: str) -> str | None:
         """Extract first author name for fallback queries.
 
@@ -291,7 +337,13 @@ class CitationResolver:
         return None
 
     def close(self) -> None:
-        """Close the HTTP client and clean up resources."""
+        """Close the HTTP client and clean up resources.
+
+        Waits for lookups still running after their citation was answered
+        by the other service, so they never use a closed client.
+        """
+        if hasattr(self, "_lookups"):
+            self._lookups.shutdown(wait=True, cancel_futures=True)
         if hasattr(self, "client"):
             self.client.close()
 
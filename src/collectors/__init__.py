@@ -50,6 +50,9 @@ Usage:
     # Collect from all sources
     items = collect_all_sources()
 
+    # Or concurrently, on one pooled async HTTP client
+    items = asyncio.run(collect_all_sources_async())
+
     # Save to file
     save_collected_items(items)
 
@@ -69,19 +72,28 @@ from .base import (
     is_political_content,
     is_relevant_content,
 )
-from .github import collect_from_github_trending
-from .hackernews import collect_from_hackernews
+from .github import collect_from_github_trending, collect_from_github_trending_async
+from .hackernews import collect_from_hackernews, collect_from_hackernews_async
+from .http_engine import CollectionHTTPEngine, HostLimit
+from .instance_stats import InstanceStatsStore
 from .mastodon import (
     collect_from_mastodon,
+    collect_from_mastodon_instances_async,
     collect_from_mastodon_public,
+    collect_from_mastodon_public_async,
     collect_from_mastodon_trending,
+    collect_from_mastodon_trending_async,
 )
 
 # Import utilities
 from .orchestrator import (
+    StreamingDeduplicator,
     collect_all_sources,
+    collect_all_sources_async,
     deduplicate_items,
+    open_collected_writer,
     save_collected_items,
+    stream_all_sources,
 )
 from .reddit import collect_from_reddit
 
@@ -93,11 +105,24 @@ __all__ = [
     "collect_from_reddit",
     "collect_from_hackernews",
     "collect_from_github_trending",
+    # Async collectors (shared HTTP engine)
+    "CollectionHTTPEngine",
+    "HostLimit",
+    "InstanceStatsStore",
+    "collect_from_mastodon_instances_async",
+    "collect_from_mastodon_trending_async",
+    "collect_from_mastodon_public_async",
+    "collect_from_hackernews_async",
+    "collect_from_github_trending_async",
     # Orchestration
     "collect_all_sources",
+    "collect_all_sources_async",
+    "stream_all_sources",
     # Utilities
     "save_collected_items",
+    "open_collected_writer",
     "deduplicate_items",
+    "StreamingDeduplicator",
     # Filters (for use by other modules if needed)
     "is_entitled_whining",
     "is_political_content",
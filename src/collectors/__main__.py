@@ -4,19 +4,14 @@ Usage:
     python -m src.collectors
 
 This will collect content from all configured sources and save to data/.
-With PYTHON_GIL=0, uses parallel collection for faster results.
+Sources are collected concurrently on a shared async HTTP engine.
 """
 
 import asyncio
 
 from rich.console import Console
 
-from ..utils.free_threading import supports_free_threading
-from .orchestrator import (
-    collect_all_sources,
-    collect_all_sources_async,
-    save_collected_items,
-)
+from .orchestrator import collect_all_sources_async, save_collected_items
 
 console = Console()
 
@@ -25,14 +20,8 @@ def main() -> int:
     """Run collection from all sources."""
     console.print("[bold blue]📥 Starting content collection...[/bold blue]")
 
-    # Use parallel collection if free-threading is available
-    if supports_free_threading():
-        console.print(
-            "[bold green]⚡ Python 3.14 free-threading enabled - collecting in parallel![/bold green]"
-        )
-        items = asyncio.run(collect_all_sources_async())
-    else:
-        items = collect_all_sources()
+    # Async I/O doesn't depend on free-threading, so always collect concurrently
+    items = asyncio.run(collect_all_sources_async())
 
     if items:
         save_collected_items(items)
@@ -13,14 +13,209 @@ Shared utilities:
 - Title extraction
 """
 
+import re
+from functools import lru_cache
+
 from rich.console import Console
 
 from ..models import PipelineConfig
+from ..utils.keyword_matcher import KeywordMatcher
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 console = Console()
 
+# Entitled complaints about free software
+ENTITLED_PATTERNS = [
+    "should be free",
+    "shouldn't cost",
+    "charging for",
+    "how dare they",
+    "outrageous price",
+    "greedy developers",
+    "money grab",
+    "cash grab",
+]
+
+# Context that indicates it's about pricing/monetization
+MONETIZATION_CONTEXT = [
+    "price",
+    "cost",
+    "pricing",
+    "pay",
+    "paid",
+    "paying",
+    "subscription",
+    "license",
+    "free",
+    "open source",
+    "oss",
+]
+
+# Political keywords
+POLITICAL_WORDS = [
+    "democrat",
+    "republican",
+    "liberal",
+    "conservative",
+    "leftist",
+    "right-wing",
+    "left-wing",
+    "trump",
+    "biden",
+    "congress",
+    "senate",
+    "election",
+    "vote",
+    "voter",
+    "voting",
+    "ballot",
+    "politician",
+    "political party",
+]
+
+# Tech policy keywords (these are OK)
+TECH_POLICY_WORDS = [
+    "privacy",
+    "regulation",
+    "antitrust",
+    "monopoly",
+    "data protection",
+    "encryption",
+    "surveillance",
+    "net neutrality",
+    "copyright",
+    "patent",
+    "open source",
+    "security",
+    "gdpr",
+    "section 230",
+]
+
+# Tech-related keywords (very broad to avoid false negatives). Keywords match
+# whole words (plus plural -s/-es), so common derived forms are listed too.
+TECH_KEYWORDS = [
+    "software",
+    "hardware",
+    "code",
+    "coding",
+    "programming",
+    "developer",
+    "development",
+    "algorithm",
+    "data",
+    "api",
+    "cloud",
+    "server",
+    "database",
+    "app",
+    "application",
+    "web",
+    "mobile",
+    "computer",
+    "tech",
+    "technology",
+    "technologies",
+    "technical",
+    "digital",
+    "cyber",
+    "cybersecurity",
+    "internet",
+    "network",
+    "networking",
+    "system",
+    "computing",
+    "linux",
+    "windows",
+    "mac",
+    "android",
+    "ios",
+    "python",
+    "javascript",
+    "rust",
+    "golang",
+    "java",
+    "ai",
+    "ml",
+    "machine learning",
+    "neural",
+    "llm",
+    "open source",
+    "github",
+    "git",
+    "repository",
+]
+
+# Science keywords
+SCIENCE_KEYWORDS = [
+    "research",
+    "researcher",
+    "study",
+    "studies",
+    "scientist",
+    "scientific",
+    "laboratory",
+    "experiment",
+    "discovery",
+    "breakthrough",
+    "published",
+    "paper",
+    "journal",
+    "university",
+    "professor",
+    "phd",
+    "doctorate",
+    "biology",
+    "physics",
+    "chemistry",
+    "astronomy",
+    "mathematics",
+    "quantum",
+    "genome",
+    "molecule",
+    "particle",
+    "theory",
+]
+
+# Policy keywords (tech regulation, etc.)
+POLICY_KEYWORDS = [
+    "regulation",
+    "privacy",
+    "security",
+    "encryption",
+    "surveillance",
+    "antitrust",
+    "monopoly",
+    "patent",
+    "copyright",
+    "gdpr",
+    "compliance",
+    "legislation",
+]
+
+_WHINING = KeywordMatcher(
+    {"entitled": ENTITLED_PATTERNS, "monetization": MONETIZATION_CONTEXT}
+)
+_POLITICS = KeywordMatcher(
+    {"political": POLITICAL_WORDS, "tech_policy": TECH_POLICY_WORDS}
+)
+_TOPICS = KeywordMatcher(
+    {"tech": TECH_KEYWORDS, "science": SCIENCE_KEYWORDS, "policy": POLICY_KEYWORDS}
+)
+
+
+@lru_cache(maxsize=8)
+def _negative_pattern(negative_keywords: str) -> re.Pattern[str] | None:
+    """Pattern for the comma-separated ``relevance_negative_keywords`` setting.
+
+    Unlike the built-in lists, these user-configured keywords keep matching
+    anywhere in the text, so "music" also rejects "musician" and "musical".
+    """
+    keywords = [kw.strip() for kw in negative_keywords.split(",") if kw.strip()]
+    if not keywords:
+        return None
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
 
 def is_entitled_whining(content: str) -> bool:
     """Filter out entitled complaints about free/open-source projects.
@@ -34,36 +229,8 @@ def is_entitled_whining(content: str) -> bool:
     Returns:
         True if content appears to be entitled whining
     """
-    content_lower = content.lower()
-
-    # Entitled complaints about free software
-    entitled_patterns = [
-        "should be free",
-        "shouldn't cost",
-        "charging for",
-        "how dare they",
-        "outrageous price",
-        "greedy developers",
-        "money grab",
-        "cash grab",
-    ]
-
-    # Context that indicates it's about pricing/monetization
-    monetization_context = [
-        "price",
-        "cost",
-        "pay",
-        "subscription",
-        "license",
-        "free",
-        "open source",
-        "oss",
-    ]
-
-    has_entitled = any(pattern in content_lower for pattern in entitled_patterns)
-    has_monetization = any(word in content_lower for word in monetization_context)
-
-    return has_entitled and has_monetization
+    hits = _WHINING.matches(content)
+    return "entitled" in hits and "monetization" in hits
 
 
 def is_political_content(content: str) -> bool:
@@ -79,53 +246,10 @@ def is_political_content(content: str) -> bool:
     Returns:
         True if content is primarily political (not tech-related)
     """
-    content_lower = content.lower()
-
-    # Political keywords
-    political_words = [
-        "democrat",
-        "republican",
-        "liberal",
-        "conservative",
-        "leftist",
-        "right-wing",
-        "left-wing",
-        "trump",
-        "biden",
-        "congress",
-        "senate",
-        "election",
-        "vote",
-        "voter",
-        "ballot",
-        "politician",
-        "political party",
-    ]
-
-    # Tech policy keywords (these are OK)
-    tech_policy_words = [
-        "privacy",
-        "regulation",
-        "antitrust",
-        "monopoly",
-        "data protection",
-        "encryption",
-        "surveillance",
-        "net neutrality",
-        "copyright",
-        "patent",
-        "open source",
-        "security",
-        "gdpr",
-        "section 230",
-    ]
-
-    # Count political vs tech-policy mentions
-    political_count = sum(1 for word in political_words if word in content_lower)
-    tech_policy_count = sum(1 for word in tech_policy_words if word in content_lower)
+    hits = _POLITICS.matches(content)
 
     # If it mentions politics without tech policy context, filter it
-    return political_count > 0 and tech_policy_count == 0
+    return "political" in hits and "tech_policy" not in hits
 
 
 def is_relevant_content(content: str, title: str, config: PipelineConfig) -> bool:
@@ -142,114 +266,18 @@ def is_relevant_content(content: str, title: str, config: PipelineConfig) -> boo
     Returns:
         True if content is relevant, False otherwise
     """
-    text = f"{title} {content}".lower()
-
-    # Parse negative keywords from config
-    negative_keywords = [
-        kw.strip() for kw in config.relevance_negative_keywords.split(",") if kw.strip()
-    ]
+    text = f"{title} {content}"
 
     # Check for negative keywords first (quick rejection)
-    if any(keyword in text for keyword in negative_keywords):
+    negative = _negative_pattern(config.relevance_negative_keywords)
+    if negative is not None and negative.search(text):
         return False
 
-    # Tech-related keywords (very broad to avoid false negatives)
-    tech_keywords = [
-        "software",
-        "hardware",
-        "code",
-        "programming",
-        "developer",
-        "algorithm",
-        "data",
-        "api",
-        "cloud",
-        "server",
-        "database",
-        "app",
-        "application",
-        "web",
-        "mobile",
-        "computer",
-        "tech",
-        "digital",
-        "cyber",
-        "internet",
-        "network",
-        "system",
-        "linux",
-        "windows",
-        "mac",
-        "android",
-        "ios",
-        "python",
-        "javascript",
-        "rust",
-        "golang",
-        "java",
-        "ai",
-        "ml",
-        "machine learning",
-        "neural",
-        "llm",
-        "open source",
-        "github",
-        "git",
-        "repository",
-    ]
-
-    # Science keywords
-    science_keywords = [
-        "research",
-        "study",
-        "scientist",
-        "laboratory",
-        "experiment",
-        "discovery",
-        "breakthrough",
-        "published",
-        "paper",
-        "journal",
-        "university",
-        "professor",
-        "phd",
-        "doctorate",
-        "biology",
-        "physics",
-        "chemistry",
-        "astronomy",
-        "mathematics",
-        "quantum",
-        "genome",
-        "molecule",
-        "particle",
-        "theory",
-    ]
-
-    # Policy keywords (tech regulation, etc.)
-    policy_keywords = [
-        "regulation",
-        "privacy",
-        "security",
-        "encryption",
-        "surveillance",
-        "antitrust",
-        "monopoly",
-        "patent",
-        "copyright",
-        "gdpr",
-        "compliance",
-        "legislation",
-    ]
-
     # Check if content matches enabled categories
-    has_tech = config.allow_tech_content and any(kw in text for kw in tech_keywords)
-    has_science = config.allow_science_content and any(
-        kw in text for kw in science_keywords
-    )
-    has_policy = config.allow_policy_content and any(
-        kw in text for kw in policy_keywords
-    )
+    hits = _TOPICS.matches(text)
+    has_tech = config.allow_tech_content and "tech" in hits
+    has_science = config.allow_science_content and "science" in hits
+    has_policy = config.allow_policy_content and "policy" in hits
 
     return has_tech or has_science or has_policy
 
@@ -4,7 +4,10 @@ Collects trending repos from GitHub.
 GitHub is TIER_3 source - shows what's hot in open source.
 """
 
+from __future__ import annotations
+
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
 
 import httpx
 from rich.console import Console
@@ -12,9 +15,66 @@ from rich.console import Console
 from ..models import CollectedItem, SourceType
 from ..utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from .http_engine import CollectionHTTPEngine
+
 logger = get_logger(__name__)
 console = Console()
 
+GITHUB_SEARCH_URL = "https://api.github.com/search/repositories"
+GITHUB_HEADERS = {"Accept": "application/vnd.github.v3+json"}
+
+
+def _search_params(language: str | None, limit: int) -> dict[str, Any]:
+    """Search parameters approximating GitHub trending."""
+    params: dict[str, Any] = {
+        "q": "stars:>100 pushed:>2025-10-01",  # Active repos with good engagement
+        "sort": "stars",
+        "order": "desc",
+        "per_page": limit,
+    }
+    if language:
+        params["q"] += f" language:{language}"
+    return params
+
+
+def _repos_to_items(repos: list[dict[str, Any]]) -> list[CollectedItem]:
+    """Convert GitHub search results to CollectedItems, skipping bad repos."""
+    items = []
+    for repo in repos:
+        try:
+            # Build content from repo description
+            content = f"{repo['name']}\n\n{repo.get('description', 'No description')}"
+
+            item = CollectedItem(
+                id=f"github_{repo['id']}",
+                title=f"{repo['full_name']}: {repo.get('description', '')[:100]}",
+                content=content,
+                source=SourceType.GITHUB,
+                url=repo["html_url"],
+                author=repo["owner"]["login"],
+                collected_at=datetime.now(UTC),
+                metadata={
+                    "stars": repo["stargazers_count"],
+                    "forks": repo["forks_count"],
+                    "watchers": repo["watchers_count"],
+                    "language": repo.get("language") or "Unknown",
+                    "topics": repo.get("topics", []),
+                    "source_name": "github_trending",
+                    "open_issues": repo.get("open_issues_count", 0),
+                },
+            )
+            items.append(item)
+
+        except Exception as e:
+            logger.debug(
+                f"Error processing GitHub repo: {type(e).__name__}",
+                exc_info=True,
+            )
+            console.print(f"[yellow]⚠[/yellow] Failed to process GitHub repo: {e}")
+            continue
+    return items
+
 
 def collect_from_github_trending(
     language: str | None = None, limit: int = 20
@@ -43,23 +103,15 @@ def collect_from_github_trending(
         config = get_config()
         with httpx.Client(timeout=config.timeouts.http_client_timeout) as client:
             # Search for recently starred repos
-            params = {
-                "q": "stars:>100 pushed:>2025-10-01",  # Active repos with good engagement
-                "sort": "stars",
-                "order": "desc",
-                "per_page": limit,
-            }
-
-            if language:
-                params["q"] += f" language:{language}"
+            params = _search_params(language, limit)
 
             logger.debug(
                 f"Searching GitHub for trending repos (language={language}, limit={limit})"
             )
             response = client.get(
-                "https://api.github.com/search/repositories",
+                GITHUB_SEARCH_URL,
                 params=params,
-                headers={"Accept": "application/vnd.github.v3+json"},
+                headers=GITHUB_HEADERS,
             )
 
             if response.status_code == 403:
@@ -74,42 +126,52 @@ def collect_from_github_trending(
             logger.info(f"Found {len(repos)} trending repositories from GitHub")
             console.print(f"  Found {len(repos)} trending repositories...")
 
-            for repo in repos:
-                try:
-                    # Build content from repo description
-                    content = (
-                        f"{repo['name']}\n\n{repo.get('description', 'No description')}"
-                    )
-
-                    item = CollectedItem(
-                        id=f"github_{repo['id']}",
-                        title=f"{repo['full_name']}: {repo.get('description', '')[:100]}",
-                        content=content,
-                        source=SourceType.GITHUB,
-                        url=repo["html_url"],
-                        author=repo["owner"]["login"],
-                        collected_at=datetime.now(UTC),
-                        metadata={
-                            "stars": repo["stargazers_count"],
-                            "forks": repo["forks_count"],
-                            "watchers": repo["watchers_count"],
-                            "language": repo.get("language") or "Unknown",
-                            "topics": repo.get("topics", []),
-                            "source_name": "github_trending",
-                            "open_issues": repo.get("open_issues_count", 0),
-                        },
-                    )
-                    items.append(item)
-
-                except Exception as e:
-                    logger.debug(
-                        f"Error processing GitHub repo: {type(e).__name__}",
-                        exc_info=True,
-                    )
-                    console.print(
-                        f"[yellow]⚠[/yellow] Failed to process GitHub repo: {e}"
-                    )
-                    continue
+            items = _repos_to_items(repos)
+
+    except Exception as e:
+        logger.exception(f"GitHub trending collection failed: {type(e).__name__} - {e}")
+        console.print(f"[red]✗[/red] GitHub trending collection failed: {e}")
+        return []
+
+    logger.info(f"Collected {len(items)} trending repos from GitHub")
+    console.print(f"[green]✓[/green] Collected {len(items)} trending repos from GitHub")
+    return items
+
+
+async def collect_from_github_trending_async(
+    engine: CollectionHTTPEngine, language: str | None = None, limit: int = 20
+) -> list[CollectedItem]:
+    """Collect trending repositories from GitHub through the shared async engine.
+
+    Args:
+        engine: Open collection HTTP engine
+        language: Filter by programming language (None = all languages)
+        limit: Maximum number of repos to collect
+
+    Returns:
+        List of collected items from GitHub Trending
+    """
+    console.print(
+        f"[blue]Collecting from GitHub Trending{f' ({language})' if language else ''}...[/blue]"
+    )
+
+    try:
+        response = await engine.get(
+            GITHUB_SEARCH_URL,
+            params=_search_params(language, limit),
+            headers=GITHUB_HEADERS,
+        )
+
+        if response.status_code == 403:
+            logger.warning("GitHub API rate limit hit")
+            console.print("[yellow]⚠[/yellow] GitHub API rate limit hit, skipping")
+            return []
+
+        response.raise_for_status()
+        repos = response.json().get("items", [])[:limit]
+        logger.info(f"Found {len(repos)} trending repositories from GitHub")
+        console.print(f"  Found {len(repos)} trending repositories...")
+        items = _repos_to_items(repos)
 
     except Exception as e:
         logger.exception(f"GitHub trending collection failed: {type(e).__name__} - {e}")
@@ -0,0 +1,196 @@
+"""Shared async HTTP engine for collectors.
+
+All async collectors fetch through one pooled ``httpx.AsyncClient`` so
+connections (and TLS sessions) are reused across sources. Each host gets its
+own concurrency cap and token bucket (``AsyncRateLimiter``), which lets HN item
+fetches and several Mastodon instances run concurrently without hammering any
+single API.
+
+HTTP/2 is enabled when the optional ``h2`` package is installed
+(``pip install httpx[http2]``); otherwise the client falls back to HTTP/1.1.
+
+With an HTTPCache, GETs are sent as conditional requests and 304 replies are
+answered from disk (see utils/http_cache.py).
+
+Usage:
+    async with CollectionHTTPEngine() as engine:
+        response = await engine.get("https://hacker-news.firebaseio.com/v0/topstories.json")
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+from ..utils.clients import http2_available
+from ..utils.http_cache import HTTPCache
+from ..utils.logging import get_logger
+from ..utils.rate_limit import AsyncRateLimiter
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class HostLimit:
+    """Concurrency and rate limits applied to a single host."""
+
+    concurrency: int
+    rate_per_minute: int
+    burst: int
+
+
+# Used for any host without an explicit entry (e.g. Mastodon instances)
+DEFAULT_HOST_LIMIT = HostLimit(concurrency=4, rate_per_minute=300, burst=4)
+
+# Unauthenticated GitHub search allows 10 requests/minute
+GITHUB_HOST_LIMIT = HostLimit(concurrency=2, rate_per_minute=10, burst=2)
+
+HACKERNEWS_HOST = "hacker-news.firebaseio.com"
+GITHUB_API_HOST = "api.github.com"
+
+
+def _default_host_limits() -> dict[str, HostLimit]:
+    """Per-host limits derived from pipeline configuration."""
+    from ..config import get_config
+
+    config = get_config()
+    # Keep the configured HN spacing as a rate instead of a sleep per item
+    hn_interval = config.sleep_intervals.between_hackernews_requests
+    hn_rate = int(60 / hn_interval) if hn_interval > 0 else 6000
+    return {
+        HACKERNEWS_HOST: HostLimit(concurrency=10, rate_per_minute=hn_rate, burst=10),
+        GITHUB_API_HOST: GITHUB_HOST_LIMIT,
+    }
+
+
+class _HostState:
+    """Semaphore and limiter shared by every request to one host."""
+
+    def __init__(self, limit: HostLimit) -> None:
+        self.semaphore = asyncio.Semaphore(max(1, limit.concurrency))
+        self.limiter = AsyncRateLimiter(
+            rate_per_minute=max(1, limit.rate_per_minute),
+            burst=max(1, limit.burst),
+        )
+
+
+class CollectionHTTPEngine:
+    """Pooled async HTTP client with per-host concurrency and rate limits.
+
+    Use as an async context manager; the underlying client is closed on exit.
+    Host state is created lazily, so any number of Mastodon instances share
+    the pool while each keeps its own limits.
+    """
+
+    def __init__(
+        self,
+        timeout: float | None = None,
+        host_limits: dict[str, HostLimit] | None = None,
+        default_limit: HostLimit = DEFAULT_HOST_LIMIT,
+        max_connections: int = 50,
+        transport: httpx.AsyncBaseTransport | None = None,
+        cache: HTTPCache | None = None,
+    ) -> None:
+        """Create the engine.
+
+        Args:
+            timeout: Request timeout in seconds (config default if None)
+            host_limits: Per-host overrides (defaults from config if None)
+            default_limit: Limits for hosts without an override
+            max_connections: Total connection pool size across all hosts
+            transport: Optional httpx transport (used by tests)
+            cache: Optional response cache for conditional GETs
+        """
+        from ..config import get_config
+
+        config = get_config()
+        self.timeout = (
+            timeout if timeout is not None else config.timeouts.http_client_timeout
+        )
+        self.host_limits = (
+            host_limits if host_limits is not None else _default_host_limits()
+        )
+        self.default_limit = default_limit
+        self.max_connections = max_connections
+        self._transport = transport
+        self.cache = cache
+        self._hosts: dict[str, _HostState] = {}
+        self._client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self) -> CollectionHTTPEngine:
+        use_http2 = self._transport is None and http2_available()
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            follow_redirects=True,
+            http2=use_http2,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+            transport=self._transport,
+        )
+        logger.debug(
+            f"Collection HTTP engine started (http2={use_http2}, "
+            f"max_connections={self.max_connections})"
+        )
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            raise RuntimeError("CollectionHTTPEngine must be used with 'async with'")
+        return self._client
+
+    def _host_state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            limit = self.host_limits.get(host, self.default_limit)
+            state = _HostState(limit)
+            self._hosts[host] = state
+        return state
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        """GET ``url`` once the host's concurrency slot and rate token allow.
+
+        Keyword arguments are passed through to ``httpx.AsyncClient.get``.
+        With a cache, a 304 reply comes back as a 200 built from the cached
+        body.
+        """
+        params = kwargs.get("params")
+        if self.cache is not None:
+            kwargs["headers"] = {
+                **self.cache.conditional_headers(url, params),
+                **(kwargs.get("headers") or {}),
+            }
+
+        state = self._host_state(urlsplit(url).netloc.lower())
+        async with state.semaphore:
+            await state.limiter.acquire()
+            response = await self.client.get(url, **kwargs)
+
+        if self.cache is None:
+            return response
+        cached = self.cache.resolve(
+            url,
+            response.status_code,
+            response.headers,
+            lambda: response.content,
+            params,
+        )
+        if cached is None:
+            return response
+        return httpx.Response(
+            200,
+            headers=cached.headers,
+            content=cached.content,
+            request=response.request,
+        )
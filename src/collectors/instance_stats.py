@@ -0,0 +1,109 @@
+"""Per-instance latency and yield tracking for Mastodon fan-out.
+
+Each run records how long every queried instance took and how many items it
+produced. The next run launches instances cheapest-first (seconds per item),
+so slow or dead instances only start once faster ones have had their turn.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+
+from ..utils.file_io import atomic_write_json
+from ..utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class InstanceStats:
+    """Smoothed performance of one Mastodon instance."""
+
+    latency_seconds: float
+    items: float
+    runs: int = 1
+    failures: int = 0
+    last_seen: str = ""
+
+    @property
+    def seconds_per_item(self) -> float:
+        """Expected cost of one item; zero-yield instances count as half an item."""
+        return self.latency_seconds / max(self.items, 0.5)
+
+
+class InstanceStatsStore:
+    """Persisted exponential moving averages of instance latency and yield.
+
+    Not thread-safe: updated from the event loop during collection and saved
+    once at the end of the fan-out.
+    """
+
+    SMOOTHING = 0.3
+
+    def __init__(self, stats_file: Path | None = None):
+        if stats_file is None:
+            from ..config import get_data_dir
+
+            stats_file = get_data_dir() / "mastodon_instance_stats.json"
+        self.stats_file = stats_file
+        self.stats: dict[str, InstanceStats] = {}
+        self.load()
+
+    def load(self) -> None:
+        """Load stats from disk, starting empty if missing or corrupt."""
+        if not self.stats_file.exists():
+            return
+        try:
+            with open(self.stats_file, encoding="utf-8") as f:
+                data = json.load(f)
+            self.stats = {
+                instance: InstanceStats(**entry) for instance, entry in data.items()
+            }
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Could not load Mastodon instance stats: {e}")
+            self.stats = {}
+
+    def save(self) -> None:
+        """Persist stats atomically."""
+        data = {instance: asdict(entry) for instance, entry in self.stats.items()}
+        atomic_write_json(self.stats_file, data)
+
+    def record(
+        self, instance: str, latency_seconds: float, items: int, failed: bool = False
+    ) -> None:
+        """Fold one run's observation for ``instance`` into its averages."""
+        now = datetime.now().isoformat()
+        entry = self.stats.get(instance)
+        if entry is None:
+            self.stats[instance] = InstanceStats(
+                latency_seconds=latency_seconds,
+                items=float(items),
+                failures=int(failed),
+                last_seen=now,
+            )
+            return
+
+        alpha = self.SMOOTHING
+        entry.latency_seconds = (
+            alpha * latency_seconds + (1 - alpha) * entry.latency_seconds
+        )
+        entry.items = alpha * items + (1 - alpha) * entry.items
+        entry.runs += 1
+        entry.failures += int(failed)
+        entry.last_seen = now
+
+    def order(self, instances: list[str]) -> list[str]:
+        """Instances sorted cheapest-first.
+
+        Instances without history sort first so they get measured; ties keep
+        the configured order.
+        """
+        return sorted(
+            instances,
+            key=lambda instance: (
+                self.stats[instance].seconds_per_item if instance in self.stats else 0.0
+            ),
+        )
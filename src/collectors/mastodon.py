@@ -4,7 +4,13 @@ Collects trending and public timeline posts from Mastodon instances.
 Mastodon is TIER_1 source - high quality, community-filtered content.
 """
 
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING
 from urllib.parse import urljoin
 
 import httpx
@@ -21,6 +27,10 @@ from .base import (
     is_relevant_content,
 )
 
+if TYPE_CHECKING:
+    from .http_engine import CollectionHTTPEngine
+    from .instance_stats import InstanceStatsStore
+
 logger = get_logger(__name__)
 console = Console()
 
@@ -160,6 +170,215 @@ def collect_from_mastodon_public(
         raise
 
 
+async def collect_from_mastodon_trending_async(
+    engine: CollectionHTTPEngine, instance: str, limit: int = 30
+) -> list[CollectedItem]:
+    """Collect trending posts from one Mastodon instance via the async engine.
+
+    Same behaviour as collect_from_mastodon_trending(), including the public
+    timeline fallback, but requests share the engine's pool and host limits.
+
+    Args:
+        engine: Open collection HTTP engine
+        instance: Mastodon instance base URL
+        limit: Maximum number of posts to collect
+
+    Returns:
+        List of collected items from Mastodon trending
+    """
+    from ..config import get_config
+
+    config = get_config()
+    logger.debug(
+        f"Starting async Mastodon trending collection from {instance} (limit={limit})"
+    )
+    console.print(
+        f"[blue]Collecting trending content from Mastodon ({instance})...[/blue]"
+    )
+
+    trending_url = urljoin(instance, "/api/v1/trends/statuses")
+
+    try:
+        trending_response = await engine.get(
+            trending_url, params={"limit": min(limit, 20)}
+        )
+
+        if trending_response.status_code == 200:
+            trending_posts = trending_response.json()
+            logger.info(f"Retrieved {len(trending_posts)} trending posts from Mastodon")
+            console.print(
+                f"[green]✓[/green] Found {len(trending_posts)} trending posts"
+            )
+
+            if trending_posts:
+                return _process_mastodon_posts(
+                    trending_posts, config, "trending", instance
+                )
+
+        logger.debug("Trending API not available, falling back to public timeline")
+        console.print(
+            "[yellow]Trending not available, falling back to public timeline[/yellow]"
+        )
+
+    except (httpx.HTTPError, ValueError, TypeError) as e:
+        logger.warning(
+            f"Mastodon trending API error: {type(e).__name__} - {e}", exc_info=True
+        )
+        console.print(
+            f"[yellow]Trending collection failed: {e}, using public timeline[/yellow]"
+        )
+
+    return await collect_from_mastodon_public_async(engine, instance, limit)
+
+
+async def collect_from_mastodon_public_async(
+    engine: CollectionHTTPEngine, instance: str, limit: int = 20
+) -> list[CollectedItem]:
+    """Collect from one instance's public timeline via the async engine.
+
+    Args:
+        engine: Open collection HTTP engine
+        instance: Mastodon instance base URL
+        limit: Maximum number of posts to collect
+
+    Returns:
+        List of collected items from Mastodon public timeline
+    """
+    from ..config import get_config
+
+    config = get_config()
+    logger.debug(f"Starting Mastodon public timeline collection from {instance}")
+    console.print(f"[blue]Collecting from public timeline ({instance})...[/blue]")
+
+    url = urljoin(instance, "/api/v1/timelines/public")
+    params = {
+        "only_media": "false",
+        "local": "false",  # Include federated content
+        "limit": min(limit, 40),  # Mastodon's max is 40
+    }
+
+    try:
+        response = await engine.get(url, params=params)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.error(f"Mastodon HTTP error: {type(e).__name__} - {e}")
+        console.print(f"[red]✗[/red] Failed to collect from Mastodon: {e}")
+        raise
+
+    posts = response.json()
+    logger.info(f"Retrieved {len(posts)} posts from Mastodon public timeline")
+    console.print(f"[green]✓[/green] Retrieved {len(posts)} posts from public timeline")
+
+    return _process_mastodon_posts(posts, config, "public", instance)
+
+
+async def collect_from_mastodon_instances_async(
+    engine: CollectionHTTPEngine,
+    instances: list[str],
+    quota: int | None = None,
+    deadline: float | None = None,
+    max_concurrent: int | None = None,
+    stats: InstanceStatsStore | None = None,
+) -> list[CollectedItem]:
+    """Fan out across Mastodon instances until the item quota is met.
+
+    Up to ``max_concurrent`` instances run at once, each bounded by
+    ``deadline`` seconds. Results are merged as instances finish; once
+    ``quota`` items are in hand the remaining requests are cancelled and
+    queued instances are never started. With ``stats``, instances launch
+    cheapest-first (seconds per item on past runs) and this run's latency and
+    yield are recorded.
+
+    Args:
+        engine: Open collection HTTP engine
+        instances: Mastodon instance base URLs
+        quota: Items to collect before stopping (config default if None)
+        deadline: Per-instance time limit in seconds (config default if None)
+        max_concurrent: Instances in flight at once (config default if None)
+        stats: Optional latency/yield store used for ordering and recording
+
+    Returns:
+        Collected items, in the order instances finished
+    """
+    from ..config import get_config
+
+    config = get_config()
+    if quota is None:
+        quota = config.mastodon_item_quota
+    if deadline is None:
+        deadline = config.mastodon_instance_deadline
+    if max_concurrent is None:
+        max_concurrent = config.mastodon_max_concurrent_instances
+
+    queued = deque(stats.order(list(instances)) if stats else instances)
+    running: dict[asyncio.Task[list[CollectedItem]], tuple[str, float]] = {}
+    items: list[CollectedItem] = []
+
+    def launch() -> None:
+        while queued and len(running) < max(1, max_concurrent):
+            instance = queued.popleft()
+            task = asyncio.create_task(
+                asyncio.wait_for(
+                    collect_from_mastodon_trending_async(engine, instance), deadline
+                )
+            )
+            running[task] = (instance, time.perf_counter())
+
+    launch()
+    try:
+        while running and len(items) < quota:
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                instance, started = running.pop(task)
+                elapsed = time.perf_counter() - started
+                try:
+                    result = task.result()
+                except TimeoutError:
+                    logger.warning(
+                        f"Mastodon {instance} exceeded {deadline:.1f}s deadline"
+                    )
+                    if stats:
+                        stats.record(instance, elapsed, 0, failed=True)
+                    continue
+                except Exception as e:
+                    logger.error(f"Mastodon {instance} failed: {e}", exc_info=True)
+                    if stats:
+                        stats.record(instance, elapsed, 0, failed=True)
+                    continue
+
+                items.extend(result)
+                logger.info(
+                    f"Collected {len(result)} items from {instance} in {elapsed:.2f}s",
+                    extra={
+                        "source": "Mastodon",
+                        "instance": instance,
+                        "count": len(result),
+                        "elapsed_seconds": elapsed,
+                    },
+                )
+                if stats:
+                    stats.record(instance, elapsed, len(result))
+
+            if len(items) < quota:
+                launch()
+    finally:
+        # Quota met (or caller cancelled): drop in-flight and queued instances
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+        if stats:
+            stats.save()
+
+    if len(items) >= quota:
+        skipped = [instance for instance, _ in running.values()] + list(queued)
+        logger.info(
+            f"Reached {quota} items from Mastodon, stopping"
+            + (f" (cancelled {', '.join(skipped)})" if skipped else "")
+        )
+    return items
+
+
 def _process_mastodon_posts(
     posts: list, config: PipelineConfig, source_type: str, instance: str
 ) -> list[CollectedItem]:
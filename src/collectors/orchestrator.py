@@ -1,11 +1,14 @@
 """Collection utilities and orchestration.
 
 This module provides utility functions for managing collected items:
-- Saving collected items to JSON files
+- Saving collected items to NDJSON files
 - Deduplicating collected items
 - Orchestrating collection from all sources
 
-With PYTHON_GIL=0, uses parallel collection for improved performance.
+collect_all_sources_async() runs every source concurrently on a shared async
+HTTP engine (see http_engine.py); collect_all_sources() is the sequential
+fallback. stream_all_sources() yields items per source as they finish, with
+online deduplication, for the streaming pipeline (pipeline/streaming.py).
 
 LOGGING & OBSERVABILITY:
 ========================
@@ -36,8 +39,8 @@ Parallel collection includes comprehensive structured logging for tracking:
 
 import asyncio
 import time
-from concurrent.futures import ThreadPoolExecutor
-from datetime import UTC, datetime
+from collections.abc import AsyncIterator, Awaitable, Iterable
+from datetime import datetime
 from pathlib import Path
 from typing import cast
 
@@ -45,25 +48,44 @@ from rich.console import Console
 
 from ..config import get_config, get_data_dir
 from ..deduplication.dedup_feedback import DeduplicationFeedbackSystem
-from ..deduplication.semantic_dedup import SemanticDeduplicator
+from ..deduplication.semantic_dedup import ContentFeatures, SemanticDeduplicator
 from ..models import CollectedItem, PipelineConfig
-from ..utils.file_io import atomic_write_json
+from ..utils.http_cache import ItemCache, get_http_cache
 from ..utils.logging import get_logger
+from ..utils.ndjson import NDJSON_SUFFIX, NDJSONWriter
 from ..utils.url_tools import normalize_url
-from ..utils.worker_config import get_optimal_worker_count, log_worker_config
-from .github import collect_from_github_trending
-from .hackernews import collect_from_hackernews
-from .mastodon import collect_from_mastodon_trending
+from .github import collect_from_github_trending, collect_from_github_trending_async
+from .hackernews import collect_from_hackernews, collect_from_hackernews_async
+from .http_engine import CollectionHTTPEngine
+from .instance_stats import InstanceStatsStore
+from .mastodon import (
+    collect_from_mastodon_instances_async,
+    collect_from_mastodon_trending,
+)
 from .reddit import collect_from_reddit
 
 logger = get_logger(__name__)
 console = Console()
 
 
+def open_collected_writer(timestamp: str | None = None) -> NDJSONWriter:
+    """Create a streaming writer for a new collected items file.
+
+    Args:
+        timestamp: Optional timestamp for filename, defaults to now
+
+    Returns:
+        Unopened NDJSONWriter for ``data/collected_<timestamp>.ndjson``
+    """
+    if not timestamp:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return NDJSONWriter(get_data_dir() / f"collected_{timestamp}{NDJSON_SUFFIX}")
+
+
 def save_collected_items(
-    items: list[CollectedItem], timestamp: str | None = None
+    items: Iterable[CollectedItem], timestamp: str | None = None
 ) -> Path:
-    """Save collected items to JSON file.
+    """Save collected items to an NDJSON file (one item per line).
 
     Why JSON files instead of a database:
     - Simple to debug (you can open the file and see what's in it)
@@ -71,31 +93,21 @@ def save_collected_items(
     - Easy to process with other tools
     - Good enough for this scale
 
+    One item per line means items are written as they are iterated and can
+    be read back lazily (see enrichment.file_io.iter_collected_items).
+
     Args:
-        items: List of collected items to save
+        items: Collected items to save (any iterable, consumed once)
         timestamp: Optional timestamp for filename, defaults to now
 
     Returns:
         Path to the saved file
     """
-    if not timestamp:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-
-    filename = f"collected_{timestamp}.json"
-    filepath = get_data_dir() / filename
-
-    # Convert Pydantic models to dict for JSON serialization
-    data = {
-        "collected_at": datetime.now(UTC).isoformat(),
-        "total_items": len(items),
-        "items": [item.model_dump() for item in items],
-    }
-
-    # Use atomic write to prevent corruption
-    atomic_write_json(filepath, data, ensure_ascii=False, default=str)
+    with open_collected_writer(timestamp) as writer:
+        count = writer.write_many(items)
 
-    console.print(f"[green]✓[/green] Saved {len(items)} items to {filename}")
-    return filepath
+    console.print(f"[green]✓[/green] Saved {count} items to {writer.filepath.name}")
+    return writer.filepath
 
 
 def deduplicate_items(items: list[CollectedItem]) -> list[CollectedItem]:
@@ -206,140 +218,145 @@ def deduplicate_items(items: list[CollectedItem]) -> list[CollectedItem]:
     return unique_items
 
 
-async def collect_all_sources_async() -> list[CollectedItem]:
-    """Collect content from all sources in parallel using free-threading.
-
-    This function uses ThreadPoolExecutor for true parallel I/O when running
-    with PYTHON_GIL=0. Each collector runs independently with no shared state,
-    then results are merged sequentially at the end.
+class StreamingDeduplicator:
+    """Online counterpart of deduplicate_items() for items arriving over time.
 
-    Returns:
-        List of deduplicated collected items
+    Each item is checked once, against the items already accepted: first by
+    normalized URL, then by semantic similarity of precomputed features. An
+    accepted item is never withdrawn, so the first copy of a duplicate wins
+    instead of the one with the highest engagement.
     """
-    config = get_config()
 
-    console.print("[bold blue]⚡ Starting parallel content collection...[/bold blue]")
+    def __init__(
+        self,
+        threshold: float = 0.6,
+        deduplicator: SemanticDeduplicator | None = None,
+    ) -> None:
+        self.threshold = threshold
+        self.deduplicator = deduplicator or SemanticDeduplicator()
+        self._urls: set[str] = set()
+        self._features: list[ContentFeatures] = []
+        self.url_duplicates = 0
+        self.semantic_duplicates = 0
+
+    def accept(self, item: CollectedItem) -> bool:
+        """Return True (and remember the item) if it is not a duplicate."""
+        url = normalize_url(str(item.url))
+        if url in self._urls:
+            self.url_duplicates += 1
+            return False
+
+        features = self.deduplicator.extract_features(item.content)
+        for seen in self._features:
+            if self.deduplicator.feature_similarity(features, seen) >= self.threshold:
+                self.semantic_duplicates += 1
+                return False
+
+        self._urls.add(url)
+        self._features.append(features)
+        return True
+
+
+async def _timed_source(
+    name: str, coro: Awaitable[list[CollectedItem]]
+) -> tuple[list[CollectedItem], float]:
+    """Await one source's collection and return its items with elapsed time."""
+    start = time.perf_counter()
+    try:
+        items = await coro
+    except Exception as e:
+        elapsed = time.perf_counter() - start
+        logger.error(
+            f"{name} collection failed: {e}",
+            exc_info=True,
+            extra={
+                "source": name,
+                "phase": "collection",
+                "elapsed_seconds": elapsed,
+            },
+        )
+        console.print(f"[yellow]⚠[/yellow] {name} collection failed: {e}")
+        return [], elapsed
+    return items, time.perf_counter() - start
+
+
+def _source_coroutines(
+    engine: CollectionHTTPEngine, config: PipelineConfig
+) -> dict[str, Awaitable[list[CollectedItem]]]:
+    """One collection coroutine per source, keyed by display name."""
+    hn_item_cache = (
+        ItemCache("hackernews", config.http_cache_item_ttl_seconds)
+        if config.http_cache_enabled
+        else None
+    )
+    return {
+        "Mastodon": collect_from_mastodon_instances_async(
+            engine, config.mastodon_instances, stats=InstanceStatsStore()
+        ),
+        "Reddit": asyncio.to_thread(collect_from_reddit, config, 20),
+        "HackerNews": collect_from_hackernews_async(
+            engine, limit=30, item_cache=hn_item_cache
+        ),
+        "GitHub": collect_from_github_trending_async(engine, limit=20),
+    }
 
-    # Define wrapper functions for each source (isolated, no shared state)
-    def collect_mastodon_wrapper():
-        """Collect from all Mastodon instances."""
-        items = []
-        for instance in config.mastodon_instances:
-            try:
-                instance_config = PipelineConfig(
-                    openai_api_key=config.openai_api_key,
-                    mastodon_instances=[instance],
-                    articles_per_run=config.articles_per_run,
-                    min_content_length=config.min_content_length,
-                    max_content_length=config.max_content_length,
-                )
-                mastodon_items = collect_from_mastodon_trending(instance_config)
-                items.extend(mastodon_items)
-                logger.info(f"Collected {len(mastodon_items)} items from {instance}")
-
-                if len(items) >= 80:
-                    logger.info("Reached 80 items from Mastodon, stopping")
-                    break
-            except Exception as e:
-                logger.error(f"Mastodon {instance} failed: {e}", exc_info=True)
-                continue
-        return items
 
-    def collect_reddit_wrapper():
-        """Collect from Reddit."""
-        try:
-            items = collect_from_reddit(config, limit=20)
-            logger.info(f"Collected {len(items)} items from Reddit")
-            return items
-        except Exception as e:
-            logger.error(f"Reddit collection failed: {e}", exc_info=True)
-            return []
+async def collect_all_sources_async(
+    engine: CollectionHTTPEngine | None = None,
+) -> list[CollectedItem]:
+    """Collect content from all sources concurrently.
 
-    def collect_hn_wrapper():
-        """Collect from HackerNews."""
-        try:
-            items = collect_from_hackernews(limit=30)
-            logger.info(f"Collected {len(items)} items from HackerNews")
-            return items
-        except Exception as e:
-            logger.error(f"HackerNews collection failed: {e}", exc_info=True)
-            return []
+    HTTP sources (Mastodon, HackerNews, GitHub) share one pooled
+    ``httpx.AsyncClient`` via CollectionHTTPEngine, which enforces per-host
+    concurrency and rate limits. Mastodon instances fan out concurrently until
+    ``config.mastodon_item_quota`` is met, and HN item fetches run
+    concurrently, so wall-clock time is close to the slowest single source.
+    Reddit goes through PRAW, which is synchronous, so it runs in a worker
+    thread alongside the async sources.
 
-    def collect_github_wrapper():
-        """Collect from GitHub Trending."""
-        try:
-            items = collect_from_github_trending(limit=20)
-            logger.info(f"Collected {len(items)} items from GitHub")
-            return items
-        except Exception as e:
-            logger.error(f"GitHub collection failed: {e}", exc_info=True)
-            return []
+    Responses are revalidated against data/http_cache/ (ETag/Last-Modified)
+    and HN items younger than ``config.http_cache_item_ttl_seconds`` are
+    reused without a request, so repeat runs mostly see 304s and cache hits.
+
+    Args:
+        engine: Open engine to reuse (a new one, with the shared HTTP cache,
+            is created and closed if None)
+
+    Returns:
+        List of deduplicated collected items
+    """
+    if engine is None:
+        async with CollectionHTTPEngine(cache=get_http_cache()) as owned_engine:
+            return await collect_all_sources_async(owned_engine)
+
+    console.print("[bold blue]⚡ Starting parallel content collection...[/bold blue]")
 
-    # Parallel phase: each thread isolated, no sharing
     collection_start = time.perf_counter()
     console.print(
         "[bold blue]⚡ Launching parallel collection from 4 sources...[/bold blue]"
     )
 
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-    source_names = ["Mastodon", "Reddit", "HackerNews", "GitHub"]
-    source_start_times = {name: time.perf_counter() for name in source_names}
-
-    # Determine optimal worker count based on environment and resources
-    optimal_workers = get_optimal_worker_count(use_case="collection", max_limit=4)
-    logger.info(
-        "Parallel collection starting with optimal worker configuration",
-        extra=log_worker_config("collection", optimal_workers),
+    sources = _source_coroutines(engine, get_config())
+    results = await asyncio.gather(
+        *(_timed_source(name, coro) for name, coro in sources.items())
     )
 
-    with ThreadPoolExecutor(max_workers=optimal_workers) as executor:
-        futures = [
-            loop.run_in_executor(executor, collect_mastodon_wrapper),
-            loop.run_in_executor(executor, collect_reddit_wrapper),
-            loop.run_in_executor(executor, collect_hn_wrapper),
-            loop.run_in_executor(executor, collect_github_wrapper),
-        ]
-        results = await asyncio.gather(*futures, return_exceptions=True)
-
-    # Sequential merge: no locks needed
     all_items = []
-    for i, result in enumerate(results):
-        source_elapsed = time.perf_counter() - source_start_times[source_names[i]]
-        if isinstance(result, Exception):
-            logger.error(
-                f"{source_names[i]} collection failed: {result}",
-                exc_info=(type(result), result, result.__traceback__),
-                extra={
-                    "source": source_names[i],
-                    "phase": "collection",
-                    "elapsed_seconds": source_elapsed,
-                },
-            )
-            console.print(
-                f"[yellow]⚠[/yellow] {source_names[i]} collection failed: {result}"
-            )
-            continue
-        if isinstance(result, list):
-            all_items.extend(result)
-            logger.info(
-                f"{source_names[i]} collected {len(result)} items in {source_elapsed:.2f}s",
-                extra={
-                    "source": source_names[i],
-                    "count": len(result),
-                    "elapsed_seconds": source_elapsed,
-                },
-            )
+    for name, (items, source_elapsed) in zip(sources, results, strict=True):
+        all_items.extend(items)
+        logger.info(
+            f"{name} collected {len(items)} items in {source_elapsed:.2f}s",
+            extra={
+                "source": name,
+                "count": len(items),
+                "elapsed_seconds": source_elapsed,
+            },
+        )
 
     collection_elapsed = time.perf_counter() - collection_start
     console.print(f"\n[bold]Total items before deduplication: {len(all_items)}[/bold]")
     console.print(f"[dim]Collection time: {collection_elapsed:.2f}s[/dim]")
 
-    # Deduplication reads immutable patterns - no locks needed
     dedup_start = time.perf_counter()
     unique_items = deduplicate_items(all_items)
     dedup_elapsed = time.perf_counter() - dedup_start
@@ -360,6 +377,73 @@ async def collect_all_sources_async() -> list[CollectedItem]:
     return unique_items
 
 
+async def stream_all_sources(
+    engine: CollectionHTTPEngine | None = None,
+    deduplicator: StreamingDeduplicator | None = None,
+) -> AsyncIterator[CollectedItem]:
+    """Yield collected items as each source finishes, deduplicated online.
+
+    Sources run concurrently exactly as in collect_all_sources_async(), but
+    instead of waiting for the slowest source and a batch deduplication pass,
+    each source's items are yielded as soon as that source completes. Used by
+    the streaming pipeline so enrichment can start on the fastest source.
+
+    Args:
+        engine: Open engine to reuse (a new one, with the shared HTTP cache,
+            is created and closed if None)
+        deduplicator: Online deduplicator (a new one if None)
+
+    Yields:
+        Unique collected items in source completion order
+    """
+    if engine is None:
+        async with CollectionHTTPEngine(cache=get_http_cache()) as owned_engine:
+            async for item in stream_all_sources(owned_engine, deduplicator):
+                yield item
+        return
+
+    deduplicator = deduplicator or StreamingDeduplicator()
+    sources = _source_coroutines(engine, get_config())
+
+    async def run(name: str, coro: Awaitable[list[CollectedItem]]):
+        items, elapsed = await _timed_source(name, coro)
+        return name, items, elapsed
+
+    tasks = [asyncio.create_task(run(name, coro)) for name, coro in sources.items()]
+    total = 0
+    unique = 0
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            name, items, elapsed = await next_done
+            total += len(items)
+            logger.info(
+                f"{name} collected {len(items)} items in {elapsed:.2f}s",
+                extra={
+                    "source": name,
+                    "count": len(items),
+                    "elapsed_seconds": elapsed,
+                },
+            )
+            for item in items:
+                if deduplicator.accept(item):
+                    unique += 1
+                    yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    logger.info(
+        f"Streaming collection completed: {unique} unique of {total} items "
+        f"({deduplicator.url_duplicates} URL and "
+        f"{deduplicator.semantic_duplicates} semantic duplicates)",
+        extra={"total_items": total, "unique_items": unique},
+    )
+    console.print(
+        f"[bold green]Collected {unique} unique items ({total} before dedup)[/bold green]"
+    )
+
+
 def collect_all_sources() -> list[CollectedItem]:
     """Collect content from all configured sources.
 
@@ -34,6 +34,23 @@ def _optional_float(env_var: str) -> float | None:
         raise ValueError(f"Invalid float value for {env_var}: {value}") from exc
 
 
+def _optional_int(env_var: str) -> int | None:
+    value = os.getenv(env_var)
+    if value is None or value.strip() == "":
+        return None
+    try:
+        return int(value)
+    except ValueError as exc:
+        raise ValueError(f"Invalid integer value for {env_var}: {value}") from exc
+
+
+def _optional_list(env_var: str) -> list[str] | None:
+    value = os.getenv(env_var)
+    if value is None or value.strip() == "":
+        return None
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
 def _env_model(primary: str, legacy: str, default: str) -> str:
     """Resolve model env vars with backward-compatible fallbacks."""
 
@@ -126,9 +143,55 @@ def _build_config() -> PipelineConfig:
             "MASTODON_INSTANCES", "https://hachyderm.io"
         ).split(","),
         mastodon_access_token=os.getenv("MASTODON_ACCESS_TOKEN"),
+        mastodon_item_quota=int(os.getenv("MASTODON_ITEM_QUOTA", "80")),
+        mastodon_instance_deadline=float(
+            os.getenv("MASTODON_INSTANCE_DEADLINE", "20.0")
+        ),
+        mastodon_max_concurrent_instances=int(
+            os.getenv("MASTODON_MAX_CONCURRENT_INSTANCES", "4")
+        ),
         reddit_client_id=os.getenv("REDDIT_CLIENT_ID"),
         reddit_client_secret=os.getenv("REDDIT_CLIENT_SECRET"),
         reddit_user_agent=os.getenv("REDDIT_USER_AGENT"),
+        http_cache_enabled=os.getenv("HTTP_CACHE_ENABLED", "true").lower() == "true",
+        http_cache_item_ttl_seconds=int(
+            os.getenv("HTTP_CACHE_ITEM_TTL_SECONDS", "10800")
+        ),
+        http_cache_max_age_days=int(os.getenv("HTTP_CACHE_MAX_AGE_DAYS", "30")),
+        http_cache_max_entries=int(os.getenv("HTTP_CACHE_MAX_ENTRIES", "5000")),
+        openai_max_connections=int(os.getenv("OPENAI_MAX_CONNECTIONS", "20")),
+        openai_max_keepalive_connections=int(
+            os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "10")
+        ),
+        openai_keepalive_expiry=float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", "60.0")),
+        openai_http2=os.getenv("OPENAI_HTTP2", "true").lower() == "true",
+        openai_rate_limiting=os.getenv("OPENAI_RATE_LIMITING", "true").lower()
+        == "true",
+        openai_requests_per_minute=_optional_int("OPENAI_REQUESTS_PER_MINUTE"),
+        openai_tokens_per_minute=_optional_int("OPENAI_TOKENS_PER_MINUTE"),
+        llm_cache_enabled=os.getenv("LLM_CACHE_ENABLED", "false").lower() == "true",
+        llm_cache_ttl_seconds=int(os.getenv("LLM_CACHE_TTL_SECONDS", "604800")),
+        llm_cache_max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000")),
+        **(
+            {"llm_cache_stages": llm_cache_stages}
+            if (llm_cache_stages := _optional_list("LLM_CACHE_STAGES")) is not None
+            else {}
+        ),
+        enrichment_batch_size=int(os.getenv("ENRICHMENT_BATCH_SIZE", "1")),
+        enrichment_concurrency=int(os.getenv("ENRICHMENT_CONCURRENCY", "32")),
+        enrichment_early_stop=os.getenv("ENRICHMENT_EARLY_STOP", "false").lower()
+        == "true",
+        enrichment_ready_margin=int(os.getenv("ENRICHMENT_READY_MARGIN", "5")),
+        quality_threshold=float(os.getenv("QUALITY_THRESHOLD", "0.5")),
+        generation_max_concurrency=int(os.getenv("GENERATION_MAX_CONCURRENCY", "8")),
+        parallel_article_stages=os.getenv("PARALLEL_ARTICLE_STAGES", "true").lower()
+        == "true",
+        adaptive_concurrency=os.getenv("ADAPTIVE_CONCURRENCY", "true").lower()
+        == "true",
+        adaptive_adjustment_interval=float(
+            os.getenv("ADAPTIVE_ADJUSTMENT_INTERVAL", "10.0")
+        ),
+        pipeline_queue_size=int(os.getenv("PIPELINE_QUEUE_SIZE", "32")),
         reddit_requests_per_minute=int(os.getenv("REDDIT_REQUESTS_PER_MINUTE", "30")),
         reddit_burst=int(os.getenv("REDDIT_BURST", "5")),
         reddit_request_interval_seconds=float(
@@ -159,6 +222,7 @@ def _build_config() -> PipelineConfig:
         == "true",
         enable_citations=os.getenv("ENABLE_CITATIONS", "true").lower() == "true",
         citations_cache_ttl_days=int(os.getenv("CITATIONS_CACHE_TTL_DAYS", "30")),
+        citation_max_concurrency=int(os.getenv("CITATION_MAX_CONCURRENCY", "4")),
         # Image selection - multi-source fallback
         unsplash_api_key=os.getenv("UNSPLASH_API_KEY", ""),
         pexels_api_key=os.getenv("PEXELS_API_KEY", ""),
@@ -221,6 +285,7 @@ def _build_config() -> PipelineConfig:
         max_secondary_references=int(os.getenv("MAX_SECONDARY_REFERENCES", "3")),
         max_cost_per_run=_optional_float("MAX_COST_PER_RUN"),
         max_cost_per_article=_optional_float("MAX_COST_PER_ARTICLE"),
+        budget_wait_seconds=float(os.getenv("BUDGET_WAIT_SECONDS", "30.0")),
         # Fact-check policy (validation)
         fact_check_mode=os.getenv("FACT_CHECK_MODE", "strict").lower(),
         fact_check_max_broken_links=int(os.getenv("FACT_CHECK_MAX_BROKEN_LINKS", "0")),
@@ -235,6 +300,17 @@ def _build_config() -> PipelineConfig:
             os.getenv("FACT_CHECK_RETRY_BACKOFF_MAX", "8.0")
         ),
         fact_check_retry_jitter=float(os.getenv("FACT_CHECK_RETRY_JITTER", "0.1")),
+        fact_check_max_concurrency=int(os.getenv("FACT_CHECK_MAX_CONCURRENCY", "16")),
+        fact_check_per_host_limit=int(os.getenv("FACT_CHECK_PER_HOST_LIMIT", "2")),
+        fact_check_deadline_seconds=float(
+            os.getenv("FACT_CHECK_DEADLINE_SECONDS", "60.0")
+        ),
+        fact_check_cache_ttl_seconds=int(
+            os.getenv("FACT_CHECK_CACHE_TTL_SECONDS", "86400")
+        ),
+        fact_check_cache_failure_ttl_seconds=int(
+            os.getenv("FACT_CHECK_CACHE_FAILURE_TTL_SECONDS", "3600")
+        ),
     )
 
     # Validate required keys (except in test environment)
@@ -19,6 +19,7 @@ from openai import OpenAI
 
 from ..config import get_config
 from ..models import GeneratedArticle
+from ..utils.clients import get_shared_openai_client
 from ..utils.logging import get_logger
 from ..utils.openai_wrapper import chat_completion
 
@@ -97,10 +98,10 @@ class ArticleReviewer:
         """Initialize reviewer with OpenAI client.
 
         Args:
-            client: Optional OpenAI client (creates new if None)
+            client: Optional OpenAI client (uses the shared client if None)
         """
         self.config = get_config()
-        self.client = client or OpenAI(api_key=self.config.openai_api_key)
+        self.client = client or get_shared_openai_client(self.config)
         logger.debug("ArticleReviewer initialized")
 
     def review_article(
@@ -8,11 +8,20 @@ import re
 from dataclasses import dataclass
 
 from ..models import GeneratedArticle
+from ..utils.keyword_matcher import KeywordMatcher
 from ..utils.logging import get_logger
 from .readability import ReadabilityAnalyzer
 
 logger = get_logger(__name__)
 
+# Tone markers checked by QualityScorer._score_tone
+_TONE_MARKERS = KeywordMatcher(
+    {
+        "casual": ["lol", "omg", "btw", "imho", "gonna", "wanna"],
+        "second_person": ["you will", "you can", "let's", "we'll"],
+    }
+)
+
 
 @dataclass
 class QualityScore:
@@ -350,25 +359,18 @@ class QualityScorer:
         """
         score = 100.0  # Start with perfect, deduct for issues
 
-        content_lower = content.lower()
+        markers = _TONE_MARKERS.counts(content)
 
         # Check for inappropriate casual language in formal content
         if content_type in ["research", "analysis"]:
-            casual_markers = ["lol", "omg", "btw", "imho", "gonna", "wanna"]
-            casual_count = sum(
-                1 for marker in casual_markers if marker in content_lower
-            )
+            casual_count = markers["casual"]
             if casual_count > 0:
                 score -= casual_count * 10
 
         # Check for overly formal language in tutorials
         if content_type == "tutorial":
             # Should use second person
-            has_second_person = any(
-                word in content_lower
-                for word in ["you will", "you can", "let's", "we'll"]
-            )
-            if not has_second_person:
+            if markers["second_person"] == 0:
                 score -= 20
 
         # Check for appropriate technical depth indicators
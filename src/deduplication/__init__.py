@@ -20,6 +20,7 @@ Components:
 - story_clustering: Group related stories together
 - adaptive_dedup: Learning-based deduplication
 - post_gen_dedup: Post-generation duplicate detection
+- near_dup_index: Persistent MinHash LSH candidates for post-generation checks
 - recent_content_cache: Track recently published content
 - dedup_feedback: User feedback processing
 
@@ -56,6 +57,7 @@ Deduplication Strategies:
 # Import all deduplication modules
 from .adaptive_dedup import AdaptiveDedupFeedback
 from .dedup_feedback import DeduplicationFeedback, DeduplicationFeedbackSystem
+from .near_dup_index import NearDuplicateIndex, get_near_duplicate_index
 from .post_gen_dedup import (
     calculate_entity_similarity,
     extract_entities,
@@ -66,6 +68,7 @@ from .recent_content_cache import RecentContentCache
 from .semantic_dedup import DuplicationPattern, SemanticDeduplicator
 from .story_clustering import (
     StoryCluster,
+    StoryClusterer,
     filter_duplicate_stories,
     find_story_clusters,
     report_story_clusters,
@@ -80,6 +83,7 @@ __all__ = [
     "filter_duplicate_stories",
     "report_story_clusters",
     "StoryCluster",
+    "StoryClusterer",
     # Adaptive deduplication
     "AdaptiveDedupFeedback",
     # Post-generation deduplication
@@ -87,6 +91,8 @@ __all__ = [
     "report_duplicate_candidates",
     "calculate_entity_similarity",
     "extract_entities",
+    "NearDuplicateIndex",
+    "get_near_duplicate_index",
     # Recent content cache
     "RecentContentCache",
     # Feedback
@@ -0,0 +1,531 @@
+"""Persistent MinHash LSH index for post-generation duplicate checks.
+
+``find_duplicate_articles`` scored every pair of articles with
+``check_articles_for_duplicates`` (SequenceMatcher over titles, summaries
+and bodies), so each new article cost one full comparison per published
+article. This module narrows the comparison to likely candidates first:
+
+- Every article gets three MinHash signatures: over its topic features
+  (title keywords, entities, tags), over its tag set alone (the
+  summary-plus-tags rule fires on matching tags even when titles differ)
+  and over word 3-shingles of its body
+- Signatures are cut into bands of ``ROWS`` values (locality-sensitive
+  hashing); articles sharing a band in any signature are candidates, and
+  only candidates are scored with the existing rules
+- The index over ``content/posts`` is persisted to
+  ``data/near_dup_index.json``, refreshed incrementally from the article
+  index (mtime/size) and updated by ``save_article_to_file`` after each write
+
+With 128 permutations in bands of 2, sets with a Jaccard similarity of 0.2
+become candidates with ~93% probability, 0.3 with >99%, while unrelated
+bodies (Jaccard ~0.01) almost never collide. Candidate selection is
+approximate by design; ``find_duplicate_articles(..., exhaustive=True)``
+still compares every pair.
+
+Usage:
+    index = get_near_duplicate_index()
+    duplicates = index.find_duplicates(article_data)  # scored candidates only
+    pairs = index.duplicate_pairs()  # whole archive
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+import random
+import re
+import struct
+import threading
+import zlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+
+import frontmatter
+
+from ..config import get_content_dir, get_project_root
+from ..utils.article_index import PARSE_ERRORS, get_article_index
+from ..utils.file_io import atomic_write_json
+from ..utils.logging import get_logger
+from .post_gen_dedup import (
+    DuplicateCandidate,
+    check_articles_for_duplicates,
+    extract_entities,
+    extract_keywords,
+)
+
+logger = get_logger(__name__)
+
+INDEX_VERSION = 1
+NUM_PERM = 128
+ROWS = 2
+SHINGLE_WORDS = 3
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_rng = random.Random(1)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERM)
+]
+_WORD_RE = re.compile(r"[a-z0-9]+(?:['’-][a-z0-9]+)*")
+
+
+# ----------------------------------------------------------------------
+# Features and signatures
+# ----------------------------------------------------------------------
+
+
+def topic_features(title: str, summary: str, tags: Iterable[str]) -> set[str]:
+    """Features behind the title, entity and tag rules of the scorer."""
+    features = {f"k:{keyword}" for keyword in extract_keywords(title)}
+    features.update(f"e:{entity}" for entity in extract_entities(f"{title} {summary}"))
+    features.update(f"t:{tag}" for tag in tag_features(tags))
+    return features
+
+
+def tag_features(tags: Iterable[str]) -> set[str]:
+    return {str(tag).lower() for tag in tags}
+
+
+def body_features(content: str) -> set[str]:
+    """Word shingles of the normalized body (empty for very short bodies)."""
+    words = _WORD_RE.findall(content.lower())
+    return {
+        " ".join(words[i : i + SHINGLE_WORDS])
+        for i in range(len(words) - SHINGLE_WORDS + 1)
+    }
+
+
+def minhash(features: Iterable[str]) -> tuple[int, ...]:
+    """MinHash signature of a feature set (empty tuple for an empty set).
+
+    Features are hashed with CRC-32 (stable across processes, unlike
+    ``hash()``) and permuted with ``(a * x + b) mod (2^61 - 1)``.
+    """
+    hashes = {zlib.crc32(feature.encode("utf-8")) for feature in features}
+    if not hashes:
+        return ()
+    return tuple(
+        min([(a * x + b) % _MERSENNE_PRIME for x in hashes]) & _MAX_HASH
+        for a, b in _PERMUTATIONS
+    )
+
+
+def _encode(signature: tuple[int, ...]) -> str:
+    return base64.b64encode(struct.pack(f">{len(signature)}I", *signature)).decode()
+
+
+def _decode(text: str) -> tuple[int, ...]:
+    raw = base64.b64decode(text)
+    return struct.unpack(f">{len(raw) // 4}I", raw)
+
+
+@dataclass(frozen=True)
+class ArticleSignature:
+    """MinHash signatures of one article."""
+
+    topic: tuple[int, ...]
+    tags: tuple[int, ...]
+    body: tuple[int, ...]
+
+    @classmethod
+    def from_article(cls, article: dict) -> ArticleSignature:
+        """Signatures for an article dict (title, summary, tags, content)."""
+        tags = article.get("tags") or []
+        return cls(
+            topic=minhash(
+                topic_features(
+                    article.get("title", ""), article.get("summary", ""), tags
+                )
+            ),
+            tags=minhash(tag_features(tags)),
+            body=minhash(body_features(article.get("content") or "")),
+        )
+
+
+class MinHashLSH:
+    """Banded LSH buckets over MinHash signatures (in memory)."""
+
+    def __init__(self, rows: int = ROWS) -> None:
+        self.rows = rows
+        self._buckets: dict[tuple[int, ...], set[str]] = {}
+        self._keys: dict[str, list[tuple[int, ...]]] = {}
+
+    def _bands(self, signature: tuple[int, ...]) -> list[tuple[int, ...]]:
+        return [
+            (band, *signature[start : start + self.rows])
+            for band, start in enumerate(range(0, len(signature), self.rows))
+        ]
+
+    def insert(self, key: str, signature: tuple[int, ...]) -> None:
+        self.remove(key)
+        bands = self._bands(signature)
+        self._keys[key] = bands
+        for band in bands:
+            self._buckets.setdefault(band, set()).add(key)
+
+    def remove(self, key: str) -> None:
+        for band in self._keys.pop(key, ()):
+            bucket = self._buckets[band]
+            bucket.discard(key)
+            if not bucket:
+                del self._buckets[band]
+
+    def query(self, signature: tuple[int, ...]) -> set[str]:
+        """Keys sharing at least one band with the signature."""
+        found: set[str] = set()
+        for band in self._bands(signature):
+            found.update(self._buckets.get(band, ()))
+        return found
+
+
+class _SignatureLSH:
+    """One LSH per signature kind; a match in any of them makes a candidate."""
+
+    def __init__(self) -> None:
+        self._topic = MinHashLSH()
+        self._tags = MinHashLSH()
+        self._body = MinHashLSH()
+
+    def insert(self, key: str, signature: ArticleSignature) -> None:
+        self._topic.insert(key, signature.topic)
+        self._tags.insert(key, signature.tags)
+        self._body.insert(key, signature.body)
+
+    def remove(self, key: str) -> None:
+        self._topic.remove(key)
+        self._tags.remove(key)
+        self._body.remove(key)
+
+    def query(self, signature: ArticleSignature) -> set[str]:
+        return (
+            self._topic.query(signature.topic)
+            | self._tags.query(signature.tags)
+            | self._body.query(signature.body)
+        )
+
+
+def candidate_pairs(articles: list[dict]) -> list[tuple[int, int]]:
+    """Index pairs ``(i, j)``, ``i < j``, that share an LSH bucket."""
+    index = _SignatureLSH()
+    pairs: set[tuple[int, int]] = set()
+    for j, article in enumerate(articles):
+        signature = ArticleSignature.from_article(article)
+        pairs.update((int(i), j) for i in index.query(signature))
+        index.insert(str(j), signature)
+    return sorted(pairs)
+
+
+def load_article(filepath: Path) -> dict | None:
+    """Article dict in the shape ``check_articles_for_duplicates`` expects."""
+    try:
+        post = frontmatter.load(str(filepath))
+    except PARSE_ERRORS as e:
+        logger.warning(f"Failed to load article {filepath}: {e}")
+        return None
+    meta = post.metadata or {}
+    tags = meta.get("tags") or []
+    if not isinstance(tags, list):
+        tags = [tags]
+    return {
+        "path": str(filepath),
+        "title": str(meta.get("title") or ""),
+        "summary": str(meta.get("summary") or ""),
+        "tags": [str(tag) for tag in tags],
+        "content": post.content,
+    }
+
+
+# ----------------------------------------------------------------------
+# Persistent index
+# ----------------------------------------------------------------------
+
+
+@dataclass
+class _Entry:
+    mtime_ns: int
+    size: int
+    signature: ArticleSignature
+
+
+class NearDuplicateIndex:
+    """LSH index over published articles, kept in step with the article index.
+
+    All public methods take the index lock, so a single instance can be
+    shared across generation worker threads.
+    """
+
+    def __init__(self, content_dir: Path, index_file: Path | None = None) -> None:
+        """Initialize the index and bring it up to date with the directory.
+
+        Args:
+            content_dir: Directory containing article markdown files
+            index_file: Where to persist signatures (None keeps them in memory)
+        """
+        self.content_dir = Path(content_dir)
+        self.index_file = index_file
+        self._lock = threading.RLock()
+        self._entries: dict[str, _Entry] = {}
+        self._lsh = _SignatureLSH()
+        self._load()
+        self.refresh()
+
+    def _load(self) -> None:
+        """Load persisted signatures; mismatched or corrupt files are ignored."""
+        if not self.index_file or not self.index_file.exists():
+            return
+        try:
+            with open(self.index_file, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION or data.get("num_perm") != NUM_PERM:
+                logger.info("Near-duplicate index format changed; rebuilding")
+                return
+            for name, raw in data.get("articles", {}).items():
+                self._entries[name] = _Entry(
+                    mtime_ns=raw["mtime_ns"],
+                    size=raw["size"],
+                    signature=ArticleSignature(
+                        topic=_decode(raw["topic"]),
+                        tags=_decode(raw["tags"]),
+                        body=_decode(raw["body"]),
+                    ),
+                )
+        except (OSError, ValueError, TypeError, KeyError, struct.error) as e:
+            logger.warning(f"Ignoring unreadable near-duplicate index: {e}")
+            self._entries = {}
+        for name, entry in self._entries.items():
+            self._insert(name, entry)
+
+    def _save(self) -> None:
+        if not self.index_file:
+            return
+        data = {
+            "version": INDEX_VERSION,
+            "num_perm": NUM_PERM,
+            "articles": {
+                name: {
+                    "mtime_ns": entry.mtime_ns,
+                    "size": entry.size,
+                    "topic": _encode(entry.signature.topic),
+                    "tags": _encode(entry.signature.tags),
+                    "body": _encode(entry.signature.body),
+                }
+                for name, entry in sorted(self._entries.items())
+            },
+        }
+        try:
+            atomic_write_json(self.index_file, data, indent=None)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to persist near-duplicate index: {e}")
+
+    def _insert(self, name: str, entry: _Entry) -> None:
+        self._entries[name] = entry
+        self._lsh.insert(name, entry.signature)
+
+    def _remove(self, name: str) -> None:
+        self._entries.pop(name, None)
+        self._lsh.remove(name)
+
+    def refresh(self) -> int:
+        """Re-sign articles whose mtime or size changed; drop deleted ones.
+
+        Returns:
+            Number of entries added, updated or removed
+        """
+        records = get_article_index(self.content_dir).records()
+        with self._lock:
+            changed = 0
+            seen = set()
+            for record in records:
+                seen.add(record.filename)
+                existing = self._entries.get(record.filename)
+                if (
+                    existing
+                    and existing.mtime_ns == record.mtime_ns
+                    and existing.size == record.size
+                ):
+                    continue
+                article = load_article(self.content_dir / record.filename)
+                if article is None:
+                    self._remove(record.filename)
+                else:
+                    self._insert(
+                        record.filename,
+                        _Entry(
+                            record.mtime_ns,
+                            record.size,
+                            ArticleSignature.from_article(article),
+                        ),
+                    )
+                changed += 1
+
+            for name in set(self._entries) - seen:
+                self._remove(name)
+                changed += 1
+
+            if changed:
+                self._save()
+                logger.debug(
+                    f"Near-duplicate index refreshed: {changed} changes, "
+                    f"{len(self._entries)} articles"
+                )
+            return changed
+
+    def update(self, filepath: Path) -> list[DuplicateCandidate]:
+        """Re-sign a file after it was written and check it for duplicates.
+
+        Returns:
+            Duplicates of the article among its LSH candidates, highest
+            overall score first (empty if the file is gone or unreadable)
+        """
+        filepath = Path(filepath)
+        with self._lock:
+            try:
+                stat = filepath.stat()
+            except FileNotFoundError:
+                self._remove(filepath.name)
+                self._save()
+                return []
+            except OSError as e:
+                logger.warning(f"Failed to index {filepath}: {e}")
+                return []
+            article = load_article(filepath)
+            if article is None:
+                # Drop the signature of the last readable version
+                if filepath.name in self._entries:
+                    self._remove(filepath.name)
+                    self._save()
+                return []
+            signature = ArticleSignature.from_article(article)
+            duplicates = self._score(
+                article, self._candidates(signature, exclude=filepath.name)
+            )
+            self._insert(
+                filepath.name, _Entry(stat.st_mtime_ns, stat.st_size, signature)
+            )
+            self._save()
+            return duplicates
+
+    def _candidates(
+        self, signature: ArticleSignature, exclude: str | None = None
+    ) -> list[str]:
+        names = self._lsh.query(signature)
+        names.discard(exclude)
+        return sorted(names)
+
+    def _score(self, article: dict, names: list[str]) -> list[DuplicateCandidate]:
+        duplicates = []
+        for name in names:
+            other = load_article(self.content_dir / name)
+            if other is None:
+                continue
+            candidate = check_articles_for_duplicates(article, other)
+            if candidate:
+                duplicates.append(candidate)
+        duplicates.sort(key=lambda x: x.overall_score, reverse=True)
+        return duplicates
+
+    def candidates(self, article: dict, exclude: str | None = None) -> list[str]:
+        """Filenames sharing an LSH bucket with the article."""
+        signature = ArticleSignature.from_article(article)
+        with self._lock:
+            return self._candidates(signature, exclude=exclude)
+
+    def find_duplicates(
+        self, article: dict, exclude: str | None = None
+    ) -> list[DuplicateCandidate]:
+        """Score an article against its LSH candidates only.
+
+        Args:
+            article: Article dict with title, summary, tags, content, path
+            exclude: Filename to skip (the article itself, if published)
+
+        Returns:
+            DuplicateCandidate pairs sorted by overall_score (highest first)
+        """
+        signature = ArticleSignature.from_article(article)
+        with self._lock:
+            return self._score(article, self._candidates(signature, exclude=exclude))
+
+    def duplicate_pairs(self) -> list[DuplicateCandidate]:
+        """Duplicate pairs across the whole index, scoring candidates only."""
+        with self._lock:
+            pairs: set[tuple[str, str]] = set()
+            for name, entry in self._entries.items():
+                for other in self._candidates(entry.signature, exclude=name):
+                    pairs.add((min(name, other), max(name, other)))
+
+            loaded: dict[str, dict | None] = {}
+
+            def article(name: str) -> dict | None:
+                if name not in loaded:
+                    loaded[name] = load_article(self.content_dir / name)
+                return loaded[name]
+
+            duplicates = []
+            for first, second in sorted(pairs):
+                article1, article2 = article(first), article(second)
+                if article1 is None or article2 is None:
+                    continue
+                candidate = check_articles_for_duplicates(article1, article2)
+                if candidate:
+                    duplicates.append(candidate)
+            duplicates.sort(key=lambda x: x.overall_score, reverse=True)
+            logger.info(
+                f"Checked {len(pairs)} candidate pairs across "
+                f"{len(self._entries)} articles: {len(duplicates)} duplicates",
+                extra={
+                    "phase": "dedup",
+                    "event": "near_duplicates_checked",
+                    "articles": len(self._entries),
+                    "candidate_pairs": len(pairs),
+                    "duplicates": len(duplicates),
+                },
+            )
+            return duplicates
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_INDEXES: dict[Path, NearDuplicateIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_near_duplicate_index(content_dir: Path | None = None) -> NearDuplicateIndex:
+    """Return the process-wide near-duplicate index for a content directory.
+
+    The default content directory is persisted to
+    ``data/near_dup_index.json``. Each call re-signs only articles whose
+    mtime/size changed; ``save_article_to_file`` updates entries directly via
+    :meth:`NearDuplicateIndex.update`.
+    """
+    content_dir = Path(content_dir) if content_dir is not None else get_content_dir()
+    key = content_dir.resolve()
+    project_root = get_project_root()
+
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index_file = (
+                project_root / "data" / "near_dup_index.json"
+                if key == (project_root / "content" / "posts").resolve()
+                else None
+            )
+            index = NearDuplicateIndex(content_dir, index_file=index_file)
+            _INDEXES[key] = index
+            return index
+
+    index.refresh()
+    return index
+
+
+def _reset_near_duplicate_indexes() -> None:
+    """Drop cached index instances.
+
+    INTERNAL: Only meant for tests.
+    """
+    with _INDEXES_LOCK:
+        _INDEXES.clear()
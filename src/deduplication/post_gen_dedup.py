@@ -9,6 +9,7 @@ See: docs/ADR-002-ENHANCED-DEDUPLICATION.md
 
 import re
 from difflib import SequenceMatcher
+from itertools import combinations
 from pathlib import Path
 from typing import NamedTuple
 
@@ -156,6 +157,12 @@ def extract_entities(text: str) -> set[str]:
     return entities
 
 
+def extract_keywords(text: str) -> set[str]:
+    """Extract significant keywords (>4 chars) from text."""
+    words = text.lower().split()
+    return {w.strip(".,!?;:") for w in words if len(w) > 4 and not w.startswith("http")}
+
+
 def calculate_entity_similarity(entities1: set[str], entities2: set[str]) -> float:
     """
     Calculate similarity based on shared entities.
@@ -247,13 +254,6 @@ def check_articles_for_duplicates(
         content_sim = calculate_content_similarity(content1, content2)
 
     # NEW: Keyword overlap - extract significant keywords (>4 chars) from titles
-    def extract_keywords(text: str) -> set[str]:
-        """Extract significant keywords (>4 chars) from text."""
-        words = text.lower().split()
-        return {
-            w.strip(".,!?;:") for w in words if len(w) > 4 and not w.startswith("http")
-        }
-
     keywords1 = extract_keywords(title1)
     keywords2 = extract_keywords(title2)
     keyword_overlap = (
@@ -367,23 +367,34 @@ def check_articles_for_duplicates(
     return None
 
 
-def find_duplicate_articles(articles: list[dict]) -> list[DuplicateCandidate]:
+def find_duplicate_articles(
+    articles: list[dict], exhaustive: bool = False
+) -> list[DuplicateCandidate]:
     """
     Find all likely duplicate pairs in a list of articles.
 
+    Only pairs that share a MinHash LSH bucket (see near_dup_index.py) are
+    scored, instead of every pair.
+
     Args:
         articles: List of article metadata dicts
+        exhaustive: Score every pair (quadratic; the pre-LSH behaviour)
 
     Returns:
         List of DuplicateCandidate pairs sorted by overall_score (highest first)
     """
-    duplicates = []
+    from .near_dup_index import candidate_pairs
+
+    if exhaustive:
+        pairs = combinations(range(len(articles)), 2)
+    else:
+        pairs = candidate_pairs(articles)
 
-    for i, article1 in enumerate(articles):
-        for article2 in articles[i + 1 :]:
-            candidate = check_articles_for_duplicates(article1, article2)
-            if candidate:
-                duplicates.append(candidate)
+    duplicates = []
+    for i, j in pairs:
+        candidate = check_articles_for_duplicates(articles[i], articles[j])
+        if candidate:
+            duplicates.append(candidate)
 
     # Sort by overall score (highest similarity first)
     duplicates.sort(key=lambda x: x.overall_score, reverse=True)
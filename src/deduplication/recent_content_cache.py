@@ -5,23 +5,50 @@ This module maintains a cache of recently generated articles to prevent
 generating similar content. It's used BEFORE article generation to save
 API costs by rejecting candidates that are too similar to recent articles.
 
+Articles come from the persisted article index (data/article_index.json), so
+opening the cache re-parses only posts that changed since the last run. Each
+candidate is scored only against a shortlist from two in-memory indexes:
+
+- tag -> cached articles (any shared tag)
+- title trigram -> cached articles (trigram Dice >= TITLE_TRIGRAM_DICE)
+
+Without a shared tag, a match needs title similarity of at least
+``similarity_threshold / 0.4 - 1`` (0.75 at the default 0.70), and mutated
+post titles at a SequenceMatcher ratio >= 0.70 all share a trigram Dice
+above 0.3. Shortlisted articles are scored exactly as before;
+``check_similarity(..., indexed=False)`` scans every cached article, and
+scripts/benchmark_recent_cache.py compares the two.
+
 See: docs/ADR-004-ADAPTIVE-DEDUPLICATION.md
 """
 
+from collections import Counter
+from collections.abc import Iterable
 from dataclasses import dataclass
-from datetime import UTC, date, datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import NamedTuple
 
-import frontmatter
 from rich.console import Console
 
+from ..utils.article_index import get_article_index
 from ..utils.logging import get_logger
 from .post_gen_dedup import calculate_tag_overlap, calculate_text_similarity
 
 logger = get_logger(__name__)
 console = Console()
 
+TITLE_TRIGRAM_DICE = 0.25
+# Below this required title similarity, trigram shortlisting is not reliable
+# and every cached article is scored
+_MIN_INDEXED_TITLE_SIMILARITY = 0.70
+
+
+def title_trigrams(title: str) -> set[str]:
+    """Character trigrams of a lowercased, whitespace-normalized title."""
+    text = " ".join(title.lower().split())
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
 
 @dataclass
 class CachedArticle:
@@ -71,82 +98,76 @@ class RecentContentCache:
         self.cache_days = cache_days
         self.similarity_threshold = similarity_threshold
         self.cache: list[CachedArticle] = []
+        self._by_tag: dict[str, list[int]] = {}
+        self._by_trigram: dict[str, list[int]] = {}
+        self._trigram_counts: list[int] = []
         self._load_recent_articles()
 
     def _load_recent_articles(self):
-        """Load articles generated in the last N days."""
+        """Load articles generated in the last N days from the article index."""
         cutoff_date = datetime.now(UTC) - timedelta(days=self.cache_days)
         logger.debug(
             f"Loading recent articles from {self.content_dir} (cutoff: {self.cache_days} days ago)"
         )
 
-        for filepath in self.content_dir.glob("*.md"):
-            try:
-                post = frontmatter.load(str(filepath))
-                meta = post.metadata or {}
-
-                # Parse generation date
-                generated_at_str = meta.get("generated_at") or meta.get("date")
-                if not generated_at_str:
-                    continue
-
-                # Handle both ISO format and simple date strings.
-                # Normalize to timezone-aware UTC to avoid naive/aware comparisons.
-                try:
-                    if isinstance(generated_at_str, datetime):
-                        generated_at = (
-                            generated_at_str.replace(tzinfo=UTC)
-                            if generated_at_str.tzinfo is None
-                            else generated_at_str.astimezone(UTC)
-                        )
-                    elif isinstance(generated_at_str, date):
-                        generated_at = datetime.combine(
-                            generated_at_str, datetime.min.time()
-                        ).replace(tzinfo=UTC)
-                    elif isinstance(generated_at_str, str):
-                        parsed = datetime.fromisoformat(
-                            generated_at_str.replace("Z", "+00:00")
-                        )
-                        generated_at = (
-                            parsed.replace(tzinfo=UTC)
-                            if parsed.tzinfo is None
-                            else parsed.astimezone(UTC)
-                        )
-                    else:
-                        continue
-                except (ValueError, TypeError, AttributeError):
-                    continue
-
-                # Only cache recent articles
-                if generated_at < cutoff_date:
-                    continue
-
-                article = CachedArticle(
-                    title=meta.get("title", ""),
-                    summary=meta.get("summary", ""),
-                    tags=meta.get("tags", []),
-                    date=meta.get("date", ""),
-                    filepath=str(filepath),
+        index = get_article_index(self.content_dir)
+        for record in index.records():
+            # Dates are normalized to timezone-aware UTC by the index
+            generated_at = record.generated_datetime
+            if generated_at is None or generated_at < cutoff_date:
+                continue
+
+            self._add(
+                CachedArticle(
+                    title=record.title,
+                    summary=record.summary,
+                    tags=record.tags,
+                    date=record.date,
+                    filepath=str(index.path_for(record)),
                     generated_at=generated_at,
                 )
-                self.cache.append(article)
-
-            except Exception:
-                logger.warning(
-                    "Failed to load recent article into cache: %s",
-                    filepath.name,
-                    exc_info=True,
-                )
-                console.print(
-                    f"[dim yellow]Warning: Failed to load {filepath.name}[/dim yellow]"
-                )
+            )
 
         console.print(
             f"[dim]Loaded {len(self.cache)} articles from last {self.cache_days} days into cache[/dim]"
         )
 
+    def _add(self, article: CachedArticle) -> None:
+        position = len(self.cache)
+        self.cache.append(article)
+        for tag in set(article.tags):
+            self._by_tag.setdefault(tag, []).append(position)
+        trigrams = title_trigrams(article.title)
+        self._trigram_counts.append(len(trigrams))
+        for trigram in trigrams:
+            self._by_trigram.setdefault(trigram, []).append(position)
+
+    def _shortlist(self, title: str, tags: list[str]) -> Iterable[int]:
+        """Positions of cached articles sharing a tag or enough title trigrams."""
+        min_title_similarity = self.similarity_threshold / 0.4 - 1
+        if min_title_similarity < _MIN_INDEXED_TITLE_SIMILARITY:
+            return range(len(self.cache))
+
+        positions: set[int] = set()
+        for tag in set(tags):
+            positions.update(self._by_tag.get(tag, ()))
+
+        trigrams = title_trigrams(title)
+        shared = Counter(
+            position
+            for trigram in trigrams
+            for position in self._by_trigram.get(trigram, ())
+        )
+        for position, count in shared.items():
+            total = len(trigrams) + self._trigram_counts[position]
+            if 2 * count >= TITLE_TRIGRAM_DICE * total:
+                positions.add(position)
+
+        # Cache order, so ties resolve as in a linear scan
+        return sorted(positions)
+
     def check_similarity(
-        self, title: str, summary: str, tags: list[str]
+        self, title: str, summary: str, tags: list[str], indexed: bool = True
     ) -> SimilarityMatch | None:
         """
         Check if candidate is similar to any recent article.
@@ -155,6 +176,8 @@ class RecentContentCache:
             title: Candidate article title
             summary: Candidate article summary
             tags: Candidate article tags
+            indexed: Score only the tag/trigram shortlist (False scans
+                every cached article)
 
         Returns:
             SimilarityMatch if similar article found, None otherwise
@@ -162,7 +185,9 @@ class RecentContentCache:
         best_match = None
         best_score = 0.0
 
-        for cached in self.cache:
+        positions = self._shortlist(title, tags) if indexed else range(len(self.cache))
+        for position in positions:
+            cached = self.cache[position]
             # Calculate similarities
             title_sim = calculate_text_similarity(title, cached.title)
             summary_sim = calculate_text_similarity(summary, cached.summary)
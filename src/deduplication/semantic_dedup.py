@@ -4,12 +4,13 @@ Semantic deduplication with adaptive learning.
 
 import json
 import re
+import threading
 from collections import Counter, defaultdict
 from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Protocol
+from typing import NamedTuple, Protocol
 
 from ..utils.file_io import atomic_write_json
 from ..utils.logging import get_logger
@@ -23,6 +24,21 @@ class ContentProtocol(Protocol):
     content: str
 
 
+class ContentFeatures(NamedTuple):
+    """Entities and keywords extracted once per item for similarity scoring."""
+
+    entities: dict[str, frozenset[str]]
+    keywords: frozenset[str]
+
+    def entity_tokens(self) -> set[tuple[str, str]]:
+        """Blocking tokens for entities, as (category, entity) pairs."""
+        return {
+            (category, entity)
+            for category, values in self.entities.items()
+            for entity in values
+        }
+
+
 @dataclass
 class DuplicationPattern:
     """A learned pattern for identifying duplicate content."""
@@ -39,17 +55,29 @@ class DuplicationPattern:
 class SemanticDeduplicator:
     """Learns patterns for semantic deduplication.
 
+    Similarity is ``ENTITY_WEIGHT * entity_jaccard + KEYWORD_WEIGHT *
+    keyword_jaccard``; the weights also bound which pairs can reach a
+    threshold, which find_duplicates() uses to prune candidates.
+
     Thread-safe design:
     - Patterns are loaded once at initialization
-    - find_duplicates() is read-only, safe for parallel access
-    - Learning (_learn_from_duplicates) is called single-threaded after parallel phase
-    - save_patterns() is called single-threaded at pipeline end
+    - Pattern learning happens in memory under a lock; find_duplicates()
+      flushes the patterns file once per call instead of once per group
+    - Patterns are indexed by entity, so matching a new pattern against
+      the stored ones doesn't scan the whole list
     """
 
+    ENTITY_WEIGHT = 0.7
+    KEYWORD_WEIGHT = 0.3
+
     def __init__(self, patterns_file: Path = Path("data/dedup_patterns.json")):
         self.patterns_file = patterns_file
         self.patterns: list[DuplicationPattern] = []
         self.entity_extractors = self._build_entity_extractors()
+        self._patterns_lock = threading.RLock()
+        self._entity_index: dict[str, list[int]] = defaultdict(list)
+        self._entity_index_signature: tuple[int, int] | None = None
+        self._dirty = False
         self.load_patterns()
 
     def _build_entity_extractors(self) -> dict[str, re.Pattern]:
@@ -140,13 +168,27 @@ class SemanticDeduplicator:
         }
         return {word for word in words if word not in stop_words}
 
-    def calculate_content_similarity(self, content1: str, content2: str) -> float:
-        """Calculate semantic similarity between two pieces of content."""
-        # Extract entities and keywords for both
-        entities1 = self.extract_entities(content1)
-        entities2 = self.extract_entities(content2)
-        keywords1 = self.extract_keywords(content1)
-        keywords2 = self.extract_keywords(content2)
+    def extract_features(self, content: str) -> ContentFeatures:
+        """Extract entities and keywords for one piece of content."""
+        return ContentFeatures(
+            entities={
+                category: frozenset(values)
+                for category, values in self.extract_entities(content).items()
+            },
+            keywords=frozenset(self.extract_keywords(content)),
+        )
+
+    @classmethod
+    def feature_similarity(
+        cls, features1: ContentFeatures, features2: ContentFeatures
+    ) -> float:
+        """Similarity between two precomputed feature sets.
+
+        Without a shared entity a pair scores at most KEYWORD_WEIGHT, and
+        without a shared keyword at most ENTITY_WEIGHT; find_duplicates()
+        relies on these bounds to skip pairs exactly.
+        """
+        entities1, entities2 = features1.entities, features2.entities
 
         # Calculate entity overlap
         entity_scores = []
@@ -161,6 +203,7 @@ class SemanticDeduplicator:
         )
 
         # Calculate keyword overlap
+        keywords1, keywords2 = features1.keywords, features2.keywords
         if keywords1 and keywords2:
             keyword_overlap = len(keywords1 & keywords2)
             keyword_total = len(keywords1 | keywords2)
@@ -169,81 +212,188 @@ class SemanticDeduplicator:
             keyword_similarity = 0
 
         # Weighted combination
-        return (entity_similarity * 0.7) + (keyword_similarity * 0.3)
+        return (entity_similarity * cls.ENTITY_WEIGHT) + (
+            keyword_similarity * cls.KEYWORD_WEIGHT
+        )
+
+    def calculate_content_similarity(self, content1: str, content2: str) -> float:
+        """Calculate semantic similarity between two pieces of content."""
+        return self.feature_similarity(
+            self.extract_features(content1), self.extract_features(content2)
+        )
 
     def find_duplicates(
-        self, items: Sequence[ContentProtocol], threshold: float = 0.6
+        self,
+        items: Sequence[ContentProtocol],
+        threshold: float = 0.6,
+        blocked: bool = True,
     ) -> list[list[ContentProtocol]]:
-        """Find groups of duplicate items using learned patterns and similarity."""
+        """Find groups of duplicate items using learned patterns and similarity.
+
+        Groups are built greedily: each unprocessed item absorbs every later
+        unprocessed item scoring at least ``threshold`` against it.
+
+        Features are extracted once per item. With ``blocked=True`` (default)
+        only pairs that can reach the threshold are scored: candidates come
+        from an inverted index (integer bitsets) over shared entities and/or
+        keywords, so the groups are identical to the exhaustive scan.
+
+        Args:
+            items: Content items to group
+            threshold: Minimum similarity for two items to be duplicates
+            blocked: Use inverted-index candidate blocking (False scores all pairs)
+        """
+        features = [self.extract_features(item.content) for item in items]
+
+        if blocked and threshold > 0:
+            group_indices = self._group_blocked(features, threshold)
+        else:
+            group_indices = self._group_exhaustive(features, threshold)
+
         duplicate_groups = []
+        for indices in group_indices:
+            current_group = [items[i] for i in indices]
+            duplicate_groups.append(current_group)
+            # Learn from this duplication pattern (persisted once below)
+            self._learn_from_duplicates(
+                current_group, [features[i] for i in indices], save=False
+            )
+
+        if self._dirty:
+            self.save_patterns()
+
+        return duplicate_groups
+
+    def _group_exhaustive(
+        self, features: list[ContentFeatures], threshold: float
+    ) -> list[list[int]]:
+        """Greedy grouping that scores every remaining pair."""
+        groups = []
         processed = set()
 
-        for i, item1 in enumerate(items):
+        for i in range(len(features)):
             if i in processed:
                 continue
 
-            current_group = [item1]
+            current_group = [i]
             processed.add(i)
 
-            for j, item2 in enumerate(items[i + 1 :], i + 1):
+            for j in range(i + 1, len(features)):
                 if j in processed:
                     continue
 
-                similarity = self.calculate_content_similarity(
-                    item1.content, item2.content
-                )
-
+                similarity = self.feature_similarity(features[i], features[j])
                 if similarity >= threshold:
-                    current_group.append(item2)
+                    current_group.append(j)
                     processed.add(j)
 
             if len(current_group) > 1:
-                duplicate_groups.append(current_group)
-                # Learn from this duplication pattern
-                self._learn_from_duplicates(current_group)
-
-        return duplicate_groups
+                groups.append(current_group)
+
+        return groups
+
+    def _group_blocked(
+        self, features: list[ContentFeatures], threshold: float
+    ) -> list[list[int]]:
+        """Greedy grouping that only scores pairs able to reach the threshold.
+
+        Each entity and keyword maps to a bitset (Python int) of the items
+        containing it; OR-ing an item's postings yields its candidates. Above
+        KEYWORD_WEIGHT a shared entity is required, and above ENTITY_WEIGHT a
+        shared keyword is required too, so those postings are intersected.
+        """
+        need_entity = threshold > self.KEYWORD_WEIGHT
+        need_keyword = threshold > self.ENTITY_WEIGHT
+
+        item_entities = [f.entity_tokens() for f in features]
+        entity_postings: dict[tuple[str, str], int] = defaultdict(int)
+        keyword_postings: dict[str, int] = defaultdict(int)
+        for i, f in enumerate(features):
+            bit = 1 << i
+            for token in item_entities[i]:
+                entity_postings[token] |= bit
+            for keyword in f.keywords:
+                keyword_postings[keyword] |= bit
+
+        groups = []
+        processed = 0  # Bitset of grouped items
+
+        for i in range(len(features)):
+            bit = 1 << i
+            if processed & bit:
+                continue
+            processed |= bit
+
+            by_entity = 0
+            for token in item_entities[i]:
+                by_entity |= entity_postings[token]
+            by_keyword = 0
+            if need_keyword or not need_entity:
+                for keyword in features[i].keywords:
+                    by_keyword |= keyword_postings[keyword]
+
+            if need_keyword:
+                candidates = by_entity & by_keyword
+            elif need_entity:
+                candidates = by_entity
+            else:
+                candidates = by_entity | by_keyword
+            # Later, still-unprocessed items only
+            candidates &= ~processed & ~((bit << 1) - 1)
 
-    def _learn_from_duplicates(self, duplicate_group: list[ContentProtocol]):
-        """Learn patterns from confirmed duplicates."""
-        # Extract common entities and keywords
-        all_entities = defaultdict(set)
-        all_keywords = set()
+            current_group = [i]
+            while candidates:
+                lowest = candidates & -candidates
+                j = lowest.bit_length() - 1
+                candidates ^= lowest
 
-        for item in duplicate_group:
-            entities = self.extract_entities(item.content)
-            keywords = self.extract_keywords(item.content)
+                similarity = self.feature_similarity(features[i], features[j])
+                if similarity >= threshold:
+                    current_group.append(j)
+                    processed |= lowest
 
-            for category, entity_set in entities.items():
-                all_entities[category].update(entity_set)
-            all_keywords.update(keywords)
+            if len(current_group) > 1:
+                groups.append(current_group)
+
+        return groups
+
+    def _learn_from_duplicates(
+        self,
+        duplicate_group: list[ContentProtocol],
+        features: list[ContentFeatures] | None = None,
+        save: bool = True,
+    ):
+        """Learn patterns from confirmed duplicates.
+
+        Args:
+            duplicate_group: Items confirmed as duplicates of each other
+            features: Precomputed features for the group (extracted if omitted)
+            save: Persist patterns immediately; find_duplicates() passes False
+                and flushes once after all groups have been learned
+        """
+        if features is None:
+            features = [self.extract_features(item.content) for item in duplicate_group]
+
+        # Entities and keywords that appear in at least half the items
+        min_appearances = len(duplicate_group) // 2 + 1
 
-        # Find entities common to all items
         common_entities = set()
-        for category, _entity_set in all_entities.items():
-            # Entities that appear in most items
+        for category in {c for f in features for c in f.entities}:
             entity_counts = Counter()
-            for item in duplicate_group:
-                item_entities = self.extract_entities(item.content)
-                entity_counts.update(item_entities.get(category, set()))
-
-            # Consider entities that appear in at least half the items
-            min_appearances = len(duplicate_group) // 2 + 1
+            for item_features in features:
+                entity_counts.update(item_features.entities.get(category, ()))
             for entity, count in entity_counts.items():
                 if count >= min_appearances:
                     common_entities.add(entity)
 
-        # Find keywords common to most items
-        common_keywords = set()
         keyword_counts = Counter()
-        for item in duplicate_group:
-            keywords = self.extract_keywords(item.content)
-            keyword_counts.update(keywords)
-
-        min_appearances = len(duplicate_group) // 2 + 1
-        for keyword, count in keyword_counts.items():
-            if count >= min_appearances:
-                common_keywords.add(keyword)
+        for item_features in features:
+            keyword_counts.update(item_features.keywords)
+        common_keywords = {
+            keyword
+            for keyword, count in keyword_counts.items()
+            if count >= min_appearances
+        }
 
         # Create or update pattern
         if common_entities or common_keywords:
@@ -259,52 +409,109 @@ class SemanticDeduplicator:
                 last_seen=datetime.now(),
             )
 
-            # Check if similar pattern exists
-            existing_pattern = self._find_similar_pattern(pattern)
-            if existing_pattern:
-                # Update existing pattern
-                existing_pattern.entities.update(pattern.entities)
-                existing_pattern.keywords.update(pattern.keywords)
-                existing_pattern.frequency += 1
-                existing_pattern.last_seen = datetime.now()
-                existing_pattern.confidence = min(
-                    0.95, existing_pattern.confidence + 0.05
-                )
-            else:
-                # Add new pattern
-                self.patterns.append(pattern)
-
-        self.save_patterns()
+            with self._patterns_lock:
+                # Check if similar pattern exists
+                position = self._find_similar_pattern_position(pattern)
+                if position is not None:
+                    # Update existing pattern
+                    existing_pattern = self.patterns[position]
+                    self._index_pattern_entities(
+                        position, pattern.entities - existing_pattern.entities
+                    )
+                    existing_pattern.entities.update(pattern.entities)
+                    existing_pattern.keywords.update(pattern.keywords)
+                    existing_pattern.frequency += 1
+                    existing_pattern.last_seen = datetime.now()
+                    existing_pattern.confidence = min(
+                        0.95, existing_pattern.confidence + 0.05
+                    )
+                else:
+                    # Add new pattern
+                    self._ensure_entity_index()
+                    self.patterns.append(pattern)
+                    self._index_pattern_entities(
+                        len(self.patterns) - 1, pattern.entities
+                    )
+                self._dirty = True
+
+        if save:
+            self.save_patterns()
+
+    def _ensure_entity_index(self) -> dict[str, list[int]]:
+        """Return the entity -> pattern positions index, rebuilding if stale.
+
+        ``self.patterns`` is a public list that callers may replace or append
+        to directly, so the index is keyed on its identity and length.
+        """
+        signature = (id(self.patterns), len(self.patterns))
+        if signature != self._entity_index_signature:
+            self._entity_index = defaultdict(list)
+            for position, pattern in enumerate(self.patterns):
+                for entity in pattern.entities:
+                    self._entity_index[entity].append(position)
+            self._entity_index_signature = signature
+        return self._entity_index
+
+    def _index_pattern_entities(self, position: int, entities: set[str]) -> None:
+        """Record entities of the pattern at ``position`` in the entity index."""
+        # Appending changes the list length; refresh the signature rather
+        # than rebuilding the whole index.
+        self._entity_index_signature = (id(self.patterns), len(self.patterns))
+        for entity in entities:
+            positions = self._entity_index[entity]
+            if position not in positions:
+                positions.append(position)
+                positions.sort()
 
     def _find_similar_pattern(
         self, new_pattern: DuplicationPattern
     ) -> DuplicationPattern | None:
         """Find existing pattern similar to the new one."""
-        for pattern in self.patterns:
-            entity_overlap = len(pattern.entities & new_pattern.entities)
-            keyword_overlap = len(pattern.keywords & new_pattern.keywords)
+        position = self._find_similar_pattern_position(new_pattern)
+        return self.patterns[position] if position is not None else None
 
-            if entity_overlap >= 2 or (entity_overlap >= 1 and keyword_overlap >= 3):
-                return pattern
+    def _find_similar_pattern_position(
+        self, new_pattern: DuplicationPattern
+    ) -> int | None:
+        """Position of the first stored pattern similar to the new one.
+
+        Similarity needs at least one shared entity, so only patterns reached
+        through the entity index are considered.
+        """
+        index = self._ensure_entity_index()
+        entity_overlaps: Counter[int] = Counter()
+        for entity in new_pattern.entities:
+            entity_overlaps.update(index.get(entity, ()))
+
+        for position in sorted(entity_overlaps):
+            pattern = self.patterns[position]
+            entity_overlap = entity_overlaps[position]
+            if entity_overlap >= 2:
+                return position
+            keyword_overlap = len(pattern.keywords & new_pattern.keywords)
+            if entity_overlap >= 1 and keyword_overlap >= 3:
+                return position
         return None
 
     def save_patterns(self):
         """Save learned patterns to file."""
         self.patterns_file.parent.mkdir(exist_ok=True)
 
-        patterns_data = []
-        for pattern in self.patterns:
-            patterns_data.append(
-                {
-                    "entities": list(pattern.entities),
-                    "keywords": list(pattern.keywords),
-                    "confidence": pattern.confidence,
-                    "examples": pattern.examples,
-                    "created_at": pattern.created_at.isoformat(),
-                    "last_seen": pattern.last_seen.isoformat(),
-                    "frequency": pattern.frequency,
-                }
-            )
+        with self._patterns_lock:
+            patterns_data = []
+            for pattern in self.patterns:
+                patterns_data.append(
+                    {
+                        "entities": list(pattern.entities),
+                        "keywords": list(pattern.keywords),
+                        "confidence": pattern.confidence,
+                        "examples": pattern.examples,
+                        "created_at": pattern.created_at.isoformat(),
+                        "last_seen": pattern.last_seen.isoformat(),
+                        "frequency": pattern.frequency,
+                    }
+                )
+            self._dirty = False
 
         # Use atomic write to prevent corruption
         atomic_write_json(self.patterns_file, patterns_data)
@@ -14,7 +14,11 @@ This catches RELATED articles about the same story before generation.
 See: docs/RELATED-ARTICLES-CURATION.md
 """
 
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
+from datetime import datetime
 from difflib import SequenceMatcher
 
 from rich.console import Console
@@ -73,43 +77,39 @@ def extract_story_entities(item: EnrichedItem) -> set[str]:
     return entities
 
 
-def calculate_story_similarity(item1: EnrichedItem, item2: EnrichedItem) -> float:
-    """Calculate how likely two items are about the same story.
+@dataclass(frozen=True)
+class StoryFeatures:
+    """Per-item inputs of calculate_story_similarity(), computed once."""
 
-    This uses multiple signals:
-    1. Entity overlap (key indicator of same story)
-    2. Topic overlap (similar subject matter)
-    3. Time proximity (published close together)
-    4. Title similarity (less weight than entities)
+    entities: frozenset[str]
+    topics: frozenset[str]
+    title: str  # Lowercased
+    collected_at: datetime
 
-    Args:
-        item1: First item
-        item2: Second item
+    @classmethod
+    def from_item(cls, item: EnrichedItem) -> StoryFeatures:
+        return cls(
+            entities=frozenset(extract_story_entities(item)),
+            topics=frozenset(t.lower() for t in item.topics),
+            title=item.original.title.lower(),
+            collected_at=item.original.collected_at,
+        )
 
-    Returns:
-        Similarity score 0.0-1.0 (higher = more likely same story)
-    """
-    # Extract story-defining entities
-    entities1 = extract_story_entities(item1)
-    entities2 = extract_story_entities(item2)
 
+def _partial_story_score(
+    features1: StoryFeatures, features2: StoryFeatures, title_sim: float
+) -> float:
+    """Story similarity for a given title similarity (see below)."""
     # Strong entity overlap is the primary signal
-    entity_sim = calculate_entity_similarity(entities1, entities2)
+    entity_sim = calculate_entity_similarity(features1.entities, features2.entities)
 
     # Topic overlap (tags)
-    topics1 = {t.lower() for t in item1.topics}
-    topics2 = {t.lower() for t in item2.topics}
-    topic_overlap = len(topics1 & topics2) / max(len(topics1), len(topics2), 1)
-
-    # Title similarity (less important, but still a signal)
-    title_sim = SequenceMatcher(
-        None, item1.original.title.lower(), item2.original.title.lower()
-    ).ratio()
+    topic_overlap = len(features1.topics & features2.topics) / max(
+        len(features1.topics), len(features2.topics), 1
+    )
 
     # Time proximity (same day = more likely same story)
-    time_diff = abs(
-        (item1.original.collected_at - item2.original.collected_at).total_seconds()
-    )
+    time_diff = abs((features1.collected_at - features2.collected_at).total_seconds())
     time_proximity = 1.0 if time_diff < 86400 else 0.5  # 24 hours
 
     # Weighted combination (entity overlap is most important)
@@ -128,8 +128,143 @@ def calculate_story_similarity(item1: EnrichedItem, item2: EnrichedItem) -> floa
     return score
 
 
+def calculate_story_similarity(item1: EnrichedItem, item2: EnrichedItem) -> float:
+    """Calculate how likely two items are about the same story.
+
+    This uses multiple signals:
+    1. Entity overlap (key indicator of same story)
+    2. Topic overlap (similar subject matter)
+    3. Time proximity (published close together)
+    4. Title similarity (less weight than entities)
+
+    Args:
+        item1: First item
+        item2: Second item
+
+    Returns:
+        Similarity score 0.0-1.0 (higher = more likely same story)
+    """
+    features1 = StoryFeatures.from_item(item1)
+    features2 = StoryFeatures.from_item(item2)
+    # Title similarity (less important, but still a signal)
+    title_sim = SequenceMatcher(None, features1.title, features2.title).ratio()
+    return _partial_story_score(features1, features2, title_sim)
+
+
+# Topics are entities too, so without a shared entity only the title (0.10)
+# and time (0.10) terms can contribute to the score
+_MAX_SCORE_WITHOUT_SHARED_ENTITY = 0.20
+
+
+class StoryClusterer:
+    """Greedy story clustering, one item at a time.
+
+    Each item joins the cluster whose primary item it is most similar to (at
+    least ``min_similarity``), or starts a new cluster. Features are computed
+    once per item; candidate clusters come from an entity -> cluster index,
+    and the title comparison is skipped for clusters that cannot win even
+    with identical titles. Results are identical to comparing against every
+    cluster.
+
+    Adding items in descending quality order reproduces
+    find_story_clusters(); items added in arrival order (e.g. while
+    enrichment is still running) cluster greedily in that order instead.
+    Not thread-safe.
+    """
+
+    def __init__(self, min_similarity: float = 0.50) -> None:
+        self.min_similarity = min_similarity
+        self._clusters: list[StoryCluster] = []
+        self._primary_features: list[StoryFeatures] = []
+        self._title_matchers: list[SequenceMatcher] = []
+        self._signature_parts: list[set[str]] = []
+        self._by_entity: dict[str, list[int]] = {}
+
+    def _candidates(self, features: StoryFeatures) -> Iterable[int]:
+        if self.min_similarity <= _MAX_SCORE_WITHOUT_SHARED_ENTITY:
+            return range(len(self._clusters))
+        found: set[int] = set()
+        for entity in features.entities:
+            found.update(self._by_entity.get(entity, ()))
+        # Creation order, so ties go to the older cluster as before
+        return sorted(found)
+
+    def add(
+        self, item: EnrichedItem, features: StoryFeatures | None = None
+    ) -> StoryCluster:
+        """Cluster one item.
+
+        Args:
+            item: Item to add
+            features: Precomputed StoryFeatures.from_item(item)
+
+        Returns:
+            The cluster the item joined or started
+        """
+        if features is None:
+            features = StoryFeatures.from_item(item)
+
+        best_index = None
+        best_similarity = 0.0
+        for index in self._candidates(features):
+            primary = self._primary_features[index]
+            # Upper bound with identical titles; skip the SequenceMatcher
+            # when even that cannot beat the current best
+            bound = _partial_story_score(features, primary, 1.0)
+            if bound < self.min_similarity or bound <= best_similarity:
+                continue
+            matcher = self._title_matchers[index]
+            matcher.set_seq1(features.title)
+            similarity = _partial_story_score(features, primary, matcher.ratio())
+            if similarity > best_similarity and similarity >= self.min_similarity:
+                best_similarity = similarity
+                best_index = index
+
+        if best_index is not None:
+            # Add to existing cluster
+            cluster = self._clusters[best_index]
+            cluster.items.append(item)
+            cluster.consolidation_score = max(
+                cluster.consolidation_score, best_similarity
+            )
+            # Update story signature with new entities
+            combined = self._signature_parts[best_index] | features.entities
+            cluster.story_signature = ", ".join(sorted(combined)[:5])
+            self._signature_parts[best_index] = set(cluster.story_signature.split(", "))
+            return cluster
+
+        # Create new cluster
+        index = len(self._clusters)
+        cluster = StoryCluster(
+            items=[item],
+            primary_item=item,
+            story_signature=", ".join(sorted(features.entities)[:5]),  # Top 5
+            consolidation_score=1.0,  # Single item = 100% confidence
+        )
+        self._clusters.append(cluster)
+        self._primary_features.append(features)
+        # The primary title is the second sequence, as in
+        # calculate_story_similarity(item, primary); its index is built once
+        self._title_matchers.append(SequenceMatcher(None, "", features.title))
+        self._signature_parts.append(set(cluster.story_signature.split(", ")))
+        for entity in features.entities:
+            self._by_entity.setdefault(entity, []).append(index)
+        return cluster
+
+    @property
+    def clusters(self) -> list[StoryCluster]:
+        """Clusters by consolidation opportunity (multi-source first)."""
+        return sorted(
+            self._clusters,
+            key=lambda c: (len(c.items), c.consolidation_score),
+            reverse=True,
+        )
+
+
 def find_story_clusters(
-    items: list[EnrichedItem], min_similarity: float = 0.50
+    items: list[EnrichedItem],
+    min_similarity: float = 0.50,
+    features: Mapping[str, StoryFeatures] | None = None,
 ) -> list[StoryCluster]:
     """Group items into story clusters.
 
@@ -141,6 +276,7 @@ def find_story_clusters(
     Args:
         items: List of enriched items to cluster
         min_similarity: Minimum similarity to consider items as same story
+        features: Precomputed StoryFeatures by item id (computed if missing)
 
     Returns:
         List of StoryCluster objects
@@ -148,54 +284,20 @@ def find_story_clusters(
     if not items:
         return []
 
+    features = features or {}
+    clusterer = StoryClusterer(min_similarity)
     # Sort by quality (best first)
-    sorted_items = sorted(items, key=lambda x: x.quality_score, reverse=True)
-
-    clusters: list[StoryCluster] = []
-
-    for item in sorted_items:
-        # Check if this item belongs to an existing cluster
-        best_cluster = None
-        best_similarity = 0.0
-
-        for cluster in clusters:
-            # Compare against the primary item in the cluster
-            similarity = calculate_story_similarity(item, cluster.primary_item)
-            if similarity > best_similarity and similarity >= min_similarity:
-                best_similarity = similarity
-                best_cluster = cluster
-
-        if best_cluster:
-            # Add to existing cluster
-            best_cluster.items.append(item)
-            best_cluster.consolidation_score = max(
-                best_cluster.consolidation_score, best_similarity
-            )
-            # Update story signature with new entities
-            new_entities = extract_story_entities(item)
-            existing_sig = set(best_cluster.story_signature.split(", "))
-            combined = existing_sig | new_entities
-            best_cluster.story_signature = ", ".join(sorted(combined)[:5])
-        else:
-            # Create new cluster
-            entities = extract_story_entities(item)
-            clusters.append(
-                StoryCluster(
-                    items=[item],
-                    primary_item=item,
-                    story_signature=", ".join(sorted(entities)[:5]),  # Top 5 entities
-                    consolidation_score=1.0,  # Single item = 100% confidence
-                )
-            )
-
-    # Sort clusters by consolidation opportunity (multi-source first)
-    clusters.sort(key=lambda c: (len(c.items), c.consolidation_score), reverse=True)
+    for item in sorted(items, key=lambda x: x.quality_score, reverse=True):
+        clusterer.add(item, features.get(item.original.id))
 
-    return clusters
+    return clusterer.clusters
 
 
 def filter_duplicate_stories(
-    items: list[EnrichedItem], keep_best: bool = True, min_similarity: float = 0.50
+    items: list[EnrichedItem],
+    keep_best: bool = True,
+    min_similarity: float = 0.50,
+    clusters: list[StoryCluster] | None = None,
 ) -> list[EnrichedItem]:
     """Filter out duplicate stories, keeping only the best item from each cluster.
 
@@ -206,11 +308,13 @@ def filter_duplicate_stories(
         items: List of enriched items
         keep_best: If True, keep the highest quality item from each cluster
         min_similarity: Minimum similarity to consider items as same story
+        clusters: Result of find_story_clusters(items) if already computed
 
     Returns:
         Filtered list with one item per story
     """
-    clusters = find_story_clusters(items, min_similarity)
+    if clusters is None:
+        clusters = find_story_clusters(items, min_similarity)
 
     if not clusters:
         return items
@@ -13,6 +13,7 @@ Components:
 - scorer: Fast heuristic quality assessment
 - ai_analyzer: OpenAI-powered content analysis
 - orchestrator: Pipeline coordination and parallel processing
+- prioritization: Priority ordering and early stop for enrichment
 - file_io: Load/save operations for enriched content
 - adaptive_scoring: Learning-based scoring improvements
 - fact_check: Validation and fact-checking
@@ -29,8 +30,11 @@ Usage:
     # Enrich a single item
     enriched = enrich_single_item(item, config)
 
-    # Enrich all items in parallel
-    all_enriched = enrich_collected_items(items, max_workers=5)
+    # Enrich all items sequentially
+    all_enriched = enrich_collected_items(items)
+
+    # ...or concurrently on the event loop (ENRICHMENT_CONCURRENCY in flight)
+    all_enriched = asyncio.run(enrich_collected_items_async(items))
 
 Design Principles:
 - Fail gracefully: Return basic enrichment if AI fails
@@ -51,28 +55,62 @@ Enrichment Pipeline:
 from .adaptive_scoring import ScoringAdapter
 from .ai_analyzer import (
     analyze_content_quality,
+    analyze_content_quality_async,
+    analyze_items_batch,
+    analyze_items_batch_async,
     extract_topics_and_themes,
+    extract_topics_and_themes_async,
     research_additional_context,
+    research_additional_context_async,
 )
 from .fact_check import validate_article
-from .file_io import load_collected_items, load_enriched_items, save_enriched_items
-from .orchestrator import enrich_collected_items, enrich_single_item
+from .file_io import (
+    iter_collected_items,
+    iter_enriched_items,
+    load_collected_items,
+    load_enriched_items,
+    open_enriched_writer,
+    save_enriched_items,
+)
+from .orchestrator import (
+    enrich_collected_items,
+    enrich_collected_items_async,
+    enrich_item_batch,
+    enrich_item_batch_async,
+    enrich_single_item,
+    enrich_single_item_async,
+)
+from .prioritization import ReadyTracker, prioritize_items
 from .scorer import calculate_heuristic_score
 
 __all__ = [
     # Core orchestration
     "enrich_single_item",
+    "enrich_single_item_async",
+    "enrich_item_batch",
+    "enrich_item_batch_async",
     "enrich_collected_items",
+    "enrich_collected_items_async",
+    "prioritize_items",
+    "ReadyTracker",
     # Scoring
     "calculate_heuristic_score",
     "ScoringAdapter",
     # AI analysis
     "analyze_content_quality",
+    "analyze_content_quality_async",
+    "analyze_items_batch",
+    "analyze_items_batch_async",
     "extract_topics_and_themes",
+    "extract_topics_and_themes_async",
     "research_additional_context",
+    "research_additional_context_async",
     # File I/O
+    "iter_collected_items",
+    "iter_enriched_items",
     "load_collected_items",
     "load_enriched_items",
+    "open_enriched_writer",
     "save_enriched_items",
     # Validation
     "validate_article",
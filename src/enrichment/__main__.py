@@ -3,8 +3,9 @@
 Usage:
     python -m src.enrichment
 
-This will find the most recent collected data file and enrich all items.
-With PYTHON_GIL=0, uses parallel enrichment for faster results.
+This will find the most recent collected data file and enrich all items
+concurrently with the asyncio engine (ENRICHMENT_CONCURRENCY requests in
+flight). Set ENRICHMENT_CONCURRENCY=1 for sequential, one-at-a-time enrichment.
 """
 
 import asyncio
@@ -12,8 +13,8 @@ import logging
 
 from rich.console import Console
 
-from ..config import get_data_dir
-from ..utils.free_threading import supports_free_threading
+from ..config import get_config, get_data_dir
+from ..utils.ndjson import find_item_files
 from .file_io import load_collected_items, save_enriched_items
 from .orchestrator import enrich_collected_items, enrich_collected_items_async
 
@@ -26,7 +27,7 @@ def main() -> int:
     data_dir = get_data_dir()
 
     # Find the most recent collected file
-    collected_files = list(data_dir.glob("collected_*.json"))
+    collected_files = find_item_files(data_dir, "collected")
     if not collected_files:
         console.print("[red]No collected data files found. Run collection first.[/red]")
         logger.error("No collected data files found")
@@ -39,11 +40,9 @@ def main() -> int:
     # Load and enrich items
     items = load_collected_items(latest_file)
 
-    # Use parallel enrichment if free-threading is available
-    if supports_free_threading():
-        console.print(
-            "[bold green]⚡ Python 3.14 free-threading enabled - enriching in parallel![/bold green]"
-        )
+    # The asyncio engine does not need free-threading: requests wait on the
+    # event loop, not in threads
+    if get_config().enrichment_concurrency > 1:
         enriched = asyncio.run(enrich_collected_items_async(items))
     else:
         enriched = enrich_collected_items(items)
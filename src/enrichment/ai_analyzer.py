@@ -4,15 +4,27 @@ This module handles all OpenAI API calls for content enrichment:
 - Quality assessment
 - Topic extraction
 - Research context generation
+- Batched quality assessment and topic extraction (several items per call)
+- ``*_async`` variants of each call for ``AsyncOpenAI`` clients, used by the
+  asyncio enrichment engine; they share prompts and parsing with the sync calls
 
 Includes retry logic for transient failures and error handling
 for graceful degradation when the API is unavailable.
 """
 
+import inspect
 import json
 from json import JSONDecodeError
-
-from openai import APIConnectionError, APITimeoutError, OpenAI, RateLimitError
+from typing import Any
+
+from openai import (
+    APIConnectionError,
+    APITimeoutError,
+    AsyncOpenAI,
+    OpenAI,
+    RateLimitError,
+)
+from openai.types.chat import ChatCompletion
 from rich.console import Console
 from tenacity import (
     RetryCallState,
@@ -25,7 +37,7 @@ from tenacity import (
 from ..api.openai_error_handler import handle_openai_error
 from ..models import CollectedItem
 from ..utils.logging import get_logger
-from ..utils.openai_wrapper import chat_completion
+from ..utils.openai_wrapper import chat_completion, chat_completion_async
 
 console = Console()
 logger = get_logger(__name__)
@@ -48,12 +60,11 @@ def lazy_openai_retry(func):  # type: ignore[no-untyped-def]
     """
     from functools import wraps
 
-    @wraps(func)
-    def wrapper(*args: object, **kwargs: object):  # type: ignore[no-untyped-def]
+    def build_retry():  # type: ignore[no-untyped-def]
         from ..config import get_config
 
         config = get_config()
-        decorator = retry(
+        return retry(
             stop=stop_after_attempt(config.retries.max_attempts),
             wait=wait_exponential(
                 multiplier=config.retries.backoff_multiplier,
@@ -65,7 +76,19 @@ def lazy_openai_retry(func):  # type: ignore[no-untyped-def]
             ),
             before_sleep=log_retry_attempt,
         )
-        decorated_func = decorator(func)
+
+    if inspect.iscoroutinefunction(func):
+        # tenacity retries coroutines with async sleeps between attempts
+
+        @wraps(func)
+        async def async_wrapper(*args: object, **kwargs: object):  # type: ignore[no-untyped-def]
+            return await build_retry()(func)(*args, **kwargs)
+
+        return async_wrapper
+
+    @wraps(func)
+    def wrapper(*args: object, **kwargs: object):  # type: ignore[no-untyped-def]
+        decorated_func = build_retry()(func)
         return decorated_func(*args, **kwargs)
 
     return wrapper
@@ -89,6 +112,17 @@ def analyze_content_quality(item: CollectedItem, client: OpenAI) -> tuple[float,
         Score is 0.0-1.0 with more realistic distribution
     """
     logger.debug(f"Starting AI quality analysis for item: {item.id}")
+    try:
+        response = chat_completion(client=client, **_quality_request(item))
+    except Exception as e:
+        # Classify and log error, but don't stop pipeline for analysis failures
+        handle_openai_error(e, context="quality analysis", should_raise=False)
+        return 0.0, "Analysis failed - using degraded score"
+    return _parse_quality(item, response)
+
+
+def _quality_request(item: CollectedItem) -> dict[str, Any]:
+    """chat_completion() arguments for analyze_content_quality."""
     # Create a more specific prompt that forces the AI to actually analyze the content
     prompt = f"""
     Analyze this social media post and give it a realistic quality score for a tech blog.
@@ -133,24 +167,19 @@ def analyze_content_quality(item: CollectedItem, client: OpenAI) -> tuple[float,
     from ..config import get_config
 
     config = get_config()
-
-    try:
-        response = chat_completion(
-            client=client,
-            model=config.enrichment_model,  # Quality assessment
-            messages=[{"role": "user", "content": prompt}],
-            stage="enrichment",
-            config=config,
-            article_id=item.id,
-            context={"operation": "quality_analysis"},
-            temperature=0.4,  # Slightly higher for more variation
-            max_tokens=150,
-        )
-    except Exception as e:
-        # Classify and log error, but don't stop pipeline for analysis failures
-        handle_openai_error(e, context="quality analysis", should_raise=False)
-        return 0.0, "Analysis failed - using degraded score"
-
+    return {
+        "model": config.enrichment_model,  # Quality assessment
+        "messages": [{"role": "user", "content": prompt}],
+        "stage": "enrichment",
+        "config": config,
+        "article_id": item.id,
+        "context": {"operation": "quality_analysis"},
+        "temperature": 0.4,  # Slightly higher for more variation
+        "max_tokens": 150,
+    }
+
+
+def _parse_quality(item: CollectedItem, response: ChatCompletion) -> tuple[float, str]:
     content = response.choices[0].message.content
     if not content:
         logger.error("Empty OpenAI response content during quality analysis")
@@ -184,6 +213,17 @@ def extract_topics_and_themes(item: CollectedItem, client: OpenAI) -> list[str]:
     Returns:
         List of topic strings (e.g., ["machine learning", "python", "data science"])
     """
+    try:
+        response = chat_completion(client=client, **_topics_request(item))
+    except Exception as e:
+        # Classify and log error, but don't stop pipeline for extraction failures
+        handle_openai_error(e, context="topic extraction", should_raise=False)
+        return []
+    return _parse_topics(item, response)
+
+
+def _topics_request(item: CollectedItem) -> dict[str, Any]:
+    """chat_completion() arguments for extract_topics_and_themes."""
     prompt = f"""
     Extract the main technical topics and themes from this social media post.
 
@@ -211,24 +251,19 @@ def extract_topics_and_themes(item: CollectedItem, client: OpenAI) -> list[str]:
     from ..config import get_config
 
     config = get_config()
-
-    try:
-        response = chat_completion(
-            client=client,
-            model=config.enrichment_model,
-            messages=[{"role": "user", "content": prompt}],
-            stage="enrichment",
-            config=config,
-            article_id=item.id,
-            context={"operation": "topic_extraction"},
-            temperature=0.2,
-            max_tokens=150,
-        )
-    except Exception as e:
-        # Classify and log error, but don't stop pipeline for extraction failures
-        handle_openai_error(e, context="topic extraction", should_raise=False)
-        return []
-
+    return {
+        "model": config.enrichment_model,
+        "messages": [{"role": "user", "content": prompt}],
+        "stage": "enrichment",
+        "config": config,
+        "article_id": item.id,
+        "context": {"operation": "topic_extraction"},
+        "temperature": 0.2,
+        "max_tokens": 150,
+    }
+
+
+def _parse_topics(item: CollectedItem, response: ChatCompletion) -> list[str]:
     content = response.choices[0].message.content
     if not content:
         logger.error(
@@ -272,6 +307,17 @@ def research_additional_context(
     Returns:
         Research summary string
     """
+    try:
+        response = chat_completion(client=client, **_research_request(item, topics))
+    except Exception as e:
+        # Classify and log error, but don't stop pipeline for research failures
+        handle_openai_error(e, context="research generation", should_raise=False)
+        return "Research unavailable"
+    return _parse_research(item, response)
+
+
+def _research_request(item: CollectedItem, topics: list[str]) -> dict[str, Any]:
+    """chat_completion() arguments for research_additional_context."""
     from .source_fetcher import extract_urls_from_content, is_meta_content
 
     # Detect if this is meta-content (post about an article)
@@ -321,29 +367,206 @@ def research_additional_context(
     from ..config import get_config
 
     config = get_config()
+    return {
+        "model": config.enrichment_model,  # Research context
+        "messages": [{"role": "user", "content": prompt}],
+        "stage": "enrichment",
+        "config": config,
+        "article_id": item.id,
+        "context": {"operation": "research_generation", "is_meta": is_meta},
+        "temperature": 0.3,
+        "max_tokens": 500,
+    }
+
+
+def _parse_research(item: CollectedItem, response: ChatCompletion) -> str:
+    content = response.choices[0].message.content
+    if not content:
+        logger.error(
+            f"Empty OpenAI response content during research generation for {item.id}"
+        )
+        return "Research unavailable"
+
+    return content.strip()
+
+
+@lazy_openai_retry
+def analyze_items_batch(
+    items: list[CollectedItem], client: OpenAI
+) -> dict[str, tuple[float, str, list[str]]]:
+    """Score and extract topics for several items in one chat call.
+
+    Sends the scoring rubric and topic instructions once, followed by the
+    items as a JSON list, and asks for one result per item keyed by id.
+    Results are validated individually: items that are missing from the
+    response or come back malformed are left out, so the caller can fall
+    back to analyze_content_quality/extract_topics_and_themes for them.
+
+    Args:
+        items: Collected items to analyze together
+        client: OpenAI client instance
+
+    Returns:
+        Mapping of item id to (quality_score, explanation, topics) for every
+        item the batch answered; empty if the whole batch failed
+    """
+    if not items:
+        return {}
 
+    logger.debug(f"Starting batched AI analysis for {len(items)} items")
     try:
-        response = chat_completion(
-            client=client,
-            model=config.enrichment_model,  # Research context
-            messages=[{"role": "user", "content": prompt}],
-            stage="enrichment",
-            config=config,
-            article_id=item.id,
-            context={"operation": "research_generation", "is_meta": is_meta},
-            temperature=0.3,
-            max_tokens=500,
-        )
+        response = chat_completion(client=client, **_batch_request(items))
     except Exception as e:
-        # Classify and log error, but don't stop pipeline for research failures
-        handle_openai_error(e, context="research generation", should_raise=False)
-        return "Research unavailable"
+        # Classify and log error; the caller falls back to per-item analysis
+        handle_openai_error(e, context="batch analysis", should_raise=False)
+        return {}
+    return _parse_batch(items, response)
+
+
+def _batch_request(items: list[CollectedItem]) -> dict[str, Any]:
+    """chat_completion() arguments for analyze_items_batch."""
+    payload = json.dumps(
+        [{"id": item.id, "content": item.content[:500]} for item in items],
+        ensure_ascii=False,
+    )
+    prompt = f"""
+    Analyze each of these social media posts for a tech blog. For EVERY post,
+    give a realistic quality score and extract its main technical topics.
+
+    POSTS (JSON list of objects with "id" and "content"):
+    {payload}
+
+    Score each post:
+    - 0.8-1.0: Major technical breakthrough, deep insight, or historically significant discovery
+    - 0.6-0.7: Solid technical content with practical value OR important historical figure/discovery
+    - 0.5-0.55: Educational/historical content about underrepresented tech pioneers or foundational science
+    - 0.4-0.5: Some technical merit, basic but useful
+    - 0.2-0.3: Minimal technical value, niche, or mostly commentary
+    - 0.0-0.1: Not technical, purely personal, or no actionable value
+
+    Judge technical depth and actionability, broader applicability vs niche
+    concerns, and useful insight vs complaints. Score each post on its own
+    merits; do not compare posts with each other.
 
+    For topics, list 5-7 specific topics per post (programming languages,
+    technical concepts, tools and frameworks, core technologies) using common,
+    standard terminology, e.g. "machine learning" rather than "ML model training".
+
+    Respond ONLY with JSON, one result per post, using the post ids exactly:
+    {{"results": [{{"id": "post id", "score": 0.X, "explanation": "Specific reason", "topics": ["topic1", "topic2"]}}]}}
+    """
+
+    from ..config import get_config
+
+    config = get_config()
+    return {
+        "model": config.enrichment_model,
+        "messages": [{"role": "user", "content": prompt}],
+        "stage": "enrichment",
+        "config": config,
+        "context": {"operation": "batch_analysis", "batch_size": len(items)},
+        "temperature": 0.3,
+        "max_tokens": 200 * len(items),
+    }
+
+
+def _parse_batch(
+    items: list[CollectedItem], response: ChatCompletion
+) -> dict[str, tuple[float, str, list[str]]]:
     content = response.choices[0].message.content
     if not content:
-        logger.error(
-            f"Empty OpenAI response content during research generation for {item.id}"
+        logger.error("Empty OpenAI response content during batch analysis")
+        return {}
+
+    try:
+        results = json.loads(content.strip())["results"]
+    except (JSONDecodeError, KeyError, TypeError, ValueError) as e:
+        logger.error(f"Invalid OpenAI JSON response during batch analysis: {e}")
+        return {}
+    if not isinstance(results, list):
+        logger.error("Invalid OpenAI JSON response during batch analysis: no list")
+        return {}
+
+    requested = {item.id for item in items}
+    analyses: dict[str, tuple[float, str, list[str]]] = {}
+    for result in results:
+        try:
+            item_id = str(result["id"])
+            score = float(result["score"])
+            explanation = str(result["explanation"])
+            topics = result.get("topics", [])
+        except KeyError, TypeError, ValueError:
+            continue
+        if item_id not in requested or not isinstance(topics, list):
+            continue
+        analyses[item_id] = (
+            score,
+            explanation,
+            [t.lower().strip() for t in topics if isinstance(t, str) and t.strip()],
         )
+
+    if len(analyses) < len(requested):
+        logger.warning(
+            f"Batch analysis answered {len(analyses)}/{len(requested)} items; "
+            "falling back to per-item analysis for the rest"
+        )
+    return analyses
+
+
+@lazy_openai_retry
+async def analyze_content_quality_async(
+    item: CollectedItem, client: AsyncOpenAI
+) -> tuple[float, str]:
+    """Async analyze_content_quality() for the asyncio enrichment engine."""
+    logger.debug(f"Starting AI quality analysis for item: {item.id}")
+    try:
+        response = await chat_completion_async(client=client, **_quality_request(item))
+    except Exception as e:
+        handle_openai_error(e, context="quality analysis", should_raise=False)
+        return 0.0, "Analysis failed - using degraded score"
+    return _parse_quality(item, response)
+
+
+@lazy_openai_retry
+async def extract_topics_and_themes_async(
+    item: CollectedItem, client: AsyncOpenAI
+) -> list[str]:
+    """Async extract_topics_and_themes() for the asyncio enrichment engine."""
+    try:
+        response = await chat_completion_async(client=client, **_topics_request(item))
+    except Exception as e:
+        handle_openai_error(e, context="topic extraction", should_raise=False)
+        return []
+    return _parse_topics(item, response)
+
+
+@lazy_openai_retry
+async def research_additional_context_async(
+    item: CollectedItem, topics: list[str], client: AsyncOpenAI
+) -> str:
+    """Async research_additional_context() for the asyncio enrichment engine."""
+    try:
+        response = await chat_completion_async(
+            client=client, **_research_request(item, topics)
+        )
+    except Exception as e:
+        handle_openai_error(e, context="research generation", should_raise=False)
         return "Research unavailable"
+    return _parse_research(item, response)
 
-    return content.strip()
+
+@lazy_openai_retry
+async def analyze_items_batch_async(
+    items: list[CollectedItem], client: AsyncOpenAI
+) -> dict[str, tuple[float, str, list[str]]]:
+    """Async analyze_items_batch() for the asyncio enrichment engine."""
+    if not items:
+        return {}
+
+    logger.debug(f"Starting batched AI analysis for {len(items)} items")
+    try:
+        response = await chat_completion_async(client=client, **_batch_request(items))
+    except Exception as e:
+        handle_openai_error(e, context="batch analysis", should_raise=False)
+        return {}
+    return _parse_batch(items, response)
@@ -4,19 +4,28 @@ Lightweight validation that checks:
 - Source URLs are reachable
 - Markdown links aren't broken
 - Basic claim validation against research summary
+
+URLs are checked concurrently over one pooled client (per-host limits, one
+deadline per article), and results are cached in ``data/http_cache/`` so
+links shared across articles and runs are not re-probed while fresh.
 """
 
 from __future__ import annotations
 
+import atexit
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from random import random
+from urllib.parse import urlparse
 
 import httpx
 from rich.console import Console
 
-from ..models import EnrichedItem, GeneratedArticle
+from ..models import EnrichedItem, GeneratedArticle, PipelineConfig
+from ..utils.http_cache import get_link_status_cache
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -34,22 +43,25 @@ class FactCheckResult:
     passed: bool
 
 
-def validate_url_reachable(url: str, timeout: float | None = None) -> bool:
-    """Check if a URL is reachable with a HEAD request.
+class _DeadlineExceeded(Exception):
+    """A link check ran out of the article's time budget."""
+
+
+def _check_url(
+    client: httpx.Client, url: str, deadline: float | None = None
+) -> tuple[bool, int | None]:
+    """Probe ``url`` with retries; return (reachable, last status code).
 
     Args:
+        client: Client to send the requests with
         url: URL to check
-        timeout: Request timeout in seconds (uses config default if not provided)
+        deadline: ``time.monotonic()`` value after which no retry is started
 
-    Returns:
-        True if URL returns 2xx or 3xx status code
+    Raises:
+        _DeadlineExceeded: If a retry would run past ``deadline``
     """
     from ..config import get_config
 
-    if timeout is None:
-        config = get_config()
-        timeout = config.timeouts.fact_check_timeout
-
     config = get_config()
     attempts = max(1, int(config.fact_check_retry_attempts))
     backoff_min = float(config.fact_check_retry_backoff_min)
@@ -61,13 +73,15 @@ def validate_url_reachable(url: str, timeout: float | None = None) -> bool:
         base = backoff_min * (2 ** max(0, attempt_index - 1))
         delay = min(backoff_max, base)
         delay = delay * (1.0 - jitter + (2.0 * jitter * random()))
+        if deadline is not None and time.monotonic() + delay >= deadline:
+            raise _DeadlineExceeded(url)
         if delay > 0:
             time.sleep(delay)
 
     def _should_retry_status(status_code: int) -> bool:
         return status_code in (408, 425, 429) or 500 <= status_code <= 599
 
-    def _try_request(client: httpx.Client, method: str) -> httpx.Response:
+    def _try_request(method: str) -> httpx.Response:
         # Some servers break on HEAD; we still try it first, then fallback to GET.
         if method == "HEAD":
             return client.head(url)
@@ -75,47 +89,206 @@ def validate_url_reachable(url: str, timeout: float | None = None) -> bool:
         headers = {"Range": "bytes=0-0"}
         return client.get(url, headers=headers)
 
-    with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-        for attempt in range(1, attempts + 1):
-            try:
-                response = _try_request(client, method="HEAD")
+    status_code: int | None = None
+    for attempt in range(1, attempts + 1):
+        try:
+            response = _try_request(method="HEAD")
+            logger.debug(
+                f"URL validation HEAD request: {url} -> {response.status_code}"
+            )
+
+            # If HEAD looks blocked/unsupported, fallback to GET.
+            if response.status_code in (400, 403, 405):
+                response = _try_request(method="GET")
                 logger.debug(
-                    f"URL validation HEAD request: {url} -> {response.status_code}"
+                    f"URL validation GET request (fallback): {url} -> {response.status_code}"
                 )
 
-                # If HEAD looks blocked/unsupported, fallback to GET.
-                if response.status_code in (400, 403, 405):
-                    response = _try_request(client, method="GET")
-                    logger.debug(
-                        f"URL validation GET request (fallback): {url} -> {response.status_code}"
-                    )
-
-                if response.status_code < 400:
-                    return True
-
-                if attempt < attempts and _should_retry_status(response.status_code):
-                    _sleep_backoff(attempt)
-                    continue
-                return False
-            except (
-                httpx.TimeoutException,
-                httpx.NetworkError,
-                httpx.ProtocolError,
-            ) as e:
-                logger.debug(
-                    f"URL validation request error (attempt {attempt}/{attempts}) for {url}: {type(e).__name__}"
-                )
-                if attempt < attempts:
-                    _sleep_backoff(attempt)
-                    continue
-                logger.warning(
-                    f"URL unreachable after retries: {url} ({type(e).__name__})"
-                )
-                return False
-            except Exception:
-                # Unexpected exception: log stack trace and fail closed.
-                logger.exception(f"Unexpected error while validating URL: {url}")
-                return False
+            status_code = response.status_code
+            if status_code < 400:
+                return True, status_code
+
+            if attempt < attempts and _should_retry_status(status_code):
+                _sleep_backoff(attempt)
+                continue
+            return False, status_code
+        except (
+            httpx.TimeoutException,
+            httpx.NetworkError,
+            httpx.ProtocolError,
+        ) as e:
+            logger.debug(
+                f"URL validation request error (attempt {attempt}/{attempts}) for {url}: {type(e).__name__}"
+            )
+            if attempt < attempts:
+                _sleep_backoff(attempt)
+                continue
+            logger.warning(f"URL unreachable after retries: {url} ({type(e).__name__})")
+            return False, None
+        except _DeadlineExceeded:
+            raise
+        except Exception:
+            # Unexpected exception: log stack trace and fail closed.
+            logger.exception(f"Unexpected error while validating URL: {url}")
+            return False, status_code
+    return False, status_code
+
+
+def validate_url_reachable(url: str, timeout: float | None = None) -> bool:
+    """Check if a URL is reachable with a HEAD request.
+
+    Uses a dedicated client; ``check_urls()`` checks many URLs concurrently
+    over the shared link-check client.
+
+    Args:
+        url: URL to check
+        timeout: Request timeout in seconds (uses config default if not provided)
+
+    Returns:
+        True if URL returns 2xx or 3xx status code
+    """
+    from ..config import get_config
+
+    if timeout is None:
+        timeout = get_config().timeouts.fact_check_timeout
+
+    with httpx.Client(timeout=timeout, follow_redirects=True) as client:
+        return _check_url(client, url)[0]
+
+
+_LINK_CLIENT: httpx.Client | None = None
+_HOST_SLOTS: dict[str, threading.BoundedSemaphore] = {}
+_LINK_LOCK = threading.Lock()
+
+
+def _link_check_client(config: PipelineConfig) -> httpx.Client:
+    """Pooled client shared by every concurrent link check in the process."""
+    global _LINK_CLIENT
+    with _LINK_LOCK:
+        if _LINK_CLIENT is None:
+            _LINK_CLIENT = httpx.Client(
+                timeout=config.timeouts.fact_check_timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=config.fact_check_max_concurrency,
+                    max_keepalive_connections=config.fact_check_max_concurrency,
+                ),
+            )
+        return _LINK_CLIENT
+
+
+def close_link_check_client() -> None:
+    """Close the shared link-check client (reopened on next use)."""
+    global _LINK_CLIENT
+    with _LINK_LOCK:
+        client, _LINK_CLIENT = _LINK_CLIENT, None
+        _HOST_SLOTS.clear()
+    if client is not None:
+        client.close()
+
+
+atexit.register(close_link_check_client)
+
+
+def _host_slot(url: str, limit: int) -> threading.BoundedSemaphore:
+    host = urlparse(url).netloc.lower()
+    with _LINK_LOCK:
+        slot = _HOST_SLOTS.get(host)
+        if slot is None:
+            slot = _HOST_SLOTS[host] = threading.BoundedSemaphore(limit)
+        return slot
+
+
+def _check_pooled(
+    client: httpx.Client, url: str, per_host_limit: int, deadline: float
+) -> tuple[bool, int | None]:
+    """_check_url() holding one of the URL host's slots."""
+    slot = _host_slot(url, per_host_limit)
+    if not slot.acquire(timeout=max(0.0, deadline - time.monotonic())):
+        raise _DeadlineExceeded(url)
+    try:
+        if time.monotonic() >= deadline:
+            raise _DeadlineExceeded(url)
+        return _check_url(client, url, deadline)
+    finally:
+        slot.release()
+
+
+def check_urls(urls: list[str]) -> dict[str, bool | None]:
+    """Check many URLs concurrently, reusing cached results.
+
+    Fresh results from the link status cache (``data/http_cache/``) are used
+    as is. The rest are probed over one pooled client, with at most
+    ``fact_check_max_concurrency`` checks in flight and
+    ``fact_check_per_host_limit`` per host. Checks still running after
+    ``fact_check_deadline_seconds`` are abandoned.
+
+    Args:
+        urls: URLs to check (duplicates are checked once)
+
+    Returns:
+        URL -> True (reachable), False (unreachable) or None (not checked
+        before the deadline)
+    """
+    from ..config import get_config
+
+    config = get_config()
+    cache = get_link_status_cache()
+    results: dict[str, bool | None] = {}
+    pending: list[str] = []
+    for url in dict.fromkeys(urls):
+        cached = cache.get(url) if cache is not None else None
+        if cached is None:
+            pending.append(url)
+        else:
+            results[url] = cached
+
+    if pending:
+        client = _link_check_client(config)
+        deadline = time.monotonic() + config.fact_check_deadline_seconds
+        executor = ThreadPoolExecutor(
+            max_workers=min(config.fact_check_max_concurrency, len(pending)),
+            thread_name_prefix="link-check",
+        )
+        futures = {
+            executor.submit(
+                _check_pooled, client, url, config.fact_check_per_host_limit, deadline
+            ): url
+            for url in pending
+        }
+        wait(futures, timeout=config.fact_check_deadline_seconds)
+        # Abandon unfinished checks; they stop at their next retry or request timeout
+        executor.shutdown(wait=False, cancel_futures=True)
+
+        for future, url in futures.items():
+            if not future.done() or future.cancelled():
+                results[url] = None
+                continue
+            try:
+                reachable, status = future.result()
+            except _DeadlineExceeded:
+                results[url] = None
+                continue
+            results[url] = reachable
+            if cache is not None:
+                cache.put(url, reachable, status)
+        if cache is not None:
+            cache.save()
+
+    unchecked = sum(1 for url in pending if results[url] is None)
+    logger.info(
+        f"Checked {len(results)} URLs ({len(results) - len(pending)} cached, "
+        f"{unchecked} unchecked at deadline)",
+        extra={
+            "phase": "fact_check",
+            "event": "links_checked",
+            "urls": len(results),
+            "cached": len(results) - len(pending),
+            "probed": len(pending) - unchecked,
+            "unchecked": unchecked,
+        },
+    )
+    return results
 
 
 def extract_markdown_links(content: str) -> list[tuple[str, str]]:
@@ -160,27 +333,32 @@ def validate_article(
     max_broken_links = int(config.fact_check_max_broken_links)
     max_unreachable_sources = int(config.fact_check_max_unreachable_sources)
 
-    # 1. Check all source URLs are reachable
-    logger.debug(f"Checking {len(article.sources)} source URLs")
-    console.print("  Checking source URLs...")
-    for source in article.sources:
-        url = str(source.original.url)
-        if not validate_url_reachable(url):
+    # 1. Check source URLs and markdown links concurrently (cached per URL)
+    source_urls = [str(source.original.url) for source in article.sources]
+    # Skip anchor links and relative paths
+    links = [
+        (text, url)
+        for text, url in extract_markdown_links(article.content)
+        if not url.startswith("#") and url.startswith("http")
+    ]
+    logger.debug(f"Checking {len(source_urls)} source URLs and {len(links)} links")
+    console.print("  Checking source URLs and markdown links...")
+    reachable = check_urls(source_urls + [url for _, url in links])
+
+    for url in source_urls:
+        if reachable[url] is False:
             unreachable_sources.append(url)
             warnings.append(f"Source URL unreachable: {url}")
+        elif reachable[url] is None:
+            warnings.append(f"Source URL not checked before deadline: {url}")
 
-    # 2. Extract and validate all markdown links in the article
-    logger.debug("Checking markdown links in article")
-    console.print("  Checking markdown links...")
-    links = extract_markdown_links(article.content)
+    # 2. Report broken markdown links
     for text, url in links:
-        # Skip anchor links and relative paths
-        if url.startswith("#") or not url.startswith("http"):
-            continue
-
-        if not validate_url_reachable(url):
+        if reachable[url] is False:
             broken_links.append(url)
             warnings.append(f"Broken link: [{text}]({url})")
+        elif reachable[url] is None:
+            warnings.append(f"Link not checked before deadline: {url}")
 
     # 3. Basic validation: check word count is reasonable
     if article.word_count < 500:
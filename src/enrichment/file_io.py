@@ -1,30 +1,51 @@
 """File I/O operations for enrichment pipeline.
 
 This module handles loading and saving enriched content:
-- Load collected items from JSON files
-- Save enriched items to JSON files
+- Load collected items from NDJSON (or legacy JSON) files
+- Stream enriched items to NDJSON files as they are produced
 - Timestamp management for file naming
+
+Item files are NDJSON (one item per line, see utils/ndjson.py). Loaders are
+generators underneath, so callers that only need part of a file can use the
+``iter_*`` variants and stop early or seek by item id.
 """
 
-import json
-from datetime import UTC, datetime
+from collections.abc import Callable, Collection, Iterator
+from datetime import datetime
 from pathlib import Path
 
-from pydantic import ValidationError
 from rich.console import Console
 
 from ..config import get_data_dir
 from ..models import CollectedItem, EnrichedItem
 from ..utils.logging import get_logger
+from ..utils.ndjson import NDJSON_SUFFIX, NDJSONWriter, iter_models
 
 logger = get_logger(__name__)
 console = Console()
 
 
+def open_enriched_writer(timestamp: str | None = None) -> NDJSONWriter:
+    """Create a streaming writer for a new enriched items file.
+
+    Use as a context manager and call ``write`` for each item as soon as it
+    is enriched.
+
+    Args:
+        timestamp: Optional timestamp for filename (default: current time)
+
+    Returns:
+        Unopened NDJSONWriter for ``data/enriched_<timestamp>.ndjson``
+    """
+    if not timestamp:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return NDJSONWriter(get_data_dir() / f"enriched_{timestamp}{NDJSON_SUFFIX}")
+
+
 def save_enriched_items(
     items: list[EnrichedItem], timestamp: str | None = None
 ) -> Path:
-    """Save enriched items to JSON file.
+    """Save enriched items to an NDJSON file.
 
     Args:
         items: List of enriched items to save
@@ -34,52 +55,95 @@ def save_enriched_items(
         Path to saved file
     """
     logger.debug(f"Saving {len(items)} enriched items")
-    if not timestamp:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    with open_enriched_writer(timestamp) as writer:
+        writer.write_many(items)
 
-    filename = f"enriched_{timestamp}.json"
-    filepath = get_data_dir() / filename
+    filename = writer.filepath.name
+    logger.info(f"Saved {len(items)} enriched items to {filename}")
+    console.print(f"[green]✓[/green] Saved {len(items)} enriched items to {filename}")
+    return writer.filepath
 
-    # Convert to dict for JSON serialization
-    data = {
-        "enriched_at": datetime.now(UTC).isoformat(),
-        "total_items": len(items),
-        "items": [item.model_dump() for item in items],
-    }
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+def _warn_invalid(kind: str, filepath: Path) -> Callable[[Exception], None]:
+    def warn(e: Exception) -> None:
+        logger.warning(
+            f"Failed to load {kind} item from {filepath.name}: {type(e).__name__}: {e}",
+            exc_info=True,
+        )
+        console.print(f"[yellow]⚠[/yellow] Failed to load item: {e}")
 
-    logger.info(f"Saved {len(items)} enriched items to {filename}")
-    console.print(f"[green]✓[/green] Saved {len(items)} enriched items to {filename}")
-    return filepath
+    return warn
+
+
+def iter_collected_items(
+    filepath: Path,
+    *,
+    skip: int = 0,
+    start_after_id: str | None = None,
+    ids: Collection[str] | None = None,
+) -> Iterator[CollectedItem]:
+    """Lazily load collected items, skipping ones that fail validation.
+
+    Args:
+        filepath: Collected items file (``.ndjson`` or legacy ``.json``)
+        skip: Number of leading items to skip without parsing them
+        start_after_id: Resume after the item with this id
+        ids: Only yield items with these ids
+
+    Yields:
+        CollectedItem objects in file order
+    """
+    return iter_models(
+        filepath,
+        CollectedItem,
+        skip=skip,
+        start_after_id=start_after_id,
+        ids=ids,
+        on_error=_warn_invalid("collected", filepath),
+    )
+
+
+def iter_enriched_items(
+    filepath: Path,
+    *,
+    skip: int = 0,
+    start_after_id: str | None = None,
+    ids: Collection[str] | None = None,
+) -> Iterator[EnrichedItem]:
+    """Lazily load enriched items, skipping ones that fail validation.
+
+    Item ids are those of the original collected items.
+
+    Args:
+        filepath: Enriched items file (``.ndjson`` or legacy ``.json``)
+        skip: Number of leading items to skip without parsing them
+        start_after_id: Resume after the item with this id
+        ids: Only yield items with these ids
+
+    Yields:
+        EnrichedItem objects in file order
+    """
+    return iter_models(
+        filepath,
+        EnrichedItem,
+        skip=skip,
+        start_after_id=start_after_id,
+        ids=ids,
+        on_error=_warn_invalid("enriched", filepath),
+    )
 
 
 def load_collected_items(filepath: Path) -> list[CollectedItem]:
-    """Load collected items from a JSON file.
+    """Load collected items from an NDJSON or legacy JSON file.
 
     Args:
-        filepath: Path to the collected items JSON file
+        filepath: Path to the collected items file
 
     Returns:
         List of CollectedItem objects
     """
     logger.debug(f"Loading collected items from {filepath.name}")
-    with open(filepath, encoding="utf-8") as f:
-        data = json.load(f)
-
-    items = []
-    for item_data in data["items"]:
-        try:
-            item = CollectedItem(**item_data)
-            items.append(item)
-        except (ValidationError, TypeError, ValueError) as e:
-            logger.warning(
-                f"Failed to load collected item from {filepath.name}: {type(e).__name__}: {e}",
-                exc_info=True,
-            )
-            console.print(f"[yellow]⚠[/yellow] Failed to load item: {e}")
-            continue
+    items = list(iter_collected_items(filepath))
 
     logger.info(f"Loaded {len(items)} collected items from {filepath.name}")
     console.print(
@@ -89,30 +153,16 @@ def load_collected_items(filepath: Path) -> list[CollectedItem]:
 
 
 def load_enriched_items(filepath: Path) -> list[EnrichedItem]:
-    """Load enriched items from a JSON file.
+    """Load enriched items from an NDJSON or legacy JSON file.
 
     Args:
-        filepath: Path to the enriched items JSON file
+        filepath: Path to the enriched items file
 
     Returns:
         List of EnrichedItem objects
     """
     logger.debug(f"Loading enriched items from {filepath.name}")
-    with open(filepath, encoding="utf-8") as f:
-        data = json.load(f)
-
-    items = []
-    for item_data in data["items"]:
-        try:
-            item = EnrichedItem(**item_data)
-            items.append(item)
-        except (ValidationError, TypeError, ValueError) as e:
-            logger.warning(
-                f"Failed to load enriched item from {filepath.name}: {type(e).__name__}: {e}",
-                exc_info=True,
-            )
-            console.print(f"[yellow]⚠[/yellow] Failed to load item: {e}")
-            continue
+    items = list(iter_enriched_items(filepath))
 
     logger.info(f"Loaded {len(items)} enriched items from {filepath.name}")
     console.print(
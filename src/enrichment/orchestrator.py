@@ -7,10 +7,14 @@ This module coordinates the enrichment process, combining:
 
 The orchestrator manages:
 - Single item enrichment with combined scoring
-- Parallel processing with thread-local adapters (with PYTHON_GIL=0)
+- Batched AI scoring (ENRICHMENT_BATCH_SIZE items per call) with per-item fallback
+- Concurrent asyncio enrichment (AsyncOpenAI, AIMD-adjusted concurrency)
+  with task-local adapters merged afterwards
 - Sequential batch processing fallback for reliability
 - Adaptive learning updates and feedback tracking
 - Early exit optimization to save API costs
+- Priority ordering (tier-weighted heuristic score) with an optional stop
+  once enough article-ready items exist (prioritization.py)
 
 LOGGING & OBSERVABILITY:
 ========================
@@ -53,31 +57,44 @@ Example Output:
 
 import asyncio
 import time
-from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 
+from openai import AsyncOpenAI
 from rich.console import Console
 
 from ..api.openai_error_handler import handle_openai_error, is_fatal
 from ..config import get_config
 from ..models import CollectedItem, EnrichedItem, PipelineConfig
-from ..utils.clients import get_openai_client
+from ..utils.adaptive_worker_manager import build_worker_manager
+from ..utils.clients import get_async_openai_client, get_openai_client
 from ..utils.logging import get_logger
 from ..utils.worker_config import get_optimal_worker_count, log_worker_config
 from .adaptive_scoring import ScoringAdapter
 from .ai_analyzer import (
     analyze_content_quality,
+    analyze_content_quality_async,
+    analyze_items_batch,
+    analyze_items_batch_async,
     extract_topics_and_themes,
+    extract_topics_and_themes_async,
     research_additional_context,
+    research_additional_context_async,
 )
+from .prioritization import ReadyTracker, prioritize_items
 from .scorer import calculate_heuristic_score
 
 console = Console()
 logger = get_logger(__name__)
 
+# Items scoring below this heuristically never reach the AI analysis
+HEURISTIC_SKIP_THRESHOLD = 0.15
+
 
 def enrich_single_item(
-    item: CollectedItem, config: PipelineConfig, adapter: ScoringAdapter | None = None
+    item: CollectedItem,
+    config: PipelineConfig,
+    adapter: ScoringAdapter | None = None,
+    analysis: tuple[float, str, list[str]] | None = None,
 ) -> EnrichedItem | None:
     """Enrich a single collected item with AI analysis and adaptive scoring.
 
@@ -96,6 +113,8 @@ def enrich_single_item(
         item: The collected item to enrich
         config: Pipeline configuration with API keys
         adapter: Optional scoring adapter for learning improvements
+        analysis: Precomputed (ai_score, explanation, topics) from
+            analyze_items_batch; replaces steps 3 and 6 when given
 
     Returns:
         EnrichedItem if successful, None if enrichment fails
@@ -106,120 +125,359 @@ def enrich_single_item(
     try:
         with get_openai_client(config) as client:
             # Step 1a: Fast heuristic scoring with adaptive improvements (no API cost)
-            heuristic_score, heuristic_explanation = calculate_heuristic_score(
+            heuristic_score, heuristic_explanation, rejected = _heuristic_gate(
                 item, adapter
             )
-            console.print(
-                f"  Heuristic: {heuristic_score:.2f} - {heuristic_explanation[:50]}..."
-            )
-            logger.debug(
-                f"Heuristic score: {heuristic_score:.3f} | reason: {heuristic_explanation}"
-            )
-
-            # Early exit for very low heuristic scores (save API costs)
-            if heuristic_score < 0.15:
-                console.print(
-                    "[dim]  Skipping AI analysis - heuristic score too low[/dim]"
-                )
-                logger.info(
-                    f"Rejected at heuristic stage: {item.id} (score: {heuristic_score:.3f} < 0.15)"
-                )
-                return EnrichedItem(
-                    original=item,
-                    research_summary="Heuristic score too low for AI analysis",
-                    related_sources=[],
-                    topics=[],
-                    quality_score=heuristic_score,
-                    enriched_at=datetime.now(UTC),
-                )
+            if rejected is not None:
+                return rejected
 
             # Step 1b: AI quality analysis (only for promising content)
-            ai_score, ai_explanation = analyze_content_quality(item, client)
-            console.print(f"  AI Quality: {ai_score:.2f} - {ai_explanation[:50]}...")
-            logger.debug(f"AI quality score: {ai_score:.3f} | reason: {ai_explanation}")
-
-            # Record feedback for adaptive learning
-            if adapter:
-                adapter.record_feedback(
-                    item, heuristic_score, ai_score, heuristic_explanation
-                )
-
-            # NEW APPROACH: Use AI as primary score, keep heuristic for pre-filtering analysis
-            # The heuristic and AI are uncorrelated, so we use AI for quality judgment
-            # and keep heuristic for cost-analysis purposes only
-            final_score = ai_score  # Trust AI for quality judgment
-            console.print(f"  Final (AI-based): {final_score:.2f}")
-            logger.info(
-                f"Scoring analysis - Heuristic: {heuristic_score:.3f} | AI: {ai_score:.3f} | Using: {final_score:.3f} (AI-based)"
+            if analysis is not None:
+                ai_score, ai_explanation, topics = analysis
+            else:
+                ai_score, ai_explanation = analyze_content_quality(item, client)
+            final_score = _apply_ai_score(
+                item,
+                adapter,
+                heuristic_score,
+                heuristic_explanation,
+                ai_score,
+                ai_explanation,
             )
 
             # Step 2: Extract topics (always extract for metadata, even if score is low)
-            topics = extract_topics_and_themes(item, client)
-            console.print(
-                f"  Topics: {', '.join(topics[:3])}{'...' if len(topics) > 3 else ''}"
+            if analysis is None:
+                topics = extract_topics_and_themes(item, client)
+            rejected = _ai_score_gate(
+                item, topics, final_score, heuristic_score, ai_score
             )
-            logger.debug(f"Extracted {len(topics)} topics: {topics}")
-
-            # Early exit for very low AI scores (after topic extraction)
-            # Note: We use 0.3 as the absolute minimum (below this, don't even research)
-            if final_score < 0.3:
-                console.print(
-                    "[dim]  Skipping further analysis - AI score too low[/dim]"
-                )
-                logger.info(
-                    f"Rejected at AI score stage: {item.id} (score: {final_score:.3f} < 0.3)"
-                )
-                return EnrichedItem(
-                    original=item,
-                    research_summary="Score below threshold for further analysis.",
-                    related_sources=[],
-                    topics=topics,
-                    quality_score=final_score,
-                    heuristic_score=heuristic_score,
-                    ai_score=ai_score,
-                    enriched_at=datetime.now(UTC),
-                )
+            if rejected is not None:
+                return rejected
 
             # Step 3: Research context (for all items >= 0.3 to gather rich metadata)
             # This allows us to include educational content and do full analysis
-            logger.debug(f"Running deep research for item {item.id} (score >= 0.3)")
             research_summary = research_additional_context(item, topics, client)
+            return _researched_item(
+                item, research_summary, topics, final_score, heuristic_score, ai_score
+            )
 
-            # Create enriched item with both scores for analysis
-            enriched = EnrichedItem(
+    except Exception as e:
+        if _is_fatal_enrichment_error(item, e):
+            raise
+        return None
+
+
+def _heuristic_gate(
+    item: CollectedItem, adapter: ScoringAdapter | None
+) -> tuple[float, str, EnrichedItem | None]:
+    """Heuristic score, its explanation, and the item if it stops here."""
+    heuristic_score, heuristic_explanation = calculate_heuristic_score(item, adapter)
+    console.print(
+        f"  Heuristic: {heuristic_score:.2f} - {heuristic_explanation[:50]}..."
+    )
+    logger.debug(
+        f"Heuristic score: {heuristic_score:.3f} | reason: {heuristic_explanation}"
+    )
+
+    # Early exit for very low heuristic scores (save API costs)
+    if heuristic_score < HEURISTIC_SKIP_THRESHOLD:
+        console.print("[dim]  Skipping AI analysis - heuristic score too low[/dim]")
+        logger.info(
+            f"Rejected at heuristic stage: {item.id} (score: {heuristic_score:.3f} < {HEURISTIC_SKIP_THRESHOLD})"
+        )
+        return (
+            heuristic_score,
+            heuristic_explanation,
+            EnrichedItem(
                 original=item,
-                research_summary=research_summary,
-                related_sources=[],  # We'll add web search in a future iteration
-                topics=topics,
-                quality_score=final_score,
-                heuristic_score=heuristic_score,
-                ai_score=ai_score,
+                research_summary="Heuristic score too low for AI analysis",
+                related_sources=[],
+                topics=[],
+                quality_score=heuristic_score,
                 enriched_at=datetime.now(UTC),
+            ),
+        )
+    return heuristic_score, heuristic_explanation, None
+
+
+def _apply_ai_score(
+    item: CollectedItem,
+    adapter: ScoringAdapter | None,
+    heuristic_score: float,
+    heuristic_explanation: str,
+    ai_score: float,
+    ai_explanation: str,
+) -> float:
+    """Record adaptive-learning feedback and return the final score."""
+    console.print(f"  AI Quality: {ai_score:.2f} - {ai_explanation[:50]}...")
+    logger.debug(f"AI quality score: {ai_score:.3f} | reason: {ai_explanation}")
+
+    # Record feedback for adaptive learning
+    if adapter:
+        adapter.record_feedback(item, heuristic_score, ai_score, heuristic_explanation)
+
+    # NEW APPROACH: Use AI as primary score, keep heuristic for pre-filtering analysis
+    # The heuristic and AI are uncorrelated, so we use AI for quality judgment
+    # and keep heuristic for cost-analysis purposes only
+    final_score = ai_score  # Trust AI for quality judgment
+    console.print(f"  Final (AI-based): {final_score:.2f}")
+    logger.info(
+        f"Scoring analysis - Heuristic: {heuristic_score:.3f} | AI: {ai_score:.3f} | Using: {final_score:.3f} (AI-based)"
+    )
+    return final_score
+
+
+def _ai_score_gate(
+    item: CollectedItem,
+    topics: list[str],
+    final_score: float,
+    heuristic_score: float,
+    ai_score: float,
+) -> EnrichedItem | None:
+    """The item if its AI score is too low to research, else None."""
+    console.print(
+        f"  Topics: {', '.join(topics[:3])}{'...' if len(topics) > 3 else ''}"
+    )
+    logger.debug(f"Extracted {len(topics)} topics: {topics}")
+
+    # Early exit for very low AI scores (after topic extraction)
+    # Note: We use 0.3 as the absolute minimum (below this, don't even research)
+    if final_score < 0.3:
+        console.print("[dim]  Skipping further analysis - AI score too low[/dim]")
+        logger.info(
+            f"Rejected at AI score stage: {item.id} (score: {final_score:.3f} < 0.3)"
+        )
+        return EnrichedItem(
+            original=item,
+            research_summary="Score below threshold for further analysis.",
+            related_sources=[],
+            topics=topics,
+            quality_score=final_score,
+            heuristic_score=heuristic_score,
+            ai_score=ai_score,
+            enriched_at=datetime.now(UTC),
+        )
+
+    logger.debug(f"Running deep research for item {item.id} (score >= 0.3)")
+    return None
+
+
+def _researched_item(
+    item: CollectedItem,
+    research_summary: str,
+    topics: list[str],
+    final_score: float,
+    heuristic_score: float,
+    ai_score: float,
+) -> EnrichedItem:
+    # Create enriched item with both scores for analysis
+    enriched = EnrichedItem(
+        original=item,
+        research_summary=research_summary,
+        related_sources=[],  # We'll add web search in a future iteration
+        topics=topics,
+        quality_score=final_score,
+        heuristic_score=heuristic_score,
+        ai_score=ai_score,
+        enriched_at=datetime.now(UTC),
+    )
+
+    console.print(
+        f"[green]✓[/green] Enriched: {item.title[:30]}... (score: {final_score:.2f})"
+    )
+    logger.info(f"Successfully enriched item {item.id} with score {final_score:.3f}")
+    return enriched
+
+
+def _is_fatal_enrichment_error(item: CollectedItem, e: Exception) -> bool:
+    """Classify and log an enrichment failure; True if it must stop the pipeline."""
+    error_type = handle_openai_error(
+        e, context=f"enriching {item.id}", should_raise=False
+    )
+
+    # If it's a fatal error (quota, auth), propagate to stop pipeline
+    if is_fatal(error_type):
+        logger.critical(f"Fatal error enriching {item.id}: {e}", exc_info=True)
+        return True
+
+    # Otherwise, log and skip this item
+    console.print(f"[red]✗[/red] Enrichment failed for {item.id}")
+    logger.error(f"Enrichment failed for item {item.id}: {e}", exc_info=True)
+    return False
+
+
+async def enrich_single_item_async(
+    item: CollectedItem,
+    config: PipelineConfig,
+    client: AsyncOpenAI,
+    adapter: ScoringAdapter | None = None,
+    analysis: tuple[float, str, list[str]] | None = None,
+) -> EnrichedItem | None:
+    """Async enrich_single_item() using a shared ``AsyncOpenAI`` client.
+
+    Runs the same steps and early exits; the client is owned by the caller
+    (see enrich_collected_items_async) rather than created per item.
+    """
+    console.print(f"[blue]Enriching:[/blue] {item.title[:50]}...")
+    logger.info(f"Starting enrichment for item: {item.id} | title: {item.title[:60]}")
+
+    try:
+        heuristic_score, heuristic_explanation, rejected = _heuristic_gate(
+            item, adapter
+        )
+        if rejected is not None:
+            return rejected
+
+        if analysis is not None:
+            ai_score, ai_explanation, topics = analysis
+        else:
+            ai_score, ai_explanation = await analyze_content_quality_async(item, client)
+        final_score = _apply_ai_score(
+            item,
+            adapter,
+            heuristic_score,
+            heuristic_explanation,
+            ai_score,
+            ai_explanation,
+        )
+
+        if analysis is None:
+            topics = await extract_topics_and_themes_async(item, client)
+        rejected = _ai_score_gate(item, topics, final_score, heuristic_score, ai_score)
+        if rejected is not None:
+            return rejected
+
+        research_summary = await research_additional_context_async(item, topics, client)
+        return _researched_item(
+            item, research_summary, topics, final_score, heuristic_score, ai_score
+        )
+
+    except Exception as e:
+        if _is_fatal_enrichment_error(item, e):
+            raise
+        return None
+
+
+def enrich_item_batch(
+    items: list[CollectedItem],
+    config: PipelineConfig,
+    adapter: ScoringAdapter | None = None,
+) -> list[EnrichedItem | None]:
+    """Enrich several items, scoring and tagging them in one AI call.
+
+    Items that pass the heuristic pre-filter are sent to analyze_items_batch
+    together; every item is then finished by enrich_single_item using its
+    batch result. Items the batch did not answer (unparseable response,
+    missing or malformed entry) go through the usual per-item calls, so a
+    failed batch costs one extra request rather than the items.
+
+    Args:
+        items: Collected items to enrich together
+        config: Pipeline configuration with API keys
+        adapter: Optional scoring adapter for learning improvements
+
+    Returns:
+        One EnrichedItem (or None on failure) per input item, in order
+    """
+    promising = [
+        item
+        for item in items
+        if calculate_heuristic_score(item, adapter)[0] >= HEURISTIC_SKIP_THRESHOLD
+    ]
+
+    analyses: dict[str, tuple[float, str, list[str]]] = {}
+    if len(promising) > 1:
+        try:
+            with get_openai_client(config) as client:
+                analyses = analyze_items_batch(promising, client)
+        except Exception as e:
+            error_type = handle_openai_error(
+                e, context="batch enrichment", should_raise=False
             )
+            if is_fatal(error_type):
+                raise
+        logger.info(
+            f"Batch analysis scored {len(analyses)}/{len(promising)} items in one call",
+            extra={
+                "phase": "enrichment",
+                "event": "batch_analyzed",
+                "batch_size": len(promising),
+                "answered": len(analyses),
+            },
+        )
 
-            console.print(
-                f"[green]✓[/green] Enriched: {item.title[:30]}... (score: {final_score:.2f})"
+    results: list[EnrichedItem | None] = []
+    for item in items:
+        if item.id in analyses:
+            results.append(
+                enrich_single_item(item, config, adapter, analysis=analyses[item.id])
             )
-            logger.info(
-                f"Successfully enriched item {item.id} with score {final_score:.3f}"
+        else:
+            results.append(enrich_single_item(item, config, adapter))
+    return results
+
+
+async def enrich_item_batch_async(
+    items: list[CollectedItem],
+    config: PipelineConfig,
+    client: AsyncOpenAI,
+    adapter: ScoringAdapter | None = None,
+) -> list[EnrichedItem | None]:
+    """Async enrich_item_batch() using a shared ``AsyncOpenAI`` client.
+
+    Items are finished one after another so a batch holds at most one
+    request in flight, like a single item does.
+    """
+    promising = [
+        item
+        for item in items
+        if calculate_heuristic_score(item, adapter)[0] >= HEURISTIC_SKIP_THRESHOLD
+    ]
+
+    analyses: dict[str, tuple[float, str, list[str]]] = {}
+    if len(promising) > 1:
+        try:
+            analyses = await analyze_items_batch_async(promising, client)
+        except Exception as e:
+            error_type = handle_openai_error(
+                e, context="batch enrichment", should_raise=False
             )
-            return enriched
+            if is_fatal(error_type):
+                raise
+        logger.info(
+            f"Batch analysis scored {len(analyses)}/{len(promising)} items in one call",
+            extra={
+                "phase": "enrichment",
+                "event": "batch_analyzed",
+                "batch_size": len(promising),
+                "answered": len(analyses),
+            },
+        )
 
-    except Exception as e:
-        # Classify error and log with context
-        error_type = handle_openai_error(
-            e, context=f"enriching {item.id}", should_raise=False
+    return [
+        await enrich_single_item_async(
+            item, config, client, adapter, analysis=analyses.get(item.id)
         )
+        for item in items
+    ]
 
-        # If it's a fatal error (quota, auth), propagate to stop pipeline
-        if is_fatal(error_type):
-            logger.critical(f"Fatal error enriching {item.id}: {e}", exc_info=True)
-            raise
 
-        # Otherwise, log and return None to skip this item
-        console.print(f"[red]✗[/red] Enrichment failed for {item.id}")
-        logger.error(f"Enrichment failed for item {item.id}: {e}", exc_info=True)
-        return None
+def _log_early_stop(tracker: ReadyTracker, skipped: int) -> None:
+    console.print(
+        f"[dim]Stopped early: {tracker.ready} items article ready "
+        f"(target {tracker.target}), skipped {skipped} lower-priority items[/dim]"
+    )
+    logger.info(
+        f"Enrichment stopped early with {tracker.ready} article-ready items, "
+        f"skipped {skipped}",
+        extra={
+            "phase": "enrichment",
+            "event": "early_stop",
+            "ready_items": tracker.ready,
+            "target": tracker.target,
+            "skipped_items": skipped,
+        },
+    )
 
 
 def enrich_collected_items(
@@ -227,7 +485,9 @@ def enrich_collected_items(
 ) -> list[EnrichedItem]:
     """Enrich all collected items with AI analysis and adaptive scoring.
 
-    Processes items sequentially for reliability and easier debugging.
+    Processes items sequentially for reliability and easier debugging, in
+    priority order (see prioritization.py). With ENRICHMENT_EARLY_STOP the
+    remaining items are skipped once enough are article ready.
     The max_workers parameter is kept for API compatibility but not used.
 
     Args:
@@ -247,13 +507,31 @@ def enrich_collected_items(
         f"[bold blue]Starting enrichment of {len(items)} items (sequential processing)...[/bold blue]"
     )
     logger.info(f"Beginning enrichment of {len(items)} collected items")
+    items = prioritize_items(items)
+    tracker = ReadyTracker.from_config(config)
 
-    # Process items sequentially
+    # Process items sequentially, ENRICHMENT_BATCH_SIZE items per AI scoring call
     rejected_items = []
+    skipped = 0
+    batch_size = config.enrichment_batch_size
+    batched: list[EnrichedItem | None] = []
     for i, item in enumerate(items, 1):
+        if tracker.reached and (batch_size <= 1 or (i - 1) % batch_size == 0):
+            skipped = len(items) - i + 1
+            break
         try:
             console.print(f"\r[dim]Progress: {i}/{len(items)}[/dim]", end="")
-            enriched = enrich_single_item(item, config, adapter)
+            if batch_size > 1:
+                offset = (i - 1) % batch_size
+                if offset == 0:
+                    batched = []  # A failed batch leaves its items unenriched
+                    batched = enrich_item_batch(
+                        items[i - 1 : i - 1 + batch_size], config, adapter
+                    )
+                enriched = batched[offset] if offset < len(batched) else None
+            else:
+                enriched = enrich_single_item(item, config, adapter)
+            tracker.record(enriched)
             if enriched:
                 # Track if item was rejected (returned but with low score)
                 if enriched.quality_score < 0.2:
@@ -276,6 +554,8 @@ def enrich_collected_items(
             continue
 
     console.print()  # New line after progress
+    if skipped:
+        _log_early_stop(tracker, skipped)
 
     # Update learned patterns and save feedback
     console.print("[blue]Updating adaptive scoring patterns...[/blue]")
@@ -325,21 +605,27 @@ def enrich_collected_items(
 async def enrich_collected_items_async(
     items: list[CollectedItem], max_workers: int | None = None
 ) -> list[EnrichedItem]:
-    """Enrich items in parallel using free-threading with thread-local adapters.
+    """Enrich items concurrently on the event loop with per-task adapters.
 
-    Uses ThreadPoolExecutor for true parallel enrichment when running with
-    PYTHON_GIL=0. Each thread gets its own ScoringAdapter with shared patterns
-    loaded once before the thread pool starts.
+    Every item (or ENRICHMENT_BATCH_SIZE batch) runs as an asyncio task using
+    one shared ``AsyncOpenAI`` client. The tasks in flight are capped by an
+    AdaptiveWorkerManager that starts from get_optimal_worker_count and
+    grows or backs off (AIMD) with API health, up to ENRICHMENT_CONCURRENCY.
+    Each task gets its own ScoringAdapter whose
+    feedback is merged sequentially afterwards, so no locks are needed, and
+    hundreds of requests can be in flight without an OS thread each.
 
-    CRITICAL FIX: Patterns are loaded ONCE before threading starts, preventing
-    per-thread disk I/O which would cause massive contention.
+    Tasks are started in priority order (see prioritization.py), so the
+    likeliest candidates get slots first. With ENRICHMENT_EARLY_STOP, tasks
+    that have not started once enough items are article ready are skipped.
 
-    Note: Worker count dynamically calculated based on environment and API tier.
-    Set WORKER_COUNT env var to override.
+    CRITICAL FIX: Patterns are loaded ONCE before tasks start, preventing
+    per-task disk I/O.
 
     Args:
         items: Collected items to enrich
-        max_workers: Optional hard limit on workers (default: None, uses dynamic config)
+        max_workers: Optional hard limit on concurrent tasks (default: None,
+            uses ENRICHMENT_CONCURRENCY)
 
     Returns:
         List of successfully enriched items
@@ -355,8 +641,8 @@ async def enrich_collected_items_async(
         extra={"phase": "enrichment", "mode": "parallel", "total_items": len(items)},
     )
 
-    # CRITICAL FIX: Load patterns ONCE before thread pool starts
-    # This prevents per-thread disk reads (major I/O contention)
+    # CRITICAL FIX: Load patterns ONCE before any task starts
+    # This prevents per-task disk reads (major I/O contention)
     patterns_start = time.perf_counter()
     base_patterns = ScoringAdapter.get_shared_patterns()
     patterns_time = time.perf_counter() - patterns_start
@@ -370,22 +656,53 @@ async def enrich_collected_items_async(
         },
     )
 
-    def enrich_wrapper(item: CollectedItem) -> tuple[EnrichedItem | None, dict]:
-        """Wrapper that enriches item with thread-local adapter.
+    items = prioritize_items(items)
+    tracker = ReadyTracker.from_config(config)
+
+    max_concurrency = config.enrichment_concurrency
+    if max_workers is not None:
+        max_concurrency = max(1, min(max_concurrency, max_workers))
+    manager = build_worker_manager(
+        "enrichment",
+        min(max_concurrency, get_optimal_worker_count("enrichment", max_concurrency)),
+        max_concurrency,
+        config,
+    )
+
+    async def enrich_task(
+        item: CollectedItem, client: AsyncOpenAI
+    ) -> tuple[EnrichedItem | None, dict] | None:
+        """Enrich one item with a task-local adapter (None if skipped).
 
-        Each thread gets an isolated ScoringAdapter with:
+        Each task gets an isolated ScoringAdapter with:
         - Empty feedback_history (accumulate from this run only)
         - Shared reference to base_patterns (immutable, already loaded)
         """
-        # Create per-thread adapter with empty feedback
-        adapter = ScoringAdapter(use_empty=True)
-        item_start = time.perf_counter()
+        async with manager.async_slot():
+            if tracker.reached:
+                return None
+            adapter = ScoringAdapter(use_empty=True)
+            item_start = time.perf_counter()
+
+            try:
+                enriched = await enrich_single_item_async(item, config, client, adapter)
+            except Exception as e:
+                item_time = time.perf_counter() - item_start
+                logger.error(
+                    f"Enrichment failed for item {item.id} after {item_time:.2f}s: {e}",
+                    exc_info=True,
+                    extra={
+                        "phase": "enrichment",
+                        "event": "item_failed",
+                        "item_id": item.id,
+                        "time_seconds": item_time,
+                        "error": str(e),
+                    },
+                )
+                return (None, {})
 
-        try:
-            enriched = enrich_single_item(item, config, adapter)
             item_time = time.perf_counter() - item_start
-
-            # Log successful enrichment with timing
+            tracker.record(enriched)
             logger.debug(
                 f"Enriched item {item.id} in {item_time:.2f}s (score: {enriched.quality_score if enriched else 'N/A'})",
                 extra={
@@ -398,51 +715,91 @@ async def enrich_collected_items_async(
             )
             # Return both result and adapter state for merging
             return (enriched, adapter.get_feedback_data())
-        except Exception as e:
-            item_time = time.perf_counter() - item_start
-            logger.error(
-                f"Enrichment failed for item {item.id} after {item_time:.2f}s: {e}",
-                exc_info=True,
-                extra={
-                    "phase": "enrichment",
-                    "event": "item_failed",
-                    "item_id": item.id,
-                    "time_seconds": item_time,
-                    "error": str(e),
-                },
-            )
-            return (None, {})
 
-    # Parallel phase: isolated processing (no per-thread disk reads!)
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        # No running loop, create one
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
-    # Dynamic worker count based on environment and API limits
-    optimal_workers = get_optimal_worker_count(
-        use_case="enrichment", max_limit=max_workers
-    )
+    async def enrich_batch_task(
+        batch: list[CollectedItem], client: AsyncOpenAI
+    ) -> list[tuple[EnrichedItem | None, dict] | None]:
+        """Enrich a batch of items with one task-local adapter.
+
+        Returns one (result, feedback) pair per item (None per item if the
+        batch was skipped); the adapter's feedback is attached to the first
+        pair only so it is merged once.
+        """
+        async with manager.async_slot():
+            if tracker.reached:
+                return [None for _ in batch]
+            adapter = ScoringAdapter(use_empty=True)
+            batch_start = time.perf_counter()
+
+            try:
+                enriched_batch = await enrich_item_batch_async(
+                    batch, config, client, adapter
+                )
+            except Exception as e:
+                batch_time = time.perf_counter() - batch_start
+                logger.error(
+                    f"Batch enrichment of {len(batch)} items failed after {batch_time:.2f}s: {e}",
+                    exc_info=True,
+                    extra={
+                        "phase": "enrichment",
+                        "event": "batch_failed",
+                        "item_ids": [item.id for item in batch],
+                        "time_seconds": batch_time,
+                        "error": str(e),
+                    },
+                )
+                return [(None, {}) for _ in batch]
+
+            for enriched in enriched_batch:
+                tracker.record(enriched)
+            feedback = adapter.get_feedback_data()
+            return [
+                (enriched, feedback if i == 0 else {})
+                for i, enriched in enumerate(enriched_batch)
+            ]
+
+    concurrency = manager.get_current_worker_count()
     logger.info(
-        f"Using {optimal_workers} workers for parallel enrichment",
-        extra=log_worker_config("enrichment", optimal_workers),
+        f"Starting with {concurrency} concurrent enrichment tasks (max {max_concurrency})",
+        extra=log_worker_config(
+            "enrichment", concurrency, {"mode": "asyncio", "max": max_concurrency}
+        ),
     )
 
-    # Execute parallel enrichment
+    # Concurrent phase: isolated processing (no per-task disk reads!)
     parallel_start = time.perf_counter()
     console.print(
-        f"[dim]Launching {optimal_workers} parallel enrichment workers...[/dim]"
+        f"[dim]Enriching with {concurrency} concurrent requests (adaptive, max {max_concurrency})...[/dim]"
     )
 
-    with ThreadPoolExecutor(max_workers=optimal_workers) as executor:
-        futures = [
-            loop.run_in_executor(executor, enrich_wrapper, item) for item in items
-        ]
-        results = await asyncio.gather(*futures, return_exceptions=True)
+    batch_size = config.enrichment_batch_size
+    with manager.tracking():
+        async with get_async_openai_client(
+            config, max_connections=max_concurrency
+        ) as client:
+            if batch_size > 1:
+                # One AI scoring call per batch; flatten back to per-item results
+                batch_results = await asyncio.gather(
+                    *(
+                        enrich_batch_task(items[i : i + batch_size], client)
+                        for i in range(0, len(items), batch_size)
+                    ),
+                    return_exceptions=True,
+                )
+                results = []
+                for batch_result in batch_results:
+                    if isinstance(batch_result, Exception):
+                        results.append(batch_result)
+                    else:
+                        results.extend(batch_result)
+            else:
+                results = await asyncio.gather(
+                    *(enrich_task(item, client) for item in items),
+                    return_exceptions=True,
+                )
 
     parallel_time = time.perf_counter() - parallel_start
+    concurrency = manager.get_current_worker_count()
     throughput = len(results) / parallel_time if parallel_time > 0 else 0
     logger.info(
         f"Parallel enrichment phase completed in {parallel_time:.2f}s",
@@ -451,7 +808,7 @@ async def enrich_collected_items_async(
             "event": "parallel_phase_complete",
             "time_seconds": parallel_time,
             "items_processed": len(results),
-            "workers": optimal_workers,
+            "concurrency": concurrency,
             "throughput_items_per_sec": round(throughput, 2),
             "avg_time_per_item": round(parallel_time / len(results), 2)
             if results
@@ -459,7 +816,7 @@ async def enrich_collected_items_async(
         },
     )
     console.print(
-        f"[dim]Throughput: {throughput:.2f} items/sec with {optimal_workers} workers[/dim]"
+        f"[dim]Throughput: {throughput:.2f} items/sec (ended at {concurrency} concurrent tasks)[/dim]"
     )
 
     # Sequential merge: no locks needed
@@ -469,22 +826,28 @@ async def enrich_collected_items_async(
     rejected_items = []
     failed_count = 0
     exception_count = 0
+    skipped = 0
 
     for result in results:
+        if result is None:
+            skipped += 1
+            continue
         if isinstance(result, Exception):
             logger.error(
-                f"Thread execution failed: {result}",
+                f"Enrichment task failed: {result}",
                 extra={
                     "phase": "enrichment",
-                    "event": "thread_exception",
+                    "event": "task_exception",
                     "error": str(result),
                 },
             )
             exception_count += 1
-            rejected_items.append(("Unknown", 0.0, "thread_exception"))
+            rejected_items.append(("Unknown", 0.0, "task_exception"))
             continue
 
         enriched, feedback_data = result
+        if feedback_data:
+            final_adapter.merge_feedback(feedback_data)
         if enriched:
             # Track if item was rejected (returned but with low score)
             if enriched.quality_score < 0.2:
@@ -496,23 +859,24 @@ async def enrich_collected_items_async(
                     )
                 )
             enriched_items.append(enriched)
-            final_adapter.merge_feedback(feedback_data)
         else:
             failed_count += 1
             rejected_items.append(("Unknown", 0.0, "enrichment_failed"))
 
     merge_time = time.perf_counter() - merge_start
+    if skipped:
+        _log_early_stop(tracker, skipped)
 
     if exception_count > 0 or failed_count > 0:
         console.print(
-            f"[yellow]⚠ {exception_count} thread exceptions, {failed_count} enrichment failures[/yellow]"
+            f"[yellow]⚠ {exception_count} task exceptions, {failed_count} enrichment failures[/yellow]"
         )
         logger.warning(
-            f"Enrichment: {exception_count} thread exceptions, {failed_count} enrichment failures",
+            f"Enrichment: {exception_count} task exceptions, {failed_count} enrichment failures",
             extra={
                 "phase": "enrichment",
                 "event": "merge_complete",
-                "thread_exceptions": exception_count,
+                "task_exceptions": exception_count,
                 "enrichment_failures": failed_count,
                 "successful": len(enriched_items),
                 "time_seconds": merge_time,
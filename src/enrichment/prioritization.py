@@ -0,0 +1,114 @@
+"""Priority ordering and early stop for enrichment.
+
+Generation only ever uses ``articles_per_run`` items, but every collected
+item used to go through AI scoring, topic extraction and research. This
+module lets the enrichment engines spend API calls on the likeliest
+candidates first:
+
+- ``prioritize_items()`` scores every item heuristically (no API cost) and
+  orders them by that score, weighted by the source's tier strategy
+  (``sources/tiers``): sources whose strategy keeps a larger share of
+  their items are trusted more.
+- ``ReadyTracker`` counts enriched items at or above the quality threshold
+  and reports when ``articles_per_run`` plus a safety margin have been
+  reached, so the remaining (lower-priority) items can be skipped.
+
+Usage:
+    ordered = prioritize_items(items)
+    tracker = ReadyTracker.from_config(config)
+    for item in ordered:
+        if tracker.reached:
+            break
+        tracker.record(enrich_single_item(item, config, adapter))
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+
+from ..models import CollectedItem, EnrichedItem, PipelineConfig, SourceType
+from ..sources.tiers import get_selection_strategy
+from ..utils.logging import get_logger
+from .adaptive_scoring import ScoringAdapter
+from .scorer import calculate_heuristic_score
+
+logger = get_logger(__name__)
+
+# Tier strategy (sources/tiers.SOURCE_CONFIGS) each collector's items follow
+SOURCE_STRATEGIES = {
+    SourceType.HACKERNEWS: "hackernews_top",
+    SourceType.GITHUB: "github_trending",
+    SourceType.REDDIT: "reddit_programming",
+    SourceType.MASTODON: "mastodon_trending",
+    SourceType.BLUESKY: "bluesky_trending",
+}
+
+
+def source_weights(items: list[CollectedItem]) -> dict[SourceType, float]:
+    """Priority multiplier per source, from its tier strategy for this volume.
+
+    The multiplier is ``1 + keep_percentage``: an S-tier source keeping 60%
+    of its items weighs 1.6, a B-tier source keeping 25% weighs 1.25.
+    """
+    counts = Counter(SourceType(item.source) for item in items)
+    return {
+        source: 1.0
+        + get_selection_strategy(SOURCE_STRATEGIES[source], count)["keep_percentage"]
+        for source, count in counts.items()
+    }
+
+
+def prioritize_items(
+    items: list[CollectedItem], adapter: ScoringAdapter | None = None
+) -> list[CollectedItem]:
+    """Items in descending tier-weighted heuristic order (stable for ties)."""
+    if len(items) < 2:
+        return list(items)
+
+    weights = source_weights(items)
+    priorities = {
+        item.id: calculate_heuristic_score(item, adapter)[0]
+        * weights[SourceType(item.source)]
+        for item in items
+    }
+    ordered = sorted(items, key=lambda item: priorities[item.id], reverse=True)
+    logger.info(
+        f"Prioritized {len(items)} items for enrichment "
+        f"(top priority {priorities[ordered[0].id]:.2f}, "
+        f"lowest {priorities[ordered[-1].id]:.2f})",
+        extra={
+            "phase": "enrichment",
+            "event": "items_prioritized",
+            "total_items": len(items),
+            "source_weights": {
+                source.value: round(weight, 3) for source, weight in weights.items()
+            },
+        },
+    )
+    return ordered
+
+
+@dataclass
+class ReadyTracker:
+    """Counts article-ready enriched items against an early-stop target."""
+
+    target: int | None  # None: never stop early
+    threshold: float
+    ready: int = 0
+
+    @classmethod
+    def from_config(cls, config: PipelineConfig) -> ReadyTracker:
+        """Target of ``articles_per_run + enrichment_ready_margin`` when enabled."""
+        target = (
+            config.articles_per_run + config.enrichment_ready_margin
+            if config.enrichment_early_stop
+            else None
+        )
+        return cls(target=target, threshold=config.quality_threshold)
+
+    def record(self, enriched: EnrichedItem | None) -> None:
+        if enriched is not None and enriched.quality_score >= self.threshold:
+            self.ready += 1
+
+    @property
+    def reached(self) -> bool:
+        return self.target is not None and self.ready >= self.target
@@ -26,11 +26,193 @@ saves API costs by filtering low-quality content early.
 import re
 
 from ..models import CollectedItem
+from ..utils.keyword_matcher import KeywordMatcher
 from ..utils.logging import get_logger
 from .adaptive_scoring import ScoringAdapter
 
 logger = get_logger(__name__)
 
+# Technical keyword indicators
+TECH_KEYWORDS = [
+    "python",
+    "javascript",
+    "rust",
+    "go",
+    "docker",
+    "kubernetes",
+    "aws",
+    "azure",
+    "algorithm",
+    "database",
+    "api",
+    "framework",
+    "library",
+    "open source",
+    "machine learning",
+    "ai",
+    "devops",
+    "cloud",
+    "architecture",
+    "performance",
+    "security",
+    "blockchain",
+    "web3",
+    "git",
+    "linux",
+    "unix",
+    "programming",
+    "software",
+    "hardware",
+    "network",
+    "protocol",
+    "stack",
+    "backend",
+    "frontend",
+]
+
+# Negative indicators: personal content
+PERSONAL_INDICATORS = [
+    "i feel",
+    "my day",
+    "my life",
+    "personally",
+    "imo",
+    "just me",
+]
+
+# News/announcement indicators (timely, important)
+NEWS_INDICATORS = [
+    "announcing",
+    "released",
+    "launched",
+    "new version",
+    "breaking",
+    "vulnerability",
+    "security",
+    "critical",
+    "update",
+    "available now",
+    "just released",
+    "today",
+    "major",
+    "important",
+]
+
+# Educational/tutorial indicators
+EDUCATIONAL_INDICATORS = [
+    "how to",
+    "tutorial",
+    "guide",
+    "learn",
+    "explained",
+    "introduction",
+    "getting started",
+    "step by step",
+    "walkthrough",
+    "best practices",
+    "tips",
+    "tricks",
+    "examples",
+]
+
+# Technical depth indicators
+DEPTH_INDICATORS = [
+    "architecture",
+    "implementation",
+    "performance",
+    "benchmark",
+    "optimization",
+    "analysis",
+    "deep dive",
+    "internals",
+    "how it works",
+    "under the hood",
+    "technical details",
+    "design",
+    "algorithm",
+]
+
+# Actionable content indicators
+ACTION_INDICATORS = [
+    "try",
+    "use",
+    "install",
+    "download",
+    "check out",
+    "see",
+    "read",
+    "should",
+    "can",
+    "how",
+    "step",
+    "guide",
+    "tutorial",
+]
+
+# Vague or clickbait language (diminishes quality)
+VAGUE_INDICATORS = [
+    "amazing",
+    "incredible",
+    "mind-blowing",
+    "insane",
+    "crazy",
+    "wow",
+    "omg",
+]
+
+# Derived forms credited to their base keyword. The matcher only accepts a
+# plural ending, so "learning" or "installed" need listing to count as
+# "learn" or "install"; a text with several forms of one keyword counts once.
+DERIVED_FORMS = {
+    "algorithm": ["algorithmic"],
+    "benchmark": ["benchmarking", "benchmarked"],
+    "can": ["cannot"],
+    "critical": ["critically"],
+    "design": ["designed", "designing", "designer"],
+    "docker": ["dockerfile", "dockerized"],
+    "download": ["downloaded", "downloading"],
+    "git": ["github", "gitlab"],
+    "guide": ["guided", "guidelines"],
+    "important": ["importantly"],
+    "install": ["installed", "installing", "installation", "installer"],
+    "learn": ["learning", "learned", "learnt", "learner"],
+    "network": ["networking", "networked"],
+    "read": ["reading", "reader"],
+    "security": ["cybersecurity"],
+    "see": ["seeing", "seen"],
+    "try": ["trying"],
+    "update": ["updated", "updating"],
+    "use": ["used", "useful", "user"],
+}
+_BASE_FORM = {form: base for base, forms in DERIVED_FORMS.items() for form in forms}
+
+
+def _with_derived_forms(keywords: list[str]) -> list[str]:
+    return [*keywords, *(form for kw in keywords for form in DERIVED_FORMS.get(kw, ()))]
+
+
+# All content keyword groups, matched in one pass per item
+_CONTENT_SIGNALS = KeywordMatcher(
+    {
+        "tech": _with_derived_forms(TECH_KEYWORDS),
+        "personal": PERSONAL_INDICATORS,
+        "news": _with_derived_forms(NEWS_INDICATORS),
+        "educational": _with_derived_forms(EDUCATIONAL_INDICATORS),
+        "depth": _with_derived_forms(DEPTH_INDICATORS),
+        "action": _with_derived_forms(ACTION_INDICATORS),
+        "vague": VAGUE_INDICATORS,
+    }
+)
+
+
+def _content_signal_counts(content: str) -> dict[str, int]:
+    """Distinct base keywords found per group."""
+    hits = _CONTENT_SIGNALS.matches(content)
+    return {
+        name: len({_BASE_FORM.get(kw, kw) for kw in hits.get(name, ())})
+        for name in _CONTENT_SIGNALS.groups
+    }
+
 
 def calculate_heuristic_score(
     item: CollectedItem, adapter: ScoringAdapter | None = None
@@ -75,45 +257,9 @@ def calculate_heuristic_score(
         score += 0.1
         factors.append("very long")
 
-    # Technical keyword indicators
-    tech_keywords = [
-        "python",
-        "javascript",
-        "rust",
-        "go",
-        "docker",
-        "kubernetes",
-        "aws",
-        "azure",
-        "algorithm",
-        "database",
-        "api",
-        "framework",
-        "library",
-        "open source",
-        "machine learning",
-        "ai",
-        "devops",
-        "cloud",
-        "architecture",
-        "performance",
-        "security",
-        "blockchain",
-        "web3",
-        "git",
-        "linux",
-        "unix",
-        "programming",
-        "software",
-        "hardware",
-        "network",
-        "protocol",
-        "stack",
-        "backend",
-        "frontend",
-    ]
-
-    tech_count = sum(1 for keyword in tech_keywords if keyword in content)
+    # Keyword indicators (all groups in one pass over the content)
+    signals = _content_signal_counts(content)
+    tech_count = signals["tech"]
     if tech_count >= 3:
         score += 0.3
         factors.append(f"{tech_count} tech keywords")
@@ -203,36 +349,12 @@ def calculate_heuristic_score(
         factors.append("organization account")
 
     # Negative indicators
-    personal_indicators = [
-        "i feel",
-        "my day",
-        "my life",
-        "personally",
-        "imo",
-        "just me",
-    ]
-    if any(indicator in content for indicator in personal_indicators):
+    if signals["personal"]:
         score -= 0.2
         factors.append("personal content")
 
     # News/announcement indicators (timely, important)
-    news_indicators = [
-        "announcing",
-        "released",
-        "launched",
-        "new version",
-        "breaking",
-        "vulnerability",
-        "security",
-        "critical",
-        "update",
-        "available now",
-        "just released",
-        "today",
-        "major",
-        "important",
-    ]
-    news_count = sum(1 for indicator in news_indicators if indicator in content)
+    news_count = signals["news"]
     if news_count >= 2:
         score += 0.20
         factors.append("newsworthy announcement")
@@ -241,22 +363,7 @@ def calculate_heuristic_score(
         factors.append("announcement content")
 
     # Educational/tutorial indicators
-    educational_indicators = [
-        "how to",
-        "tutorial",
-        "guide",
-        "learn",
-        "explained",
-        "introduction",
-        "getting started",
-        "step by step",
-        "walkthrough",
-        "best practices",
-        "tips",
-        "tricks",
-        "examples",
-    ]
-    edu_count = sum(1 for indicator in educational_indicators if indicator in content)
+    edu_count = signals["educational"]
     if edu_count >= 2:
         score += 0.15
         factors.append("educational content")
@@ -265,22 +372,7 @@ def calculate_heuristic_score(
         factors.append("somewhat educational")
 
     # Technical depth indicators
-    depth_indicators = [
-        "architecture",
-        "implementation",
-        "performance",
-        "benchmark",
-        "optimization",
-        "analysis",
-        "deep dive",
-        "internals",
-        "how it works",
-        "under the hood",
-        "technical details",
-        "design",
-        "algorithm",
-    ]
-    depth_count = sum(1 for indicator in depth_indicators if indicator in content)
+    depth_count = signals["depth"]
     if depth_count >= 2:
         score += 0.15
         factors.append("technical depth")
@@ -323,37 +415,13 @@ def calculate_heuristic_score(
         factors.append("no sources cited")
 
     # Lack of actionable content
-    action_indicators = [
-        "try",
-        "use",
-        "install",
-        "download",
-        "check out",
-        "see",
-        "read",
-        "should",
-        "can",
-        "how",
-        "step",
-        "guide",
-        "tutorial",
-    ]
-    action_count = sum(1 for indicator in action_indicators if indicator in content)
+    action_count = signals["action"]
     if action_count == 0 and word_count > 50:
         score -= 0.08
         factors.append("not actionable")
 
     # Vague or clickbait language (diminishes quality)
-    vague_indicators = [
-        "amazing",
-        "incredible",
-        "mind-blowing",
-        "insane",
-        "crazy",
-        "wow",
-        "omg",
-    ]
-    vague_count = sum(1 for indicator in vague_indicators if indicator in content)
+    vague_count = signals["vague"]
     if vague_count >= 2:
         score -= 0.10
         factors.append("vague/clickbait language")
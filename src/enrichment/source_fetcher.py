@@ -13,6 +13,7 @@ from __future__ import annotations
 import re
 
 from ..models import CollectedItem
+from ..utils.http_cache import HTTPCache, conditional_get, get_http_cache
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -166,7 +167,9 @@ def is_meta_content(item: CollectedItem, urls: list[str]) -> bool:
     return False
 
 
-def fetch_article_content(url: str, max_size: int = 5000) -> str | None:
+def fetch_article_content(
+    url: str, max_size: int = 5000, cache: HTTPCache | None = None
+) -> str | None:
     """Fetch and extract main content from article URL.
 
     Uses basic HTTP fetching to retrieve article content.
@@ -175,6 +178,8 @@ def fetch_article_content(url: str, max_size: int = 5000) -> str | None:
     Args:
         url: Article URL to fetch
         max_size: Maximum characters to return
+        cache: Optional HTTP cache; the page is revalidated with a conditional
+            GET and a 304 reuses the cached body
 
     Returns:
         Main article content or None if fetch fails
@@ -207,7 +212,9 @@ def fetch_article_content(url: str, max_size: int = 5000) -> str | None:
         headers = {
             "User-Agent": "Mozilla/5.0 (compatible; TechContentCurator/1.0; +https://github.com/Hardcoreprawn/tech-content-curator)"
         }
-        response = requests.get(url, headers=headers, timeout=10)
+        response = conditional_get(
+            requests.get, url, cache, headers=headers, timeout=10
+        )
         response.raise_for_status()
 
         # Parse HTML
@@ -348,7 +355,7 @@ def enrich_with_primary_source(
     logger.info(f"Meta-content detected, fetching primary source from {urls[0]}")
 
     # Fetch the first (primary) URL
-    primary_content = fetch_article_content(urls[0])
+    primary_content = fetch_article_content(urls[0], cache=get_http_cache())
 
     if primary_content:
         result["primary_source_content"] = primary_content
@@ -28,7 +28,6 @@ import argparse
 import asyncio
 import os
 
-from openai import OpenAI
 from rich.console import Console
 
 from .config import get_config, get_content_dir, get_data_dir
@@ -44,8 +43,10 @@ from .pipeline.diversity_selector import (
     select_diverse_candidates as _select_diverse_candidates,
 )
 from .pipeline.orchestrator import generate_articles_async
+from .utils.clients import get_shared_openai_client
 from .utils.free_threading import supports_free_threading
 from .utils.logging import get_logger
+from .utils.ndjson import find_item_files
 
 console = Console()
 logger = get_logger(__name__)
@@ -135,7 +136,7 @@ Examples:
     data_dir = get_data_dir()
 
     # Find the most recent enriched file
-    enriched_files = list(data_dir.glob("enriched_*.json"))
+    enriched_files = find_item_files(data_dir, "enriched")
     if not enriched_files:
         console.print("[red]No enriched data files found. Run enrichment first.[/red]")
         exit(1)
@@ -149,11 +150,7 @@ Examples:
     if args.dry_run:
         console.print("\n[yellow]DRY RUN MODE - No articles will be generated[/yellow]")
         candidates = select_article_candidates(items)
-        client = OpenAI(
-            api_key=config.openai_api_key,
-            timeout=config.timeouts.openai_api_timeout,
-            max_retries=config.retries.max_attempts,
-        )
+        client = get_shared_openai_client(config)
         generators = get_available_generators(client)
         selected = _select_diverse_candidates(candidates, args.max_articles, generators)
 
@@ -4,6 +4,7 @@ Detects high-value concepts in article content that would benefit from visual ai
 Performs keyword analysis, structural pattern detection, and content density analysis.
 """
 
+from ..utils.keyword_matcher import KeywordMatcher
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -142,12 +143,14 @@ class ConceptDetector:
         """
         logger.debug(f"Detecting concepts in content ({len(content)} chars)")
         concepts: dict[str, Concept] = {}
-        content_lower = content.lower()
+        hits = _CONCEPT_KEYWORDS.matches(content)
 
         # Detect each concept pattern
         for concept_name, pattern in self.CONCEPT_PATTERNS.items():
-            keywords = pattern["keywords"]
-            matches = sum(1 for kw in keywords if kw in content_lower)
+            found = [
+                kw for kw in pattern["keywords"] if kw in hits.get(concept_name, ())
+            ]
+            matches = len(found)
 
             if matches > 0:
                 # Calculate confidence based on keyword density
@@ -158,7 +161,7 @@ class ConceptDetector:
 
                 concepts[concept_name] = Concept(
                     name=concept_name,
-                    keywords=[kw for kw in keywords if kw in content_lower],
+                    keywords=found,
                     confidence=confidence,
                     visual_types=pattern["visual_types"],
                     description=pattern["description"],
@@ -212,6 +215,15 @@ class ConceptDetector:
         return [c for c in concepts if visual_type in c.visual_types]
 
 
+# Every concept's keywords, matched in one pass per article
+_CONCEPT_KEYWORDS = KeywordMatcher(
+    {
+        name: pattern["keywords"]
+        for name, pattern in ConceptDetector.CONCEPT_PATTERNS.items()
+    }
+)
+
+
 def detect_concepts(content: str, min_confidence: float = 0.7) -> list[Concept]:
     """Convenience function to detect concepts in article content.
 
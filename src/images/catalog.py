@@ -1,6 +1,6 @@
 """Catalog and reuse existing AI-generated images.
 
-Scans content/posts/*.md frontmatter to build a map of:
+Reads content/posts/*.md frontmatter (via the shared article index) to build a map of:
   tag -> list of (image_path, article_slug)
 
 When generating a new article, we prefer an existing AI image with a matching tag
@@ -12,10 +12,10 @@ from __future__ import annotations
 import json
 from pathlib import Path
 
-import frontmatter
 from rich.console import Console
 
 from ..config import get_content_dir, get_project_root
+from ..utils.article_index import get_article_index
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -45,40 +45,22 @@ def build_image_catalog(
     catalog: dict[str, list[tuple[str, str]]] = {}
     content_dir = get_content_dir()
 
-    for md_file in content_dir.glob("*.md"):
-        try:
-            post = frontmatter.load(str(md_file))
-            meta = post.metadata or {}
-            tags = meta.get("tags", [])
-            cover = meta.get("cover", {})
-            image_url = cover.get("image") if isinstance(cover, dict) else None
-
-            # Skip if no image or if it's a gradient/default
-            if (
-                not image_url
-                or "library/" in image_url
-                or "default-social" in image_url
-            ):
-                continue
-
-            # Extract slug from image URL (e.g., /images/2025-10-30-something.png -> 2025-10-30-something)
-            slug = Path(image_url).stem
-
-            for tag in tags:
-                tag_lower = tag.lower()
-                if tag_lower not in catalog:
-                    catalog[tag_lower] = []
-                catalog[tag_lower].append((image_url, slug))
-
-        except Exception as e:
-            logger.warning(
-                "Failed to parse %s: %s: %s",
-                md_file.name,
-                type(e).__name__,
-                e,
-                exc_info=True,
-            )
-            console.print(f"[yellow]⚠[/yellow] Failed to parse {md_file.name}: {e}")
+    for record in get_article_index(content_dir).records():
+        tags = record.tags
+        image_url = record.cover_image
+
+        # Skip if no image or if it's a gradient/default
+        if not image_url or "library/" in image_url or "default-social" in image_url:
+            continue
+
+        # Extract slug from image URL (e.g., /images/2025-10-30-something.png -> 2025-10-30-something)
+        slug = Path(image_url).stem
+
+        for tag in tags:
+            tag_lower = tag.lower()
+            if tag_lower not in catalog:
+                catalog[tag_lower] = []
+            catalog[tag_lower].append((image_url, slug))
 
     # Save catalog
     catalog_file.parent.mkdir(parents=True, exist_ok=True)
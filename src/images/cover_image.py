@@ -12,12 +12,12 @@ from io import BytesIO
 from pathlib import Path
 
 import httpx
-from openai import OpenAI
 from PIL import Image
 from rich.console import Console
 
 from ..config import get_project_root
 from ..models import PipelineConfig
+from ..utils.clients import get_shared_openai_client
 from ..utils.costs import append_generation_cost
 from ..utils.logging import get_logger
 from ..utils.openai_wrapper import create_image
@@ -63,8 +63,12 @@ def generate_featured_image(
     """
     logger.debug(f"Generating featured image for article: {slug}")
     try:
+        from ..config import get_config
+
         resolved_config = config
-        client = OpenAI(api_key=openai_api_key)
+        client = get_shared_openai_client(
+            resolved_config or get_config(), api_key=openai_api_key
+        )
 
         # Create a concise prompt for DALL-E 3
         # Focus on abstract, professional tech imagery
@@ -121,8 +125,6 @@ The image should work well as a blog header - wide format, visually appealing, n
         # Download the image
         logger.debug(f"Downloading image from OpenAI: {image_url}")
         console.print("[blue]Downloading image from OpenAI...[/blue]")
-        from ..config import get_config
-
         cfg = resolved_config or get_config()
         with httpx.Client(timeout=cfg.timeouts.http_client_timeout) as http_client:
             img_response = http_client.get(image_url)
@@ -23,13 +23,12 @@ logger = get_logger(__name__)
 import json
 from dataclasses import dataclass
 
-import frontmatter
 import httpx
 from openai import OpenAI
 from rich.console import Console
 
-from ..config import get_content_dir
 from ..models import PipelineConfig
+from ..utils.article_index import get_article_index
 
 console = Console()
 
@@ -74,46 +73,31 @@ class CoverImageSelector:
 
         recent_images = set()
         try:
-            content_dir = get_content_dir()
             cutoff_date = datetime.now() - timedelta(days=days_back)
 
-            for article_file in content_dir.glob("*.md"):
+            for record in get_article_index().records():
                 # Quick date check from filename (YYYY-MM-DD format)
                 try:
-                    date_str = article_file.name[:10]
-                    article_date = datetime.strptime(date_str, "%Y-%m-%d")
+                    article_date = datetime.strptime(record.filename[:10], "%Y-%m-%d")
                     if article_date < cutoff_date:
                         continue
 
-                    # Load frontmatter and extract image
-                    with open(article_file, encoding="utf-8") as f:
-                        post = frontmatter.load(f)
-                        if (
-                            "cover" in post.metadata
-                            and isinstance(post.metadata["cover"], dict)
-                            and "image" in post.metadata["cover"]
-                        ):
-                            image_url = post.metadata["cover"]["image"]
-                            if image_url:
-                                # Extract the photo ID to handle different query parameters
-                                if (
-                                    "unsplash.com" in image_url
-                                    and "photo-" in image_url
-                                ):
-                                    photo_id = image_url.split("photo-")[1].split("?")[
-                                        0
-                                    ]
-                                    recent_images.add(f"unsplash:{photo_id}")
-                                elif "pexels.com" in image_url:
-                                    photo_id = (
-                                        image_url.split("/photos/")[1].split("-")[0]
-                                        if "/photos/" in image_url
-                                        else None
-                                    )
-                                    if photo_id:
-                                        recent_images.add(f"pexels:{photo_id}")
-                                else:
-                                    recent_images.add(image_url)
+                    image_url = record.cover_image
+                    if image_url:
+                        # Extract the photo ID to handle different query parameters
+                        if "unsplash.com" in image_url and "photo-" in image_url:
+                            photo_id = image_url.split("photo-")[1].split("?")[0]
+                            recent_images.add(f"unsplash:{photo_id}")
+                        elif "pexels.com" in image_url:
+                            photo_id = (
+                                image_url.split("/photos/")[1].split("-")[0]
+                                if "/photos/" in image_url
+                                else None
+                            )
+                            if photo_id:
+                                recent_images.add(f"pexels:{photo_id}")
+                        else:
+                            recent_images.add(image_url)
                 except (ValueError, IndexError):
                     continue
 
@@ -429,6 +429,162 @@ class PipelineConfig(BaseModel):
         description="Base URL for Hugo site (e.g., 'https://site.com/blog'). Used for absolute image URLs.",
     )
 
+    # Mastodon multi-instance fan-out
+    mastodon_item_quota: int = Field(
+        default=80,
+        ge=1,
+        description="Stop querying Mastodon instances once this many items are collected",
+    )
+    mastodon_instance_deadline: float = Field(
+        default=20.0,
+        gt=0,
+        description="Seconds allowed per Mastodon instance (trending + fallback) before it is abandoned",
+    )
+    mastodon_max_concurrent_instances: int = Field(
+        default=4,
+        ge=1,
+        description="Mastodon instances queried at once; slower instances (by past runs) start last",
+    )
+
+    # Collector HTTP caching (data/http_cache/)
+    http_cache_enabled: bool = Field(
+        default=True,
+        description="Cache collector/source responses and revalidate with ETag/Last-Modified",
+    )
+    http_cache_item_ttl_seconds: int = Field(
+        default=10800,
+        ge=0,
+        description="How long cached API items (e.g. HN stories by id) are reused without refetching",
+    )
+    http_cache_max_age_days: int = Field(
+        default=30,
+        ge=0,
+        description="Prune cached responses not used for this many days (0 keeps them)",
+    )
+    http_cache_max_entries: int = Field(
+        default=5000,
+        ge=0,
+        description="Keep at most this many cached responses, least recently used pruned first (0: unlimited)",
+    )
+
+    # Shared OpenAI client connection pool
+    openai_max_connections: int = Field(
+        default=20,
+        ge=1,
+        description="Maximum concurrent connections held by the shared OpenAI client",
+    )
+    openai_max_keepalive_connections: int = Field(
+        default=10,
+        ge=0,
+        description="Idle connections the shared OpenAI client keeps open for reuse",
+    )
+    openai_keepalive_expiry: float = Field(
+        default=60.0,
+        ge=0.0,
+        description="Seconds an idle OpenAI connection is kept before it is closed",
+    )
+    openai_http2: bool = Field(
+        default=True,
+        description="Use HTTP/2 for OpenAI calls when the h2 package is installed",
+    )
+
+    # Per-model OpenAI rate limits (utils/rate_limit.ModelRateLimiter)
+    openai_rate_limiting: bool = Field(
+        default=True,
+        description="Throttle chat calls per model to stay within request and token limits",
+    )
+    openai_requests_per_minute: int | None = Field(
+        default=None,
+        ge=1,
+        description="Requests per minute per model until the API reports its limit (None = unlimited)",
+    )
+    openai_tokens_per_minute: int | None = Field(
+        default=None,
+        ge=1,
+        description="Tokens per minute per model until the API reports its limit (None = unlimited)",
+    )
+
+    # LLM response cache (data/llm_cache.sqlite3)
+    llm_cache_enabled: bool = Field(
+        default=False,
+        description="Reuse chat completion responses for identical requests in cacheable stages",
+    )
+    llm_cache_ttl_seconds: int = Field(
+        default=604800,
+        ge=0,
+        description="How long a cached chat completion stays valid",
+    )
+    llm_cache_max_entries: int = Field(
+        default=5000,
+        ge=1,
+        description="Cached responses kept; least recently used are evicted first",
+    )
+    llm_cache_stages: list[str] = Field(
+        default=[
+            "quality_analysis",
+            "topic_extraction",
+            "batch_analysis",
+            "illustration_diagram_validate",
+            "illustration_concept_scoring",
+            "image_relevance_validation",
+        ],
+        description="Stages or context operations whose responses may be cached (deterministic scoring/validation only)",
+    )
+
+    # Enrichment
+    enrichment_batch_size: int = Field(
+        default=1,
+        ge=1,
+        le=20,
+        description="Items scored and tagged per enrichment AI call; 1 keeps separate per-item calls",
+    )
+    enrichment_early_stop: bool = Field(
+        default=False,
+        description="Stop enrichment once articles_per_run + enrichment_ready_margin items reach quality_threshold",
+    )
+    enrichment_ready_margin: int = Field(
+        default=5,
+        ge=0,
+        description="Article-ready items enriched beyond articles_per_run before stopping early",
+    )
+    quality_threshold: float = Field(
+        default=0.5,
+        ge=0.0,
+        le=1.0,
+        description="Minimum enriched quality score for an item to be article ready",
+    )
+    enrichment_concurrency: int = Field(
+        default=32,
+        ge=1,
+        le=1000,
+        description="Upper bound on items (or batches) enriched concurrently by the asyncio enrichment engine",
+    )
+    generation_max_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Upper bound on articles generated concurrently",
+    )
+    parallel_article_stages: bool = Field(
+        default=True,
+        description="Overlap independent steps of one article (title, illustrations, cover image, citations)",
+    )
+    adaptive_concurrency: bool = Field(
+        default=True,
+        description="Adjust enrichment/generation concurrency from API latency, 429s and timeouts (AIMD)",
+    )
+    adaptive_adjustment_interval: float = Field(
+        default=10.0,
+        gt=0,
+        description="Seconds between adaptive concurrency adjustments",
+    )
+
+    # Streaming pipeline (python -m src.pipeline)
+    pipeline_queue_size: int = Field(
+        default=32,
+        ge=1,
+        description="Capacity of each queue between streaming stages; a full queue pauses the stage feeding it",
+    )
+
     # Reddit rate limiting and retry behavior
     reddit_requests_per_minute: int = Field(
         default=30, ge=1, description="Max Reddit API requests per minute"
@@ -487,6 +643,11 @@ class PipelineConfig(BaseModel):
         le=365,
         description="Time-to-live for citation cache entries in days",
     )
+    citation_max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        description="Citations of one article resolved at once (each queries CrossRef and arXiv in parallel)",
+    )
 
     # Fact-check / validation behavior
     fact_check_mode: str = Field(
@@ -523,6 +684,31 @@ class PipelineConfig(BaseModel):
         ge=0.0,
         description="Jitter factor (0-1) applied to retry backoff delays",
     )
+    fact_check_max_concurrency: int = Field(
+        default=16,
+        ge=1,
+        description="URLs checked at once per article over the shared link-check client",
+    )
+    fact_check_per_host_limit: int = Field(
+        default=2,
+        ge=1,
+        description="Concurrent link checks against any single host",
+    )
+    fact_check_deadline_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        description="Time budget for all link checks of one article; unfinished URLs are reported as unchecked",
+    )
+    fact_check_cache_ttl_seconds: int = Field(
+        default=86400,
+        ge=0,
+        description="How long a reachable URL is trusted without re-probing (data/http_cache/link_status.json); 0 disables the cache",
+    )
+    fact_check_cache_failure_ttl_seconds: int = Field(
+        default=3600,
+        ge=0,
+        description="How long an unreachable URL stays cached before it is probed again",
+    )
 
     # Image selection - multi-source fallback
     unsplash_api_key: str = Field(
@@ -645,6 +831,11 @@ class PipelineConfig(BaseModel):
         ge=0.0,
         description="Optional USD cap for a single article",
     )
+    budget_wait_seconds: float = Field(
+        default=30.0,
+        ge=0.0,
+        description="How long a call waits for in-flight calls to settle when their reservations leave no room under a cost cap",
+    )
 
     @model_validator(mode="before")
     @classmethod
@@ -8,7 +8,9 @@ curation workflow:
 - Generation: Creating articles from enriched content
 
 Each stage is designed to be run independently or as part of the full pipeline,
-enabling flexible workflows and easier testing.
+enabling flexible workflows and easier testing. ``python -m src.pipeline`` runs
+collection, enrichment and candidate selection concurrently as a streaming
+pipeline (see streaming.py) before generating articles.
 
 Example:
     from src.pipeline import generate_articles_from_enriched, load_enriched_items
@@ -34,6 +36,7 @@ from .article_builder import (
     generate_article_title,
 )
 from .candidate_selector import (
+    IncrementalCandidateSelector,
     get_available_generators,
     select_article_candidates,
     select_generator,
@@ -62,6 +65,7 @@ __all__ = [
     # Candidate selection
     "get_available_generators",
     "select_article_candidates",
+    "IncrementalCandidateSelector",
     "select_generator",
     # Deduplication
     "check_article_exists_for_source",
@@ -0,0 +1,84 @@
+"""Run the full pipeline in streaming mode.
+
+Usage:
+    python -m src.pipeline [--max-articles N] [--dry-run]
+
+Collection, enrichment and candidate selection run concurrently, connected
+by bounded queues (see streaming.py), then articles are generated from the
+selected candidates. Collected and enriched items are still written to
+data/, so the individual steps can be re-run from those files.
+"""
+
+import argparse
+import asyncio
+import os
+
+from rich.console import Console
+
+from ..config import get_config
+from ..utils.free_threading import supports_free_threading
+from .orchestrator import generate_articles_async, generate_articles_from_enriched
+from .streaming import run_streaming_pipeline
+
+console = Console()
+
+
+def main() -> int:
+    """Collect, enrich, select and generate in one streaming run."""
+    config = get_config()
+
+    parser = argparse.ArgumentParser(
+        description="Run collection, enrichment, selection and generation as one streaming pipeline"
+    )
+    parser.add_argument(
+        "--max-articles",
+        type=int,
+        default=config.articles_per_run,
+        help=f"Maximum number of articles to generate (default: {config.articles_per_run})",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Stop after candidate selection and list the candidates",
+    )
+    args = parser.parse_args()
+
+    result = asyncio.run(run_streaming_pipeline())
+    if not result.candidates:
+        console.print("[yellow]No suitable article candidates found.[/yellow]")
+        return 1
+
+    if args.dry_run:
+        console.print(f"\nSelected {len(result.candidates)} candidates:")
+        for i, item in enumerate(result.candidates, 1):
+            console.print(
+                f"  {i}. {item.original.title[:60]} ({item.quality_score:.2f})"
+            )
+        return 0
+
+    action_run_id = os.getenv("GITHUB_RUN_ID")
+    if supports_free_threading():
+        articles = asyncio.run(
+            generate_articles_async(
+                result.candidates,
+                args.max_articles,
+                action_run_id=action_run_id,
+                candidates_selected=True,
+            )
+        )
+    else:
+        articles = generate_articles_from_enriched(
+            result.candidates,
+            args.max_articles,
+            action_run_id=action_run_id,
+            candidates_selected=True,
+        )
+
+    console.print(
+        f"\n[bold green]🎉 Streaming pipeline generated {len(articles)} articles[/bold green]"
+    )
+    return 0 if articles else 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -29,6 +29,7 @@ from ..deduplication import (
     find_story_clusters,
     report_story_clusters,
 )
+from ..deduplication.story_clustering import StoryFeatures
 from ..generators.base import BaseGenerator
 from ..generators.integrative import IntegrativeListGenerator
 from ..models import EnrichedItem
@@ -83,57 +84,83 @@ def select_generator(item: EnrichedItem, generators: list) -> BaseGenerator:
     return generators[-1]
 
 
-def select_article_candidates(
-    items: list[EnrichedItem],
-    min_quality: float | None = None,
-    use_adaptive_filtering: bool = True,
-    deduplicate_stories: bool = True,
-) -> list[EnrichedItem]:
-    """Select items suitable for article generation.
-
-    This filters items based on quality score and other criteria.
-    We only want to spend API credits on content that will make good articles.
-
-    NEW: Now includes adaptive dedup filtering to reject likely duplicates
-    BEFORE generation, saving API costs.
+class IncrementalCandidateSelector:
+    """Select article candidates one enriched item at a time.
 
-    NEW: Story clustering to detect when multiple sources cover the same story.
-
-    Args:
-        items: List of enriched items
-        min_quality: Minimum quality score (0.0-1.0). Defaults to QUALITY_THRESHOLD env var.
-        use_adaptive_filtering: If True, use recent content cache and learned patterns
-        deduplicate_stories: If True, filter out duplicate stories from different sources
-
-    Returns:
-        List of items suitable for article generation
+    Applies the per-item filters of select_article_candidates() as items
+    arrive, so selection can run while enrichment is still producing items.
+    Story clustering needs the whole candidate set and runs in finalize();
+    each candidate's story features are extracted as it is accepted.
     """
-    if min_quality is None:
-        min_quality = float(os.getenv("QUALITY_THRESHOLD", "0.5"))
 
-    candidates = []
-    content_dir = get_content_dir()
+    def __init__(
+        self,
+        min_quality: float | None = None,
+        use_adaptive_filtering: bool = True,
+        deduplicate_stories: bool = True,
+    ) -> None:
+        """Set up filters and the adaptive dedup systems.
+
+        Args:
+            min_quality: Minimum quality score (0.0-1.0). Defaults to QUALITY_THRESHOLD env var.
+            use_adaptive_filtering: If True, use recent content cache and learned patterns
+            deduplicate_stories: If True, filter out duplicate stories from different sources
+        """
+        if min_quality is None:
+            min_quality = float(os.getenv("QUALITY_THRESHOLD", "0.5"))
+
+        self.min_quality = min_quality
+        self.use_adaptive_filtering = use_adaptive_filtering
+        self.deduplicate_stories = deduplicate_stories
+        self.content_dir = get_content_dir()
+        self.cooldown_days = int(os.getenv("SOURCE_COOLDOWN_DAYS", "7"))
+
+        # Initialize adaptive dedup systems
+        self.cost_tracker = CostTracker()
+        self.adaptive_feedback = AdaptiveDedupFeedback()
+        self.recent_cache = (
+            RecentContentCache(
+                self.content_dir,
+                cache_days=int(os.getenv("RECENT_CACHE_DAYS", "14")),
+            )
+            if use_adaptive_filtering
+            else None
+        )
 
-    # Initialize adaptive dedup systems
-    cost_tracker = CostTracker()
-    adaptive_feedback = AdaptiveDedupFeedback()
-    recent_cache = RecentContentCache(content_dir) if use_adaptive_filtering else None
+        self.candidates: list[EnrichedItem] = []
+        self.story_features: dict[str, StoryFeatures] = {}
+        self.rejection_reasons: dict[str, int] = {}
+        self.seen = 0
+
+    def offer(self, item: EnrichedItem) -> bool:
+        """Run the per-item filters and keep the item if it passes.
+
+        Returns:
+            True if the item was accepted as a candidate
+        """
+        self.seen += 1
+        reason = self.rejection_reason(item)
+        if reason is not None:
+            self.rejection_reasons[reason] = self.rejection_reasons.get(reason, 0) + 1
+            logger.debug(f"Rejected {item.original.id}: {reason}")
+            return False
 
-    logger.info(
-        f"Starting candidate selection from {len(items)} enriched items (min_quality={min_quality})"
-    )
-    rejection_reasons = {}
+        self.candidates.append(item)
+        if self.deduplicate_stories:
+            self.story_features[item.original.id] = StoryFeatures.from_item(item)
+        logger.debug(
+            f"Accepted {item.original.id} as candidate (quality: {item.quality_score:.3f})"
+        )
+        return True
 
-    for item in items:
+    def rejection_reason(self, item: EnrichedItem) -> str | None:
+        """Why ``item`` is not a candidate, or None if it is acceptable."""
         # Primary filter: quality score (AI-based, >= 0.5 for good content)
         # Log both heuristic and AI scores for tracking
         heuristic = getattr(item, "heuristic_score", 0)
 
-        if item.quality_score < min_quality:
-            reason = f"low_quality (AI: {item.quality_score:.2f} < {min_quality}, heur: {heuristic:.2f})"
-            rejection_reasons[reason] = rejection_reasons.get(reason, 0) + 1
-            logger.debug(f"Rejected {item.original.id}: {reason}")
-            continue
+        if item.quality_score < self.min_quality:
+            return f"low_quality (AI: {item.quality_score:.2f} < {self.min_quality}, heur: {heuristic:.2f})"
 
         # Secondary filters: content substance (allow short if it's clearly technical)
         content_len = len(item.original.content)
@@ -143,58 +170,41 @@ def select_article_candidates(
         temp_gen = IntegrativeListGenerator(None)
         if temp_gen.can_handle(item):
             if item.topics:
-                candidates.append(item)
                 logger.debug(f"Accepted {item.original.id} as list/listicle content")
-            else:
-                reason = "list_format_but_no_topics"
-                rejection_reasons[reason] = rejection_reasons.get(reason, 0) + 1
-                logger.debug(f"Rejected {item.original.id}: {reason}")
-            continue
+                return None
+            return "list_format_but_no_topics"
 
         # Allow shorter content if it has strong technical signals (acronyms/links)
         has_link = "http" in content_lower
         has_acronym = bool(re.search(r"\b[A-Z0-9-]{2,10}\b", item.original.content))
         if content_len < 200 and not (has_link or has_acronym):
-            reason = f"too_short ({content_len} chars, no links/acronyms)"
-            rejection_reasons[reason] = rejection_reasons.get(reason, 0) + 1
-            logger.debug(f"Rejected {item.original.id}: {reason}")
-            continue
+            return f"too_short ({content_len} chars, no links/acronyms)"
 
         if not item.topics:
-            reason = "no_topics_identified"
-            rejection_reasons[reason] = rejection_reasons.get(reason, 0) + 1
-            logger.debug(f"Rejected {item.original.id}: {reason}")
-            continue
+            return "no_topics_identified"
 
         # Require at least one usable supporting URL (grounded sources)
         has_supporting_urls = bool(item.related_sources)
         has_inline_url = "http" in item.original.content
         if not (has_supporting_urls or has_inline_url):
-            reason = "no_usable_source_urls"
-            rejection_reasons[reason] = rejection_reasons.get(reason, 0) + 1
-            logger.debug(f"Rejected {item.original.id}: {reason}")
-            continue
+            return "no_usable_source_urls"
 
         # Reject items without usable research context to avoid ungrounded articles
         research_summary = (item.research_summary or "").strip()
         if not research_summary or research_summary.lower().startswith(
             "research unavailable"
         ):
-            reason = "research_unavailable"
-            rejection_reasons[reason] = rejection_reasons.get(reason, 0) + 1
-            logger.debug(f"Rejected {item.original.id}: {reason}")
-            continue
+            return "research_unavailable"
 
         # Skip if we've already published an article for this source URL
         try:
-            if check_article_exists_for_source(str(item.original.url), content_dir):
-                reason = "source_already_published"
-                rejection_reasons[reason] = rejection_reasons.get(reason, 0) + 1
-                logger.debug(f"Rejected {item.original.id}: {reason}")
+            if check_article_exists_for_source(
+                str(item.original.url), self.content_dir
+            ):
                 console.print(
                     f"[dim]⏭ Skipping known source:[/dim] {item.original.title[:60]}..."
                 )
-                continue
+                return "source_already_published"
         except Exception as e:
             logger.warning(
                 f"Source existence check failed for {item.original.id}: {e}",
@@ -202,44 +212,36 @@ def select_article_candidates(
             )
 
         # Skip if source is in cooldown period
-        cooldown_days = int(os.getenv("SOURCE_COOLDOWN_DAYS", "7"))
-        if is_source_in_cooldown(str(item.original.url), content_dir, cooldown_days):
-            reason = f"source_in_cooldown ({cooldown_days}d)"
-            rejection_reasons[reason] = rejection_reasons.get(reason, 0) + 1
-            logger.debug(f"Rejected {item.original.id}: {reason}")
+        if is_source_in_cooldown(
+            str(item.original.url), self.content_dir, self.cooldown_days
+        ):
             console.print(
-                f"[dim]⏸ In cooldown ({cooldown_days}d):[/dim] {item.original.title[:60]}..."
+                f"[dim]⏸ In cooldown ({self.cooldown_days}d):[/dim] {item.original.title[:60]}..."
             )
-            continue
+            return f"source_in_cooldown ({self.cooldown_days}d)"
 
         # Adaptive pre-generation filtering
-        if use_adaptive_filtering and recent_cache:
+        if self.use_adaptive_filtering and self.recent_cache:
             candidate_summary = item.research_summary[:200]
 
-            is_dup, match = recent_cache.is_duplicate_candidate(
+            is_dup, match = self.recent_cache.is_duplicate_candidate(
                 item.original.title, candidate_summary, item.topics
             )
 
             if is_dup and match:
-                recent_cache.report_match(match, item.original.title)
-                cost_tracker.record_pre_gen_rejection(item.original.title)
-                reason = "adaptive_dedup_match"
-                rejection_reasons[reason] = rejection_reasons.get(reason, 0) + 1
-                logger.debug(f"Rejected {item.original.id}: {reason}")
+                self.recent_cache.report_match(match, item.original.title)
+                self.cost_tracker.record_pre_gen_rejection(item.original.title)
                 console.print(
                     "[yellow]⏭ Rejected pre-generation (likely duplicate)[/yellow]"
                 )
-                continue
+                return "adaptive_dedup_match"
 
             # Check against learned duplicate patterns
-            matches_pattern, pattern = adaptive_feedback.check_against_patterns(
+            matches_pattern, pattern = self.adaptive_feedback.check_against_patterns(
                 item.original.title, item.topics
             )
 
             if matches_pattern and pattern:
-                reason = "learned_pattern_match"
-                rejection_reasons[reason] = rejection_reasons.get(reason, 0) + 1
-                logger.debug(f"Rejected {item.original.id}: {reason}")
                 console.print(
                     f"[yellow]⚠ Matches learned duplicate pattern:[/yellow] "
                     f"{list(pattern.common_tags)[:3]}..."
@@ -247,61 +249,110 @@ def select_article_candidates(
                 console.print(
                     "[yellow]⏭ Rejected pre-generation (pattern match)[/yellow]"
                 )
-                continue
+                return "learned_pattern_match"
 
-        candidates.append(item)
-        logger.debug(
-            f"Accepted {item.original.id} as candidate (quality: {item.quality_score:.3f})"
-        )
+        return None
 
-    # Sort by quality score (best first)
-    candidates.sort(key=lambda x: x.quality_score, reverse=True)
+    def finalize(self) -> list[EnrichedItem]:
+        """Rank accepted candidates and remove cross-source duplicate stories.
 
-    # Show rejection summary
-    if rejection_reasons:
-        console.print("\n[yellow]📊 Rejection Summary:[/yellow]")
-        for reason, count in sorted(
-            rejection_reasons.items(), key=lambda x: x[1], reverse=True
-        ):
-            console.print(f"  {reason}: {count}")
-        logger.info(
-            f"Rejected {sum(rejection_reasons.values())} items: {rejection_reasons}"
+        Returns:
+            Candidates sorted by quality score (best first)
+        """
+        # Sort by quality score (best first)
+        candidates = sorted(
+            self.candidates, key=lambda x: x.quality_score, reverse=True
         )
 
-    console.print(
-        f"[green]✓[/green] Selected {len(candidates)} candidates from {len(items)} enriched items"
-    )
-    logger.info(
-        f"Candidate selection: {len(candidates)} candidates from {len(items)} items"
-    )
+        # Show rejection summary
+        if self.rejection_reasons:
+            console.print("\n[yellow]📊 Rejection Summary:[/yellow]")
+            for reason, count in sorted(
+                self.rejection_reasons.items(), key=lambda x: x[1], reverse=True
+            ):
+                console.print(f"  {reason}: {count}")
+            logger.info(
+                f"Rejected {sum(self.rejection_reasons.values())} items: {self.rejection_reasons}"
+            )
 
-    # Story clustering to detect cross-source duplicates
-    if deduplicate_stories and len(candidates) > 1:
         console.print(
-            "\n[blue]🔍 Checking for duplicate stories across sources...[/blue]"
+            f"[green]✓[/green] Selected {len(candidates)} candidates from {self.seen} enriched items"
         )
-
-        # Find and report story clusters
-        clusters = find_story_clusters(candidates, min_similarity=0.50)
-        report_story_clusters(clusters, verbose=True)
-        logger.info(f"Story clustering: found {len(clusters)} potential story clusters")
-
-        # Filter out duplicate stories (keep best source for each story)
-        pre_filter = len(candidates)
-        candidates = filter_duplicate_stories(candidates, keep_best=True)
         logger.info(
-            f"After story dedup: {len(candidates)} candidates (removed {pre_filter - len(candidates)})"
+            f"Candidate selection: {len(candidates)} candidates from {self.seen} items"
         )
 
-    # Print cache stats if using adaptive filtering
-    if use_adaptive_filtering and recent_cache:
-        stats = recent_cache.get_cache_stats()
-        console.print(
-            f"[dim]Recent cache: {stats['cached_articles']} articles, "
-            f"{stats['unique_tags']} unique tags[/dim]"
-        )
+        # Story clustering to detect cross-source duplicates
+        if self.deduplicate_stories and len(candidates) > 1:
+            console.print(
+                "\n[blue]🔍 Checking for duplicate stories across sources...[/blue]"
+            )
+
+            # Find and report story clusters
+            clusters = find_story_clusters(
+                candidates, min_similarity=0.50, features=self.story_features
+            )
+            report_story_clusters(clusters, verbose=True)
+            logger.info(
+                f"Story clustering: found {len(clusters)} potential story clusters"
+            )
+
+            # Filter out duplicate stories (keep best source for each story)
+            pre_filter = len(candidates)
+            candidates = filter_duplicate_stories(
+                candidates, keep_best=True, clusters=clusters
+            )
+            logger.info(
+                f"After story dedup: {len(candidates)} candidates (removed {pre_filter - len(candidates)})"
+            )
+
+        # Print cache stats if using adaptive filtering
+        if self.use_adaptive_filtering and self.recent_cache:
+            stats = self.recent_cache.get_cache_stats()
+            console.print(
+                f"[dim]Recent cache: {stats['cached_articles']} articles, "
+                f"{stats['unique_tags']} unique tags[/dim]"
+            )
+
+        return candidates
+
+
+def select_article_candidates(
+    items: list[EnrichedItem],
+    min_quality: float | None = None,
+    use_adaptive_filtering: bool = True,
+    deduplicate_stories: bool = True,
+) -> list[EnrichedItem]:
+    """Select items suitable for article generation.
+
+    This filters items based on quality score and other criteria.
+    We only want to spend API credits on content that will make good articles.
+
+    NEW: Now includes adaptive dedup filtering to reject likely duplicates
+    BEFORE generation, saving API costs.
+
+    NEW: Story clustering to detect when multiple sources cover the same story.
+
+    Args:
+        items: List of enriched items
+        min_quality: Minimum quality score (0.0-1.0). Defaults to QUALITY_THRESHOLD env var.
+        use_adaptive_filtering: If True, use recent content cache and learned patterns
+        deduplicate_stories: If True, filter out duplicate stories from different sources
+
+    Returns:
+        List of items suitable for article generation
+    """
+    selector = IncrementalCandidateSelector(
+        min_quality, use_adaptive_filtering, deduplicate_stories
+    )
+    logger.info(
+        f"Starting candidate selection from {len(items)} enriched items (min_quality={selector.min_quality})"
+    )
+
+    for item in items:
+        selector.offer(item)
 
-    return candidates
+    return selector.finalize()
 
 
 def select_diverse_candidates(
@@ -9,13 +9,14 @@ cooldown periods to ensure content diversity:
 - Load article metadata for deduplication checks
 
 Supports both legacy single-source and current multi-source formats.
+All lookups go through the shared article index (utils/article_index.py)
+rather than re-parsing every post's frontmatter.
 """
 
-from datetime import UTC, date, datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
-import frontmatter
-
+from ..utils.article_index import get_article_index
 from ..utils.logging import get_logger
 from ..utils.url_tools import normalize_url
 
@@ -33,33 +34,12 @@ def check_article_exists_for_source(source_url: str, content_dir: Path) -> Path
         Path to existing article if found, None otherwise
     """
     logger.debug(f"Checking if article exists for source: {source_url}")
-    # Normalize incoming URL once
-    normalized_input = normalize_url(source_url)
-
-    # Check all existing markdown files for this source URL
-    for filepath in content_dir.glob("*.md"):
-        try:
-            post = frontmatter.load(str(filepath))
-            meta = post.metadata or {}
-            # New format: list of sources
-            sources = meta.get("sources")
-            if isinstance(sources, list):
-                for s in sources:
-                    url = s.get("url") if isinstance(s, dict) else None
-                    if url and normalize_url(str(url)) == normalized_input:
-                        return filepath
-            # Legacy format: single source dict
-            source_meta = meta.get("source")
-            if isinstance(source_meta, dict):
-                url = source_meta.get("url")
-                if url and normalize_url(str(url)) == normalized_input:
-                    logger.info(f"Found existing article for source: {filepath.name}")
-                    return filepath
-        except (OSError, ValueError) as e:
-            logger.warning(
-                f"Failed to load article metadata from {filepath}: {e}", exc_info=True
-            )
-            continue
+    index = get_article_index(content_dir)
+    matches = index.find_by_source(source_url)
+    if matches:
+        filepath = index.path_for(matches[0])
+        logger.info(f"Found existing article for source: {filepath.name}")
+        return filepath
     logger.debug("No existing article found for source")
     return None
 
@@ -76,29 +56,7 @@ def collect_existing_source_urls(content_dir: Path) -> set[str]:
         Set of normalized source URLs
     """
     logger.debug("Collecting existing source URLs from articles")
-    urls: set[str] = set()
-    for filepath in content_dir.glob("*.md"):
-        try:
-            post = frontmatter.load(str(filepath))
-            meta = post.metadata or {}
-            # New format: list of sources
-            sources = meta.get("sources")
-            if isinstance(sources, list):
-                for s in sources:
-                    url = s.get("url") if isinstance(s, dict) else None
-                    if url:
-                        urls.add(normalize_url(str(url)))
-            # Legacy format: single source dict
-            legacy = meta.get("source")
-            if isinstance(legacy, dict):
-                url = legacy.get("url")
-                if url:
-                    urls.add(normalize_url(str(url)))
-        except (OSError, ValueError) as e:
-            logger.warning(
-                f"Failed to load article metadata from {filepath}: {e}", exc_info=True
-            )
-            continue
+    urls = get_article_index(content_dir).source_urls()
     logger.info(f"Collected {len(urls)} existing source URLs")
     return urls
 
@@ -122,56 +80,15 @@ def is_source_in_cooldown(
     normalized_url = normalize_url(source_url)
     cutoff_date = datetime.now(UTC) - timedelta(days=cooldown_days)
 
-    for filepath in content_dir.glob("*.md"):
-        try:
-            post = frontmatter.load(str(filepath))
-            meta = post.metadata or {}
-
-            # Check article date
-            article_date_str = meta.get("date")
-            if not article_date_str:
-                continue
-
-            # Handle datetime.date, datetime.datetime, or string
-            if isinstance(article_date_str, datetime):
-                article_date = (
-                    article_date_str.replace(tzinfo=UTC)
-                    if article_date_str.tzinfo is None
-                    else article_date_str
-                )
-            elif isinstance(article_date_str, date):
-                # Convert date to datetime at start of day
-                article_date = datetime.combine(
-                    article_date_str, datetime.min.time()
-                ).replace(tzinfo=UTC)
-            elif isinstance(article_date_str, str):
-                # Parse date (format: YYYY-MM-DD or full ISO format)
-                article_date = datetime.fromisoformat(article_date_str)
-                if article_date.tzinfo is None:
-                    article_date = article_date.replace(tzinfo=UTC)
-            else:
-                continue
-
-            # If article is older than cooldown, skip it
-            if article_date < cutoff_date:
-                continue
-
-            # Check if this article used our source URL
-            sources = meta.get("sources", [])
-            if isinstance(sources, list):
-                for s in sources:
-                    url = s.get("url") if isinstance(s, dict) else None
-                    if url and normalize_url(str(url)) == normalized_url:
-                        logger.debug(
-                            f"Source {source_url} in cooldown (article from {article_date})"
-                        )
-                        return True  # Found recent article with this source
-
-        except (OSError, ValueError) as e:
-            logger.warning(
-                f"Failed to load article metadata from {filepath}: {e}", exc_info=True
-            )
+    for record in get_article_index(content_dir).find_by_source(source_url):
+        # Only the current 'sources' list counts towards cooldown
+        if normalized_url not in record.source_urls:
             continue
+        article_date = record.published_datetime
+        if article_date is None or article_date < cutoff_date:
+            continue
+        logger.debug(f"Source {source_url} in cooldown (article from {article_date})")
+        return True  # Found recent article with this source
 
     logger.debug(f"Source {source_url} not in cooldown")
     return False  # Source not used recently
@@ -192,16 +109,12 @@ def find_article_by_slug(slug: str, content_dir: Path) -> Path | None:
     """
     logger.debug(f"Searching for existing article with slug: {slug}")
 
-    # Pattern: any date prefix followed by the slug
-    pattern = f"*-{slug}.md"
-
-    for filepath in content_dir.glob(pattern):
-        # Verify it matches the date-slug pattern
-        filename = filepath.stem  # Remove .md extension
-        # Expected format: YYYY-MM-DD-slug
-        if filename.endswith(f"-{slug}"):
-            logger.info(f"Found existing article with slug '{slug}': {filepath.name}")
-            return filepath
+    index = get_article_index(content_dir)
+    record = index.find_by_slug(slug)
+    if record:
+        filepath = index.path_for(record)
+        logger.info(f"Found existing article with slug '{slug}': {filepath.name}")
+        return filepath
 
     logger.debug(f"No existing article found with slug: {slug}")
     return None
@@ -220,27 +133,17 @@ def load_article_metadata_for_dedup(content_dir: Path) -> list[dict]:
         List of article metadata dictionaries
     """
     logger.debug("Loading article metadata for deduplication")
-    articles = []
-
-    for filepath in content_dir.glob("*.md"):
-        try:
-            post = frontmatter.load(str(filepath))
-            meta = post.metadata or {}
-
-            articles.append(
-                {
-                    "title": meta.get("title", ""),
-                    "summary": meta.get("summary", ""),
-                    "tags": meta.get("tags", []),
-                    "content": post.content[:500],  # First 500 chars
-                    "filepath": filepath,
-                }
-            )
-        except (OSError, ValueError) as e:
-            logger.warning(
-                f"Failed to load article metadata from {filepath}: {e}", exc_info=True
-            )
-            continue
+    index = get_article_index(content_dir)
+    articles = [
+        {
+            "title": record.title,
+            "summary": record.summary,
+            "tags": record.tags,
+            "content": record.excerpt,  # First 500 chars
+            "filepath": index.path_for(record),
+        }
+        for record in index.records()
+    ]
 
     logger.info(f"Loaded metadata for {len(articles)} articles for deduplication")
     return articles
@@ -7,7 +7,6 @@ Handles saving and loading of generated articles:
 - Attach cover images and metadata
 """
 
-import json
 import re
 from pathlib import Path
 from urllib.parse import urlparse
@@ -16,20 +15,29 @@ import frontmatter
 from openai import OpenAI
 from rich.console import Console
 
-from ..citations import CitationExtractor, CitationFormatter, CitationResolver
+from ..citations import (
+    Citation,
+    CitationExtractor,
+    CitationFormatter,
+    CitationResolver,
+)
 from ..citations.cache import CitationCache
 from ..citations.resolver import ResolvedCitation
 from ..config import PipelineConfig, get_content_dir
+from ..deduplication.near_dup_index import get_near_duplicate_index
 from ..images import CoverImageSelector, select_or_create_cover_image
 from ..images.downloader import download_and_persist
 from ..models import EnrichedItem, GeneratedArticle
+from ..utils.article_index import PARSE_ERRORS, get_article_index
 from ..utils.costs import append_generation_cost
 from ..utils.file_io import (
     atomic_write_text,
     format_generation_costs,
 )
 from ..utils.logging import get_logger
+from ..utils.ndjson import iter_models
 from ..utils.sanitization import safe_filename, validate_path
+from ..utils.stage_graph import StageGraph
 from ..utils.url_tools import normalize_url
 from .deduplication import find_article_by_slug
 
@@ -37,6 +45,242 @@ logger = get_logger(__name__)
 console = Console()
 
 
+def _attach_cover_image(
+    article: GeneratedArticle,
+    config: PipelineConfig,
+    client: OpenAI | None,
+    filepath: Path,
+    metadata: dict,
+    artifact_failures: list[str],
+) -> None:
+    """Select a cover image and record it (with attribution) in metadata."""
+    slug = filepath.stem
+    hero_path = icon_path = None
+    image_attribution = None  # Store attribution info
+    try:
+        # Try multi-source image selection first
+        if client and (config.unsplash_api_key or config.pexels_api_key):
+            try:
+                selector = CoverImageSelector(client, config)
+                cover_image = selector.select(
+                    article.title,
+                    article.tags,
+                    article.content,
+                    article_id=slug,
+                    generation_costs=article.generation_costs,
+                )
+                hero_path = cover_image.url
+                icon_path = cover_image.url
+                image_attribution = cover_image  # Store for attribution
+                # Append image cost for itemized billing
+                append_generation_cost(
+                    article.generation_costs, "image_generation", cover_image.cost
+                )
+                console.print(
+                    f"[green]✓[/green] Selected {cover_image.source} image "
+                    f"(cost: ${cover_image.cost:.4f})"
+                )
+            except (ValueError, KeyError, AttributeError) as e:
+                logger.warning(
+                    f"Multi-source image selection failed for article '{article.title}': {e}",
+                    exc_info=True,
+                )
+                console.print(
+                    f"[yellow]⚠ Multi-source image selection failed: {e}[/yellow]"
+                )
+                artifact_failures.append("image_selection_failed")
+
+                # If the selected cover_image is an external URL, download and persist locally
+                if hero_path and hero_path.startswith("http"):
+                    try:
+                        meta = {
+                            "photographer": getattr(
+                                image_attribution, "photographer_name", None
+                            ),
+                            "photographer_url": getattr(
+                                image_attribution, "photographer_url", None
+                            ),
+                            "source": getattr(image_attribution, "source", None),
+                        }
+                        hero_path_local, icon_path_local = download_and_persist(
+                            hero_path, slug, meta=meta, base_url=""
+                        )
+                        hero_path = hero_path_local
+                        icon_path = icon_path_local
+                        console.print(
+                            f"[dim]Downloaded image and saved as {hero_path}[/dim]"
+                        )
+                    except (OSError, ValueError, KeyError, AttributeError) as e:
+                        logger.warning(
+                            f"Failed to persist external image: {type(e).__name__}: {e}",
+                            exc_info=True,
+                        )
+                        console.print(
+                            f"[yellow]⚠ Failed to persist image: {e}[/yellow]"
+                        )
+                        artifact_failures.append("image_persist_failed")
+                        hero_path = None
+                        icon_path = None
+
+        # Fallback: Reuse from library
+        if not hero_path and config.image_strategy in (
+            "reuse",
+            "reuse_then_generate",
+        ):
+            hero_path, icon_path = select_or_create_cover_image(
+                article.tags, slug, config.hugo_base_url
+            )
+            # Append zero cost for reused image
+            append_generation_cost(article.generation_costs, "image_generation", 0.0)
+
+        # Normalize: persist any external URL so frontmatter stores local Hugo paths.
+        if hero_path and str(hero_path).startswith("http"):
+            try:
+                meta = {}
+                if image_attribution is not None:
+                    meta = {
+                        "photographer": getattr(
+                            image_attribution, "photographer_name", None
+                        ),
+                        "photographer_url": getattr(
+                            image_attribution, "photographer_url", None
+                        ),
+                        "source": getattr(image_attribution, "source", None),
+                    }
+                hero_path_local, icon_path_local = download_and_persist(
+                    str(hero_path), slug, meta=meta, base_url=""
+                )
+                hero_path = hero_path_local
+                icon_path = icon_path_local
+                console.print(f"[dim]Downloaded image and saved as {hero_path}[/dim]")
+            except (OSError, ValueError, KeyError, AttributeError) as e:
+                logger.warning(
+                    f"Failed to persist external cover image: {type(e).__name__}: {e}",
+                    exc_info=True,
+                )
+                console.print(f"[yellow]⚠ Failed to persist cover image: {e}[/yellow]")
+                artifact_failures.append("image_persist_failed")
+                hero_path = None
+                icon_path = None
+    except (OSError, ValueError, KeyError) as ie:
+        logger.error(
+            f"Image attachment failed for article '{article.title}': {ie}",
+            exc_info=True,
+        )
+        console.print(f"[yellow]⚠[/yellow] Image attach failed: {ie}")
+        artifact_failures.append("image_attach_failed")
+
+    if hero_path:
+        metadata["cover"]["image"] = hero_path
+        metadata["cover"]["alt"] = article.title
+        metadata["icon"] = icon_path or ""
+        # Add image attribution if available
+        if image_attribution and image_attribution.photographer_name:
+            metadata["cover"]["photographer"] = image_attribution.photographer_name
+            if image_attribution.photographer_url:
+                metadata["cover"]["photographer_url"] = (
+                    image_attribution.photographer_url
+                )
+            metadata["cover"]["image_source"] = image_attribution.source
+
+
+def _lookup_citations(
+    citations: list[Citation],
+) -> dict[tuple[str, int], ResolvedCitation]:
+    """Resolve each distinct (authors, year), cached entries first.
+
+    New resolutions are written to the citation cache in one commit, and the
+    cache is closed even if a lookup fails.
+    """
+    with CitationCache(autosave=False) as cache:
+        # Cached resolutions first (including cached misses)
+        resolutions: dict[tuple[str, int], ResolvedCitation] = {}
+        for citation in citations:
+            key = (citation.authors, citation.year)
+            if key in resolutions:
+                continue
+            cached_entry = cache.get(citation.authors, citation.year)
+            if cached_entry:
+                # Convert cached dict to ResolvedCitation
+                resolutions[key] = ResolvedCitation(
+                    doi=cached_entry.get("doi"),
+                    arxiv_id=cached_entry.get("arxiv_id"),
+                    pmid=cached_entry.get("pmid"),
+                    url=cached_entry.get("url"),
+                    confidence=cached_entry.get("confidence") or 0.0,
+                    source_uri=cached_entry.get("url"),  # Use URL as source_uri
+                )
+
+        # Resolve the rest concurrently, then persist them in one write
+        misses = list(
+            dict.fromkeys(
+                (c.authors, c.year)
+                for c in citations
+                if (c.authors, c.year) not in resolutions
+            )
+        )
+        if misses:
+            resolver = CitationResolver()
+            try:
+                results = resolver.resolve_many(misses)
+            finally:
+                resolver.close()
+            for (authors, year), result in zip(misses, results, strict=True):
+                resolutions[(authors, year)] = result
+                cache.put(
+                    authors,
+                    year,
+                    doi=result.doi,
+                    url=result.url,
+                    arxiv_id=result.arxiv_id,
+                    confidence=result.confidence,
+                )
+    return resolutions
+
+
+def _resolve_citations(
+    article: GeneratedArticle, config: PipelineConfig
+) -> tuple[str, list[str]]:
+    """Resolve academic citations in the article body if enabled.
+
+    Returns:
+        (content with formatted citations, bibliography entries)
+    """
+    article_content = article.content
+    citation_bibliography: list[str] = []
+    if config.enable_citations:
+        try:
+            extractor = CitationExtractor()
+            formatter = CitationFormatter()
+            citations = extractor.extract(article_content)
+            if citations:
+                resolutions = _lookup_citations(citations)
+
+                formatted_citations = [
+                    formatter.format(
+                        citation, resolutions[(citation.authors, citation.year)]
+                    )
+                    for citation in citations
+                ]
+
+                # Apply all formatted citations to the article content
+                article_content = formatter.apply_to_text(
+                    article_content, formatted_citations
+                )
+
+                # Build bibliography from resolved citations
+                citation_bibliography = formatter.build_bibliography(
+                    formatted_citations
+                )
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(
+                f"Citation processing failed for article '{article.title}': {e}",
+                exc_info=True,
+            )
+            console.print(f"[yellow]⚠ Citation processing failed: {e}[/yellow]")
+    return article_content, citation_bibliography
+
+
 def save_article_to_file(
     article: GeneratedArticle,
     config: PipelineConfig,
@@ -197,142 +441,20 @@ def save_article_to_file(
             "enrichment": config.enrichment_model,
         }
 
-    # Optional: Attach cover image
+    # Cover image selection and citation resolution only read the article
+    # (citations must be resolved BEFORE building references), so they overlap
+    stages = StageGraph(f"save {filepath.name}", phase="publish")
     if generate_image:
-        slug = filepath.stem
-        hero_path = icon_path = None
-        image_attribution = None  # Store attribution info
-        try:
-            # Try multi-source image selection first
-            if client and (config.unsplash_api_key or config.pexels_api_key):
-                try:
-                    selector = CoverImageSelector(client, config)
-                    cover_image = selector.select(
-                        article.title,
-                        article.tags,
-                        article.content,
-                        article_id=slug,
-                        generation_costs=article.generation_costs,
-                    )
-                    hero_path = cover_image.url
-                    icon_path = cover_image.url
-                    image_attribution = cover_image  # Store for attribution
-                    # Append image cost for itemized billing
-                    append_generation_cost(
-                        article.generation_costs, "image_generation", cover_image.cost
-                    )
-                    console.print(
-                        f"[green]✓[/green] Selected {cover_image.source} image "
-                        f"(cost: ${cover_image.cost:.4f})"
-                    )
-                except (ValueError, KeyError, AttributeError) as e:
-                    logger.warning(
-                        f"Multi-source image selection failed for article '{article.title}': {e}",
-                        exc_info=True,
-                    )
-                    console.print(
-                        f"[yellow]⚠ Multi-source image selection failed: {e}[/yellow]"
-                    )
-                    artifact_failures.append("image_selection_failed")
-
-                    # If the selected cover_image is an external URL, download and persist locally
-                    if hero_path and hero_path.startswith("http"):
-                        try:
-                            meta = {
-                                "photographer": getattr(
-                                    image_attribution, "photographer_name", None
-                                ),
-                                "photographer_url": getattr(
-                                    image_attribution, "photographer_url", None
-                                ),
-                                "source": getattr(image_attribution, "source", None),
-                            }
-                            hero_path_local, icon_path_local = download_and_persist(
-                                hero_path, slug, meta=meta, base_url=""
-                            )
-                            hero_path = hero_path_local
-                            icon_path = icon_path_local
-                            console.print(
-                                f"[dim]Downloaded image and saved as {hero_path}[/dim]"
-                            )
-                        except (OSError, ValueError, KeyError, AttributeError) as e:
-                            logger.warning(
-                                f"Failed to persist external image: {type(e).__name__}: {e}",
-                                exc_info=True,
-                            )
-                            console.print(
-                                f"[yellow]⚠ Failed to persist image: {e}[/yellow]"
-                            )
-                            artifact_failures.append("image_persist_failed")
-                            hero_path = None
-                            icon_path = None
-
-            # Fallback: Reuse from library
-            if not hero_path and config.image_strategy in (
-                "reuse",
-                "reuse_then_generate",
-            ):
-                hero_path, icon_path = select_or_create_cover_image(
-                    article.tags, slug, config.hugo_base_url
-                )
-                # Append zero cost for reused image
-                append_generation_cost(
-                    article.generation_costs, "image_generation", 0.0
-                )
-
-            # Normalize: persist any external URL so frontmatter stores local Hugo paths.
-            if hero_path and str(hero_path).startswith("http"):
-                try:
-                    meta = {}
-                    if image_attribution is not None:
-                        meta = {
-                            "photographer": getattr(
-                                image_attribution, "photographer_name", None
-                            ),
-                            "photographer_url": getattr(
-                                image_attribution, "photographer_url", None
-                            ),
-                            "source": getattr(image_attribution, "source", None),
-                        }
-                    hero_path_local, icon_path_local = download_and_persist(
-                        str(hero_path), slug, meta=meta, base_url=""
-                    )
-                    hero_path = hero_path_local
-                    icon_path = icon_path_local
-                    console.print(
-                        f"[dim]Downloaded image and saved as {hero_path}[/dim]"
-                    )
-                except (OSError, ValueError, KeyError, AttributeError) as e:
-                    logger.warning(
-                        f"Failed to persist external cover image: {type(e).__name__}: {e}",
-                        exc_info=True,
-                    )
-                    console.print(
-                        f"[yellow]⚠ Failed to persist cover image: {e}[/yellow]"
-                    )
-                    artifact_failures.append("image_persist_failed")
-                    hero_path = None
-                    icon_path = None
-        except (OSError, ValueError, KeyError) as ie:
-            logger.error(
-                f"Image attachment failed for article '{article.title}': {ie}",
-                exc_info=True,
-            )
-            console.print(f"[yellow]⚠[/yellow] Image attach failed: {ie}")
-            artifact_failures.append("image_attach_failed")
-
-        if hero_path:
-            metadata["cover"]["image"] = hero_path
-            metadata["cover"]["alt"] = article.title
-            metadata["icon"] = icon_path or ""
-            # Add image attribution if available
-            if image_attribution and image_attribution.photographer_name:
-                metadata["cover"]["photographer"] = image_attribution.photographer_name
-                if image_attribution.photographer_url:
-                    metadata["cover"]["photographer_url"] = (
-                        image_attribution.photographer_url
-                    )
-                metadata["cover"]["image_source"] = image_attribution.source
+        stages.add(
+            "cover_image",
+            lambda: _attach_cover_image(
+                article, config, client, filepath, metadata, artifact_failures
+            ),
+        )
+    stages.add("citations", lambda: _resolve_citations(article, config))
+    article_content, citation_bibliography = stages.run(
+        concurrent=config.parallel_article_stages
+    )["citations"]
 
     # Non-blocking fallback: ensure a local cover image exists for sustainability.
     if not metadata["cover"]["image"]:
@@ -371,62 +493,6 @@ def save_article_to_file(
             f"> Original: {normalize_url(str(primary.url))}\n\n"
         )
 
-    # Apply citation resolution if enabled (must happen BEFORE building references)
-    article_content = article.content
-    citation_bibliography: list[str] = []
-    if config.enable_citations:
-        try:
-            extractor = CitationExtractor()
-            resolver = CitationResolver()
-            formatter = CitationFormatter()
-            cache = CitationCache()
-
-            citations = extractor.extract(article_content)
-            if citations:
-                # Resolve each citation individually with cache checking
-                formatted_citations = []
-                for citation in citations:
-                    # Check cache first
-                    cached_entry = cache.get(citation.authors, citation.year)
-                    if cached_entry:
-                        # Convert cached dict to ResolvedCitation
-                        cached = ResolvedCitation(
-                            doi=cached_entry.get("doi"),
-                            arxiv_id=cached_entry.get("arxiv_id"),
-                            pmid=cached_entry.get("pmid"),
-                            url=cached_entry.get("url"),
-                            confidence=cached_entry.get("confidence", 0.0),
-                            source_uri=cached_entry.get("url"),  # Use URL as source_uri
-                        )
-                        formatted = formatter.format(citation, cached)
-                    else:
-                        # Resolve and cache
-                        result = resolver.resolve(citation.authors, citation.year)
-                        cache.put(
-                            citation.authors,
-                            citation.year,
-                            doi=result.doi,
-                            url=result.url,
-                        )
-                        formatted = formatter.format(citation, result)
-                    formatted_citations.append(formatted)
-
-                # Apply all formatted citations to the article content
-                article_content = formatter.apply_to_text(
-                    article_content, formatted_citations
-                )
-
-                # Build bibliography from resolved citations
-                citation_bibliography = formatter.build_bibliography(
-                    formatted_citations
-                )
-        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
-            logger.warning(
-                f"Citation processing failed for article '{article.title}': {e}",
-                exc_info=True,
-            )
-            console.print(f"[yellow]⚠ Citation processing failed: {e}[/yellow]")
-
     # Append references (now citation_bibliography is defined)
     references_block = ""
     if article.sources or citation_bibliography:
@@ -511,6 +577,26 @@ def save_article_to_file(
     post = frontmatter.Post(full_content, **metadata)
     article_text = frontmatter.dumps(post)
     atomic_write_text(filepath, article_text)
+    get_article_index(content_dir).update(filepath)
+    # The article is already written: a failing duplicate check must not fail the save
+    try:
+        near_duplicates = get_near_duplicate_index(content_dir).update(filepath)
+    except PARSE_ERRORS as e:
+        logger.warning(f"Near-duplicate check failed for {article.filename}: {e}")
+        near_duplicates = []
+    if near_duplicates:
+        names = ", ".join(d.article2_path.name for d in near_duplicates[:3])
+        logger.warning(
+            f"{article.filename} looks like a duplicate of {names} "
+            f"(best overall similarity {near_duplicates[0].overall_score:.0%})",
+            extra={
+                "phase": "dedup",
+                "event": "near_duplicate_saved",
+                "article": article.filename,
+                "duplicates": [d.article2_path.name for d in near_duplicates],
+            },
+        )
+        console.print(f"[yellow]⚠[/yellow] {article.filename} may duplicate: {names}")
 
     logger.info(
         f"Successfully saved article: {article.filename} ({len(full_content)} bytes)"
@@ -520,7 +606,7 @@ def save_article_to_file(
 
 
 def load_enriched_items(filepath: Path) -> list[EnrichedItem]:
-    """Load enriched items from JSON file.
+    """Load enriched items from an NDJSON or legacy JSON file.
 
     Args:
         filepath: Path to enriched items file
@@ -529,21 +615,15 @@ def load_enriched_items(filepath: Path) -> list[EnrichedItem]:
         List of EnrichedItem objects
     """
     logger.debug(f"Loading enriched items from: {filepath}")
-    with open(filepath, encoding="utf-8") as f:
-        data = json.load(f)
 
-    items = []
-    for item_data in data["items"]:
-        try:
-            item = EnrichedItem(**item_data)
-            items.append(item)
-        except (ValueError, TypeError, KeyError) as e:
-            logger.warning(
-                f"Failed to load enriched item: {type(e).__name__} - {e}, item data: {item_data}",
-                exc_info=True,
-            )
-            console.print(f"[yellow]⚠[/yellow] Failed to load enriched item: {e}")
-            continue
+    def warn(e: Exception) -> None:
+        logger.warning(
+            f"Failed to load enriched item: {type(e).__name__} - {e}",
+            exc_info=True,
+        )
+        console.print(f"[yellow]⚠[/yellow] Failed to load enriched item: {e}")
+
+    items = list(iter_models(filepath, EnrichedItem, on_error=warn))
 
     console.print(
         f"[green]✓[/green] Loaded {len(items)} enriched items from {filepath.name}"
@@ -7,9 +7,11 @@ modular design. Thread-safe and optimized for Python 3.14 free-threading.
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import os
 from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 from rich.console import Console
@@ -27,9 +29,11 @@ from ..models import (
     GeneratedArticle,
     GeneratedArticleQualityDimensions,
 )
+from ..utils.adaptive_worker_manager import build_worker_manager
 from ..utils.clients import get_openai_client
 from ..utils.costs import append_generation_cost, merge_generation_costs
 from ..utils.logging import get_logger
+from ..utils.stage_graph import StageGraph
 
 if TYPE_CHECKING:
     from openai import OpenAI
@@ -60,6 +64,135 @@ console = Console()
 logger = get_logger(__name__)
 
 
+def _select_voice(item: EnrichedItem) -> str:
+    """Select the voice profile for an article (Phase 1 feature)."""
+    try:
+        from ..generators.voices.selector import VoiceSelector
+
+        voice_selector = VoiceSelector()
+        voice_profile = voice_selector.select_voice(
+            content_type=getattr(item, "content_type", "general"),
+            complexity_score=item.quality_score,
+        )
+        console.print(f"  Voice: {voice_profile.name}")
+        voice_selector.add_to_history(
+            generate_article_slug(item.original.title), voice_profile.voice_id
+        )
+        return voice_profile.voice_id
+    except ImportError:
+        # Voice system not available (backwards compatibility)
+        console.print("  Voice: default (module not available)")
+        return "default"
+
+
+def _generate_content(
+    generator: BaseGenerator, item: EnrichedItem
+) -> tuple[str, int, int]:
+    """Generate article content, returning (content, input tokens, output tokens)."""
+    console.print("  [dim]Calling OpenAI API for content generation...[/dim]")
+    content, input_tokens, output_tokens = generator.generate_content(item)
+    console.print(f"  Content: {len(content.split())} words")
+    return content, input_tokens, output_tokens
+
+
+def _article_metadata(
+    item: EnrichedItem, content: str, title: str, content_dir: Path
+) -> tuple[dict, str]:
+    """Build metadata and pick the filename for a titled article."""
+    console.print(f"  Title: {title}")
+    metadata = create_article_metadata(item, title, content)
+
+    slug = generate_article_slug(title)
+    console.print(f"  Slug: {slug}")
+
+    # Check if an article with this slug already exists
+    # This preserves URLs when updating similar content
+    existing_by_slug = find_article_by_slug(slug, content_dir)
+    if existing_by_slug:
+        console.print(
+            f"  [cyan]📝 Will update existing article:[/cyan] {existing_by_slug.name}"
+        )
+        logger.info(
+            f"Found existing article with slug '{slug}': {existing_by_slug.name}"
+        )
+        # Use the existing filename to preserve the URL
+        return metadata, existing_by_slug.name
+    return metadata, f"{datetime.now().strftime('%Y-%m-%d')}-{slug}.md"
+
+
+def _illustrate(
+    illustration_service: IllustrationService | None,
+    generator_name: str,
+    content: str,
+    article_id: str,
+) -> tuple[str, int, dict]:
+    """Add illustrations if enabled, returning (content, count, costs)."""
+    if illustration_service is None:
+        return content, 0, {}
+    result = illustration_service.generate_illustrations(
+        generator_name,
+        content,
+        article_id=article_id,
+    )
+    return result.content, result.count, result.costs
+
+
+def _format_content(illustrated: tuple[str, int, dict]) -> str:
+    """Format the illustrated markdown with mdformat when available."""
+    content = illustrated[0]
+    if format_markdown is None:
+        console.print(
+            "  [dim]Note: mdformat not available, skipping markdown formatting[/dim]"
+        )
+        return content
+    try:
+        return format_markdown(content)
+    except Exception as e:
+        logger.warning("Markdown formatting failed", exc_info=True)
+        console.print(f"  [dim]Note: markdown formatting skipped ({str(e)[:30]})[/dim]")
+        return content
+
+
+def _track_quality(
+    article: GeneratedArticle,
+    final_content: str,
+    config: PipelineConfig,
+    voice_id: str,
+) -> None:
+    """Score the article and record it for model comparison (Phase 2)."""
+    try:
+        quality_scorer = QualityScorer()
+        quality_result = quality_scorer.score(article, final_content)
+
+        # Store quality score in article for metadata
+        article.quality_score = quality_result.overall_score
+        article.quality_dimensions = cast(
+            GeneratedArticleQualityDimensions, quality_result.dimension_scores
+        )
+        article.quality_passed = quality_result.passed_threshold
+
+        # Track quality for model comparison
+        quality_tracker = QualityTracker()
+        quality_tracker.record_quality(
+            article,
+            quality_result,
+            final_content,
+            models={
+                "content_model": config.content_model,
+                "title_model": config.title_model,
+                "review_model": config.review_model,
+                "enrichment_model": config.enrichment_model,
+                "voice": voice_id,
+            },
+        )
+        logger.debug(
+            f"Quality tracked: score={quality_result.overall_score:.1f}, "
+            f"model={config.content_model}"
+        )
+    except Exception:
+        logger.warning("Failed to track quality metrics", exc_info=True)
+
+
 def generate_single_article(
     item: EnrichedItem,
     generators: list[BaseGenerator],
@@ -115,31 +248,53 @@ def generate_single_article(
         console.print(f"  Using: {generator.name}")
         logger.debug(f"Selected generator: {generator.name}")
 
-        # Select voice for this article (Phase 1 feature)
-        voice_id = "default"
-        try:
-            from ..generators.voices.selector import VoiceSelector
-
-            voice_selector = VoiceSelector()
-            voice_profile = voice_selector.select_voice(
-                content_type=getattr(item, "content_type", "general"),
-                complexity_score=item.quality_score,
-            )
-            voice_id = voice_profile.voice_id
-            console.print(f"  Voice: {voice_profile.name}")
-            voice_selector.add_to_history(
-                generate_article_slug(item.original.title), voice_id
-            )
-        except (ImportError, ModuleNotFoundError):
-            # Voice system not available (backwards compatibility)
-            console.print("  Voice: default (module not available)")
-
-        console.print("  [dim]Calling OpenAI API for content generation...[/dim]")
-        content, content_input_tokens, content_output_tokens = (
-            generator.generate_content(item)
+        if config.enable_illustrations and illustration_service is None:
+            illustration_service = IllustrationService(client, config)
+        illustrator = illustration_service if config.enable_illustrations else None
+
+        # Steps that only need the content (title, illustrations) overlap;
+        # each stage receives the results of the stages listed in ``after``
+        stages = StageGraph(f"article {item.original.id}", phase="generation")
+        stages.add("voice", lambda: _select_voice(item))
+        stages.add("content", lambda: _generate_content(generator, item))
+        stages.add(
+            "title",
+            lambda generated: generate_article_title(
+                item,
+                generated[0],
+                client,
+                recent_titles=recent_titles,
+                config=config,
+                article_id=item.original.id,
+            ),
+            after=["content"],
+        )
+        stages.add(
+            "metadata",
+            lambda generated, titled: _article_metadata(
+                item, generated[0], titled[0], content_dir
+            ),
+            after=["content", "title"],
+        )
+        stages.add(
+            "illustrations",
+            lambda generated: _illustrate(
+                illustrator, generator.name, generated[0], item.original.id
+            ),
+            after=["content"],
         )
+        stages.add("format", _format_content, after=["illustrations"])
+        results = stages.run(concurrent=config.parallel_article_stages)
+
+        content, content_input_tokens, content_output_tokens = results["content"]
+        title, title_cost = results["title"]
+        metadata, filename = results["metadata"]
+        illustrated_content, illustrations_count, illustration_costs = results[
+            "illustrations"
+        ]
+        final_content = results["format"]
+        voice_id = results["voice"]
         word_count = len(content.split())
-        console.print(f"  Content: {word_count} words")
 
         # Initialize cost tracking with lists for itemized billing
         costs: dict[str, list[float]] = {}
@@ -151,71 +306,9 @@ def generate_single_article(
                 config.content_model, content_input_tokens, content_output_tokens
             ),
         )
-
-        # Generate title and slug
-        title, title_cost = generate_article_title(
-            item,
-            content,
-            client,
-            recent_titles=recent_titles,
-            config=config,
-            article_id=item.original.id,
-        )
         append_generation_cost(costs, "title_generation", title_cost)
-        console.print(f"  Title: {title}")
-
-        metadata = create_article_metadata(item, title, content)
-
-        slug = generate_article_slug(title)
-        console.print(f"  Slug: {slug}")
-
-        # Check if an article with this slug already exists
-        # This preserves URLs when updating similar content
-        existing_by_slug = find_article_by_slug(slug, content_dir)
-        if existing_by_slug:
-            console.print(
-                f"  [cyan]📝 Will update existing article:[/cyan] {existing_by_slug.name}"
-            )
-            logger.info(
-                f"Found existing article with slug '{slug}': {existing_by_slug.name}"
-            )
-            # Use the existing filename to preserve the URL
-            filename = existing_by_slug.name
-        else:
-            filename = f"{datetime.now().strftime('%Y-%m-%d')}-{slug}.md"
-
-        # Generate illustrations if enabled
-        illustrations_count = 0
-        final_content = content
-
-        if config.enable_illustrations:
-            if illustration_service is None:
-                illustration_service = IllustrationService(client, config)
-
-            result = illustration_service.generate_illustrations(
-                generator.name,
-                content,
-                article_id=item.original.id,
-            )
-
-            final_content = result.content
-            illustrations_count = result.count
-            # Merge illustration costs (convert scalars to lists for itemized billing)
-            merge_generation_costs(costs, result.costs)
-
-        # Format markdown
-        if format_markdown is not None:
-            try:
-                final_content = format_markdown(final_content)
-            except Exception as e:
-                logger.warning("Markdown formatting failed", exc_info=True)
-                console.print(
-                    f"  [dim]Note: markdown formatting skipped ({str(e)[:30]})[/dim]"
-                )
-        else:
-            console.print(
-                "  [dim]Note: mdformat not available, skipping markdown formatting[/dim]"
-            )
+        # Merge illustration costs (convert scalars to lists for itemized billing)
+        merge_generation_costs(costs, illustration_costs)
 
         # Create article
         article = GeneratedArticle(
@@ -235,38 +328,7 @@ def generate_single_article(
             voice_metadata={"complexity_score": item.quality_score},
         )
 
-        # Track quality metrics (Phase 2 - Model comparison)
-        try:
-            quality_scorer = QualityScorer()
-            quality_result = quality_scorer.score(article, final_content)
-
-            # Store quality score in article for metadata
-            article.quality_score = quality_result.overall_score
-            article.quality_dimensions = cast(
-                GeneratedArticleQualityDimensions, quality_result.dimension_scores
-            )
-            article.quality_passed = quality_result.passed_threshold
-
-            # Track quality for model comparison
-            quality_tracker = QualityTracker()
-            quality_tracker.record_quality(
-                article,
-                quality_result,
-                final_content,
-                models={
-                    "content_model": config.content_model,
-                    "title_model": config.title_model,
-                    "review_model": config.review_model,
-                    "enrichment_model": config.enrichment_model,
-                    "voice": voice_id,
-                },
-            )
-            logger.debug(
-                f"Quality tracked: score={quality_result.overall_score:.1f}, "
-                f"model={config.content_model}"
-            )
-        except Exception:
-            logger.warning("Failed to track quality metrics", exc_info=True)
+        _track_quality(article, final_content, config, voice_id)
 
         console.print(f"[green]✓[/green] Generated: {title}")
         return article
@@ -290,6 +352,7 @@ def generate_articles_from_enriched(
     generate_images: bool = False,
     fact_check: bool = False,
     action_run_id: str | None = None,
+    candidates_selected: bool = False,
 ) -> list[GeneratedArticle]:
     """Generate blog articles from enriched items.
 
@@ -300,6 +363,8 @@ def generate_articles_from_enriched(
         generate_images: If True, generate cover images
         fact_check: If True, validate articles
         action_run_id: GitHub Actions run ID for tracking
+        candidates_selected: If True, ``items`` already passed candidate
+            selection (e.g. from the streaming pipeline) and are not re-filtered
 
     Returns:
         List of successfully generated articles
@@ -314,8 +379,11 @@ def generate_articles_from_enriched(
         generators = get_available_generators(client)
 
         # Select candidates
-        console.print("\n[bold blue]📋 Selecting article candidates...[/bold blue]")
-        candidates = select_article_candidates(items)
+        if candidates_selected:
+            candidates = items
+        else:
+            console.print("\n[bold blue]📋 Selecting article candidates...[/bold blue]")
+            candidates = select_article_candidates(items)
 
         if not candidates:
             console.print("[yellow]No suitable article candidates found.[/yellow]")
@@ -461,10 +529,13 @@ async def generate_articles_async(
     force_regenerate: bool = False,
     generate_images: bool = False,
     action_run_id: str | None = None,
+    candidates_selected: bool = False,
 ) -> list[GeneratedArticle]:
     """Async article generation leveraging Python 3.14 free-threading.
 
     Uses ThreadPoolExecutor for true parallel execution without GIL limitations.
+    Articles in flight are capped by an AdaptiveWorkerManager that grows or
+    backs off (AIMD) with API health, up to GENERATION_MAX_CONCURRENCY.
 
     Requires: Python 3.14+ with PYTHON_GIL=0 environment variable.
 
@@ -474,6 +545,8 @@ async def generate_articles_async(
         force_regenerate: If True, regenerate existing articles
         generate_images: If True, generate cover images
         action_run_id: GitHub Actions run ID for tracking
+        candidates_selected: If True, ``items`` already passed candidate
+            selection and are not re-filtered
 
     Returns:
         List of successfully generated articles
@@ -486,8 +559,11 @@ async def generate_articles_async(
     with get_openai_client(config) as client:
         generators = get_available_generators(client)
 
-        console.print("\n[bold blue]📋 Selecting article candidates...[/bold blue]")
-        candidates = select_article_candidates(items)
+        if candidates_selected:
+            candidates = items
+        else:
+            console.print("\n[bold blue]📋 Selecting article candidates...[/bold blue]")
+            candidates = select_article_candidates(items)
 
         if not candidates:
             console.print("[yellow]No suitable article candidates found.[/yellow]")
@@ -506,25 +582,39 @@ async def generate_articles_async(
 
         articles: list[GeneratedArticle] = []
 
+        # Articles in flight start at 4 and adapt to API health (AIMD)
+        max_concurrency = min(config.generation_max_concurrency, len(selected))
+        manager = build_worker_manager(
+            "generation", min(4, max_concurrency), max_concurrency, config
+        )
+
         def generate_wrapper(item: EnrichedItem, index: int) -> GeneratedArticle | None:
-            """Wrapper for thread execution."""
-            console.print(
-                f"\n[bold cyan]Article {index + 1}/{len(selected)}[/bold cyan]"
-            )
-            return generate_single_article(
-                item,
-                generators,
-                client,
-                illustration_service,
-                force_regenerate,
-                action_run_id,
-            )
+            """Wrapper for thread execution, holding one concurrency slot."""
+            with manager.slot():
+                console.print(
+                    f"\n[bold cyan]Article {index + 1}/{len(selected)}[/bold cyan]"
+                )
+                return generate_single_article(
+                    item,
+                    generators,
+                    client,
+                    illustration_service,
+                    force_regenerate,
+                    action_run_id,
+                )
 
         # Execute in thread pool (true parallelism in Python 3.14)
         loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor(max_workers=min(4, len(selected))) as executor:
+        with (
+            manager.tracking(),
+            ThreadPoolExecutor(max_workers=max_concurrency) as executor,
+        ):
+            # Each article runs in a copy of this context, so its OpenAI calls
+            # reach the tracking manager
             futures = [
-                loop.run_in_executor(executor, generate_wrapper, item, i)
+                loop.run_in_executor(
+                    executor, contextvars.copy_context().run, generate_wrapper, item, i
+                )
                 for i, item in enumerate(selected)
             ]
 
@@ -0,0 +1,244 @@
+"""Streaming collect → enrich → select pipeline.
+
+The batch steps (``python -m src.collectors``, ``python -m src.enrichment``,
+``python -m src.generate``) hand over through files, so enrichment waits for
+the slowest source and selection waits for the last enriched item. This
+module runs the three stages in one process, connected by bounded queues:
+
+    stream_all_sources() ──collected──▶ N enrichment workers ──enriched──▶ selector
+
+- Items are deduplicated online and enriched as soon as their source
+  finishes, so the fastest source's items are being enriched while slower
+  sources are still collecting.
+- Enriched items are offered to an IncrementalCandidateSelector as they
+  arrive; only story clustering waits for the end.
+- Both queues are bounded (``config.pipeline_queue_size``). A full queue
+  makes the stage feeding it wait, so items in flight are bounded by the
+  queue sizes plus one per worker instead of growing with the run.
+- Collected and enriched items are still written to
+  ``data/collected_<ts>.ndjson`` and ``data/enriched_<ts>.ndjson`` line by
+  line, so the batch steps can pick up from either file.
+
+Usage:
+    result = asyncio.run(run_streaming_pipeline())
+    generate_articles_from_enriched(result.candidates, candidates_selected=True)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from rich.console import Console
+
+from ..collectors.http_engine import CollectionHTTPEngine
+from ..collectors.orchestrator import open_collected_writer, stream_all_sources
+from ..config import get_config
+from ..enrichment.adaptive_scoring import ScoringAdapter
+from ..enrichment.file_io import open_enriched_writer
+from ..enrichment.orchestrator import enrich_item_batch, enrich_single_item
+from ..models import CollectedItem, EnrichedItem, PipelineConfig
+from ..utils.logging import get_logger
+from ..utils.ndjson import NDJSONWriter
+from ..utils.worker_config import get_optimal_worker_count
+from .candidate_selector import IncrementalCandidateSelector
+
+console = Console()
+logger = get_logger(__name__)
+
+
+@dataclass
+class StreamingPipelineResult:
+    """Outcome of one streaming pipeline run."""
+
+    candidates: list[EnrichedItem] = field(default_factory=list)
+    collected_path: Path | None = None
+    enriched_path: Path | None = None
+    collected: int = 0
+    enriched: int = 0
+    failed: int = 0
+    first_candidate_seconds: float | None = None
+    elapsed_seconds: float = 0.0
+
+
+async def _next_batch(
+    collected: asyncio.Queue[CollectedItem | None], batch_size: int
+) -> tuple[list[CollectedItem], bool]:
+    """Wait for one item, then take up to ``batch_size - 1`` already queued.
+
+    Never waits to fill a batch, so batching adds no latency. Returns the
+    batch and whether the end-of-stream sentinel was reached.
+    """
+    item = await collected.get()
+    if item is None:
+        return [], True
+    batch = [item]
+    while len(batch) < batch_size and not collected.empty():
+        item = collected.get_nowait()
+        if item is None:
+            return batch, True
+        batch.append(item)
+    return batch, False
+
+
+async def _enrich_worker(
+    collected: asyncio.Queue[CollectedItem | None],
+    enriched: asyncio.Queue[EnrichedItem | None],
+    writer: NDJSONWriter,
+    config: PipelineConfig,
+    result: StreamingPipelineResult,
+) -> dict:
+    """Enrich items until the collection stage signals the end.
+
+    Each worker owns a ScoringAdapter (as in enrich_collected_items_async)
+    and only hands it to one thread at a time. With
+    ``config.enrichment_batch_size`` > 1, items already waiting in the queue
+    are scored together in one AI call. Returns the adapter's feedback for
+    merging.
+    """
+    adapter = ScoringAdapter(use_empty=True)
+    done = False
+    while not done:
+        batch, done = await _next_batch(collected, config.enrichment_batch_size)
+        if not batch:
+            break
+        try:
+            if len(batch) > 1:
+                results = await asyncio.to_thread(
+                    enrich_item_batch, batch, config, adapter
+                )
+            else:
+                results = [
+                    await asyncio.to_thread(
+                        enrich_single_item, batch[0], config, adapter
+                    )
+                ]
+        except Exception as e:
+            logger.error(
+                f"Enrichment failed for items {[item.id for item in batch]}: {e}",
+                exc_info=True,
+                extra={"phase": "enrichment", "event": "item_failed"},
+            )
+            results = [None] * len(batch)
+
+        for enriched_item in results:
+            if enriched_item is None:
+                result.failed += 1
+                continue
+
+            writer.write(enriched_item)
+            result.enriched += 1
+            await enriched.put(enriched_item)
+
+    return adapter.get_feedback_data()
+
+
+async def run_streaming_pipeline(
+    queue_size: int | None = None,
+    enrich_workers: int | None = None,
+    engine: CollectionHTTPEngine | None = None,
+    selector: IncrementalCandidateSelector | None = None,
+    timestamp: str | None = None,
+) -> StreamingPipelineResult:
+    """Collect, enrich and select candidates with all stages running at once.
+
+    Args:
+        queue_size: Capacity of each inter-stage queue (config default if None)
+        enrich_workers: Concurrent enrichment workers (dynamic default if None)
+        engine: Open collection engine to reuse (created if None)
+        selector: Candidate selector (default filters if None)
+        timestamp: Timestamp for the collected/enriched file names
+
+    Returns:
+        StreamingPipelineResult with the selected candidates, best first
+    """
+    config = get_config()
+    queue_size = queue_size or config.pipeline_queue_size
+    workers = enrich_workers or get_optimal_worker_count(use_case="enrichment")
+    timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+    selector = selector or IncrementalCandidateSelector()
+
+    # Load shared scoring patterns once, before any worker thread needs them
+    ScoringAdapter.get_shared_patterns()
+
+    collected: asyncio.Queue[CollectedItem | None] = asyncio.Queue(queue_size)
+    enriched: asyncio.Queue[EnrichedItem | None] = asyncio.Queue(queue_size)
+    result = StreamingPipelineResult()
+    start = time.perf_counter()
+
+    console.print(
+        f"[bold blue]⚡ Streaming pipeline: {workers} enrichment workers, "
+        f"queue size {queue_size}[/bold blue]"
+    )
+
+    async def collect_stage() -> None:
+        with open_collected_writer(timestamp) as writer:
+            result.collected_path = writer.filepath
+            async for item in stream_all_sources(engine):
+                writer.write(item)
+                result.collected += 1
+                await collected.put(item)
+        for _ in range(workers):
+            await collected.put(None)
+
+    async def enrich_stage() -> list[dict]:
+        with open_enriched_writer(timestamp) as writer:
+            result.enriched_path = writer.filepath
+            feedback = await asyncio.gather(
+                *(
+                    _enrich_worker(collected, enriched, writer, config, result)
+                    for _ in range(workers)
+                )
+            )
+        await enriched.put(None)
+        return list(feedback)
+
+    async def select_stage() -> None:
+        while (item := await enriched.get()) is not None:
+            accepted = await asyncio.to_thread(selector.offer, item)
+            if accepted and result.first_candidate_seconds is None:
+                result.first_candidate_seconds = time.perf_counter() - start
+                console.print(
+                    f"[green]✓[/green] First candidate after "
+                    f"{result.first_candidate_seconds:.1f}s: {item.original.title[:60]}"
+                )
+
+    async with asyncio.TaskGroup() as group:
+        group.create_task(collect_stage())
+        enrich_task = group.create_task(enrich_stage())
+        group.create_task(select_stage())
+
+    # Merge per-worker scoring feedback and persist once
+    final_adapter = ScoringAdapter()
+    for feedback in enrich_task.result():
+        final_adapter.merge_feedback(feedback)
+    final_adapter.update_learned_patterns()
+    final_adapter.save_feedback()
+
+    result.candidates = selector.finalize()
+    result.elapsed_seconds = time.perf_counter() - start
+
+    logger.info(
+        f"Streaming pipeline finished in {result.elapsed_seconds:.2f}s: "
+        f"{result.collected} collected, {result.enriched} enriched, "
+        f"{result.failed} failed, {len(result.candidates)} candidates",
+        extra={
+            "phase": "streaming",
+            "event": "complete",
+            "time_seconds": result.elapsed_seconds,
+            "first_candidate_seconds": result.first_candidate_seconds,
+            "collected": result.collected,
+            "enriched": result.enriched,
+            "failed": result.failed,
+            "candidates": len(result.candidates),
+        },
+    )
+    console.print(
+        f"[dim]Streaming pipeline: {result.collected} collected → "
+        f"{result.enriched} enriched → {len(result.candidates)} candidates "
+        f"in {result.elapsed_seconds:.1f}s[/dim]"
+    )
+    return result
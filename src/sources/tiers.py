@@ -89,6 +89,13 @@ SOURCE_CONFIGS = {
         min_score=0.65,
         description="Federated social media - varied quality",
     ),
+    "bluesky_trending": SourceConfig(
+        name="Bluesky Trending",
+        tier=SourceTier.B_TIER,
+        max_items=20,
+        min_score=0.65,
+        description="Federated social media - varied quality",
+    ),
     # C-Tier: Noisy, require heavy filtering
     "twitter_tech": SourceConfig(
         name="Twitter/X Tech Topics",
@@ -1,47 +1,182 @@
-"""Adaptive worker count management based on API backoff and CPU headroom.
-
-Dynamically adjusts worker count during execution to maximize throughput while
-respecting API rate limits and available CPU resources.
+"""Adaptive concurrency control (AIMD) for OpenAI-bound work.
+
+Adjusts how many items are in flight during execution to use as much of
+the API rate limit as possible without manual WORKER_COUNT tuning:
+
+- Additive increase: while calls complete with healthy latency and few
+  errors, and the current limit is actually being used, allow one more
+  item (``increase_step``) in flight per adjustment interval.
+- Multiplicative decrease: on 429s or timeouts (as classified by
+  ``api.openai_error_handler``), multiply the limit by ``backoff_factor``.
+
+Observations come from two places, both delivered to the manager whose
+``tracking()`` block is active in the current context (a contextvar, so the
+enrichment and generation managers never see each other's calls; code that
+hands work to a thread pool copies the context):
+
+- ``openai_wrapper`` reports every call's latency and final error.
+- The pooled OpenAI clients' httpx hooks (``utils.clients``) report each
+  429 response and each retry after an attempt that got no response
+  (a timeout or connection failure). The SDK retries those internally, so
+  without the hooks the controller would only see errors that exhausted
+  every retry.
+
+Work is gated with ``slot()`` in threads or ``async_slot()`` on an event
+loop; adjustments are made when a slot is released, and every adjustment is
+kept in ``adjustment_history``.
+
+Usage:
+    manager = AdaptiveWorkerManager(initial_workers=4, max_workers=32)
+    with manager.tracking():
+        async with manager.async_slot():
+            await enrich(item)
 """
 
+from __future__ import annotations
+
+import asyncio
 import logging
-import os
+import threading
 import time
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from threading import Lock
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import httpx
+
+    from ..models import PipelineConfig
 
 logger = logging.getLogger(__name__)
 
+# Manager observing OpenAI calls made in this context (see tracking())
+_ACTIVE_MANAGER: ContextVar[AdaptiveWorkerManager | None] = ContextVar(
+    "adaptive_worker_manager", default=None
+)
+
+# Whether the latest HTTP attempt in this context got a response; a retry
+# after an unanswered attempt means it timed out (or failed to connect)
+_ATTEMPT_ANSWERED: ContextVar[bool] = ContextVar(
+    "openai_attempt_answered", default=True
+)
+
+# Marks a response already counted by observe_http_response, so the error
+# the SDK raises from it is not counted again by observe_api_call
+_OBSERVED_EXTENSION = "adaptive_worker_manager.observed"
+
+
+def observe_api_call(latency: float, error: BaseException | None = None) -> None:
+    """Report one OpenAI API call to the manager tracking this context."""
+    manager = _ACTIVE_MANAGER.get()
+    if manager is not None:
+        manager.record_call(latency, error)
+
+
+def observe_http_request(request: httpx.Request) -> None:
+    """httpx request hook: count retries that follow an unanswered attempt."""
+    try:
+        retries_taken = int(request.headers.get("x-stainless-retry-count", "0"))
+    except ValueError:
+        retries_taken = 0
+    manager = _ACTIVE_MANAGER.get()
+    if manager is not None and retries_taken > 0 and not _ATTEMPT_ANSWERED.get():
+        manager.metrics.record_timeout()
+    _ATTEMPT_ANSWERED.set(False)
+
+
+def observe_http_response(response: httpx.Response) -> None:
+    """httpx response hook: count every 429, including ones the SDK retries."""
+    _ATTEMPT_ANSWERED.set(True)
+    manager = _ACTIVE_MANAGER.get()
+    if manager is not None and response.status_code == 429:
+        manager.metrics.record_rate_limit()
+        response.extensions[_OBSERVED_EXTENSION] = True
+
+
+def _already_observed(error: BaseException) -> bool:
+    response: Any = getattr(error, "response", None)
+    extensions = getattr(response, "extensions", None)
+    return isinstance(extensions, dict) and bool(extensions.get(_OBSERVED_EXTENSION))
+
 
 @dataclass
 class WorkerMetrics:
-    """Metrics for adaptive worker management."""
+    """Metrics for adaptive worker management.
+
+    Cumulative counters cover the whole run; the ``window_*`` counters cover
+    the calls since the last adjustment and are reset by ``take_window()``.
+    """
 
     worker_count: int
     start_time: float = field(default_factory=time.time)
     completed_items: int = 0
     rate_limit_errors: int = 0
+    timeout_errors: int = 0
     last_rate_limit_time: float | None = None
     total_errors: int = 0
     last_adjustment_time: float = field(default_factory=time.time)
     adjustment_history: list[tuple[float, int, str]] = field(default_factory=list)
+    window_calls: int = 0
+    window_latency: float = 0.0
+    window_rate_limits: int = 0
+    window_timeouts: int = 0
+    window_errors: int = 0
+    window_peak_in_flight: int = 0
     _lock: Lock = field(default_factory=Lock, repr=False)
 
-    def record_completion(self) -> None:
-        """Record a successfully completed item."""
+    def record_completion(self, latency: float | None = None) -> None:
+        """Record a successfully completed item or call."""
         with self._lock:
             self.completed_items += 1
+            if latency is not None:
+                self.window_calls += 1
+                self.window_latency += latency
 
     def record_rate_limit(self) -> None:
         """Record a 429 rate limit error."""
         with self._lock:
             self.rate_limit_errors += 1
+            self.window_rate_limits += 1
             self.last_rate_limit_time = time.time()
 
+    def record_timeout(self) -> None:
+        """Record a request timeout."""
+        with self._lock:
+            self.timeout_errors += 1
+            self.window_timeouts += 1
+
     def record_error(self) -> None:
         """Record a non-rate-limit error."""
         with self._lock:
             self.total_errors += 1
+            self.window_errors += 1
+
+    def record_in_flight(self, in_flight: int) -> None:
+        with self._lock:
+            self.window_peak_in_flight = max(self.window_peak_in_flight, in_flight)
+
+    def take_window(self) -> dict[str, float]:
+        """Return and reset the counters since the last adjustment."""
+        with self._lock:
+            calls = self.window_calls
+            window = {
+                "calls": calls,
+                "mean_latency": self.window_latency / calls if calls else 0.0,
+                "rate_limits": self.window_rate_limits,
+                "timeouts": self.window_timeouts,
+                "errors": self.window_errors,
+                "peak_in_flight": self.window_peak_in_flight,
+            }
+            self.window_calls = 0
+            self.window_latency = 0.0
+            self.window_rate_limits = 0
+            self.window_timeouts = 0
+            self.window_errors = 0
+            self.window_peak_in_flight = 0
+            return window
 
     def get_throughput(self) -> float:
         """Calculate current throughput in items/sec."""
@@ -61,33 +196,48 @@ class WorkerMetrics:
 
 
 class AdaptiveWorkerManager:
-    """Manages adaptive worker count scaling based on API and CPU metrics."""
+    """AIMD controller for the number of items in flight."""
 
     def __init__(
         self,
         initial_workers: int,
-        min_workers: int = 4,
+        min_workers: int = 1,
         max_workers: int | None = None,
         adjustment_interval: float = 10.0,  # seconds between adjustments
-        rate_limit_threshold: float = 0.1,  # errors/sec before backing off
-        cpu_threshold: float = 0.8,  # CPU usage threshold for scaling up
+        increase_step: int = 1,  # additive increase per healthy interval
+        backoff_factor: float = 0.5,  # multiplicative decrease on 429/timeout
+        error_rate_threshold: float = 0.1,  # failed share of calls that blocks growth
+        latency_tolerance: float = 2.0,  # mean latency vs best seen that blocks growth
+        name: str = "workers",
     ):
         """Initialize adaptive worker manager.
 
         Args:
-            initial_workers: Starting worker count
-            min_workers: Minimum allowed workers
-            max_workers: Maximum allowed workers (None = cpu_count * 8)
-            adjustment_interval: Seconds between worker count adjustments
-            rate_limit_threshold: Rate limit errors/sec before backing off
-            cpu_threshold: CPU usage % before scaling up workers
+            initial_workers: Starting concurrency limit
+            min_workers: Minimum allowed limit
+            max_workers: Maximum allowed limit (None = initial_workers * 8)
+            adjustment_interval: Seconds between limit adjustments
+            increase_step: Items added to the limit after a healthy interval
+            backoff_factor: Factor applied to the limit after 429s or timeouts
+            error_rate_threshold: Share of failed calls that stops increases
+            latency_tolerance: Multiple of the best mean latency seen above
+                which the API is treated as saturated (no increase)
+            name: Label used in adjustment logs (e.g. "enrichment")
         """
-        self.metrics = WorkerMetrics(worker_count=initial_workers)
-        self.min_workers = min_workers
-        self.max_workers = max_workers or (os.cpu_count() or 4) * 8
+        self.max_workers = max_workers or initial_workers * 8
+        self.min_workers = max(1, min(min_workers, self.max_workers))
+        initial = max(self.min_workers, min(initial_workers, self.max_workers))
+        self.metrics = WorkerMetrics(worker_count=initial)
         self.adjustment_interval = adjustment_interval
-        self.rate_limit_threshold = rate_limit_threshold
-        self.cpu_threshold = cpu_threshold
+        self.increase_step = increase_step
+        self.backoff_factor = backoff_factor
+        self.error_rate_threshold = error_rate_threshold
+        self.latency_tolerance = latency_tolerance
+        self.name = name
+        self.baseline_latency: float | None = None
+        self._in_flight = 0
+        self._cond = threading.Condition()
+        self._async_cond: asyncio.Condition | None = None
 
     def should_adjust(self) -> bool:
         """Check if enough time has passed for an adjustment."""
@@ -95,63 +245,74 @@ class AdaptiveWorkerManager:
             time.time() - self.metrics.last_adjustment_time >= self.adjustment_interval
         )
 
-    def get_cpu_usage(self) -> float:
-        """Get current CPU usage percentage (0.0-1.0).
+    def record_call(self, latency: float, error: BaseException | None = None) -> None:
+        """Record one API call's latency and outcome."""
+        if error is None:
+            self.metrics.record_completion(latency)
+            return
+        if _already_observed(error):
+            return
 
-        Returns average CPU usage across all cores.
-        """
-        try:
-            import psutil
+        from ..api.openai_error_handler import ErrorType, classify_error
 
-            return psutil.cpu_percent(interval=0.1) / 100.0
-        except ImportError:
-            # If psutil not available, assume moderate usage
-            logger.warning("psutil not available - cannot measure CPU usage")
-            return 0.5
+        error_type = classify_error(error)[0] if isinstance(error, Exception) else None
+        if error_type == ErrorType.RATE_LIMITED:
+            self.metrics.record_rate_limit()
+        elif error_type == ErrorType.TIMEOUT:
+            self.metrics.record_timeout()
+        else:
+            self.metrics.record_error()
 
     def calculate_adjustment(self) -> tuple[int, str]:
-        """Calculate worker count adjustment based on current metrics.
+        """Calculate the next limit from the calls since the last adjustment.
 
         Returns:
             Tuple of (new_worker_count, reason)
         """
         current_workers = self.metrics.worker_count
-        error_rate = self.metrics.get_error_rate()
-        throughput = self.metrics.get_throughput()
-
-        # Check for rate limiting - most important signal
-        if error_rate > self.rate_limit_threshold:
-            # Back off aggressively - reduce by 25%
-            new_workers = max(self.min_workers, int(current_workers * 0.75))
-            reason = f"rate_limit_backoff (error_rate={error_rate:.3f}/s)"
-            logger.info(
-                f"Rate limit detected - reducing workers {current_workers} → {new_workers}"
+        window = self.metrics.take_window()
+
+        # Congestion signals: back off multiplicatively
+        if window["rate_limits"] or window["timeouts"]:
+            new_workers = max(
+                self.min_workers, int(current_workers * self.backoff_factor)
+            )
+            cause = "rate_limit" if window["rate_limits"] else "timeout"
+            reason = (
+                f"{cause}_backoff (429s={window['rate_limits']}, "
+                f"timeouts={window['timeouts']})"
             )
             return new_workers, reason
 
-        # Check if we recently hit rate limits (within last 30 seconds)
+        calls = window["calls"] + window["errors"]
+        if not calls:
+            return current_workers, "idle"
+
+        if window["errors"] / calls > self.error_rate_threshold:
+            return current_workers, f"errors ({window['errors']}/{calls} calls)"
+
+        mean_latency = window["mean_latency"]
+        if window["calls"] and (
+            self.baseline_latency is None or mean_latency < self.baseline_latency
+        ):
+            self.baseline_latency = mean_latency
         if (
-            self.metrics.last_rate_limit_time
-            and time.time() - self.metrics.last_rate_limit_time < 30.0
+            self.baseline_latency
+            and mean_latency > self.baseline_latency * self.latency_tolerance
         ):
-            # Don't scale up if we recently hit rate limits
-            return current_workers, "cooldown_after_rate_limit"
+            return current_workers, (
+                f"latency_degraded ({mean_latency:.2f}s vs "
+                f"{self.baseline_latency:.2f}s best)"
+            )
 
-        # Check CPU usage
-        cpu_usage = self.get_cpu_usage()
+        if window["peak_in_flight"] < current_workers:
+            # The limit isn't what's holding throughput back
+            return current_workers, "limit_not_reached"
 
-        if cpu_usage < self.cpu_threshold and current_workers < self.max_workers:
-            # CPU has headroom and we're below max - scale up by 25%
-            new_workers = min(self.max_workers, int(current_workers * 1.25))
-            reason = (
-                f"cpu_headroom (cpu={cpu_usage:.2%}, throughput={throughput:.2f}/s)"
-            )
-            logger.info(
-                f"CPU headroom detected - increasing workers {current_workers} → {new_workers}"
-            )
-            return new_workers, reason
+        if current_workers < self.max_workers:
+            new_workers = min(self.max_workers, current_workers + self.increase_step)
+            return new_workers, f"additive_increase (latency={mean_latency:.2f}s)"
 
-        # No adjustment needed
         return current_workers, "optimal"
 
     def adjust_if_needed(self) -> bool:
@@ -165,34 +326,104 @@ class AdaptiveWorkerManager:
 
         new_workers, reason = self.calculate_adjustment()
 
-        if new_workers != self.metrics.worker_count:
-            with self.metrics._lock:
-                old_workers = self.metrics.worker_count
-                self.metrics.worker_count = new_workers
-                self.metrics.last_adjustment_time = time.time()
-                self.metrics.adjustment_history.append(
-                    (time.time(), new_workers, reason)
-                )
-
-            logger.info(
-                f"Adjusted workers: {old_workers} → {new_workers} ({reason})",
-                extra={
-                    "event": "worker_adjustment",
-                    "old_workers": old_workers,
-                    "new_workers": new_workers,
-                    "reason": reason,
-                    "throughput": self.metrics.get_throughput(),
-                    "rate_limit_errors": self.metrics.rate_limit_errors,
-                },
-            )
-            return True
-
-        return False
+        with self.metrics._lock:
+            old_workers = self.metrics.worker_count
+            self.metrics.last_adjustment_time = time.time()
+            if new_workers == old_workers:
+                return False
+            self.metrics.worker_count = new_workers
+            self.metrics.adjustment_history.append((time.time(), new_workers, reason))
+
+        logger.info(
+            f"Adjusted {self.name} concurrency: {old_workers} → {new_workers} ({reason})",
+            extra={
+                "event": "worker_adjustment",
+                "use_case": self.name,
+                "old_workers": old_workers,
+                "new_workers": new_workers,
+                "reason": reason,
+                "throughput": self.metrics.get_throughput(),
+                "rate_limit_errors": self.metrics.rate_limit_errors,
+            },
+        )
+        return True
 
     def get_current_worker_count(self) -> int:
         """Get the current recommended worker count."""
         return self.metrics.worker_count
 
+    @contextmanager
+    def tracking(self) -> Iterator[AdaptiveWorkerManager]:
+        """Feed this manager the OpenAI calls made in this context.
+
+        Tasks created inside the block inherit it; work submitted to a
+        thread pool must run in a copy of the context
+        (``contextvars.copy_context().run``).
+        """
+        token = _ACTIVE_MANAGER.set(self)
+        try:
+            yield self
+        finally:
+            _ACTIVE_MANAGER.reset(token)
+            self.log_history()
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold one of the current limit's slots (for worker threads)."""
+        with self._cond:
+            while self._in_flight >= self.metrics.worker_count:
+                self._cond.wait()
+            self._in_flight += 1
+            self.metrics.record_in_flight(self._in_flight)
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._in_flight -= 1
+                self.adjust_if_needed()
+                self._cond.notify_all()
+
+    @asynccontextmanager
+    async def async_slot(self) -> AsyncIterator[None]:
+        """Hold one of the current limit's slots (for tasks on one event loop)."""
+        if self._async_cond is None:
+            self._async_cond = asyncio.Condition()
+        cond = self._async_cond
+        async with cond:
+            await cond.wait_for(lambda: self._in_flight < self.metrics.worker_count)
+            self._in_flight += 1
+            self.metrics.record_in_flight(self._in_flight)
+        try:
+            yield
+        finally:
+            async with cond:
+                self._in_flight -= 1
+                self.adjust_if_needed()
+                cond.notify_all()
+
+    def log_history(self) -> None:
+        """Log the limit's adjustment history for this run."""
+        history = self.metrics.adjustment_history
+        if not history:
+            logger.info(
+                f"{self.name} concurrency stayed at {self.metrics.worker_count}",
+                extra={"event": "worker_adjustments", "use_case": self.name},
+            )
+            return
+        steps = " → ".join(str(workers) for _, workers, _ in history)
+        logger.info(
+            f"{self.name} concurrency adjustments: {steps}",
+            extra={
+                "event": "worker_adjustments",
+                "use_case": self.name,
+                "history": [
+                    {"time": ts, "workers": workers, "reason": reason}
+                    for ts, workers, reason in history
+                ],
+                **self.get_stats(),
+            },
+        )
+
     def get_stats(self) -> dict:
         """Get current statistics for logging/monitoring."""
         return {
@@ -200,7 +431,31 @@ class AdaptiveWorkerManager:
             "completed_items": self.metrics.completed_items,
             "throughput": self.metrics.get_throughput(),
             "rate_limit_errors": self.metrics.rate_limit_errors,
+            "timeout_errors": self.metrics.timeout_errors,
             "error_rate": self.metrics.get_error_rate(),
             "total_errors": self.metrics.total_errors,
             "adjustment_count": len(self.metrics.adjustment_history),
         }
+
+
+def build_worker_manager(
+    name: str, initial_workers: int, max_workers: int, config: PipelineConfig
+) -> AdaptiveWorkerManager:
+    """Concurrency controller for one pipeline stage.
+
+    With ``adaptive_concurrency`` disabled the limit stays fixed at
+    ``initial_workers``.
+    """
+    if not config.adaptive_concurrency:
+        return AdaptiveWorkerManager(
+            initial_workers,
+            min_workers=initial_workers,
+            max_workers=initial_workers,
+            name=name,
+        )
+    return AdaptiveWorkerManager(
+        initial_workers,
+        max_workers=max_workers,
+        adjustment_interval=config.adaptive_adjustment_interval,
+        name=name,
+    )
@@ -0,0 +1,447 @@
+"""Persistent metadata index over published articles.
+
+Several pipeline stages need the same handful of frontmatter fields from
+``content/posts/*.md`` (source URLs, slug, dates, tags, summary, cover image).
+Scanning and parsing every post on each lookup made candidate selection
+quadratic, so this module keeps a single index that is:
+
+- Persisted to ``data/article_index.json`` for the default content directory
+- Refreshed incrementally: only files whose mtime/size changed are re-parsed
+  (files are re-stat'ed at most every few seconds, or as soon as the
+  directory itself changes)
+- Updated in place by ``save_article_to_file`` after each write
+- Queried through in-memory maps (source URL -> file, slug -> file)
+
+Posts whose frontmatter cannot be parsed are logged and left out of the index
+until they change, so one broken file does not break every lookup.
+
+Indexes for other directories (e.g. temporary test directories) are kept in
+memory only.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, date, datetime
+from pathlib import Path
+from typing import Any
+
+import frontmatter
+import yaml
+
+from ..config import get_content_dir, get_project_root
+from .file_io import atomic_write_json
+from .logging import get_logger
+from .url_tools import normalize_url
+
+logger = get_logger(__name__)
+
+INDEX_VERSION = 1
+EXCERPT_CHARS = 500
+
+# A directory modified this close to our last scan may have changed again
+# within the same mtime tick, so it is rescanned on the next access.
+_RACY_WINDOW_NS = 1_000_000_000
+
+# In-place edits do not change the directory mtime, so files are re-stat'ed
+# once this long has passed since the last scan.
+_RESTAT_INTERVAL_NS = 2_000_000_000
+
+# Errors from reading one post: frontmatter raises yaml.YAMLError for
+# malformed YAML, and UnicodeDecodeError (a ValueError) for non-UTF-8 files.
+PARSE_ERRORS = (OSError, ValueError, UnicodeDecodeError, yaml.YAMLError)
+
+_DATE_PREFIX_RE = re.compile(r"^\d{4}-\d{2}-\d{2}-(.+)$")
+
+
+def to_utc_datetime(value: Any) -> datetime | None:
+    """Normalize a frontmatter date value to a timezone-aware UTC datetime.
+
+    Accepts ``datetime``, ``date`` and ISO-8601 strings (including a trailing
+    ``Z``). Naive values are assumed to be UTC.
+
+    Returns:
+        Aware UTC datetime, or None if the value cannot be parsed
+    """
+    try:
+        if isinstance(value, datetime):
+            parsed = value
+        elif isinstance(value, date):
+            parsed = datetime.combine(value, datetime.min.time())
+        elif isinstance(value, str) and value.strip():
+            parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+        else:
+            return None
+    except ValueError, TypeError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=UTC)
+    return parsed.astimezone(UTC)
+
+
+def slug_from_stem(stem: str) -> str:
+    """Return the slug of a ``YYYY-MM-DD-{slug}`` stem ("" if not date-prefixed)."""
+    match = _DATE_PREFIX_RE.match(stem)
+    return match.group(1) if match else ""
+
+
+@dataclass
+class ArticleRecord:
+    """Indexed frontmatter fields for a single published article."""
+
+    filename: str
+    mtime_ns: int
+    size: int
+    title: str = ""
+    slug: str = ""
+    date: str = ""  # Raw frontmatter date as written (for display)
+    published_at: str | None = None  # 'date' normalized to UTC ISO
+    generated_at: str | None = None  # 'generated_at' (or 'date') as UTC ISO
+    tags: list[str] = field(default_factory=list)
+    summary: str = ""
+    cover_image: str = ""
+    source_urls: list[str] = field(default_factory=list)  # 'sources' list
+    legacy_source_url: str | None = None  # legacy 'source' dict
+    excerpt: str = ""
+
+    @property
+    def published_datetime(self) -> datetime | None:
+        return to_utc_datetime(self.published_at)
+
+    @property
+    def generated_datetime(self) -> datetime | None:
+        return to_utc_datetime(self.generated_at)
+
+    @property
+    def all_source_urls(self) -> list[str]:
+        """Normalized source URLs from both current and legacy formats."""
+        if self.legacy_source_url:
+            return [*self.source_urls, self.legacy_source_url]
+        return list(self.source_urls)
+
+    @classmethod
+    def from_file(cls, filepath: Path, stat: os.stat_result) -> ArticleRecord:
+        """Parse an article's frontmatter into a record.
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not UTF-8 or its fields are invalid
+            yaml.YAMLError: If the frontmatter is malformed
+        """
+        post = frontmatter.load(str(filepath))
+        meta = post.metadata or {}
+
+        source_urls: list[str] = []
+        sources = meta.get("sources")
+        if isinstance(sources, list):
+            for s in sources:
+                url = s.get("url") if isinstance(s, dict) else None
+                if url:
+                    source_urls.append(normalize_url(str(url)))
+
+        legacy_url = None
+        legacy = meta.get("source")
+        if isinstance(legacy, dict) and legacy.get("url"):
+            legacy_url = normalize_url(str(legacy["url"]))
+
+        raw_date = meta.get("date")
+        published = to_utc_datetime(raw_date)
+        generated = to_utc_datetime(meta.get("generated_at") or raw_date)
+
+        cover = meta.get("cover")
+        cover_image = cover.get("image") if isinstance(cover, dict) else None
+
+        tags = meta.get("tags") or []
+        if not isinstance(tags, list):
+            tags = [tags]
+
+        if raw_date is None:
+            date_display = ""
+        elif isinstance(raw_date, (date, datetime)):
+            date_display = raw_date.isoformat()
+        else:
+            date_display = str(raw_date)
+
+        return cls(
+            filename=filepath.name,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            title=str(meta.get("title") or ""),
+            slug=slug_from_stem(filepath.stem),
+            date=date_display,
+            published_at=published.isoformat() if published else None,
+            generated_at=generated.isoformat() if generated else None,
+            tags=[str(t) for t in tags],
+            summary=str(meta.get("summary") or ""),
+            cover_image=str(cover_image or ""),
+            source_urls=source_urls,
+            legacy_source_url=legacy_url,
+            excerpt=post.content[:EXCERPT_CHARS],
+        )
+
+
+class ArticleIndex:
+    """Incrementally refreshed index of article frontmatter.
+
+    All public lookups take the index lock, so a single instance can be
+    shared across generation worker threads.
+    """
+
+    def __init__(self, content_dir: Path, index_file: Path | None = None) -> None:
+        """Initialize the index and bring it up to date with the directory.
+
+        Args:
+            content_dir: Directory containing article markdown files
+            index_file: Where to persist the index (None keeps it in memory)
+        """
+        self.content_dir = Path(content_dir)
+        self.index_file = index_file
+        self._lock = threading.RLock()
+        self._records: dict[str, ArticleRecord] = {}
+        # (mtime_ns, size) of posts that failed to parse, so they are only
+        # retried (and logged) again once they change
+        self._unreadable: dict[str, tuple[int, int]] = {}
+        self._by_source: dict[str, list[str]] = {}
+        self._by_slug: dict[str, list[str]] = {}
+        self._dir_mtime_ns: int | None = None
+        self._scanned_at_ns = 0
+        self._load()
+        self.refresh()
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def _load(self) -> None:
+        """Load persisted records; mismatched or corrupt files are ignored."""
+        if not self.index_file or not self.index_file.exists():
+            return
+        try:
+            with open(self.index_file, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != INDEX_VERSION:
+                logger.info("Article index version changed; rebuilding")
+                return
+            for name, raw in data.get("articles", {}).items():
+                self._records[name] = ArticleRecord(**raw)
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable article index: {e}")
+            self._records = {}
+        self._rebuild_lookups()
+
+    def _save(self) -> None:
+        if not self.index_file:
+            return
+        data = {
+            "version": INDEX_VERSION,
+            "articles": {
+                name: asdict(record) for name, record in sorted(self._records.items())
+            },
+        }
+        try:
+            atomic_write_json(self.index_file, data, indent=None)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to persist article index: {e}")
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def _rebuild_lookups(self) -> None:
+        self._by_source = {}
+        self._by_slug = {}
+        for name in sorted(self._records):
+            self._add_lookups(self._records[name])
+
+    def _add_lookups(self, record: ArticleRecord) -> None:
+        for url in record.all_source_urls:
+            names = self._by_source.setdefault(url, [])
+            if record.filename not in names:
+                names.append(record.filename)
+        if record.slug:
+            names = self._by_slug.setdefault(record.slug, [])
+            if record.filename not in names:
+                names.append(record.filename)
+
+    def _dir_stat_ns(self) -> int | None:
+        try:
+            return self.content_dir.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def is_stale(self) -> bool:
+        """Cheap check (one stat) for whether the files need re-stat'ing.
+
+        True when files were added or removed, and otherwise every
+        ``_RESTAT_INTERVAL_NS`` so that edits to existing posts are noticed.
+        """
+        current = self._dir_stat_ns()
+        if current != self._dir_mtime_ns:
+            return True
+        if time.time_ns() - self._scanned_at_ns >= _RESTAT_INTERVAL_NS:
+            return True
+        return current is not None and self._scanned_at_ns - current < _RACY_WINDOW_NS
+
+    def refresh(self) -> int:
+        """Re-parse files whose mtime or size changed; drop deleted files.
+
+        Returns:
+            Number of records added, updated or removed
+        """
+        with self._lock:
+            self._dir_mtime_ns = self._dir_stat_ns()
+            self._scanned_at_ns = time.time_ns()
+            seen: set[str] = set()
+            changed = 0
+            try:
+                entries = list(os.scandir(self.content_dir))
+            except OSError:
+                entries = []
+
+            for entry in entries:
+                if not entry.name.endswith(".md") or not entry.is_file():
+                    continue
+                seen.add(entry.name)
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                existing = self._records.get(entry.name)
+                if (
+                    existing
+                    and existing.mtime_ns == stat.st_mtime_ns
+                    and existing.size == stat.st_size
+                ):
+                    continue
+                signature = (stat.st_mtime_ns, stat.st_size)
+                if self._unreadable.get(entry.name) == signature:
+                    continue
+                try:
+                    self._records[entry.name] = ArticleRecord.from_file(
+                        Path(entry.path), stat
+                    )
+                    self._unreadable.pop(entry.name, None)
+                except PARSE_ERRORS as e:
+                    logger.warning(
+                        f"Skipping article with unreadable metadata {entry.path}: {e}"
+                    )
+                    self._unreadable[entry.name] = signature
+                    if self._records.pop(entry.name, None) is None:
+                        continue
+                changed += 1
+
+            for name in set(self._records) - seen:
+                del self._records[name]
+                changed += 1
+            for name in set(self._unreadable) - seen:
+                del self._unreadable[name]
+
+            if changed:
+                self._rebuild_lookups()
+                self._save()
+                logger.debug(
+                    f"Article index refreshed: {changed} changes, "
+                    f"{len(self._records)} articles"
+                )
+            return changed
+
+    def refresh_if_stale(self) -> None:
+        if self.is_stale():
+            self.refresh()
+
+    def update(self, filepath: Path) -> ArticleRecord | None:
+        """Re-index a single file after it was written (or remove if gone)."""
+        filepath = Path(filepath)
+        with self._lock:
+            try:
+                stat = filepath.stat()
+                record = ArticleRecord.from_file(filepath, stat)
+            except FileNotFoundError:
+                self._records.pop(filepath.name, None)
+                record = None
+            except PARSE_ERRORS as e:
+                logger.warning(f"Failed to index {filepath}: {e}")
+                record = None
+                if self._records.pop(filepath.name, None) is None:
+                    return None
+            if record is not None:
+                self._records[record.filename] = record
+                self._unreadable.pop(record.filename, None)
+            self._rebuild_lookups()
+            self._save()
+            return record
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def records(self) -> list[ArticleRecord]:
+        """All indexed records, ordered by filename."""
+        with self._lock:
+            return [self._records[name] for name in sorted(self._records)]
+
+    def path_for(self, record: ArticleRecord) -> Path:
+        return self.content_dir / record.filename
+
+    def find_by_source(self, url: str) -> list[ArticleRecord]:
+        """Records whose current or legacy sources include this URL."""
+        normalized = normalize_url(url)
+        with self._lock:
+            return [self._records[name] for name in self._by_source.get(normalized, [])]
+
+    def find_by_slug(self, slug: str) -> ArticleRecord | None:
+        with self._lock:
+            names = self._by_slug.get(slug)
+            return self._records[names[0]] if names else None
+
+    def source_urls(self) -> set[str]:
+        with self._lock:
+            return set(self._by_source)
+
+
+_INDEXES: dict[Path, ArticleIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_article_index(content_dir: Path | None = None) -> ArticleIndex:
+    """Return the process-wide index for a content directory, refreshed.
+
+    The default content directory is persisted to ``data/article_index.json``.
+    Files are re-stat'ed when the directory itself changed (files added,
+    removed or renamed) or every couple of seconds to catch in-place edits;
+    only files whose mtime or size changed are re-parsed.
+    ``save_article_to_file`` updates entries directly via
+    :meth:`ArticleIndex.update`.
+    """
+    content_dir = Path(content_dir) if content_dir is not None else get_content_dir()
+    key = content_dir.resolve()
+    project_root = get_project_root()
+
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(key)
+        if index is None:
+            index_file = (
+                project_root / "data" / "article_index.json"
+                if key == (project_root / "content" / "posts").resolve()
+                else None
+            )
+            index = ArticleIndex(content_dir, index_file=index_file)
+            _INDEXES[key] = index
+            return index
+
+    index.refresh_if_stale()
+    return index
+
+
+def _reset_article_indexes() -> None:
+    """Drop cached index instances.
+
+    INTERNAL: Only meant for tests.
+    """
+    with _INDEXES_LOCK:
+        _INDEXES.clear()
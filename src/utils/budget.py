@@ -0,0 +1,228 @@
+"""Thread-safe cost budget with up-front reservations.
+
+openai_wrapper used to add each call's cost to module totals after the call
+had been paid for, so N parallel workers could overshoot ``max_cost_per_run``
+by N calls. CostBudget instead reserves an estimated cost before a call and
+settles the actual cost afterwards:
+
+- ``reserve()`` admits a call only if spent + outstanding reservations +
+  the estimate fit under the run (and article) caps.
+- If the call only fails to fit because of other calls still in flight, it
+  waits (up to ``timeout``) for them to settle, since they usually cost less
+  than reserved. If even settled spending leaves no room, it is refused at
+  once with BudgetExceededError.
+- ``settle()`` replaces the reservation with the real cost; ``release()``
+  frees it when the call failed and cost nothing.
+
+Estimates use the prompt size and ``max_tokens`` priced via utils/pricing,
+so they are upper-bound-ish without a tokenizer dependency.
+
+Usage:
+    reservation = budget.reserve(estimate, article_id="post", run_cap=5.0)
+    try:
+        response = make_call()
+    except Exception:
+        budget.release(reservation)
+        raise
+    budget.settle(reservation, actual_cost)
+"""
+
+from __future__ import annotations
+
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from .logging import get_logger
+from .pricing import estimate_text_cost  # type: ignore[import]
+
+logger = get_logger(__name__)
+
+# Completion budget assumed when a call does not set max_tokens
+DEFAULT_COMPLETION_TOKENS = 1024
+# Rough characters per token for English prose and code
+CHARS_PER_TOKEN = 4
+# Per-message framing tokens added by the chat format
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+class BudgetExceededError(RuntimeError):
+    """A call was refused because it would exceed a cost cap."""
+
+    def __init__(self, message: str, scope: str):
+        super().__init__(message)
+        self.scope = scope
+
+
+@dataclass(frozen=True)
+class Reservation:
+    """Cost held for one in-flight call."""
+
+    id: int
+    amount: float
+    article_id: str | None = None
+
+
+def estimate_prompt_tokens(messages: list[dict[str, Any]]) -> int:
+    """Approximate prompt tokens from message text length."""
+    tokens = 0
+    for message in messages:
+        content = message.get("content") or ""
+        if isinstance(content, list):
+            # Multi-part content: count the text parts only
+            content = " ".join(
+                str(part.get("text", "")) for part in content if isinstance(part, dict)
+            )
+        tokens += len(str(content)) // CHARS_PER_TOKEN + MESSAGE_OVERHEAD_TOKENS
+    return tokens
+
+
+def estimate_chat_tokens(
+    messages: list[dict[str, Any]], max_tokens: int | None = None
+) -> int:
+    """Approximate prompt + completion tokens a chat call may use."""
+    return estimate_prompt_tokens(messages) + (max_tokens or DEFAULT_COMPLETION_TOKENS)
+
+
+def estimate_chat_cost(
+    model: str, messages: list[dict[str, Any]], max_tokens: int | None = None
+) -> float:
+    """Estimated USD cost of a chat call before it is made."""
+    return estimate_text_cost(
+        model,
+        estimate_prompt_tokens(messages),
+        max_tokens or DEFAULT_COMPLETION_TOKENS,
+    )
+
+
+class CostBudget:
+    """Run- and article-level spend tracking with reservations."""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._ids = itertools.count(1)
+        self.spent = 0.0
+        self.reserved = 0.0
+        self._article_spent: dict[str, float] = {}
+        self._article_reserved: dict[str, float] = {}
+
+    def article_spent(self, article_id: str) -> float:
+        with self._cond:
+            return self._article_spent.get(article_id, 0.0)
+
+    def _refusal(
+        self,
+        amount: float,
+        article_id: str | None,
+        run_cap: float | None,
+        article_cap: float | None,
+    ) -> BudgetExceededError | None:
+        """Error if the call cannot fit even once in-flight calls settle."""
+        if run_cap is not None and self.spent + amount > run_cap:
+            return BudgetExceededError(
+                f"Run cost cap would be exceeded ({self.spent:.4f} spent + "
+                f"{amount:.4f} estimated > {run_cap:.4f})",
+                scope="run",
+            )
+        if article_id and article_cap is not None:
+            article_spent = self._article_spent.get(article_id, 0.0)
+            if article_spent + amount > article_cap:
+                return BudgetExceededError(
+                    f"Article cost cap would be exceeded for {article_id} "
+                    f"({article_spent:.4f} spent + {amount:.4f} estimated "
+                    f"> {article_cap:.4f})",
+                    scope="article",
+                )
+        return None
+
+    def _fits(
+        self,
+        amount: float,
+        article_id: str | None,
+        run_cap: float | None,
+        article_cap: float | None,
+    ) -> bool:
+        if run_cap is not None and self.spent + self.reserved + amount > run_cap:
+            return False
+        if article_id and article_cap is not None:
+            committed = self._article_spent.get(
+                article_id, 0.0
+            ) + self._article_reserved.get(article_id, 0.0)
+            if committed + amount > article_cap:
+                return False
+        return True
+
+    def reserve(
+        self,
+        amount: float,
+        *,
+        article_id: str | None = None,
+        run_cap: float | None = None,
+        article_cap: float | None = None,
+        timeout: float = 0.0,
+    ) -> Reservation:
+        """Hold ``amount`` for a call, waiting up to ``timeout`` for room.
+
+        Raises:
+            BudgetExceededError: If the call cannot fit under the caps
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                refusal = self._refusal(amount, article_id, run_cap, article_cap)
+                if refusal is not None:
+                    raise refusal
+                if self._fits(amount, article_id, run_cap, article_cap):
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    run_blocked = (
+                        run_cap is not None
+                        and self.spent + self.reserved + amount > run_cap
+                    )
+                    raise BudgetExceededError(
+                        f"No budget available for a {amount:.4f} call while "
+                        f"{self.reserved:.4f} is reserved by calls in flight",
+                        scope="run" if run_blocked else "article",
+                    )
+                self._cond.wait(remaining)
+
+            reservation = Reservation(next(self._ids), amount, article_id)
+            self.reserved += amount
+            if article_id:
+                self._article_reserved[article_id] = (
+                    self._article_reserved.get(article_id, 0.0) + amount
+                )
+            return reservation
+
+    def _drop(self, reservation: Reservation) -> None:
+        self.reserved = max(0.0, self.reserved - reservation.amount)
+        if reservation.article_id:
+            held = self._article_reserved.get(reservation.article_id, 0.0)
+            self._article_reserved[reservation.article_id] = max(
+                0.0, held - reservation.amount
+            )
+
+    def settle(self, reservation: Reservation, actual: float) -> None:
+        """Replace a reservation with the call's actual cost."""
+        with self._cond:
+            self._drop(reservation)
+            self.spent += actual
+            if reservation.article_id:
+                self._article_spent[reservation.article_id] = (
+                    self._article_spent.get(reservation.article_id, 0.0) + actual
+                )
+            if actual > reservation.amount:
+                logger.debug(
+                    f"Call cost {actual:.4f} exceeded its reservation "
+                    f"{reservation.amount:.4f}"
+                )
+            self._cond.notify_all()
+
+    def release(self, reservation: Reservation) -> None:
+        """Free a reservation for a call that failed without cost."""
+        with self._cond:
+            self._drop(reservation)
+            self._cond.notify_all()
@@ -1,24 +1,42 @@
 """Resource management utilities for external clients (OpenAI, HTTP, etc).
 
-Provides context managers for proper cleanup of long-lived client connections.
-This ensures resources are released even if errors occur during operations.
+Provides a process-wide pool of OpenAI clients and context managers for
+proper cleanup of short-lived HTTP clients.
 
 Key features:
-- OpenAI client context manager with configurable timeout and retries
+- Shared, thread-safe OpenAI clients: enrichment, generation, illustrations,
+  image selection and review all reuse one pooled client per API key, so
+  TLS handshakes and keep-alive connections are amortized across calls
+- Configurable httpx pool limits, keep-alive expiry and HTTP/2 (when ``h2``
+  is installed)
+- Connection reuse counters for verification (``openai_connection_stats()``)
+- ``x-ratelimit-*`` response headers are fed to the per-model rate limiter
+  (``rate_limit.ModelRateLimiter``) shared by all OpenAI calls
+- 429s and timed-out attempts, including ones the SDK retries internally,
+  are reported to the active AIMD controller (``adaptive_worker_manager``)
+- AsyncOpenAI clients with the same pool settings for asyncio engines
+- Pooled clients are closed once at interpreter shutdown
 - HTTP client context manager with redirect handling
-- Automatic cleanup via context manager protocol
-- Integration with pipeline configuration
 """
 
 from __future__ import annotations
 
-from contextlib import contextmanager
-from typing import TYPE_CHECKING
+import atexit
+import importlib.util
+import json
+import os
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 import httpx
-from openai import OpenAI
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient, DefaultHttpxClient, OpenAI
 
+from .adaptive_worker_manager import observe_http_request, observe_http_response
 from .logging import get_logger
+from .rate_limit import get_model_rate_limiter
 
 if TYPE_CHECKING:
     from ..config import PipelineConfig
@@ -26,12 +44,209 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
+def http2_available() -> bool:
+    """Return True if httpx can negotiate HTTP/2 (``h2`` installed)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+@dataclass
+class ConnectionStats:
+    """Request and connection counters for one pooled client."""
+
+    requests: int = 0
+    connections_opened: int = 0
+
+    @property
+    def connections_reused(self) -> int:
+        """Requests served over an already open connection."""
+        return max(0, self.requests - self.connections_opened)
+
+
+class _ConnectionCounter:
+    """httpx request hook counting requests and newly opened connections."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.stats = ConnectionStats()
+
+    def _trace(self, event_name: str, info: dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            with self._lock:
+                self.stats.connections_opened += 1
+
+    def __call__(self, request: httpx.Request) -> None:
+        with self._lock:
+            self.stats.requests += 1
+        request.extensions["trace"] = self._trace
+
+    def snapshot(self) -> ConnectionStats:
+        with self._lock:
+            return ConnectionStats(self.stats.requests, self.stats.connections_opened)
+
+
+def _request_model(request: httpx.Request) -> str | None:
+    """Model named in a JSON request body, if any."""
+    try:
+        body = json.loads(request.content)
+    except httpx.RequestNotRead, ValueError:
+        return None
+    model = body.get("model") if isinstance(body, dict) else None
+    return model if isinstance(model, str) else None
+
+
+def _record_rate_limits(response: httpx.Response) -> None:
+    """httpx response hook passing rate limit headers to the model limiter.
+
+    Also reports the response to the AIMD controller, which counts 429s the
+    SDK is about to retry.
+    """
+    observe_http_response(response)
+    headers = response.headers
+    if (
+        "x-ratelimit-limit-tokens" not in headers
+        and "x-ratelimit-limit-requests" not in headers
+    ):
+        return
+    model = _request_model(response.request)
+    if model:
+        get_model_rate_limiter().update_from_headers(model, headers)
+
+
+async def _record_rate_limits_async(response: httpx.Response) -> None:
+    _record_rate_limits(response)
+
+
+async def _observe_request_async(request: httpx.Request) -> None:
+    observe_http_request(request)
+
+
+class OpenAIClientRegistry:
+    """Thread-safe registry of pooled OpenAI clients.
+
+    Clients are keyed by API key, base URL, timeout, retry and pool settings,
+    so callers with the same configuration share one client (and its
+    connection pool). OpenAI clients are safe to use from multiple threads.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clients: dict[tuple, OpenAI] = {}
+        self._counters: dict[tuple, _ConnectionCounter] = {}
+
+    def get(self, config: PipelineConfig, api_key: str | None = None) -> OpenAI:
+        """Return the shared client for ``config``, creating it on first use."""
+        api_key = api_key or config.openai_api_key
+        if not api_key:
+            msg = "OpenAI API key not configured. Set OPENAI_API_KEY environment variable."
+            logger.error(msg)
+            raise ValueError(msg)
+
+        use_http2 = config.openai_http2 and http2_available()
+        key = (
+            api_key,
+            os.environ.get("OPENAI_BASE_URL"),
+            config.timeouts.openai_api_timeout,
+            config.retries.max_attempts,
+            config.openai_max_connections,
+            config.openai_max_keepalive_connections,
+            config.openai_keepalive_expiry,
+            use_http2,
+        )
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                return client
+
+            counter = _ConnectionCounter()
+            http_client = DefaultHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=config.openai_max_connections,
+                    max_keepalive_connections=config.openai_max_keepalive_connections,
+                    keepalive_expiry=config.openai_keepalive_expiry,
+                ),
+                http2=use_http2,
+                event_hooks={
+                    "request": [counter, observe_http_request],
+                    "response": [_record_rate_limits],
+                },
+            )
+            client = OpenAI(
+                api_key=api_key,
+                timeout=config.timeouts.openai_api_timeout,
+                max_retries=config.retries.max_attempts,
+                http_client=http_client,
+            )
+            self._clients[key] = client
+            self._counters[key] = counter
+            logger.debug(
+                f"Created pooled OpenAI client (max_connections="
+                f"{config.openai_max_connections}, http2={use_http2})"
+            )
+            return client
+
+    def stats(self) -> ConnectionStats:
+        """Request and connection counters summed over all pooled clients."""
+        with self._lock:
+            counters = list(self._counters.values())
+        total = ConnectionStats()
+        for counter in counters:
+            snapshot = counter.snapshot()
+            total.requests += snapshot.requests
+            total.connections_opened += snapshot.connections_opened
+        return total
+
+    def close(self) -> None:
+        """Close every pooled client; later calls create fresh ones."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._counters.clear()
+        for client in clients:
+            try:
+                client.close()
+            except Exception:
+                logger.exception("Error closing OpenAI client")
+        if clients:
+            logger.debug(f"Closed {len(clients)} pooled OpenAI client(s)")
+
+
+_REGISTRY = OpenAIClientRegistry()
+
+
+def get_shared_openai_client(
+    config: PipelineConfig, api_key: str | None = None
+) -> OpenAI:
+    """Return the process-wide pooled OpenAI client for ``config``.
+
+    Args:
+        config: Pipeline configuration with API key, timeouts and pool limits
+        api_key: Optional API key overriding ``config.openai_api_key``
+
+    Raises:
+        ValueError: If no OpenAI API key is configured
+    """
+    return _REGISTRY.get(config, api_key)
+
+
+def openai_connection_stats() -> ConnectionStats:
+    """Requests made and connections opened by the pooled OpenAI clients."""
+    return _REGISTRY.stats()
+
+
+def close_openai_clients() -> None:
+    """Close all pooled OpenAI clients (also runs at interpreter exit)."""
+    _REGISTRY.close()
+
+
+atexit.register(close_openai_clients)
+
+
 @contextmanager
 def get_openai_client(config: PipelineConfig):
-    """Context manager for OpenAI client lifecycle management.
+    """Context manager yielding the shared, pooled OpenAI client.
 
-    Ensures the client is properly closed after use, preventing resource leaks
-    when processing large batches of items.
+    The client is not closed on exit: it stays in the process-wide pool so
+    later stages reuse its connections, and is closed once at shutdown.
 
     Usage:
         with get_openai_client(config) as client:
@@ -47,35 +262,69 @@ def get_openai_client(config: PipelineConfig):
         ValueError: If OpenAI API key is not configured
         openai.AuthenticationError: If API key is invalid
     """
+    client = get_shared_openai_client(config)
+    try:
+        yield client
+    except Exception:
+        logger.exception("Error during OpenAI client operation")
+        raise
+
+
+@asynccontextmanager
+async def get_async_openai_client(
+    config: PipelineConfig, max_connections: int | None = None
+) -> AsyncIterator[AsyncOpenAI]:
+    """Async context manager for an ``AsyncOpenAI`` client.
+
+    Async clients are bound to the event loop they run on, so unlike the
+    sync clients they are created per engine run and closed on exit rather
+    than pooled for the whole process. Pool settings follow the shared
+    client; ``max_connections`` raises the connection limit so that many
+    in-flight requests don't queue for a connection.
+
+    Args:
+        config: Pipeline configuration with API key, timeouts and pool limits
+        max_connections: Optional connection limit overriding the config
+
+    Yields:
+        AsyncOpenAI client ready for API calls
+
+    Raises:
+        ValueError: If OpenAI API key is not configured
+    """
     if not config.openai_api_key:
         msg = "OpenAI API key not configured. Set OPENAI_API_KEY environment variable."
         logger.error(msg)
         raise ValueError(msg)
 
-    client = None
+    connections = max(max_connections or 0, config.openai_max_connections)
+    client = AsyncOpenAI(
+        api_key=config.openai_api_key,
+        timeout=config.timeouts.openai_api_timeout,
+        max_retries=config.retries.max_attempts,
+        http_client=DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=connections,
+                max_keepalive_connections=max(
+                    config.openai_max_keepalive_connections, connections // 2
+                ),
+                keepalive_expiry=config.openai_keepalive_expiry,
+            ),
+            http2=config.openai_http2 and http2_available(),
+            event_hooks={
+                "request": [_observe_request_async],
+                "response": [_record_rate_limits_async],
+            },
+        ),
+    )
     try:
-        logger.debug(
-            f"Creating OpenAI client with timeout={config.timeouts.openai_api_timeout}s"
-        )
-        client = OpenAI(
-            api_key=config.openai_api_key,
-            timeout=config.timeouts.openai_api_timeout,
-            max_retries=config.retries.max_attempts,
-        )
-        logger.debug("OpenAI client created successfully")
         yield client
-
-    except Exception:
-        logger.exception("Error during OpenAI client operation")
-        raise
-
     finally:
-        if client is not None:
-            try:
-                client.close()
-                logger.debug("OpenAI client closed successfully")
-            except Exception:
-                logger.exception("Error closing OpenAI client")
+        try:
+            await client.close()
+            logger.debug("Async OpenAI client closed successfully")
+        except Exception:
+            logger.exception("Error closing async OpenAI client")
 
 
 @contextmanager
@@ -197,6 +197,54 @@ def atomic_write_text(
         raise
 
 
+def atomic_write_bytes(
+    filepath: Path,
+    content: bytes,
+    min_disk_space: int = 1024 * 1024,  # 1MB default
+) -> None:
+    """Write binary data atomically to prevent corruption.
+
+    Same safety guarantees as atomic_write_json but for raw bytes.
+
+    Args:
+        filepath: Target file path to write to
+        content: Bytes to write
+        min_disk_space: Minimum free disk space required (in bytes)
+
+    Raises:
+        OSError: If disk full or write fails
+        ValueError: If insufficient disk space available
+    """
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    available = get_available_disk_space(filepath.parent)
+    if available < min_disk_space:
+        msg = (
+            f"Insufficient disk space for writing {filepath}. "
+            f"Required: {min_disk_space} bytes, Available: {available} bytes"
+        )
+        logger.error(msg)
+        raise ValueError(msg)
+
+    temp_file = filepath.with_suffix(filepath.suffix + ".tmp")
+
+    try:
+        with open(temp_file, "wb") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+
+        temp_file.replace(filepath)
+
+        logger.debug(f"Atomically wrote {len(content)} bytes to {filepath}")
+
+    except OSError as e:
+        temp_file.unlink(missing_ok=True)
+        logger.error(f"Failed to write {filepath}: {e}", exc_info=True)
+        raise
+
+
 # Format utilities
 
 
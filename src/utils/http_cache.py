@@ -0,0 +1,512 @@
+"""On-disk HTTP caches for collectors and source fetching.
+
+Three caches live under ``data/http_cache/``:
+
+- HTTPCache: stores response bodies with their ETag/Last-Modified validators
+  and turns repeat fetches into conditional GETs. A 304 reply is answered from
+  disk, so unchanged feeds cost a round trip but no download. Entries not
+  used for ``http_cache_max_age_days``, and the least recently used beyond
+  ``http_cache_max_entries``, are pruned (also via
+  scripts/vacuum_http_cache.py).
+- ItemCache: a per-namespace map of API items by id (e.g. HN items) with a
+  TTL. Fresh items are not requested at all.
+- LinkStatusCache: URL reachability from fact-checking, so links shared
+  across articles and runs are not probed again while fresh.
+
+Usage:
+    cache = get_http_cache()
+    response = conditional_get(requests.get, url, cache, timeout=10)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode
+
+from .file_io import atomic_write_bytes, atomic_write_json
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+# Response headers kept alongside cached bodies
+_STORED_HEADERS = ("content-type", "etag", "last-modified")
+
+# HTTPCache entries are <sha256>.json + <sha256>.body; other files in the
+# directory (item and link status caches) are never pruned
+_ENTRY_STEM_RE = re.compile(r"^[0-9a-f]{64}$")
+
+# Prune after this many stores, so long runs stay bounded too
+_PRUNE_EVERY_PUTS = 100
+
+
+def _default_cache_dir() -> Path:
+    from ..config import get_data_dir
+
+    return get_data_dir() / "http_cache"
+
+
+@dataclass
+class CachedResponse:
+    """A cached 200 response replayed after a 304 Not Modified."""
+
+    url: str
+    headers: dict[str, str]
+    content: bytes
+    status_code: int = 200
+    from_cache: bool = True
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        return None
+
+
+class HTTPCache:
+    """Response cache keyed by URL and query parameters.
+
+    Only responses carrying an ETag or Last-Modified header are stored, since
+    nothing else can be revalidated. Each entry is a small JSON metadata file
+    plus the raw body, both written atomically. Reading an entry touches its
+    metadata file, so file mtimes record when each entry was last used.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        max_age_seconds: float | None = None,
+        max_entries: int | None = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for entries (default: data/http_cache)
+            max_age_seconds: Prune entries unused for longer (None: keep)
+            max_entries: Prune least recently used entries beyond this many
+                (None: unlimited)
+        """
+        self.cache_dir = cache_dir if cache_dir is not None else _default_cache_dir()
+        self.max_age_seconds = max_age_seconds
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._puts_since_prune = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(url: str, params: dict[str, Any] | None = None) -> str:
+        """Stable cache key for a URL plus (optional) query parameters."""
+        if params:
+            url = f"{url}?{urlencode(sorted((k, str(v)) for k, v in params.items()))}"
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.cache_dir / f"{key}.json", self.cache_dir / f"{key}.body"
+
+    def _load_meta(self, key: str) -> dict[str, Any] | None:
+        meta_path, body_path = self._paths(key)
+        if not meta_path.exists() or not body_path.exists():
+            return None
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable HTTP cache entry {key}: {e}")
+            return None
+
+    def conditional_headers(
+        self, url: str, params: dict[str, Any] | None = None
+    ) -> dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for a cached URL."""
+        meta = self._load_meta(self.key(url, params))
+        if meta is None:
+            return {}
+        headers = {}
+        stored = meta.get("headers", {})
+        if stored.get("etag"):
+            headers["If-None-Match"] = stored["etag"]
+        if stored.get("last-modified"):
+            headers["If-Modified-Since"] = stored["last-modified"]
+        return headers
+
+    def get(
+        self, url: str, params: dict[str, Any] | None = None
+    ) -> CachedResponse | None:
+        """Return the cached response for a URL, if any."""
+        key = self.key(url, params)
+        meta = self._load_meta(key)
+        if meta is None:
+            return None
+        meta_path, body_path = self._paths(key)
+        try:
+            content = body_path.read_bytes()
+        except OSError:
+            return None
+        try:
+            os.utime(meta_path)  # Mark as recently used for pruning
+        except OSError:
+            pass
+        return CachedResponse(url=url, headers=meta.get("headers", {}), content=content)
+
+    def put(
+        self,
+        url: str,
+        headers: Any,
+        content: bytes,
+        params: dict[str, Any] | None = None,
+    ) -> bool:
+        """Store a 200 response body if it has validators.
+
+        Args:
+            url: Requested URL
+            headers: Response headers (any case-insensitive mapping)
+            content: Raw response body
+            params: Query parameters the URL was requested with
+
+        Returns:
+            True if the response was cached
+        """
+        stored = {
+            name: headers.get(name) for name in _STORED_HEADERS if headers.get(name)
+        }
+        if "etag" not in stored and "last-modified" not in stored:
+            return False
+
+        key = self.key(url, params)
+        meta_path, body_path = self._paths(key)
+        meta = {"url": url, "headers": stored, "stored_at": time.time()}
+        try:
+            with self._lock:
+                # Body first: metadata only points at complete bodies
+                atomic_write_bytes(body_path, content)
+                atomic_write_json(meta_path, meta)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not cache response for {url}: {e}")
+            return False
+        self._puts_since_prune += 1
+        if self._puts_since_prune >= _PRUNE_EVERY_PUTS:
+            self.prune()
+        return True
+
+    def prune(self) -> int:
+        """Delete entries unused for ``max_age_seconds``, then the least
+        recently used ones beyond ``max_entries``.
+
+        Returns:
+            Number of entries removed
+        """
+        if self.max_age_seconds is None and self.max_entries is None:
+            return 0
+        with self._lock:
+            self._puts_since_prune = 0
+            try:
+                entries = list(os.scandir(self.cache_dir))
+            except OSError:
+                return 0
+            last_used: dict[str, float] = {}
+            for entry in entries:
+                stem, _, suffix = entry.name.partition(".")
+                if suffix not in ("json", "body") or not _ENTRY_STEM_RE.match(stem):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                last_used[stem] = max(last_used.get(stem, 0.0), mtime)
+
+            stale: set[str] = set()
+            if self.max_age_seconds is not None:
+                cutoff = time.time() - self.max_age_seconds
+                stale = {key for key, used in last_used.items() if used < cutoff}
+            if self.max_entries is not None:
+                kept = sorted(
+                    (key for key in last_used if key not in stale),
+                    key=last_used.__getitem__,
+                    reverse=True,
+                )
+                stale.update(kept[self.max_entries :])
+
+            for key in stale:
+                # Metadata first: a body without metadata is never served
+                for path in self._paths(key):
+                    try:
+                        path.unlink(missing_ok=True)
+                    except OSError as e:
+                        logger.debug(f"Could not prune HTTP cache file {path}: {e}")
+        if stale:
+            logger.info(
+                f"HTTP cache pruned: {len(stale)} entries removed, "
+                f"{len(last_used) - len(stale)} kept"
+            )
+        return len(stale)
+
+    def __len__(self) -> int:
+        try:
+            return sum(
+                1
+                for path in self.cache_dir.glob("*.json")
+                if _ENTRY_STEM_RE.match(path.stem)
+            )
+        except OSError:
+            return 0
+
+    def resolve(
+        self,
+        url: str,
+        status_code: int,
+        headers: Any,
+        content: Callable[[], bytes],
+        params: dict[str, Any] | None = None,
+    ) -> CachedResponse | None:
+        """Apply a live response to the cache.
+
+        Returns the cached response for a 304, or None when the live response
+        should be used (storing it first if it is a cacheable 200).
+        """
+        if status_code == 304:
+            cached = self.get(url, params)
+            if cached is not None:
+                self.hits += 1
+                return cached
+            logger.debug(f"304 for {url} without a cached body")
+            return None
+        self.misses += 1
+        if status_code == 200:
+            self.put(url, headers, content(), params)
+        return None
+
+
+def conditional_get(
+    get: Callable[..., Any],
+    url: str,
+    cache: HTTPCache | None,
+    *,
+    params: dict[str, Any] | None = None,
+    headers: dict[str, str] | None = None,
+    **kwargs: Any,
+) -> Any:
+    """Call a synchronous ``get`` (requests.get, httpx.Client.get) conditionally.
+
+    Validators from ``cache`` are added to the request headers. A 304 reply
+    is replaced by the cached body; a 200 with validators is stored.
+
+    Args:
+        get: Function performing the GET
+        url: URL to fetch
+        cache: Cache to consult (plain GET if None)
+        params: Query parameters
+        headers: Request headers; explicit values win over validators
+        **kwargs: Passed through to ``get``
+
+    Returns:
+        The live response, or a CachedResponse after a 304
+    """
+    if cache is None:
+        return get(url, params=params, headers=headers, **kwargs)
+
+    request_headers = {**cache.conditional_headers(url, params), **(headers or {})}
+    response = get(url, params=params, headers=request_headers, **kwargs)
+    cached = cache.resolve(
+        url,
+        response.status_code,
+        response.headers,
+        lambda: response.content,
+        params,
+    )
+    return cached if cached is not None else response
+
+
+class ItemCache:
+    """API items by id with a time-to-live, persisted per namespace.
+
+    Loaded once and saved once per run; not safe for concurrent writers in
+    different processes (the last save wins).
+    """
+
+    def __init__(
+        self, namespace: str, ttl_seconds: float, cache_dir: Path | None = None
+    ):
+        self.ttl_seconds = ttl_seconds
+        cache_dir = cache_dir if cache_dir is not None else _default_cache_dir()
+        self.path = cache_dir / f"items_{namespace}.json"
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self.load()
+
+    def load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load item cache {self.path}: {e}")
+            self._entries = {}
+
+    def get(self, item_id: str | int) -> Any | None:
+        """Cached payload for ``item_id`` if younger than the TTL."""
+        entry = self._entries.get(str(item_id))
+        if entry is None or time.time() - entry["stored_at"] > self.ttl_seconds:
+            return None
+        return entry["data"]
+
+    def put(self, item_id: str | int, data: Any) -> None:
+        self._entries[str(item_id)] = {"stored_at": time.time(), "data": data}
+        self._dirty = True
+
+    def save(self) -> None:
+        """Persist entries, dropping expired ones."""
+        now = time.time()
+        fresh = {
+            item_id: entry
+            for item_id, entry in self._entries.items()
+            if now - entry["stored_at"] <= self.ttl_seconds
+        }
+        if not self._dirty and len(fresh) == len(self._entries):
+            return
+        self._entries = fresh
+        try:
+            atomic_write_json(self.path, fresh)
+            self._dirty = False
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not save item cache {self.path}: {e}")
+
+
+class LinkStatusCache:
+    """URL reachability results with separate TTLs for successes and failures.
+
+    Entries map a URL to ``{"reachable", "status", "checked_at"}``. Failures
+    expire sooner, since a slow or flaky host may recover. Safe to share
+    between threads; like ItemCache, the last process to save wins.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        failure_ttl_seconds: float,
+        cache_dir: Path | None = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.failure_ttl_seconds = failure_ttl_seconds
+        cache_dir = cache_dir if cache_dir is not None else _default_cache_dir()
+        self.path = cache_dir / "link_status.json"
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self.load()
+
+    def load(self) -> None:
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not load link status cache {self.path}: {e}")
+            self._entries = {}
+
+    def _fresh(self, entry: dict[str, Any], now: float) -> bool:
+        ttl = self.ttl_seconds if entry["reachable"] else self.failure_ttl_seconds
+        return now - entry["checked_at"] <= ttl
+
+    def get(self, url: str) -> bool | None:
+        """Cached reachability of ``url``, or None if unknown or expired."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None or not self._fresh(entry, time.time()):
+                return None
+            return entry["reachable"]
+
+    def put(self, url: str, reachable: bool, status: int | None = None) -> None:
+        with self._lock:
+            self._entries[url] = {
+                "reachable": reachable,
+                "status": status,
+                "checked_at": time.time(),
+            }
+            self._dirty = True
+
+    def save(self) -> None:
+        """Persist entries, dropping expired ones."""
+        with self._lock:
+            now = time.time()
+            fresh = {
+                url: entry
+                for url, entry in self._entries.items()
+                if self._fresh(entry, now)
+            }
+            if not self._dirty and len(fresh) == len(self._entries):
+                return
+            self._entries = fresh
+            try:
+                atomic_write_json(self.path, fresh)
+                self._dirty = False
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not save link status cache {self.path}: {e}")
+
+
+_HTTP_CACHE: HTTPCache | None = None
+_HTTP_CACHE_LOCK = threading.Lock()
+
+
+def get_http_cache() -> HTTPCache | None:
+    """Process-wide HTTPCache, or None when disabled by configuration."""
+    from ..config import get_config
+
+    if not get_config().http_cache_enabled:
+        return None
+
+    global _HTTP_CACHE
+    with _HTTP_CACHE_LOCK:
+        if _HTTP_CACHE is None:
+            _HTTP_CACHE = build_http_cache()
+            _HTTP_CACHE.prune()
+        return _HTTP_CACHE
+
+
+def build_http_cache(cache_dir: Path | None = None) -> HTTPCache:
+    """HTTPCache with the pruning limits from configuration."""
+    from ..config import get_config
+
+    config = get_config()
+    return HTTPCache(
+        cache_dir,
+        max_age_seconds=config.http_cache_max_age_days * 86400
+        if config.http_cache_max_age_days > 0
+        else None,
+        max_entries=config.http_cache_max_entries or None,
+    )
+
+
+_LINK_STATUS_CACHE: LinkStatusCache | None = None
+
+
+def get_link_status_cache() -> LinkStatusCache | None:
+    """Process-wide LinkStatusCache, or None when its TTL is 0."""
+    from ..config import get_config
+
+    config = get_config()
+    if config.fact_check_cache_ttl_seconds <= 0:
+        return None
+
+    global _LINK_STATUS_CACHE
+    with _HTTP_CACHE_LOCK:
+        if _LINK_STATUS_CACHE is None:
+            _LINK_STATUS_CACHE = LinkStatusCache(
+                config.fact_check_cache_ttl_seconds,
+                config.fact_check_cache_failure_ttl_seconds,
+            )
+        return _LINK_STATUS_CACHE
@@ -0,0 +1,154 @@
+"""Precompiled multi-keyword matching.
+
+Heuristic scoring and the content filters check dozens of keywords per text.
+Testing each with ``keyword in text`` scans the text once per keyword and
+matches inside words ("go" in "good", "ai" in "said", "nat" in "nation").
+
+KeywordMatcher compiles all keywords of one or more named groups into a
+single regex, structured as a character trie so that each text position
+follows one branch instead of trying every keyword:
+
+- One pass over the text returns every group's hits, including keywords
+  that overlap or sit inside a longer hit ("how" inside "how to").
+- Keywords match whole words, plus a plural ``-s``/``-es`` ("protocols"
+  matches "protocol"). Keywords that start or end with punctuation or
+  whitespace ("awesome-", "1/") are not bounded on that side.
+- Matching is case-insensitive; hits are reported as the keywords given.
+
+Build matchers once (at import) and reuse them:
+
+    FILTERS = KeywordMatcher({"tech": ["python", "rust"], "news": ["released"]})
+    hits = FILTERS.matches("Rust 1.80 released")
+    # {"tech": {"rust"}, "news": {"released"}}
+    counts = FILTERS.counts("...")  # {"tech": 1, "news": 0}
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Mapping
+
+_WORD_CHAR = re.compile(r"\w")
+# Plural endings accepted after keywords that end in a word character
+_PLURAL = "(?:e?s)?"
+_END = object()
+
+
+def _is_word_char(char: str) -> bool:
+    return bool(_WORD_CHAR.match(char))
+
+
+def _right_boundary(keyword: str) -> str:
+    return _PLURAL + r"(?!\w)" if _is_word_char(keyword[-1]) else ""
+
+
+def _keyword_pattern(keyword: str) -> str:
+    """Standalone pattern for one keyword, with the matcher's boundaries."""
+    left = r"(?<!\w)" if _is_word_char(keyword[0]) else ""
+    return left + re.escape(keyword) + _right_boundary(keyword)
+
+
+def _trie_pattern(node: dict) -> str:
+    """Regex for a character trie, longest continuations tried first."""
+    branches = [
+        re.escape(char) + _trie_pattern(child)
+        for char, child in sorted(
+            ((char, child) for char, child in node.items() if char is not _END),
+            key=lambda entry: entry[0],
+        )
+    ]
+    if _END in node:
+        branches.append(_right_boundary(node[_END]))
+    if len(branches) == 1:
+        return branches[0]
+    return "(?:" + "|".join(branches) + ")"
+
+
+def _compile(keywords: Iterable[str]) -> re.Pattern[str] | None:
+    word_start: dict = {}
+    other_start: dict = {}
+    for keyword in keywords:
+        node = word_start if _is_word_char(keyword[0]) else other_start
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[_END] = keyword
+
+    alternatives = []
+    if word_start:
+        alternatives.append(r"(?<!\w)" + _trie_pattern(word_start))
+    if other_start:
+        alternatives.append(_trie_pattern(other_start))
+    if not alternatives:
+        return None
+    # Zero-width lookahead so hits starting inside an earlier hit are found too
+    return re.compile("(?=(" + "|".join(alternatives) + "))", re.IGNORECASE)
+
+
+class KeywordMatcher:
+    """Single-pass, word-bounded matcher for named keyword groups."""
+
+    def __init__(self, groups: Mapping[str, Iterable[str]]) -> None:
+        self.groups = {
+            name: tuple(dict.fromkeys(kw.lower() for kw in keywords if kw))
+            for name, keywords in groups.items()
+        }
+        self._groups_of: dict[str, list[str]] = {}
+        for name, keywords in self.groups.items():
+            for keyword in keywords:
+                self._groups_of.setdefault(keyword, []).append(name)
+
+        keywords = list(self._groups_of)
+        self._regex = _compile(keywords)
+        # Keywords inside another keyword, credited whenever it matches
+        patterns = {kw: re.compile(_keyword_pattern(kw)) for kw in keywords}
+        self._contained = {
+            keyword: [
+                other
+                for other in keywords
+                if other != keyword
+                and len(other) < len(keyword)
+                and patterns[other].search(keyword)
+            ]
+            for keyword in keywords
+        }
+
+    def _keyword(self, hit: str) -> str | None:
+        """Keyword for a matched span (which may carry a plural ending)."""
+        hit = hit.lower()
+        for candidate in (hit, hit[:-1], hit[:-2]):
+            if candidate in self._groups_of:
+                return candidate
+        return None
+
+    def keywords_in(self, text: str) -> set[str]:
+        """Every keyword (of any group) found in ``text``."""
+        found: set[str] = set()
+        if self._regex is None or not text:
+            return found
+        for match in self._regex.finditer(text):
+            keyword = self._keyword(match.group(1))
+            if keyword is not None and keyword not in found:
+                found.add(keyword)
+                found.update(self._contained[keyword])
+        return found
+
+    def matches(self, text: str) -> dict[str, set[str]]:
+        """Keywords found per group; groups without hits are omitted."""
+        hits: dict[str, set[str]] = {}
+        for keyword in self.keywords_in(text):
+            for name in self._groups_of[keyword]:
+                hits.setdefault(name, set()).add(keyword)
+        return hits
+
+    def counts(self, text: str) -> dict[str, int]:
+        """Distinct keywords found per group (0 for groups without hits)."""
+        hits = self.matches(text)
+        return {name: len(hits.get(name, ())) for name in self.groups}
+
+    def matches_many(self, texts: Iterable[str]) -> list[dict[str, set[str]]]:
+        """matches() for each text, in order."""
+        return [self.matches(text) for text in texts]
+
+    def counts_many(self, texts: Iterable[str]) -> list[dict[str, int]]:
+        """counts() for each text, in order."""
+        return [self.counts(text) for text in texts]
@@ -0,0 +1,197 @@
+"""Content-addressed cache for LLM chat completions.
+
+Re-running enrichment on the same collected items, re-scoring illustrations
+or retrying a failed generation sends byte-identical requests. For stages
+whose answers we are happy to reuse, chat_completion() looks the request up
+here first and only calls the API on a miss.
+
+- Keys are a SHA-256 of the model, messages and request parameters, so any
+  change to the prompt or settings is a different entry.
+- Entries live in a single SQLite file (``data/llm_cache.sqlite3``) and
+  expire after ``llm_cache_ttl_seconds``.
+- The store holds at most ``llm_cache_max_entries`` responses; the least
+  recently used are evicted first.
+- Only stages (or ``context["operation"]`` values) listed in
+  ``llm_cache_stages`` are cached. Creative stages such as article content
+  should stay out of it, since their variation is the point.
+
+Usage:
+    cache = get_llm_cache(config)
+    if cache is not None and is_cacheable_stage(stage, context, config):
+        ...
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from openai.types.chat import ChatCompletion
+
+from ..models import PipelineConfig
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+def _default_cache_path() -> Path:
+    from ..config import get_data_dir
+
+    return get_data_dir() / "llm_cache.sqlite3"
+
+
+class LLMResponseCache:
+    """SQLite-backed response store with TTL expiry and LRU eviction.
+
+    One connection is shared between threads and serialised with a lock;
+    every operation is a single short statement, so contention is low
+    compared with the API calls it replaces.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        ttl_seconds: int = 604800,
+        max_entries: int = 5000,
+    ):
+        self.path = path if path is not None else _default_cache_path()
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    @staticmethod
+    def key(model: str, messages: list[dict[str, Any]], params: dict[str, Any]) -> str:
+        """Stable cache key for a chat request."""
+        payload = json.dumps(
+            {"model": model, "messages": messages, "params": params},
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, stage TEXT NOT NULL, model TEXT NOT NULL, "
+                "response TEXT NOT NULL, created_at REAL NOT NULL, "
+                "last_used REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_last_used "
+                "ON responses (last_used)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, key: str) -> ChatCompletion | None:
+        """Return the cached response for a key, if present and fresh."""
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT response, created_at FROM responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is not None and now - row[1] > self.ttl_seconds:
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    conn.commit()
+                    row = None
+                if row is not None:
+                    conn.execute(
+                        "UPDATE responses SET last_used = ? WHERE key = ?", (now, key)
+                    )
+                    conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache lookup failed: {e}")
+                row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        try:
+            return ChatCompletion.model_validate_json(row[0])
+        except ValueError as e:
+            logger.debug(f"Ignoring unreadable LLM cache entry {key}: {e}")
+            return None
+
+    def put(self, key: str, response: ChatCompletion, *, stage: str) -> None:
+        """Store a response and evict expired and least recently used entries."""
+        now = time.time()
+        with self._lock:
+            try:
+                conn = self._connect()
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, stage, model, response, created_at, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, stage, response.model, response.model_dump_json(), now, now),
+                )
+                conn.execute(
+                    "DELETE FROM responses WHERE created_at < ?",
+                    (now - self.ttl_seconds,),
+                )
+                conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "SELECT key FROM responses ORDER BY last_used DESC "
+                    "LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache write failed: {e}")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return (
+                self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+def is_cacheable_stage(
+    stage: str, context: dict[str, Any] | None, config: PipelineConfig
+) -> bool:
+    """Whether the cache policy allows reusing responses for this call."""
+    allowed = config.llm_cache_stages
+    return stage in allowed or (context or {}).get("operation") in allowed
+
+
+_LLM_CACHE: LLMResponseCache | None = None
+_LLM_CACHE_LOCK = threading.Lock()
+
+
+def get_llm_cache(config: PipelineConfig) -> LLMResponseCache | None:
+    """Process-wide LLMResponseCache, or None when disabled by configuration."""
+    if not config.llm_cache_enabled:
+        return None
+
+    global _LLM_CACHE
+    with _LLM_CACHE_LOCK:
+        if _LLM_CACHE is None:
+            _LLM_CACHE = LLMResponseCache(
+                ttl_seconds=config.llm_cache_ttl_seconds,
+                max_entries=config.llm_cache_max_entries,
+            )
+        return _LLM_CACHE
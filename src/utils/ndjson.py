@@ -0,0 +1,197 @@
+"""Streaming NDJSON storage for pipeline item files.
+
+Collected and enriched items are stored one JSON object per line, so they can
+be written as they are produced and read back lazily without holding the whole
+file (or its parsed form) in memory. Each line is validated on its own with
+``model_validate_json``, so one bad item never spoils the rest of the file.
+
+Legacy files (a single ``{"items": [...]}`` document ending in ``.json``) are
+still readable through the same iterator.
+
+Usage:
+    with NDJSONWriter(path) as writer:
+        for item in produce_items():
+            writer.write(item)
+
+    for item in iter_models(path, CollectedItem, start_after_id="hn_123"):
+        ...
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from collections.abc import Callable, Collection, Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, ValidationError
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+NDJSON_SUFFIX = ".ndjson"
+
+# First "id" key on a line. Item models serialise their id (or the nested
+# original item's id) before any other string field, and quotes inside string
+# values are escaped, so this is always the item's own id.
+_LINE_ID_PATTERN = re.compile(r'"id":\s*("(?:[^"\\]|\\.)*")')
+
+
+class NDJSONWriter:
+    """Append pydantic models to an NDJSON file, one line per model.
+
+    Each line is flushed as soon as it is written so readers can follow the
+    file while it grows. A crash can leave at most one truncated final line,
+    which ``iter_models`` skips.
+    """
+
+    def __init__(self, filepath: Path, append: bool = False) -> None:
+        self.filepath = Path(filepath)
+        self.append = append
+        self.count = 0
+        self._file: Any = None
+
+    def __enter__(self) -> NDJSONWriter:
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def open(self) -> None:
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.filepath, "a" if self.append else "w", encoding="utf-8")
+
+    def write(self, item: BaseModel) -> None:
+        """Serialise and append one item."""
+        if self._file is None:
+            raise RuntimeError("NDJSONWriter must be opened before writing")
+        self._file.write(item.model_dump_json() + "\n")
+        self._file.flush()
+        self.count += 1
+
+    def write_many(self, items: Iterable[BaseModel]) -> int:
+        """Append several items and return how many were written."""
+        written = 0
+        for item in items:
+            self.write(item)
+            written += 1
+        return written
+
+    def close(self) -> None:
+        if self._file is None:
+            return
+        try:
+            os.fsync(self._file.fileno())
+        finally:
+            self._file.close()
+            self._file = None
+        logger.debug(f"Wrote {self.count} items to {self.filepath}")
+
+
+def line_item_id(line: str) -> str | None:
+    """Extract an item's id from a raw NDJSON line without validating it."""
+    match = _LINE_ID_PATTERN.search(line)
+    if match is None:
+        return None
+    try:
+        return json.loads(match.group(1))
+    except ValueError:
+        return None
+
+
+def _raw_item_id(data: Any) -> str | None:
+    """Item id from a legacy JSON item dict (plain or enriched)."""
+    if not isinstance(data, dict):
+        return None
+    if "id" in data:
+        return str(data["id"])
+    original = data.get("original")
+    if isinstance(original, dict) and "id" in original:
+        return str(original["id"])
+    return None
+
+
+def _iter_raw(
+    filepath: Path,
+) -> Iterator[tuple[int, str | None, Callable[[type], Any]]]:
+    """Yield ``(position, item_id, validate)`` for every stored item.
+
+    ``validate`` is only called for items the caller keeps, so skipped lines
+    are never parsed beyond their id.
+    """
+    if filepath.suffix != NDJSON_SUFFIX:
+        with open(filepath, encoding="utf-8") as f:
+            data = json.load(f)
+        for position, item_data in enumerate(data["items"]):
+            yield (
+                position,
+                _raw_item_id(item_data),
+                lambda model, item_data=item_data: model(**item_data),
+            )
+        return
+
+    with open(filepath, encoding="utf-8") as f:
+        position = 0
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            yield (
+                position,
+                line_item_id(line),
+                lambda model, line=line: model.model_validate_json(line),
+            )
+            position += 1
+
+
+def iter_models[ModelT: BaseModel](
+    filepath: Path,
+    model: type[ModelT],
+    *,
+    skip: int = 0,
+    start_after_id: str | None = None,
+    ids: Collection[str] | None = None,
+    on_error: Callable[[Exception], None] | None = None,
+) -> Iterator[ModelT]:
+    """Lazily load and validate items from an NDJSON or legacy JSON file.
+
+    Args:
+        filepath: ``.ndjson`` file, or legacy ``.json`` with an ``items`` list
+        model: Pydantic model to validate each item against
+        skip: Number of leading items to skip without validating them
+        start_after_id: Only yield items stored after the item with this id
+        ids: Only yield items whose id is in this collection
+        on_error: Called with the error for items that fail validation;
+            such items are always skipped
+
+    Yields:
+        Validated model instances in file order
+    """
+    seeking = start_after_id is not None
+    for position, item_id, validate in _iter_raw(filepath):
+        if position < skip:
+            continue
+        if seeking:
+            seeking = item_id != start_after_id
+            continue
+        if ids is not None and item_id not in ids:
+            continue
+        try:
+            item = validate(model)
+        except (ValidationError, TypeError, ValueError) as e:
+            if on_error is not None:
+                on_error(e)
+            continue
+        yield item
+
+
+def find_item_files(directory: Path, prefix: str) -> list[Path]:
+    """Item files named ``<prefix>_*`` in either format."""
+    return [
+        *directory.glob(f"{prefix}_*{NDJSON_SUFFIX}"),
+        *directory.glob(f"{prefix}_*.json"),
+    ]
@@ -25,7 +25,7 @@ Usage:
 import logging
 from typing import Any, Literal, TypedDict
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from openai.types.chat import ChatCompletion
 
 logger = logging.getLogger(__name__)
@@ -212,6 +212,70 @@ def get_model_family(
     return "unknown"
 
 
+def _map_chat_params(
+    model: str, messages: list[dict[str, str]], params: dict[str, Any]
+) -> dict[str, Any]:
+    """Translate our parameter names into API parameters for ``model``."""
+    config = get_model_config(model)
+
+    # Start building API parameters
+    api_params: dict[str, Any] = {"model": model}
+
+    # Map messages parameter
+    api_params[config["param_map"]["messages"]] = messages
+
+    # Translate each parameter using the model's configuration
+    for our_name, value in params.items():
+        if value is None:
+            continue
+
+        # Skip known unsupported parameters
+        if our_name in config["unsupported"]:
+            continue
+
+        # Check if we have a mapping for this parameter
+        if our_name in config["param_map"]:
+            api_name = config["param_map"][our_name]
+            api_params[api_name] = value
+
+    return api_params
+
+
+def _has_content(response: ChatCompletion) -> bool:
+    """True if the first choice carries non-blank content."""
+    if response.choices and response.choices[0].message.content is not None:
+        return bool(response.choices[0].message.content.strip())
+    return False
+
+
+def _log_empty_response(model: str, response: ChatCompletion) -> None:
+    logger.warning(
+        f"Empty response from model '{model}' "
+        f"(tokens: {response.usage.prompt_tokens if response.usage else 0}/"
+        f"{response.usage.completion_tokens if response.usage else 0})"
+    )
+
+
+def _unsupported_params(error: Exception) -> list[str]:
+    """Parameters named in an "unsupported parameter" API error, if any."""
+    error_msg = str(error).lower()
+    if "unsupported" not in error_msg and "does not support" not in error_msg:
+        return []
+    return [
+        param_name
+        for param_name in [
+            "temperature",
+            "top_p",
+            "frequency_penalty",
+            "presence_penalty",
+            "seed",
+            "logprobs",
+            "top_logprobs",
+        ]
+        if param_name in error_msg
+    ]
+
+
 def create_chat_completion(
     client: OpenAI,
     model: str,
@@ -266,15 +330,6 @@ def create_chat_completion(
         ...     temperature=0.7,
         ... )
     """
-    # Get model configuration
-    config = get_model_config(model)
-
-    # Start building API parameters
-    api_params: dict[str, Any] = {"model": model}
-
-    # Map messages parameter
-    api_params[config["param_map"]["messages"]] = messages
-
     # Collect all our parameters
     our_params = {
         "max_tokens": max_tokens,
@@ -289,37 +344,18 @@ def create_chat_completion(
         "logprobs": logprobs,
         "top_logprobs": top_logprobs,
     }
-
-    # Translate each parameter using the model's configuration
-    for our_name, value in our_params.items():
-        if value is None:
-            continue
-
-        # Skip known unsupported parameters
-        if our_name in config["unsupported"]:
-            continue
-
-        # Check if we have a mapping for this parameter
-        if our_name in config["param_map"]:
-            api_name = config["param_map"][our_name]
-            api_params[api_name] = value
+    api_params = _map_chat_params(model, messages, our_params)
 
     # Make the API call with automatic fallback on parameter errors
     try:
         response = client.chat.completions.create(**api_params)
 
         # Check for empty response content (known GPT-5 bug)
-        if response.choices and response.choices[0].message.content is not None:
-            content = response.choices[0].message.content.strip()
-            if content:
-                return response  # Valid response
+        if _has_content(response):
+            return response  # Valid response
 
         # Empty response detected
-        logger.warning(
-            f"Empty response from model '{model}' "
-            f"(tokens: {response.usage.prompt_tokens if response.usage else 0}/"
-            f"{response.usage.completion_tokens if response.usage else 0})"
-        )
+        _log_empty_response(model, response)
 
         # Try fallback to GPT-4 if available
         fallback_model = get_fallback_model(model)
@@ -328,51 +364,17 @@ def create_chat_completion(
                 f"Attempting fallback: {model} -> {fallback_model} due to empty response"
             )
 
-            # Update api_params with fallback model and adjust parameters
-            fallback_config = get_model_config(fallback_model)
-            fallback_params: dict[str, Any] = {"model": fallback_model}
-
-            # Re-map all parameters for the fallback model
-            fallback_params[fallback_config["param_map"]["messages"]] = messages
-
-            our_params = {
-                "max_tokens": max_tokens,
-                "temperature": temperature,
-                "response_format": response_format,
-                "top_p": top_p,
-                "frequency_penalty": frequency_penalty,
-                "presence_penalty": presence_penalty,
-                "seed": seed,
-                "stop": stop,
-                "stream": stream,
-                "logprobs": logprobs,
-                "top_logprobs": top_logprobs,
-            }
-
-            for our_name, value in our_params.items():
-                if value is None:
-                    continue
-                if our_name in fallback_config["unsupported"]:
-                    continue
-                if our_name in fallback_config["param_map"]:
-                    api_name = fallback_config["param_map"][our_name]
-                    fallback_params[api_name] = value
-
-            # Retry with fallback model
+            # Re-map all parameters for the fallback model and retry
+            fallback_params = _map_chat_params(fallback_model, messages, our_params)
             fallback_response = client.chat.completions.create(**fallback_params)
 
             # Check fallback response
-            if (
-                fallback_response.choices
-                and fallback_response.choices[0].message.content
-            ):
-                fallback_content = fallback_response.choices[0].message.content.strip()
-                if fallback_content:
-                    logger.info(
-                        f"Fallback successful: {fallback_model} returned "
-                        f"{len(fallback_content)} chars"
-                    )
-                    return fallback_response
+            if _has_content(fallback_response):
+                logger.info(
+                    f"Fallback successful: {fallback_model} returned "
+                    f"{len(fallback_response.choices[0].message.content.strip())} chars"
+                )
+                return fallback_response
 
             logger.error(f"Fallback to {fallback_model} also returned empty response")
 
@@ -384,40 +386,69 @@ def create_chat_completion(
         return response  # Return original empty response
 
     except Exception as e:
-        error_msg = str(e).lower()
-
-        # Check if it's an unsupported parameter error
-        if "unsupported" in error_msg or "does not support" in error_msg:
-            # Try to extract which parameter failed
-            failed_params = []
-            for param_name in [
-                "temperature",
-                "top_p",
-                "frequency_penalty",
-                "presence_penalty",
-                "seed",
-                "logprobs",
-                "top_logprobs",
-            ]:
-                if param_name in error_msg:
-                    failed_params.append(param_name)
-
-            # If we identified failed params, retry without them
-            if failed_params:
-                logger.warning(
-                    f"Model {model} doesn't support parameters: {failed_params}. Retrying without them."
-                )
-                # Remove failed parameters from api_params
-                for param in failed_params:
-                    api_params.pop(param, None)
-
-                # Retry the call
-                return client.chat.completions.create(**api_params)
+        # If it's an unsupported parameter error, retry without those params
+        failed_params = _unsupported_params(e)
+        if failed_params:
+            logger.warning(
+                f"Model {model} doesn't support parameters: {failed_params}. Retrying without them."
+            )
+            for param in failed_params:
+                api_params.pop(param, None)
+            return client.chat.completions.create(**api_params)
 
         # If not a parameter error, or retry failed, raise original error
         raise
 
 
+async def create_chat_completion_async(
+    client: AsyncOpenAI,
+    model: str,
+    messages: list[dict[str, str]],
+    **params: Any,
+) -> ChatCompletion:
+    """Async counterpart of create_chat_completion for ``AsyncOpenAI`` clients.
+
+    Accepts the same keyword parameters and applies the same parameter
+    mapping, empty-response fallback and unsupported-parameter retry.
+    """
+    our_params = {"stream": False, **params}
+    api_params = _map_chat_params(model, messages, our_params)
+
+    try:
+        response = await client.chat.completions.create(**api_params)
+        if _has_content(response):
+            return response
+
+        _log_empty_response(model, response)
+        fallback_model = get_fallback_model(model)
+        if fallback_model:
+            logger.info(
+                f"Attempting fallback: {model} -> {fallback_model} due to empty response"
+            )
+            fallback_params = _map_chat_params(fallback_model, messages, our_params)
+            fallback_response = await client.chat.completions.create(**fallback_params)
+            if _has_content(fallback_response):
+                return fallback_response
+            logger.error(f"Fallback to {fallback_model} also returned empty response")
+
+        logger.error(
+            f"No valid response from {model}"
+            + (f" or fallback {fallback_model}" if fallback_model else "")
+        )
+        return response
+
+    except Exception as e:
+        failed_params = _unsupported_params(e)
+        if failed_params:
+            logger.warning(
+                f"Model {model} doesn't support parameters: {failed_params}. Retrying without them."
+            )
+            for param in failed_params:
+                api_params.pop(param, None)
+            return await client.chat.completions.create(**api_params)
+        raise
+
+
 def validate_model_config() -> list[str]:
     """Validate MODEL_CONFIGS for completeness and consistency.
 
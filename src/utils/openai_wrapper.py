@@ -3,26 +3,43 @@
 All LLM/image traffic must flow through this module so we can:
 - enforce explicit stage + model selection
 - capture standardized telemetry and ledger entries per run/article
+  (appended to ``data/runs/<run>/ledger.ndjson``, exported to
+  ``model_usage.json`` and ``articles/<id>.json`` at exit)
 - estimate costs using ``data/model_pricing.json``
-- enforce optional spend caps defined in configuration
+- enforce optional spend caps defined in configuration, reserving each
+  call's estimated cost before it is made (see ``budget.py``)
+- reuse responses for cacheable stages (see ``llm_cache.py``)
+- report each call's latency and error to adaptive concurrency control
+  (see ``adaptive_worker_manager.py``)
+- share one per-model RPM/TPM limiter across all stages: chat calls are
+  charged their estimated tokens up front and reconciled against the
+  returned usage (see ``rate_limit.ModelRateLimiter``)
 """
 
 from __future__ import annotations
 
-import json
+import asyncio
 import os
+import threading
+import time
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 from openai.types.chat import ChatCompletion
+from openai.types.completion_usage import CompletionUsage
 
 from ..config import get_config, get_data_dir
 from ..models import PipelineConfig
+from .adaptive_worker_manager import observe_api_call
+from .budget import CostBudget, Reservation, estimate_chat_cost, estimate_chat_tokens
+from .llm_cache import LLMResponseCache, get_llm_cache, is_cacheable_stage
 from .logging import get_logger
-from .openai_client import create_chat_completion
+from .openai_client import create_chat_completion, create_chat_completion_async
 from .pricing import estimate_image_cost, estimate_text_cost  # type: ignore[import]
+from .rate_limit import TokenLease, get_model_rate_limiter
+from .telemetry_ledger import TelemetryLedger
 
 logger = get_logger(__name__)
 
@@ -36,60 +53,28 @@ def _as_int(value: Any, default: int = 0) -> int:
         return default
 
 
-def _ensure_run_dirs() -> tuple[Path, Path, Path]:
-    data_dir = get_data_dir()
-    run_dir = data_dir / "runs" / _RUN_ID
-    articles_dir = run_dir / "articles"
+def _ensure_run_dir() -> Path:
+    run_dir = get_data_dir() / "runs" / _RUN_ID
     run_dir.mkdir(parents=True, exist_ok=True)
-    articles_dir.mkdir(parents=True, exist_ok=True)
-    return run_dir, articles_dir, run_dir / "model_usage.json"
+    return run_dir
 
 
-_RUN_DIR, _ARTICLES_DIR, _MODEL_USAGE_FILE = _ensure_run_dirs()
-_RUN_COST_TOTAL = 0.0
-_ARTICLE_COSTS: dict[str, float] = {}
+_RUN_DIR = _ensure_run_dir()
+_LEDGER = TelemetryLedger(_RUN_DIR, _RUN_ID)
+_BUDGET = CostBudget()
 
 
 def _utc_now() -> str:
     return datetime.now(UTC).isoformat()
 
 
-def _append_json_entry(file_path: Path, entry: dict[str, Any], root_key: str) -> None:
-    if file_path.exists():
-        try:
-            data = json.loads(file_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
-            logger.warning("Resetting corrupt telemetry file %s: %s", file_path, exc)
-            data = {}
-    else:
-        data = {}
+def flush_telemetry() -> Path | None:
+    """Flush buffered telemetry and export this run's JSON usage files.
 
-    data.setdefault("run_id", _RUN_ID)
-    data.setdefault(root_key, [])
-    data[root_key].append(entry)
-    file_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
-
-
-def _append_article_entry(article_id: str, entry: dict[str, Any]) -> None:
-    safe_article = article_id.replace(os.sep, "-")
-    file_path = _ARTICLES_DIR / f"{safe_article}.json"
-    if file_path.exists():
-        try:
-            data = json.loads(file_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as exc:
-            logger.warning(
-                "Resetting corrupt article ledger %s: %s",
-                file_path,
-                exc,
-            )
-            data = {"article_id": article_id, "entries": []}
-    else:
-        data = {"article_id": article_id, "entries": []}
-
-    data.setdefault("article_id", article_id)
-    data.setdefault("entries", [])
-    data["entries"].append(entry)
-    file_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    Runs automatically at exit; call it directly when another process needs
+    ``model_usage.json`` mid-run.
+    """
+    return _LEDGER.export()
 
 
 def _resolve_config(config: PipelineConfig | None) -> PipelineConfig:
@@ -100,37 +85,67 @@ def _expected_model(stage: str, config: PipelineConfig) -> str | None:
     return config.stage_models.as_mapping().get(stage)
 
 
-def _register_cost(
-    *,
-    stage: str,
-    cost: float,
-    config: PipelineConfig,
-    article_id: str | None,
-) -> None:
-    global _RUN_COST_TOTAL
-    _RUN_COST_TOTAL += cost
-
-    if (
-        config.max_cost_per_run is not None
-        and _RUN_COST_TOTAL > config.max_cost_per_run
-    ):
-        raise RuntimeError(
-            f"Run cost cap exceeded ({_RUN_COST_TOTAL:.4f} > {config.max_cost_per_run:.4f})"
-        )
+def _reserve(
+    estimate: float, config: PipelineConfig, article_id: str | None
+) -> Reservation:
+    return _BUDGET.reserve(
+        estimate,
+        article_id=article_id,
+        run_cap=config.max_cost_per_run,
+        article_cap=config.max_cost_per_article,
+        timeout=config.budget_wait_seconds,
+    )
 
-    if not article_id:
-        return
-
-    article_total = _ARTICLE_COSTS.get(article_id, 0.0) + cost
-    _ARTICLE_COSTS[article_id] = article_total
-    if (
-        config.max_cost_per_article is not None
-        and article_total > config.max_cost_per_article
-    ):
-        raise RuntimeError(
-            "Article cost cap exceeded for "
-            f"{article_id} ({article_total:.4f} > {config.max_cost_per_article:.4f})"
-        )
+
+class _ThreadedReservation:
+    """A reservation made in a worker thread that the caller may abandon.
+
+    Cancelling ``await asyncio.to_thread(...)`` does not stop the thread, so a
+    reservation it completes after the caller was cancelled would never be
+    released. Whichever of :meth:`reserve` and :meth:`abandon` runs second
+    releases it.
+    """
+
+    def __init__(
+        self, estimate: float, config: PipelineConfig, article_id: str | None
+    ) -> None:
+        self._args = (estimate, config, article_id)
+        self._lock = threading.Lock()
+        self._reservation: Reservation | None = None
+        self._abandoned = False
+
+    def reserve(self) -> Reservation:
+        reservation = _reserve(*self._args)
+        with self._lock:
+            if self._abandoned:
+                _BUDGET.release(reservation)
+            else:
+                self._reservation = reservation
+        return reservation
+
+    def abandon(self) -> None:
+        with self._lock:
+            self._abandoned = True
+            reservation, self._reservation = self._reservation, None
+        if reservation is not None:
+            _BUDGET.release(reservation)
+
+
+def _rate_limit_tokens(
+    messages: list[dict[str, Any]], params: dict[str, Any], config: PipelineConfig
+) -> int | None:
+    """Tokens to charge the model's rate limit for a call (None = not limited)."""
+    if not config.openai_rate_limiting:
+        return None
+    get_model_rate_limiter().configure(
+        config.openai_requests_per_minute, config.openai_tokens_per_minute
+    )
+    return estimate_chat_tokens(messages, params.get("max_tokens"))
+
+
+def _release_lease(lease: TokenLease | None) -> None:
+    if lease is not None:
+        get_model_rate_limiter().release(lease)
 
 
 def _build_entry(
@@ -162,21 +177,32 @@ def _build_entry(
     return entry
 
 
-def chat_completion(
+def _record_entry(
+    entry: dict[str, Any],
+    article_id: str | None,
+    artifacts: dict[str, Any] | None,
+) -> None:
+    _LEDGER.record(entry, article_id=article_id, artifacts=artifacts)
+
+
+def _prepare_chat(
     *,
-    client: OpenAI,
     model: str,
     messages: list[dict[str, Any]],
     stage: str,
-    config: PipelineConfig | None = None,
-    article_id: str | None = None,
-    revision: int | None = None,
-    context: dict[str, Any] | None = None,
-    artifacts: dict[str, Any] | None = None,
-    **kwargs: Any,
-) -> ChatCompletion:
-    """Call OpenAI chat completions with telemetry and governance."""
-
+    config: PipelineConfig | None,
+    article_id: str | None,
+    revision: int | None,
+    context: dict[str, Any] | None,
+    artifacts: dict[str, Any] | None,
+    params: dict[str, Any],
+) -> tuple[PipelineConfig, LLMResponseCache | None, str | None, ChatCompletion | None]:
+    """Validate a chat call and look it up in the response cache.
+
+    Returns the resolved config, the cache and key to store the response
+    under (None when the stage is not cacheable) and a replayed response on
+    a cache hit, already recorded as a zero-cost call.
+    """
     if not model:
         raise ValueError("Model must be specified for chat completion")
 
@@ -185,22 +211,71 @@ def chat_completion(
     if expected and expected != model:
         logger.warning("Stage %s expected model %s but got %s", stage, expected, model)
 
-    response = create_chat_completion(
-        client=client,
+    cache = get_llm_cache(cfg) if is_cacheable_stage(stage, context, cfg) else None
+    cache_key = cache.key(model, messages, params) if cache is not None else None
+    if cache is None or cache_key is None:
+        return cfg, None, None, None
+
+    cached = cache.get(cache_key)
+    if cached is None:
+        return cfg, cache, cache_key, None
+
+    # Replayed responses cost nothing; zero the usage so callers that
+    # price calls from response.usage don't charge for them either
+    cached_usage = cached.usage
+    entry = _build_entry(
+        stage=stage,
         model=model,
-        messages=messages,
-        **kwargs,
+        call_type="chat_completion",
+        cost=0.0,
+        article_id=article_id,
+        revision=revision,
+        context=context,
+        extra={
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "total_tokens": 0,
+            "cache_hit": True,
+            "cached_total_tokens": cached_usage.total_tokens if cached_usage else 0,
+        },
     )
+    _record_entry(entry, article_id, artifacts)
+    replay = cached.model_copy(
+        update={
+            "usage": CompletionUsage(
+                prompt_tokens=0, completion_tokens=0, total_tokens=0
+            )
+        }
+    )
+    return cfg, cache, cache_key, replay
 
+
+def _finish_chat(
+    response: ChatCompletion,
+    reservation: Reservation,
+    lease: TokenLease | None,
+    *,
+    model: str,
+    stage: str,
+    article_id: str | None,
+    revision: int | None,
+    context: dict[str, Any] | None,
+    artifacts: dict[str, Any] | None,
+    cache: LLMResponseCache | None,
+    cache_key: str | None,
+) -> None:
+    """Settle the reservation and rate limit lease, record telemetry and cache."""
     usage = getattr(response, "usage", None)
     prompt_tokens = _as_int(getattr(usage, "prompt_tokens", 0) if usage else 0)
     completion_tokens = _as_int(getattr(usage, "completion_tokens", 0) if usage else 0)
     total_tokens = _as_int(
         getattr(usage, "total_tokens", prompt_tokens + completion_tokens)
     )
+    if lease is not None and usage is not None:
+        get_model_rate_limiter().reconcile(lease, total_tokens)
 
     cost = estimate_text_cost(model, prompt_tokens or 0, completion_tokens or 0)
-    _register_cost(stage=stage, cost=cost, config=cfg, article_id=article_id)
+    _BUDGET.settle(reservation, cost)
 
     entry = _build_entry(
         stage=stage,
@@ -216,14 +291,166 @@ def chat_completion(
             "total_tokens": total_tokens,
         },
     )
+    _record_entry(entry, article_id, artifacts)
+
+    if cache is not None and cache_key is not None and response.choices:
+        # Empty completions are failures worth retrying, not answers to reuse
+        if response.choices[0].message.content:
+            cache.put(cache_key, response, stage=stage)
 
-    _append_json_entry(_MODEL_USAGE_FILE, entry, root_key="calls")
-    if article_id:
-        ledger_entry = entry.copy()
-        if artifacts:
-            ledger_entry["artifacts"] = artifacts
-        _append_article_entry(article_id, ledger_entry)
 
+def chat_completion(
+    *,
+    client: OpenAI,
+    model: str,
+    messages: list[dict[str, Any]],
+    stage: str,
+    config: PipelineConfig | None = None,
+    article_id: str | None = None,
+    revision: int | None = None,
+    context: dict[str, Any] | None = None,
+    artifacts: dict[str, Any] | None = None,
+    **kwargs: Any,
+) -> ChatCompletion:
+    """Call OpenAI chat completions with telemetry and governance.
+
+    Responses for stages allowed by the LLM cache policy are served from
+    the cache when an identical request was made before; hits are recorded
+    as zero-cost calls with ``cache_hit`` set. Other calls wait for room
+    in the model's request and token rate limits before they are sent.
+    """
+    cfg, cache, cache_key, replay = _prepare_chat(
+        model=model,
+        messages=messages,
+        stage=stage,
+        config=config,
+        article_id=article_id,
+        revision=revision,
+        context=context,
+        artifacts=artifacts,
+        params=kwargs,
+    )
+    if replay is not None:
+        return replay
+
+    reservation = _reserve(
+        estimate_chat_cost(model, messages, kwargs.get("max_tokens")),
+        cfg,
+        article_id,
+    )
+    lease = None
+    started = time.perf_counter()
+    try:
+        tokens = _rate_limit_tokens(messages, kwargs, cfg)
+        if tokens is not None:
+            lease = get_model_rate_limiter().acquire(model, tokens)
+            started = time.perf_counter()
+        response = create_chat_completion(
+            client=client,
+            model=model,
+            messages=messages,
+            **kwargs,
+        )
+    except BaseException as e:
+        observe_api_call(time.perf_counter() - started, e)
+        _release_lease(lease)
+        _BUDGET.release(reservation)
+        raise
+    observe_api_call(time.perf_counter() - started)
+
+    _finish_chat(
+        response,
+        reservation,
+        lease,
+        model=model,
+        stage=stage,
+        article_id=article_id,
+        revision=revision,
+        context=context,
+        artifacts=artifacts,
+        cache=cache,
+        cache_key=cache_key,
+    )
+    return response
+
+
+async def chat_completion_async(
+    *,
+    client: AsyncOpenAI,
+    model: str,
+    messages: list[dict[str, Any]],
+    stage: str,
+    config: PipelineConfig | None = None,
+    article_id: str | None = None,
+    revision: int | None = None,
+    context: dict[str, Any] | None = None,
+    artifacts: dict[str, Any] | None = None,
+    **kwargs: Any,
+) -> ChatCompletion:
+    """Async chat_completion() for ``AsyncOpenAI`` clients.
+
+    Same caching, budget, rate limit and telemetry behaviour. Reservations
+    that may have to wait for in-flight calls (a cost cap is set) wait in a
+    worker thread, and rate limit waits use ``asyncio.sleep``, so the event
+    loop keeps running.
+    """
+    cfg, cache, cache_key, replay = _prepare_chat(
+        model=model,
+        messages=messages,
+        stage=stage,
+        config=config,
+        article_id=article_id,
+        revision=revision,
+        context=context,
+        artifacts=artifacts,
+        params=kwargs,
+    )
+    if replay is not None:
+        return replay
+
+    estimate = estimate_chat_cost(model, messages, kwargs.get("max_tokens"))
+    if cfg.max_cost_per_run is None and cfg.max_cost_per_article is None:
+        reservation = _reserve(estimate, cfg, article_id)
+    else:
+        pending = _ThreadedReservation(estimate, cfg, article_id)
+        try:
+            reservation = await asyncio.to_thread(pending.reserve)
+        except asyncio.CancelledError:
+            pending.abandon()
+            raise
+    lease = None
+    started = time.perf_counter()
+    try:
+        tokens = _rate_limit_tokens(messages, kwargs, cfg)
+        if tokens is not None:
+            lease = await get_model_rate_limiter().acquire_async(model, tokens)
+            started = time.perf_counter()
+        response = await create_chat_completion_async(
+            client=client,
+            model=model,
+            messages=messages,
+            **kwargs,
+        )
+    except BaseException as e:
+        observe_api_call(time.perf_counter() - started, e)
+        _release_lease(lease)
+        _BUDGET.release(reservation)
+        raise
+    observe_api_call(time.perf_counter() - started)
+
+    _finish_chat(
+        response,
+        reservation,
+        lease,
+        model=model,
+        stage=stage,
+        article_id=article_id,
+        revision=revision,
+        context=context,
+        artifacts=artifacts,
+        cache=cache,
+        cache_key=cache_key,
+    )
     return response
 
 
@@ -253,17 +480,24 @@ def create_image(
     if expected and expected != model:
         logger.warning("Stage %s expected model %s but got %s", stage, expected, model)
 
-    response = client.images.generate(
-        model=model,
-        prompt=prompt,
-        size=size,  # type: ignore[arg-type]
-        quality=quality,  # type: ignore[arg-type]
-        n=n,
-        **kwargs,
-    )
-
     cost = estimate_image_cost(model, size=size, quality=quality, count=n)
-    _register_cost(stage=stage, cost=cost, config=cfg, article_id=article_id)
+    reservation = _reserve(cost, cfg, article_id)
+    started = time.perf_counter()
+    try:
+        response = client.images.generate(
+            model=model,
+            prompt=prompt,
+            size=size,  # type: ignore[arg-type]
+            quality=quality,  # type: ignore[arg-type]
+            n=n,
+            **kwargs,
+        )
+    except BaseException as e:
+        observe_api_call(time.perf_counter() - started, e)
+        _BUDGET.release(reservation)
+        raise
+    observe_api_call(time.perf_counter() - started)
+    _BUDGET.settle(reservation, cost)
 
     entry = _build_entry(
         stage=stage,
@@ -281,11 +515,6 @@ def create_image(
         },
     )
 
-    _append_json_entry(_MODEL_USAGE_FILE, entry, root_key="calls")
-    if article_id:
-        ledger_entry = entry.copy()
-        if artifacts:
-            ledger_entry["artifacts"] = artifacts
-        _append_article_entry(article_id, ledger_entry)
+    _record_entry(entry, article_id, artifacts)
 
     return response
@@ -2,14 +2,28 @@
 
 Provides a lightweight token bucket limiter and exponential backoff helper
 to keep external API usage respectful and avoid 429 blocks.
+
+ModelRateLimiter applies OpenAI-style limits per model: a request bucket
+(RPM) and a token bucket (TPM). Calls are charged their estimated prompt +
+completion tokens up front and reconciled against the ``usage`` the API
+returns; ``x-ratelimit-*`` response headers, when present, replace the
+configured limits with the ones the API actually enforces.
 """
 
 from __future__ import annotations
 
+import asyncio
 import random
+import re
+import threading
 import time
+from collections.abc import Mapping
 from dataclasses import dataclass
 
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
 
 @dataclass
 class TokenBucket:
@@ -74,6 +88,263 @@ class RateLimiter:
         return self.bucket.time_until_available(amount)
 
 
+class AsyncRateLimiter(RateLimiter):
+    """Token bucket limiter for asyncio code.
+
+    Same bucket and jitter semantics as RateLimiter, but waits with
+    ``asyncio.sleep`` so other requests keep running while one is throttled.
+    """
+
+    def __init__(self, rate_per_minute: int, burst: int, jitter: float = 0.1) -> None:
+        super().__init__(rate_per_minute, burst, jitter)
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1.0) -> None:  # type: ignore[override]
+        from ..config import get_config
+
+        config = get_config()
+        min_interval = config.sleep_intervals.rate_limit_minimum_interval
+        # Serialize waiters so tokens are handed out in arrival order
+        async with self._lock:
+            while not self.bucket.try_take(amount):
+                wait = self.bucket.time_until_available(amount)
+                wait *= 1.0 + random.uniform(-self.jitter, self.jitter)
+                await asyncio.sleep(max(min_interval, wait))
+
+
+@dataclass(frozen=True)
+class TokenLease:
+    """Request and tokens charged to a model's buckets for one call."""
+
+    model: str
+    tokens: int
+    sync: int = 0
+
+
+@dataclass
+class _ModelBuckets:
+    requests: TokenBucket | None = None
+    tokens: TokenBucket | None = None
+    # Header updates seen; the API's remaining count already covers calls
+    # charged before the latest one, so their estimates are not refunded
+    syncs: int = 0
+
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+def parse_reset_duration(value: str | None) -> float | None:
+    """Seconds in an ``x-ratelimit-reset-*`` value such as ``6m0s`` or ``20ms``."""
+    if not value:
+        return None
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def _header_int(headers: Mapping[str, str], name: str) -> int | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
+
+
+def _sync_bucket(
+    bucket: TokenBucket | None,
+    limit: int | None,
+    remaining: int | None,
+    reset: float | None,
+) -> TokenBucket | None:
+    """Align a bucket with the limit, remaining capacity and reset the API reported."""
+    if not limit:
+        return bucket
+    if bucket is None:
+        bucket = TokenBucket.create(limit, limit)
+    bucket._refill()
+    bucket.capacity = limit
+    bucket.refill_rate_per_sec = limit / 60.0
+    if remaining is not None:
+        if reset and remaining < limit:
+            # The API refills what has been used by the time it reports
+            bucket.refill_rate_per_sec = max(
+                bucket.refill_rate_per_sec, (limit - remaining) / reset
+            )
+        bucket.tokens = min(bucket.tokens, float(remaining))
+    bucket.tokens = min(bucket.tokens, float(limit))
+    return bucket
+
+
+class ModelRateLimiter:
+    """Per-model RPM and TPM buckets shared by every OpenAI call.
+
+    Models without a known limit (none configured and no headers seen yet)
+    are not throttled. Thread-safe; ``acquire_async`` waits without
+    blocking the event loop.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int | None = None,
+        tokens_per_minute: int | None = None,
+    ) -> None:
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._lock = threading.Lock()
+        self._models: dict[str, _ModelBuckets] = {}
+
+    def configure(
+        self, requests_per_minute: int | None, tokens_per_minute: int | None
+    ) -> None:
+        """Set the limits used for models the API has not reported on yet."""
+        with self._lock:
+            if (requests_per_minute, tokens_per_minute) == (
+                self.requests_per_minute,
+                self.tokens_per_minute,
+            ):
+                return
+            self.requests_per_minute = requests_per_minute
+            self.tokens_per_minute = tokens_per_minute
+            # Limits learned from the API stay; the rest restart from config
+            self._models = {
+                model: buckets
+                for model, buckets in self._models.items()
+                if buckets.syncs
+            }
+
+    def _buckets(self, model: str) -> _ModelBuckets:
+        buckets = self._models.get(model)
+        if buckets is None:
+            buckets = _ModelBuckets(
+                requests=(
+                    TokenBucket.create(
+                        self.requests_per_minute, self.requests_per_minute
+                    )
+                    if self.requests_per_minute
+                    else None
+                ),
+                tokens=(
+                    TokenBucket.create(self.tokens_per_minute, self.tokens_per_minute)
+                    if self.tokens_per_minute
+                    else None
+                ),
+            )
+            self._models[model] = buckets
+        return buckets
+
+    @staticmethod
+    def _wait(buckets: _ModelBuckets, tokens: int) -> tuple[int, float]:
+        """Tokens to charge for a call and seconds until both buckets allow it."""
+        # A single call larger than the whole TPM limit waits for a full bucket
+        amount = min(tokens, int(buckets.tokens.capacity)) if buckets.tokens else tokens
+        wait = max(
+            buckets.requests.time_until_available(1.0) if buckets.requests else 0.0,
+            buckets.tokens.time_until_available(amount) if buckets.tokens else 0.0,
+        )
+        return amount, wait
+
+    def _try_acquire(self, model: str, tokens: int) -> TokenLease | float:
+        """Charge the call if both buckets allow it, else return the wait."""
+        with self._lock:
+            buckets = self._buckets(model)
+            amount, wait = self._wait(buckets, tokens)
+            if wait > 0:
+                return wait
+            if buckets.requests:
+                buckets.requests.tokens -= 1.0
+            if buckets.tokens:
+                buckets.tokens.tokens -= amount
+            return TokenLease(model, amount, buckets.syncs)
+
+    def acquire(self, model: str, tokens: int) -> TokenLease:
+        """Block until ``model`` has a request and ``tokens`` available."""
+        while not isinstance(lease := self._try_acquire(model, tokens), TokenLease):
+            logger.debug(f"Rate limit for {model}: waiting {lease:.2f}s")
+            time.sleep(lease)
+        return lease
+
+    async def acquire_async(self, model: str, tokens: int) -> TokenLease:
+        """acquire() that waits with ``asyncio.sleep``."""
+        while not isinstance(lease := self._try_acquire(model, tokens), TokenLease):
+            logger.debug(f"Rate limit for {model}: waiting {lease:.2f}s")
+            await asyncio.sleep(lease)
+        return lease
+
+    def _refund(self, lease: TokenLease, tokens: float) -> None:
+        with self._lock:
+            buckets = self._buckets(lease.model)
+            if buckets.tokens is None or buckets.syncs != lease.sync:
+                return
+            buckets.tokens._refill()
+            buckets.tokens.tokens = min(
+                buckets.tokens.capacity, buckets.tokens.tokens + tokens
+            )
+
+    def time_until_available(self, model: str, tokens: int) -> float:
+        """Seconds until ``model`` could admit a call of ``tokens``."""
+        with self._lock:
+            return self._wait(self._buckets(model), tokens)[1]
+
+    def reconcile(self, lease: TokenLease, actual_tokens: int) -> None:
+        """Replace the estimated token charge with the call's actual usage.
+
+        Overruns are charged too, so later calls wait for the difference.
+        Skipped once headers reported after the charge have been applied.
+        """
+        self._refund(lease, lease.tokens - actual_tokens)
+
+    def release(self, lease: TokenLease) -> None:
+        """Return the tokens of a call that failed before using any."""
+        self._refund(lease, lease.tokens)
+
+    def update_from_headers(self, model: str, headers: Mapping[str, str]) -> None:
+        """Adopt the limits reported in ``x-ratelimit-*`` response headers."""
+        request_limit = _header_int(headers, "x-ratelimit-limit-requests")
+        token_limit = _header_int(headers, "x-ratelimit-limit-tokens")
+        if request_limit is None and token_limit is None:
+            return
+        with self._lock:
+            buckets = self._buckets(model)
+            buckets.syncs += 1
+            buckets.requests = _sync_bucket(
+                buckets.requests,
+                request_limit,
+                _header_int(headers, "x-ratelimit-remaining-requests"),
+                parse_reset_duration(headers.get("x-ratelimit-reset-requests")),
+            )
+            buckets.tokens = _sync_bucket(
+                buckets.tokens,
+                token_limit,
+                _header_int(headers, "x-ratelimit-remaining-tokens"),
+                parse_reset_duration(headers.get("x-ratelimit-reset-tokens")),
+            )
+
+    def remaining(self, model: str) -> tuple[float | None, float | None]:
+        """Requests and tokens currently available for ``model`` (None = unlimited)."""
+        with self._lock:
+            buckets = self._buckets(model)
+            result = []
+            for bucket in (buckets.requests, buckets.tokens):
+                if bucket is None:
+                    result.append(None)
+                else:
+                    bucket._refill()
+                    result.append(bucket.tokens)
+            return result[0], result[1]
+
+
+_MODEL_LIMITER = ModelRateLimiter()
+
+
+def get_model_rate_limiter() -> ModelRateLimiter:
+    """Process-wide per-model limiter used by ``openai_wrapper``."""
+    return _MODEL_LIMITER
+
+
 def exponential_backoff(
     attempt: int, base: float = 2.0, max_delay: float = 60.0, jitter: float = 0.2
 ) -> float:
@@ -0,0 +1,199 @@
+"""Run a small dependency graph of pipeline stages concurrently.
+
+A stage is a callable that receives the results of the stages it depends on,
+in the order they were listed. Each stage starts as soon as all of its
+dependencies have finished, so independent stages overlap and the wall time
+approaches the critical path instead of the sum of the stages.
+
+Every run records a timing span per stage and logs one summary line:
+
+    graph = StageGraph("article", phase="generation")
+    graph.add("content", generate_content)
+    graph.add("title", make_title, after=["content"])
+    graph.add("illustrations", illustrate, after=["content"])
+    graph.add("article", build_article, after=["title", "illustrations"])
+    results = graph.run()
+
+Stages are added in dependency order (a stage may only depend on stages added
+before it), so a graph can never contain a cycle.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any
+
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class StageSpan:
+    """When one stage ran, in seconds since the start of the run."""
+
+    name: str
+    start: float
+    end: float
+
+    @property
+    def seconds(self) -> float:
+        return self.end - self.start
+
+
+class StageGraph:
+    """Dependency graph of named stages executed on a thread pool."""
+
+    def __init__(
+        self,
+        name: str,
+        phase: str | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        """Create an empty graph.
+
+        Args:
+            name: Label used in thread names and the timing log line
+            phase: Log ``phase`` for the timing summary (defaults to name)
+            max_workers: Upper bound on stages running at once
+                (default: one thread per stage)
+        """
+        self.name = name
+        self.phase = phase or name
+        self.max_workers = max_workers
+        self.spans: dict[str, StageSpan] = {}
+        self.wall_seconds = 0.0
+        self._stages: dict[str, tuple[Callable[..., Any], tuple[str, ...]]] = {}
+
+    def add(self, name: str, fn: Callable[..., Any], after: Iterable[str] = ()) -> None:
+        """Add a stage that runs once every stage in ``after`` has finished.
+
+        Raises:
+            ValueError: If the name is taken or a dependency was not added yet
+        """
+        deps = tuple(after)
+        if name in self._stages:
+            raise ValueError(f"Stage '{name}' already added")
+        missing = [dep for dep in deps if dep not in self._stages]
+        if missing:
+            raise ValueError(f"Stage '{name}' depends on unknown stages: {missing}")
+        self._stages[name] = (fn, deps)
+
+    def run(self, concurrent: bool = True) -> dict[str, Any]:
+        """Run every stage and return their results by name.
+
+        The first stage to raise stops the run: stages that have not started
+        are skipped, stages already running are waited for, and the exception
+        is re-raised.
+
+        Args:
+            concurrent: If False, run the stages one after another in the
+                order they were added (same results, no threads)
+        """
+        results: dict[str, Any] = {}
+        self.spans = {}
+        origin = time.perf_counter()
+        try:
+            if concurrent and len(self._stages) > 1:
+                self._run_concurrent(results, origin)
+            else:
+                for name, (fn, deps) in self._stages.items():
+                    results[name] = self._timed(
+                        name, fn, [results[dep] for dep in deps], origin
+                    )
+        finally:
+            self.wall_seconds = time.perf_counter() - origin
+            self._log_spans()
+        return results
+
+    def critical_path(self) -> tuple[list[str], float]:
+        """Longest chain of dependent stages from the last run.
+
+        Returns:
+            (stage names from first to last, summed seconds)
+        """
+        best: dict[str, tuple[float, list[str]]] = {}
+        for name, (_, deps) in self._stages.items():
+            span = self.spans.get(name)
+            if span is None:
+                continue
+            before = max(
+                (best[dep] for dep in deps if dep in best),
+                key=lambda entry: entry[0],
+                default=(0.0, []),
+            )
+            best[name] = (before[0] + span.seconds, [*before[1], name])
+        if not best:
+            return [], 0.0
+        seconds, path = max(best.values(), key=lambda entry: entry[0])
+        return path, seconds
+
+    def _run_concurrent(self, results: dict[str, Any], origin: float) -> None:
+        waiting = dict(self._stages)
+        running: dict[Future[Any], str] = {}
+        with ThreadPoolExecutor(
+            max_workers=self.max_workers or len(self._stages),
+            thread_name_prefix=f"{self.name}-stage",
+        ) as executor:
+            while waiting or running:
+                ready = [
+                    name
+                    for name, (_, deps) in waiting.items()
+                    if all(dep in results for dep in deps)
+                ]
+                for name in ready:
+                    fn, deps = waiting.pop(name)
+                    # Stages run in a copy of the caller's context (e.g. the
+                    # adaptive worker manager tracking its OpenAI calls)
+                    future = executor.submit(
+                        contextvars.copy_context().run,
+                        self._timed,
+                        name,
+                        fn,
+                        [results[dep] for dep in deps],
+                        origin,
+                    )
+                    running[future] = name
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    # Raising here leaves ``waiting`` unsubmitted; leaving the
+                    # with-block waits for the stages that are still running
+                    results[running.pop(future)] = future.result()
+
+    def _timed(
+        self, name: str, fn: Callable[..., Any], args: list[Any], origin: float
+    ) -> Any:
+        start = time.perf_counter() - origin
+        try:
+            return fn(*args)
+        finally:
+            self.spans[name] = StageSpan(name, start, time.perf_counter() - origin)
+
+    def _log_spans(self) -> None:
+        if not self.spans:
+            return
+        path, path_seconds = self.critical_path()
+        total = sum(span.seconds for span in self.spans.values())
+        logger.info(
+            f"{self.name} stages: {self.wall_seconds:.2f}s wall, "
+            f"{total:.2f}s summed, critical path {' -> '.join(path)} "
+            f"({path_seconds:.2f}s)",
+            extra={
+                "phase": self.phase,
+                "event": "stage_timings",
+                "graph": self.name,
+                "time_seconds": round(self.wall_seconds, 3),
+                "stages": {
+                    name: {
+                        "start": round(span.start, 3),
+                        "seconds": round(span.seconds, 3),
+                    }
+                    for name, span in self.spans.items()
+                },
+                "critical_path": path,
+            },
+        )
@@ -0,0 +1,211 @@
+"""Append-only NDJSON ledger for per-run model usage telemetry.
+
+Every chat/image call made through openai_wrapper produces one telemetry
+entry. Entries are appended to ``data/runs/<run>/ledger.ndjson`` through a
+buffered, thread-safe writer instead of re-reading and rewriting JSON
+documents, so recording a call costs the same on the 1,000th call as on the
+first, and concurrent enrichment/generation threads cannot lose entries.
+
+The buffer is flushed when it holds ``max_buffer`` entries, when
+``flush_interval`` seconds have passed since the last flush (checked on
+each append), and at interpreter exit.
+
+``export_run_ledger`` compacts the ledger into the JSON documents downstream
+tools read:
+
+- ``model_usage.json``: ``{"run_id": ..., "calls": [...]}``
+- ``articles/<article_id>.json``: ``{"article_id": ..., "entries": [...]}``
+  (entries include the call's ``artifacts``)
+
+Usage:
+    ledger = TelemetryLedger(run_dir, run_id)
+    ledger.record(entry, article_id="my-article", artifacts={"draft": 1})
+    ledger.export()  # also done automatically at exit
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import threading
+import time
+import weakref
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from .file_io import atomic_write_json
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+LEDGER_FILENAME = "ledger.ndjson"
+MODEL_USAGE_FILENAME = "model_usage.json"
+
+
+class BufferedNDJSONAppender:
+    """Thread-safe appender that batches dict lines into few writes.
+
+    Lines are only ever appended, so a crash loses at most the unflushed
+    buffer and never corrupts what is already on disk.
+    """
+
+    def __init__(
+        self,
+        filepath: Path,
+        max_buffer: int = 64,
+        flush_interval: float = 5.0,
+    ):
+        self.filepath = Path(filepath)
+        self.max_buffer = max_buffer
+        self.flush_interval = flush_interval
+        self._buffer: list[str] = []
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        _register_for_exit(self)
+
+    def append(self, entry: dict[str, Any]) -> None:
+        """Buffer one entry, flushing if the buffer is full or stale."""
+        line = json.dumps(entry, ensure_ascii=False, default=str)
+        with self._lock:
+            self._buffer.append(line)
+            if (
+                len(self._buffer) >= self.max_buffer
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Write all buffered entries to disk."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+        data = "\n".join(self._buffer) + "\n"
+        self._buffer.clear()
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.filepath, "a", encoding="utf-8") as f:
+            f.write(data)
+
+
+_EXIT_WRITERS: weakref.WeakSet[BufferedNDJSONAppender] = weakref.WeakSet()
+_EXIT_LEDGERS: weakref.WeakSet[TelemetryLedger] = weakref.WeakSet()
+
+
+def _register_for_exit(writer: BufferedNDJSONAppender) -> None:
+    _EXIT_WRITERS.add(writer)
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    for writer in list(_EXIT_WRITERS):
+        try:
+            writer.flush()
+        except OSError as e:
+            logger.warning(f"Could not flush telemetry ledger {writer.filepath}: {e}")
+    for ledger in list(_EXIT_LEDGERS):
+        try:
+            ledger.export()
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not export telemetry ledger {ledger.run_dir}: {e}")
+
+
+def iter_ledger(filepath: Path) -> Iterator[dict[str, Any]]:
+    """Yield ledger entries, skipping a truncated or corrupt line."""
+    if not filepath.exists():
+        return
+    with open(filepath, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                logger.warning(f"Skipping corrupt telemetry line in {filepath}: {e}")
+
+
+def export_run_ledger(run_dir: Path, run_id: str) -> Path | None:
+    """Compact a run's ledger into model_usage.json and per-article ledgers.
+
+    Args:
+        run_dir: ``data/runs/<run>`` directory holding ``ledger.ndjson``
+        run_id: Run identifier stored in the exported documents
+
+    Returns:
+        Path to model_usage.json, or None if the run recorded no calls
+    """
+    ledger_path = run_dir / LEDGER_FILENAME
+    if not ledger_path.exists():
+        return None
+
+    calls: list[dict[str, Any]] = []
+    articles: dict[str, list[dict[str, Any]]] = {}
+    for entry in iter_ledger(ledger_path):
+        call = {k: v for k, v in entry.items() if k != "artifacts"}
+        calls.append(call)
+        if article_id := entry.get("article_id"):
+            articles.setdefault(article_id, []).append(entry)
+
+    usage_path = run_dir / MODEL_USAGE_FILENAME
+    atomic_write_json(usage_path, {"run_id": run_id, "calls": calls})
+    articles_dir = run_dir / "articles"
+    for article_id, entries in articles.items():
+        safe_article = article_id.replace(os.sep, "-")
+        atomic_write_json(
+            articles_dir / f"{safe_article}.json",
+            {"article_id": article_id, "entries": entries},
+        )
+    return usage_path
+
+
+class TelemetryLedger:
+    """Per-run telemetry ledger: one NDJSON file for all calls."""
+
+    def __init__(
+        self,
+        run_dir: Path,
+        run_id: str,
+        max_buffer: int = 64,
+        flush_interval: float = 5.0,
+        export_at_exit: bool = True,
+    ):
+        self.run_dir = Path(run_dir)
+        self.run_id = run_id
+        self.writer = BufferedNDJSONAppender(
+            self.run_dir / LEDGER_FILENAME, max_buffer, flush_interval
+        )
+        if export_at_exit:
+            _EXIT_LEDGERS.add(self)
+
+    @property
+    def path(self) -> Path:
+        return self.writer.filepath
+
+    def record(
+        self,
+        entry: dict[str, Any],
+        article_id: str | None = None,
+        artifacts: dict[str, Any] | None = None,
+    ) -> None:
+        """Append one call's telemetry; artifacts go to the article ledger only."""
+        if article_id and artifacts:
+            entry = {**entry, "artifacts": artifacts}
+        self.writer.append(entry)
+
+    def flush(self) -> None:
+        self.writer.flush()
+
+    def entries(self) -> list[dict[str, Any]]:
+        """All entries recorded so far (flushes first)."""
+        self.flush()
+        return list(iter_ledger(self.path))
+
+    def export(self) -> Path | None:
+        """Flush and write model_usage.json plus per-article ledgers."""
+        self.flush()
+        return export_run_ledger(self.run_dir, self.run_id)
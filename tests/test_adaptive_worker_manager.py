@@ -0,0 +1,209 @@
+"""Tests for the AIMD concurrency controller."""
+
+import threading
+import time
+
+import httpx
+from openai import APITimeoutError, RateLimitError
+
+from src.models import PipelineConfig
+from src.utils.adaptive_worker_manager import (
+    AdaptiveWorkerManager,
+    build_worker_manager,
+    observe_api_call,
+    observe_http_request,
+    observe_http_response,
+)
+
+REQUEST = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+
+def rate_limit_error() -> RateLimitError:
+    return RateLimitError(
+        "Rate limit reached",
+        response=httpx.Response(429, request=REQUEST),
+        body=None,
+    )
+
+
+def saturate(manager: AdaptiveWorkerManager) -> None:
+    """Fill every slot of the current limit so growth is allowed."""
+    manager.metrics.record_in_flight(manager.get_current_worker_count())
+
+
+class TestAIMDAdjustment:
+    """Test additive increase and multiplicative decrease."""
+
+    def test_healthy_saturated_limit_grows_by_one(self):
+        manager = AdaptiveWorkerManager(4, max_workers=8, adjustment_interval=0)
+        saturate(manager)
+        manager.record_call(0.2)
+
+        assert manager.adjust_if_needed()
+        assert manager.get_current_worker_count() == 5
+        assert "additive_increase" in manager.metrics.adjustment_history[-1][2]
+
+    def test_growth_stops_at_max_workers(self):
+        manager = AdaptiveWorkerManager(8, max_workers=8, adjustment_interval=0)
+        saturate(manager)
+        manager.record_call(0.2)
+
+        assert not manager.adjust_if_needed()
+        assert manager.get_current_worker_count() == 8
+
+    def test_rate_limit_halves_the_limit(self):
+        manager = AdaptiveWorkerManager(8, max_workers=16, adjustment_interval=0)
+        manager.record_call(0.2)
+        manager.record_call(0.1, rate_limit_error())
+
+        assert manager.adjust_if_needed()
+        assert manager.get_current_worker_count() == 4
+        assert manager.metrics.rate_limit_errors == 1
+
+    def test_timeout_backs_off_but_not_below_min(self):
+        manager = AdaptiveWorkerManager(
+            2, min_workers=2, max_workers=16, adjustment_interval=0
+        )
+        manager.record_call(30.0, APITimeoutError(request=REQUEST))
+
+        manager.adjust_if_needed()
+        assert manager.get_current_worker_count() == 2
+        assert manager.metrics.timeout_errors == 1
+
+    def test_unused_limit_is_not_raised(self):
+        manager = AdaptiveWorkerManager(4, max_workers=8, adjustment_interval=0)
+        manager.metrics.record_in_flight(2)
+        manager.record_call(0.2)
+
+        assert not manager.adjust_if_needed()
+        assert manager.get_current_worker_count() == 4
+
+    def test_latency_degradation_holds_the_limit(self):
+        manager = AdaptiveWorkerManager(4, max_workers=8, adjustment_interval=0)
+        saturate(manager)
+        manager.record_call(0.2)
+        manager.adjust_if_needed()
+
+        saturate(manager)
+        manager.record_call(1.0)
+        assert not manager.adjust_if_needed()
+        assert manager.get_current_worker_count() == 5
+
+    def test_interval_gates_adjustments(self):
+        manager = AdaptiveWorkerManager(4, max_workers=8, adjustment_interval=60)
+        saturate(manager)
+        manager.record_call(0.2)
+
+        assert not manager.adjust_if_needed()
+
+
+class TestObservation:
+    """Test how API calls reach managers."""
+
+    def test_only_tracking_managers_observe_calls(self):
+        tracked = AdaptiveWorkerManager(4)
+        idle = AdaptiveWorkerManager(4)
+
+        with tracked.tracking():
+            observe_api_call(0.1)
+        observe_api_call(0.1)
+
+        assert tracked.metrics.completed_items == 1
+        assert idle.metrics.completed_items == 0
+
+    def test_concurrent_managers_only_see_their_own_calls(self):
+        enrichment = AdaptiveWorkerManager(4)
+        generation = AdaptiveWorkerManager(4)
+        both_tracking = threading.Barrier(2, timeout=5)
+
+        def run(manager: AdaptiveWorkerManager, calls: int) -> None:
+            with manager.tracking():
+                both_tracking.wait()
+                for _ in range(calls):
+                    observe_api_call(0.1)
+
+        threads = [
+            threading.Thread(target=run, args=(enrichment, 3)),
+            threading.Thread(target=run, args=(generation, 5)),
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert enrichment.metrics.completed_items == 3
+        assert generation.metrics.completed_items == 5
+
+    def test_retry_after_unanswered_attempt_counts_as_timeout(self):
+        manager = AdaptiveWorkerManager(4)
+
+        def attempt(retries_taken: int) -> httpx.Request:
+            return httpx.Request(
+                "POST",
+                REQUEST.url,
+                headers={"x-stainless-retry-count": str(retries_taken)},
+            )
+
+        with manager.tracking():
+            observe_http_request(attempt(0))  # Times out: no response
+            observe_http_request(attempt(1))
+            observe_http_response(httpx.Response(500, request=attempt(1)))
+            observe_http_request(attempt(2))  # Previous attempt was answered
+            observe_http_response(httpx.Response(200, request=attempt(2)))
+
+        assert manager.metrics.timeout_errors == 1
+        assert manager.metrics.rate_limit_errors == 0
+
+
+class TestSlots:
+    """Test that slots enforce the current limit."""
+
+    def test_slot_caps_threads_in_flight(self):
+        manager = AdaptiveWorkerManager(2, max_workers=2, adjustment_interval=60)
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def work():
+            nonlocal in_flight, peak
+            with manager.slot():
+                with lock:
+                    in_flight += 1
+                    peak = max(peak, in_flight)
+                time.sleep(0.02)
+                with lock:
+                    in_flight -= 1
+
+        threads = [threading.Thread(target=work) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert peak == 2
+
+
+class TestBuildWorkerManager:
+    """Test stage managers built from config."""
+
+    def test_adaptive_manager_can_grow_to_max(self):
+        manager = build_worker_manager(
+            "generation",
+            4,
+            8,
+            PipelineConfig(openai_api_key="test", adaptive_adjustment_interval=5.0),
+        )
+
+        assert manager.get_current_worker_count() == 4
+        assert manager.max_workers == 8
+        assert manager.adjustment_interval == 5.0
+
+    def test_disabled_adaptivity_fixes_the_limit(self):
+        manager = build_worker_manager(
+            "generation",
+            4,
+            8,
+            PipelineConfig(openai_api_key="test", adaptive_concurrency=False),
+        )
+
+        assert manager.min_workers == manager.max_workers == 4
@@ -0,0 +1,151 @@
+"""Tests for the persistent article metadata index."""
+
+from __future__ import annotations
+
+import os
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+from src.pipeline.deduplication import (
+    check_article_exists_for_source,
+    find_article_by_slug,
+    is_source_in_cooldown,
+    load_article_metadata_for_dedup,
+)
+from src.utils.article_index import ArticleIndex, get_article_index
+
+
+def _write_post(path: Path, frontmatter_yaml: str, body: str = "Body.") -> None:
+    path.write_text(f"---\n{frontmatter_yaml}\n---\n{body}\n", encoding="utf-8")
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+
+def test_index_maps_sources_and_slugs(tmp_path: Path) -> None:
+    _write_post(
+        tmp_path / "2025-01-02-docker-tips.md",
+        """title: Docker Tips
+date: 2025-01-02
+tags: [docker]
+summary: Tips
+cover:
+  image: /images/docker.png
+sources:
+  - url: https://example.com/a?utm_source=x
+source:
+  url: https://example.com/legacy""",
+    )
+
+    index = ArticleIndex(tmp_path)
+
+    assert [r.filename for r in index.find_by_source("https://example.com/a")] == [
+        "2025-01-02-docker-tips.md"
+    ]
+    assert index.find_by_source("https://example.com/legacy")
+    record = index.find_by_slug("docker-tips")
+    assert record is not None
+    assert record.cover_image == "/images/docker.png"
+    assert record.published_datetime == datetime(2025, 1, 2, tzinfo=UTC)
+    assert index.find_by_slug("tips") is None
+
+
+def test_refresh_only_reparses_changed_files(tmp_path: Path) -> None:
+    post = tmp_path / "2025-01-02-post.md"
+    _write_post(post, "title: Before")
+    _write_post(tmp_path / "2025-01-03-other.md", "title: Other")
+    index = ArticleIndex(tmp_path)
+
+    assert index.refresh() == 0
+
+    _write_post(post, "title: After, with a longer title")
+    _bump_mtime(post)
+    assert index.refresh() == 1
+    assert index.find_by_slug("post").title == "After, with a longer title"
+
+    (tmp_path / "2025-01-03-other.md").unlink()
+    assert index.refresh() == 1
+    assert index.find_by_slug("other") is None
+
+
+def test_index_persists_and_reloads(tmp_path: Path) -> None:
+    content_dir = tmp_path / "posts"
+    content_dir.mkdir()
+    index_file = tmp_path / "article_index.json"
+    _write_post(content_dir / "2025-01-02-post.md", "title: Persisted")
+
+    ArticleIndex(content_dir, index_file=index_file)
+    assert index_file.exists()
+
+    reloaded = ArticleIndex(content_dir, index_file=index_file)
+    assert reloaded.find_by_slug("post").title == "Persisted"
+
+
+def test_update_indexes_new_file(tmp_path: Path) -> None:
+    index = get_article_index(tmp_path)
+    assert index.records() == []
+
+    new_post = tmp_path / "2025-01-04-fresh.md"
+    _write_post(new_post, "title: Fresh\nsources:\n  - url: https://example.com/new")
+    index.update(new_post)
+
+    assert check_article_exists_for_source("https://example.com/new", tmp_path) == (
+        new_post
+    )
+    assert find_article_by_slug("fresh", tmp_path) == new_post
+
+
+def test_dedup_helpers_use_index(tmp_path: Path) -> None:
+    recent = (datetime.now(UTC) - timedelta(days=2)).strftime("%Y-%m-%d")
+    _write_post(
+        tmp_path / f"{recent}-recent.md",
+        f"""title: Recent
+date: {recent}
+sources:
+  - url: https://github.com/user/repo
+source:
+  url: https://github.com/user/legacy""",
+        body="x" * 600,
+    )
+
+    assert is_source_in_cooldown("https://github.com/user/repo", tmp_path, 7)
+    # Legacy 'source' entries identify existing articles but don't trigger cooldown
+    assert check_article_exists_for_source("https://github.com/user/legacy", tmp_path)
+    assert not is_source_in_cooldown("https://github.com/user/legacy", tmp_path, 7)
+
+    articles = load_article_metadata_for_dedup(tmp_path)
+    assert len(articles) == 1
+    assert len(articles[0]["content"]) == 500
+
+
+def test_malformed_frontmatter_is_skipped(tmp_path: Path) -> None:
+    broken = tmp_path / "2025-01-02-broken.md"
+    _write_post(broken, "title: [unclosed\ntags: {")
+    _write_post(tmp_path / "2025-01-03-good.md", "title: Good")
+
+    index = get_article_index(tmp_path)
+
+    assert [r.filename for r in index.records()] == ["2025-01-03-good.md"]
+    assert index.refresh() == 0
+    assert index.update(broken) is None
+    assert find_article_by_slug("good", tmp_path) == tmp_path / "2025-01-03-good.md"
+
+    _write_post(broken, "title: Fixed")
+    _bump_mtime(broken)
+    assert index.refresh() == 1
+    assert index.find_by_slug("broken").title == "Fixed"
+
+
+def test_in_place_edits_are_picked_up(tmp_path: Path, monkeypatch) -> None:
+    post = tmp_path / "2025-01-02-post.md"
+    _write_post(post, "title: Before")
+    index = get_article_index(tmp_path)
+
+    _write_post(post, "title: After, edited in place")
+    _bump_mtime(post)
+    monkeypatch.setattr("src.utils.article_index._RESTAT_INTERVAL_NS", 0)
+
+    assert get_article_index(tmp_path) is index
+    assert index.find_by_slug("post").title == "After, edited in place"
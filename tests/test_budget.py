@@ -0,0 +1,178 @@
+"""Tests for the reservation-based cost budget."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.models import PipelineConfig
+from src.utils import openai_wrapper
+from src.utils.budget import (
+    BudgetExceededError,
+    CostBudget,
+    estimate_chat_cost,
+    estimate_prompt_tokens,
+)
+from src.utils.telemetry_ledger import TelemetryLedger
+
+
+class TestCostBudget:
+    """Test reserve/settle/release accounting."""
+
+    def test_refuses_calls_that_cannot_fit(self):
+        budget = CostBudget()
+        budget.settle(budget.reserve(0.8, run_cap=1.0), 0.8)
+
+        with pytest.raises(BudgetExceededError) as excinfo:
+            budget.reserve(0.3, run_cap=1.0)
+        assert excinfo.value.scope == "run"
+        assert budget.reserved == 0.0
+
+    def test_article_cap_is_tracked_per_article(self):
+        budget = CostBudget()
+        budget.settle(budget.reserve(0.5, article_id="a", article_cap=0.6), 0.5)
+
+        with pytest.raises(BudgetExceededError) as excinfo:
+            budget.reserve(0.2, article_id="a", article_cap=0.6)
+        assert excinfo.value.scope == "article"
+        budget.reserve(0.2, article_id="b", article_cap=0.6)
+
+    def test_waits_for_in_flight_calls_to_settle(self):
+        """A call blocked only by another reservation runs once it settles low."""
+        budget = CostBudget()
+        in_flight = budget.reserve(0.9, run_cap=1.0)
+
+        def settle_cheaply():
+            time.sleep(0.05)
+            budget.settle(in_flight, 0.1)
+
+        threading.Thread(target=settle_cheaply).start()
+        reservation = budget.reserve(0.5, run_cap=1.0, timeout=5)
+
+        assert reservation.amount == 0.5
+        assert budget.spent == pytest.approx(0.1)
+
+    def test_wait_times_out_while_calls_stay_in_flight(self):
+        budget = CostBudget()
+        budget.reserve(0.9, run_cap=1.0)
+
+        with pytest.raises(BudgetExceededError):
+            budget.reserve(0.5, run_cap=1.0, timeout=0.01)
+
+    def test_release_frees_the_reservation(self):
+        budget = CostBudget()
+        budget.release(budget.reserve(0.9, run_cap=1.0))
+        budget.reserve(0.9, run_cap=1.0)
+
+    def test_parallel_workers_cannot_overshoot_the_cap(self):
+        """Eight workers racing for a budget of three calls admit exactly three."""
+        budget = CostBudget()
+        admitted = []
+        start = threading.Barrier(8)
+
+        def worker():
+            start.wait()
+            try:
+                reservation = budget.reserve(1.0, run_cap=3.0)
+            except BudgetExceededError:
+                return
+            admitted.append(reservation)
+            time.sleep(0.01)
+            budget.settle(reservation, 1.0)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(admitted) == 3
+        assert budget.spent == pytest.approx(3.0)
+
+
+class TestEstimates:
+    """Test pre-call cost estimates."""
+
+    def test_prompt_tokens_scale_with_text(self):
+        short = estimate_prompt_tokens([{"role": "user", "content": "x" * 40}])
+        long = estimate_prompt_tokens([{"role": "user", "content": "x" * 4000}])
+        assert long - short == (4000 - 40) // 4
+
+    def test_max_tokens_bounds_the_completion_estimate(self):
+        messages = [{"role": "user", "content": "Score this"}]
+        assert estimate_chat_cost("gpt-4o-mini", messages, 100) < estimate_chat_cost(
+            "gpt-4o-mini", messages, 10000
+        )
+
+
+class TestChatCompletionBudget:
+    """Test cap enforcement through chat_completion()."""
+
+    def test_call_is_refused_before_reaching_the_api(self, monkeypatch, tmp_path):
+        api = Mock()
+        monkeypatch.setattr(openai_wrapper, "create_chat_completion", api)
+        monkeypatch.setattr(openai_wrapper, "_BUDGET", CostBudget())
+        monkeypatch.setattr(
+            openai_wrapper,
+            "_LEDGER",
+            TelemetryLedger(tmp_path, "test", export_at_exit=False),
+        )
+        config = PipelineConfig(openai_api_key="test", max_cost_per_run=0.0001)
+
+        with pytest.raises(BudgetExceededError):
+            openai_wrapper.chat_completion(
+                client=Mock(),
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": "x" * 4000}],
+                stage="content",
+                config=config,
+                max_tokens=4000,
+            )
+        api.assert_not_called()
+
+    def test_cancelled_async_call_releases_its_reservation(self, monkeypatch, tmp_path):
+        """A reservation finished by the worker thread after cancellation is freed."""
+        budget = CostBudget()
+        released = []
+        release = budget.release
+        monkeypatch.setattr(
+            budget, "release", lambda r: (released.append(r), release(r))
+        )
+        api = AsyncMock()
+        monkeypatch.setattr(openai_wrapper, "create_chat_completion_async", api)
+        monkeypatch.setattr(openai_wrapper, "_BUDGET", budget)
+        monkeypatch.setattr(
+            openai_wrapper,
+            "_LEDGER",
+            TelemetryLedger(tmp_path, "test", export_at_exit=False),
+        )
+        config = PipelineConfig(
+            openai_api_key="test", max_cost_per_run=1.0, budget_wait_seconds=5
+        )
+        in_flight = budget.reserve(1.0, run_cap=1.0)
+
+        async def cancel_while_waiting():
+            task = asyncio.create_task(
+                openai_wrapper.chat_completion_async(
+                    client=Mock(),
+                    model="gpt-4o-mini",
+                    messages=[{"role": "user", "content": "hi"}],
+                    stage="content",
+                    config=config,
+                    max_tokens=100,
+                )
+            )
+            await asyncio.sleep(0.05)  # Reservation is waiting in a worker thread
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            # Make room: the worker thread now completes its reservation
+            budget.settle(in_flight, 0.0)
+
+        asyncio.run(cancel_while_waiting())  # Waits for the worker thread
+
+        assert len(released) == 1
+        assert budget.reserved == 0.0
+        api.assert_not_called()
@@ -9,11 +9,15 @@ Tests cover:
 - Integration with article generation
 """
 
+import json
 import tempfile
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from src.citations import (
     Citation,
     CitationExtractor,
@@ -232,7 +236,7 @@ class TestCitationResolver:
 
     @patch("src.citations.resolver.httpx.Client")
     def test_resolve_no_results_fallback(self, mock_client_class: MagicMock) -> None:
-        """Should try arXiv when CrossRef has no results."""
+        """Should answer from arXiv when CrossRef has no results."""
         # Mock CrossRef with no results
         mock_response_cf = MagicMock()
         mock_response_cf.json.return_value = {"message": {"items": []}}
@@ -242,13 +246,12 @@ class TestCitationResolver:
         mock_response_ax.text = "entry><id>http://arxiv.org/abs/2401.12345</id>"
 
         mock_client = MagicMock()
-        # Need 4 responses: CrossRef (full), CrossRef (first author), arXiv (full), arXiv (first author)
-        mock_client.get.side_effect = [
-            mock_response_cf,  # CrossRef full query
-            mock_response_cf,  # CrossRef first author
-            mock_response_ax,  # arXiv full query
-            mock_response_ax,  # arXiv first author
-        ]
+        # CrossRef and arXiv are queried in parallel: answer by endpoint
+        mock_client.get.side_effect = lambda url, **kwargs: (
+            mock_response_cf
+            if url == CitationResolver.CROSSREF_URL
+            else mock_response_ax
+        )
         mock_client_class.return_value = mock_client
 
         resolver = CitationResolver()
@@ -273,6 +276,68 @@ class TestCitationResolver:
         assert result.url is None
         assert result.confidence == 0.0
 
+    @patch("src.citations.resolver.httpx.Client")
+    def test_first_confident_answer_does_not_wait_for_slower_service(
+        self, mock_client_class: MagicMock
+    ) -> None:
+        """A fast arXiv answer is returned while CrossRef is still running."""
+        release_crossref = threading.Event()
+        mock_response_ax = MagicMock()
+        mock_response_ax.text = "entry><id>http://arxiv.org/abs/2401.12345</id>"
+
+        def get(url, **kwargs):
+            if url == CitationResolver.CROSSREF_URL:
+                release_crossref.wait(timeout=5)
+                raise RuntimeError("CrossRef unavailable")
+            return mock_response_ax
+
+        mock_client = MagicMock()
+        mock_client.get.side_effect = get
+        mock_client_class.return_value = mock_client
+
+        resolver = CitationResolver()
+        result = resolver.resolve("Smith et al.", 2024)
+
+        assert result.arxiv_id == "2401.12345"
+        release_crossref.set()
+        resolver.close()
+
+    @patch("src.citations.resolver.httpx.Client")
+    def test_resolve_many_keeps_order(self, mock_client_class: MagicMock) -> None:
+        """Concurrent resolution returns one result per citation, in order."""
+
+        def get(url, params=None, **kwargs):
+            if url != CitationResolver.CROSSREF_URL:
+                raise RuntimeError("arXiv unavailable")
+            author = params["query"].split()[0]
+            response = MagicMock()
+            response.json.return_value = {
+                "message": {
+                    "items": [
+                        {
+                            "DOI": f"10.1234/{author.lower()}",
+                            "published": {"date-parts": [[2024]]},
+                        }
+                    ]
+                }
+            }
+            return response
+
+        mock_client = MagicMock()
+        mock_client.get.side_effect = get
+        mock_client_class.return_value = mock_client
+
+        with CitationResolver() as resolver:
+            results = resolver.resolve_many(
+                [("Smith", 2024), ("Jones", 2024), ("Brown", 2024)]
+            )
+
+        assert [r.doi for r in results] == [
+            "10.1234/smith",
+            "10.1234/jones",
+            "10.1234/brown",
+        ]
+
 
 class TestCitationFormatter:
     """Test citation formatting to markdown links."""
@@ -530,6 +595,16 @@ class TestCitationFormatter:
         assert len(bibliography) == 1
 
 
+def age_entry(cache: CitationCache, key: str, days: int) -> None:
+    """Backdate a cache entry by ``days``."""
+    conn = cache._connect()
+    conn.execute(
+        "UPDATE citations SET resolved_at = resolved_at - ? WHERE key = ?",
+        (days * 86400, key),
+    )
+    conn.commit()
+
+
 class TestCitationCache:
     """Test citation cache with TTL."""
 
@@ -538,7 +613,7 @@ class TestCitationCache:
         with tempfile.TemporaryDirectory() as tmpdir:
             cache_file = str(Path(tmpdir) / "cache.json")
             cache = CitationCache(cache_file=cache_file)
-            assert cache.data == {}
+            assert len(cache) == 0
 
     def test_cache_put_and_get(self) -> None:
         """Cache should store and retrieve citations."""
@@ -576,20 +651,14 @@ class TestCitationCache:
             cache_file = str(Path(tmpdir) / "cache.json")
             cache = CitationCache(cache_file=cache_file)
 
-            # Manually insert expired entry
-            old_time = (datetime.now() - timedelta(days=31)).isoformat()
-            cache.data["Smith_2024"] = {
-                "authors": "Smith",
-                "year": 2024,
-                "doi": "10.1234/x",
-                "url": "https://doi.org/10.1234/x",
-                "timestamp": old_time,
-            }
+            # Insert an entry, then age it past the TTL
+            cache.put("Smith", 2024, "10.1234/x", "https://doi.org/10.1234/x")
+            age_entry(cache, "Smith_2024", days=31)
 
             # Try to get - should be None and removed
             result = cache.get("Smith", 2024)
             assert result is None
-            assert "Smith_2024" not in cache.data
+            assert len(cache) == 0
 
     def test_cache_clear(self) -> None:
         """Cache.clear() should remove all entries."""
@@ -598,12 +667,127 @@ class TestCitationCache:
             cache = CitationCache(cache_file=cache_file)
 
             cache.put("Smith", 2024, "10.1234/x", "https://doi.org/10.1234/x")
-            assert len(cache.data) > 0
+            assert len(cache) > 0
 
             cache.clear()
-            assert len(cache.data) == 0
+            assert len(cache) == 0
             assert not Path(cache_file).exists()
 
+    def test_deferred_writes_are_flushed_once(self) -> None:
+        """With autosave off, puts are written by a single flush()."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_file = str(Path(tmpdir) / "cache.json")
+            cache = CitationCache(cache_file=cache_file, autosave=False)
+
+            cache.put("Smith", 2024, "10.1234/a", "https://doi.org/10.1234/a")
+            cache.put("Jones", 2023, None, None)
+            assert CitationCache(cache_file=cache_file).get("Smith", 2024) is None
+
+            cache.flush()
+
+            reloaded = CitationCache(cache_file=cache_file)
+            assert reloaded.get("Smith", 2024) is not None
+            assert reloaded.get("Jones", 2023) is not None
+
+    def test_context_manager_closes_on_error(self) -> None:
+        """Leaving a with-block commits pending puts and closes the cache."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_file = str(Path(tmpdir) / "cache.json")
+
+            with pytest.raises(RuntimeError):
+                with CitationCache(cache_file=cache_file, autosave=False) as cache:
+                    cache.put("Smith", 2024, "10.1234/a", "https://doi.org/10.1234/a")
+                    raise RuntimeError("lookup failed")
+
+            assert cache._conn is None
+            assert CitationCache(cache_file=cache_file).get("Smith", 2024) is not None
+
+    def test_resolution_details_are_cached(self) -> None:
+        """Confidence and arXiv id survive the cache round trip."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = CitationCache(cache_file=str(Path(tmpdir) / "cache.json"))
+            cache.put(
+                "Smith",
+                2024,
+                None,
+                "https://arxiv.org/abs/2401.12345",
+                arxiv_id="2401.12345",
+                confidence=0.9,
+            )
+
+            entry = cache.get("Smith", 2024)
+            assert entry is not None
+            assert entry["arxiv_id"] == "2401.12345"
+            assert entry["confidence"] == 0.9
+
+    def test_negative_entries_expire_sooner(self) -> None:
+        """Unresolved citations are cached, but retried after NEGATIVE_TTL_DAYS."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = CitationCache(cache_file=str(Path(tmpdir) / "cache.json"))
+            cache.put("Smith", 2024, None, None)
+            cache.put("Jones", 2024, "10.1234/x", "https://doi.org/10.1234/x")
+            assert cache.get("Smith", 2024) is not None
+
+            age_entry(cache, "Smith_2024", days=10)
+            age_entry(cache, "Jones_2024", days=10)
+
+            assert cache.get("Smith", 2024) is None
+            assert cache.get("Jones", 2024) is not None
+
+    def test_vacuum_removes_expired_entries(self) -> None:
+        """vacuum() drops expired entries and keeps fresh ones."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = CitationCache(cache_file=str(Path(tmpdir) / "cache.json"))
+            cache.put("Smith", 2024, "10.1234/a", "https://doi.org/10.1234/a")
+            cache.put("Jones", 2024, "10.1234/b", "https://doi.org/10.1234/b")
+            cache.put("Brown", 2024, None, None)
+            age_entry(cache, "Smith_2024", days=31)
+            age_entry(cache, "Brown_2024", days=8)
+
+            assert cache.vacuum() == 2
+            assert len(cache) == 1
+            assert cache.get("Jones", 2024) is not None
+
+    def test_legacy_json_cache_is_migrated(self) -> None:
+        """Entries of the old JSON cache are imported into the database."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_path = Path(tmpdir) / "cache.json"
+            fresh = datetime.now().isoformat()
+            expired = (datetime.now() - timedelta(days=31)).isoformat()
+            cache_path.write_text(
+                json.dumps(
+                    {
+                        "Smith_2024": {
+                            "authors": "Smith",
+                            "year": 2024,
+                            "doi": "10.1234/x",
+                            "url": "https://doi.org/10.1234/x",
+                            "timestamp": fresh,
+                        },
+                        "Jones_2020": {
+                            "authors": "Jones",
+                            "year": 2020,
+                            "doi": "10.1234/y",
+                            "url": "https://doi.org/10.1234/y",
+                            "timestamp": expired,
+                        },
+                    }
+                ),
+                encoding="utf-8",
+            )
+
+            cache = CitationCache(cache_file=str(cache_path))
+            entry = cache.get("Smith", 2024)
+            assert entry is not None
+            assert entry["doi"] == "10.1234/x"
+            assert cache.get("Jones", 2020) is None
+
+            # Unchanged JSON is not imported again
+            cache.put("Smith", 2024, "10.1234/z", "https://doi.org/10.1234/z")
+            entry = CitationCache(cache_file=str(cache_path)).get("Smith", 2024)
+            assert entry is not None
+            assert entry["doi"] == "10.1234/z"
+
     def test_cache_key_format(self) -> None:
         """Cache key should combine author and year."""
         key = CitationCache._make_key("Smith et al.", 2024)
@@ -616,7 +800,7 @@ class TestCitationCache:
             cache_path.write_text("{not: valid json", encoding="utf-8")
 
             cache = CitationCache(cache_file=str(cache_path))
-            assert cache.data == {}
+            assert len(cache) == 0
 
             preserved = list(Path(tmpdir).glob("cache.json.corrupt-*"))
             assert len(preserved) == 1
@@ -691,7 +875,9 @@ class TestIntegration:
             # First resolution should call API
             resolver = CitationResolver()
             result1 = resolver.resolve("Smith", 2024)
-            assert mock_client.get.call_count == 1
+            resolver.close()  # Let the parallel arXiv lookup settle
+            api_calls = mock_client.get.call_count
+            assert api_calls >= 1
 
             # Cache the result
             cache.put("Smith", 2024, result1.doi, result1.url)
@@ -699,4 +885,4 @@ class TestIntegration:
             # Second resolution should use cache (no API call)
             cached = cache.get("Smith", 2024)
             assert cached is not None
-            assert mock_client.get.call_count == 1  # Still 1, not called again
+            assert mock_client.get.call_count == api_calls  # Not called again
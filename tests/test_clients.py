@@ -0,0 +1,200 @@
+"""Tests for the shared, pooled OpenAI client registry."""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from openai import RateLimitError
+
+from src.models import PipelineConfig, RetryConfig
+from src.utils.adaptive_worker_manager import AdaptiveWorkerManager, observe_api_call
+from src.utils.clients import (
+    OpenAIClientRegistry,
+    get_openai_client,
+    get_shared_openai_client,
+)
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """Minimal chat completions endpoint that keeps connections open."""
+
+    protocol_version = "HTTP/1.1"
+    rate_limited = 0  # Answer this many requests with 429 first
+
+    def do_POST(self):  # noqa: N802
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if _KeepAliveHandler.rate_limited > 0:
+            _KeepAliveHandler.rate_limited -= 1
+            error = b'{"error": {"message": "Rate limit reached"}}'
+            self.send_response(429)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Retry-After-Ms", "1")
+            self.send_header("Content-Length", str(len(error)))
+            self.end_headers()
+            self.wfile.write(error)
+            return
+        payload = json.dumps(
+            {
+                "id": "chatcmpl-test",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "ok"},
+                        "finish_reason": "stop",
+                    }
+                ],
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *_args):
+        return None
+
+
+@pytest.fixture
+def fake_openai(monkeypatch):
+    _KeepAliveHandler.rate_limited = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv(
+        "OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}/v1"
+    )
+    yield
+    server.shutdown()
+    server.server_close()
+
+
+def make_config(max_attempts: int = 1, **overrides) -> PipelineConfig:
+    return PipelineConfig(
+        openai_api_key="test",
+        retries=RetryConfig(
+            max_attempts=max_attempts,
+            backoff_multiplier=1.0,
+            backoff_min=0.01,
+            backoff_max=0.01,
+            jitter=0.0,
+        ),
+        **overrides,
+    )
+
+
+def ask(client) -> str:
+    response = client.chat.completions.create(
+        model="gpt-4o-mini", messages=[{"role": "user", "content": "hi"}]
+    )
+    return response.choices[0].message.content
+
+
+class TestOpenAIClientRegistry:
+    """Test client sharing, connection reuse and shutdown."""
+
+    def test_same_config_shares_one_client(self):
+        registry = OpenAIClientRegistry()
+        config = make_config()
+
+        first = registry.get(config)
+        assert registry.get(config) is first
+        assert registry.get(config, api_key="other") is not first
+        registry.close()
+
+    def test_missing_api_key_is_rejected(self):
+        with pytest.raises(ValueError):
+            OpenAIClientRegistry().get(PipelineConfig(openai_api_key=""))
+
+    def test_sequential_calls_reuse_one_connection(self, fake_openai):
+        registry = OpenAIClientRegistry()
+        client = registry.get(make_config())
+
+        for _ in range(5):
+            assert ask(client) == "ok"
+
+        stats = registry.stats()
+        assert stats.requests == 5
+        assert stats.connections_opened == 1
+        assert stats.connections_reused == 4
+        registry.close()
+
+    def test_parallel_calls_stay_within_pool_limit(self, fake_openai):
+        registry = OpenAIClientRegistry()
+        client = registry.get(make_config(openai_max_connections=2))
+
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            results = list(pool.map(lambda _: ask(client), range(12)))
+
+        assert results == ["ok"] * 12
+        stats = registry.stats()
+        assert stats.requests == 12
+        assert stats.connections_opened <= 2
+        registry.close()
+
+    def test_close_discards_clients(self):
+        registry = OpenAIClientRegistry()
+        config = make_config()
+        first = registry.get(config)
+
+        registry.close()
+
+        assert first.is_closed()
+        assert registry.get(config) is not first
+        registry.close()
+
+
+class TestGetOpenAIClient:
+    """Test the context manager around the process-wide pool."""
+
+    def test_context_manager_yields_the_shared_client(self):
+        config = make_config()
+        with get_openai_client(config) as client:
+            pass
+
+        assert client is get_shared_openai_client(config)
+        assert not client.is_closed()
+
+
+class TestAdaptiveObservation:
+    """Test that the pooled client reports 429s to the AIMD controller."""
+
+    def test_retried_429s_reach_the_tracking_manager(self, fake_openai):
+        _KeepAliveHandler.rate_limited = 2
+        client = OpenAIClientRegistry().get(make_config(max_attempts=3))
+        manager = AdaptiveWorkerManager(4)
+
+        with manager.tracking():
+            assert ask(client) == "ok"  # The SDK retried both 429s
+
+        assert manager.metrics.rate_limit_errors == 2
+
+    def test_final_429_is_counted_once(self, fake_openai):
+        _KeepAliveHandler.rate_limited = 10
+        client = OpenAIClientRegistry().get(make_config(max_attempts=1))
+        manager = AdaptiveWorkerManager(4)
+
+        with manager.tracking():
+            with pytest.raises(RateLimitError) as excinfo:
+                ask(client)
+            observe_api_call(0.1, excinfo.value)  # As openai_wrapper reports it
+
+        assert manager.metrics.rate_limit_errors == 2  # First attempt + one retry
+        assert manager.metrics.total_errors == 0
+
+    def test_calls_outside_the_tracking_context_are_ignored(self, fake_openai):
+        _KeepAliveHandler.rate_limited = 1
+        client = OpenAIClientRegistry().get(make_config(max_attempts=1))
+        manager = AdaptiveWorkerManager(4)
+
+        with manager.tracking():
+            # A plain thread does not inherit the tracking context
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                assert executor.submit(ask, client).result() == "ok"
+
+        assert manager.metrics.rate_limit_errors == 0
@@ -0,0 +1,157 @@
+"""Tests for the shared async collection HTTP engine and async collectors."""
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import httpx
+from pydantic import HttpUrl
+
+from src.collectors.hackernews import collect_from_hackernews_async
+from src.collectors.http_engine import CollectionHTTPEngine, HostLimit
+from src.collectors.orchestrator import collect_all_sources_async
+from src.models import CollectedItem, SourceType
+
+FAST_LIMIT = HostLimit(concurrency=2, rate_per_minute=60000, burst=100)
+
+
+def make_item(item_id: str) -> CollectedItem:
+    return CollectedItem(
+        id=item_id,
+        source=SourceType.HACKERNEWS,
+        author="tester",
+        content="Test content",
+        title="Test",
+        url=HttpUrl(f"https://example.com/{item_id}"),
+        collected_at=datetime.now(UTC),
+    )
+
+
+class TestCollectionHTTPEngine:
+    """Test pooling and per-host limits."""
+
+    def test_per_host_concurrency_is_enforced(self):
+        """No more than the host's concurrency limit run at once."""
+        active = {"a.example": 0, "b.example": 0}
+        peak = {"a.example": 0, "b.example": 0}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            host = request.url.host
+            active[host] += 1
+            peak[host] = max(peak[host], active[host])
+            await asyncio.sleep(0.01)
+            active[host] -= 1
+            return httpx.Response(200, json={}, request=request)
+
+        async def run():
+            engine = CollectionHTTPEngine(
+                host_limits={"b.example": HostLimit(1, 60000, 100)},
+                default_limit=FAST_LIMIT,
+                transport=httpx.MockTransport(handler),
+            )
+            async with engine:
+                await asyncio.gather(
+                    *(engine.get(f"https://a.example/{i}") for i in range(6)),
+                    *(engine.get(f"https://b.example/{i}") for i in range(3)),
+                )
+
+        asyncio.run(run())
+
+        assert peak["a.example"] == 2
+        assert peak["b.example"] == 1
+
+    def test_get_requires_context_manager(self):
+        """Using the engine outside 'async with' fails clearly."""
+        engine = CollectionHTTPEngine(default_limit=FAST_LIMIT)
+
+        async def run():
+            await engine.get("https://example.com")
+
+        try:
+            asyncio.run(run())
+        except RuntimeError as e:
+            assert "async with" in str(e)
+        else:
+            raise AssertionError("expected RuntimeError")
+
+
+class TestHackerNewsAsync:
+    """Test concurrent HN collection."""
+
+    def test_collects_stories_in_topstories_order(self):
+        """Stories are fetched concurrently but keep ranking order."""
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            path = request.url.path
+            if path.endswith("topstories.json"):
+                return httpx.Response(200, json=[3, 1, 2, 4], request=request)
+            story_id = int(path.rsplit("/", 1)[-1].removesuffix(".json"))
+            if story_id == 4:
+                return httpx.Response(500, request=request)
+            # Later stories answer first to prove ordering isn't by arrival
+            await asyncio.sleep(0.01 * (4 - story_id))
+            story_type = "job" if story_id == 2 else "story"
+            return httpx.Response(
+                200,
+                json={"id": story_id, "type": story_type, "title": f"Story {story_id}"},
+                request=request,
+            )
+
+        async def run():
+            engine = CollectionHTTPEngine(
+                default_limit=FAST_LIMIT,
+                host_limits={},
+                transport=httpx.MockTransport(handler),
+            )
+            async with engine:
+                return await collect_from_hackernews_async(engine, limit=4)
+
+        items = asyncio.run(run())
+
+        # Job (2) is skipped, failing story (4) is dropped
+        assert [item.id for item in items] == ["hn_3", "hn_1"]
+        assert str(items[0].url) == "https://news.ycombinator.com/item?id=3"
+
+
+class TestCollectAllSourcesAsync:
+    """Test concurrent orchestration across sources."""
+
+    @patch("src.collectors.orchestrator.deduplicate_items", side_effect=lambda x: x)
+    @patch("src.collectors.orchestrator.collect_from_reddit")
+    @patch(
+        "src.collectors.orchestrator.collect_from_github_trending_async",
+        new_callable=AsyncMock,
+    )
+    @patch(
+        "src.collectors.orchestrator.collect_from_hackernews_async",
+        new_callable=AsyncMock,
+    )
+    @patch(
+        "src.collectors.orchestrator.collect_from_mastodon_instances_async",
+        new_callable=AsyncMock,
+    )
+    @patch("src.collectors.orchestrator.InstanceStatsStore")
+    def test_merges_sources_and_survives_failures(
+        self,
+        _mock_stats,
+        mock_mastodon,
+        mock_hn,
+        mock_github,
+        mock_reddit,
+        _mock_dedup,
+    ):
+        """Every source is collected; a failing source doesn't stop the rest."""
+        mock_mastodon.return_value = [make_item("m1")]
+        mock_hn.return_value = [make_item("h1")]
+        mock_github.side_effect = RuntimeError("GitHub down")
+        mock_reddit.return_value = [make_item("r1")]
+
+        async def run():
+            engine = CollectionHTTPEngine(default_limit=FAST_LIMIT)
+            async with engine:
+                return await collect_all_sources_async(engine)
+
+        result = asyncio.run(run())
+
+        assert [item.id for item in result] == ["m1", "r1", "h1"]
+        mock_github.assert_awaited_once()
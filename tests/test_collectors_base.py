@@ -181,6 +181,13 @@ class TestRelevanceFilter:
         content = "New cryptocurrency blockchain technology."
         assert is_relevant_content(content, title, config) is False
 
+    def test_negative_keywords_match_inside_words(self):
+        """Configured negative keywords also reject derived forms."""
+        config = PipelineConfig(openai_api_key="test-key")
+        for word in ("musician", "musical", "moviegoer", "jigsaws"):
+            content = f"A {word} tries a new Python framework."
+            assert is_relevant_content(content, "Weekend", config) is False, word
+
 
 # ============================================================================
 # Test HTML Cleaning
@@ -35,10 +35,10 @@ def make_item(
 
 
 class TestSaveCollectedItems:
-    """Test saving collected items to JSON files."""
+    """Test saving collected items to NDJSON files."""
 
-    def test_saves_to_json_file(self, tmp_path):
-        """Items are saved to timestamped JSON file."""
+    def test_saves_to_ndjson_file(self, tmp_path):
+        """Items are saved one per line to a timestamped NDJSON file."""
         items = [make_item(item_id=f"item-{i}") for i in range(3)]
 
         with patch("src.collectors.orchestrator.get_data_dir", return_value=tmp_path):
@@ -46,15 +46,14 @@ class TestSaveCollectedItems:
 
         # Verify file created
         assert filepath.exists()
-        assert filepath.name == "collected_20250101_120000.json"
+        assert filepath.name == "collected_20250101_120000.ndjson"
 
         # Verify content
         with open(filepath, encoding="utf-8") as f:
-            data = json.load(f)
+            lines = [json.loads(line) for line in f]
 
-        assert data["total_items"] == 3
-        assert len(data["items"]) == 3
-        assert data["items"][0]["id"] == "item-0"
+        assert len(lines) == 3
+        assert lines[0]["id"] == "item-0"
 
     def test_uses_current_timestamp_if_not_provided(self, tmp_path):
         """Default timestamp is current datetime."""
@@ -65,7 +64,7 @@ class TestSaveCollectedItems:
 
         # Verify filename starts with "collected_"
         assert filepath.name.startswith("collected_")
-        assert filepath.name.endswith(".json")
+        assert filepath.name.endswith(".ndjson")
 
     def test_saves_empty_list(self, tmp_path):
         """Empty item list can be saved."""
@@ -73,14 +72,11 @@ class TestSaveCollectedItems:
             filepath = save_collected_items([], timestamp="20250101_120000")
 
         # Verify file created with zero items
-        with open(filepath, encoding="utf-8") as f:
-            data = json.load(f)
-
-        assert data["total_items"] == 0
-        assert data["items"] == []
+        assert filepath.exists()
+        assert filepath.read_text(encoding="utf-8") == ""
 
     def test_handles_unicode_content(self, tmp_path):
-        """Unicode content is preserved in JSON."""
+        """Unicode content is preserved in NDJSON."""
         items = [make_item(content="Unicode: 日本語 🚀 émojis")]
 
         with patch("src.collectors.orchestrator.get_data_dir", return_value=tmp_path):
@@ -88,10 +84,19 @@ class TestSaveCollectedItems:
 
         # Verify unicode preserved
         with open(filepath, encoding="utf-8") as f:
-            data = json.load(f)
+            data = json.loads(f.readline())
+
+        assert "日本語" in data["content"]
+        assert "🚀" in data["content"]
+
+    def test_accepts_generator(self, tmp_path):
+        """Items are streamed from any iterable, not just lists."""
+        items = (make_item(item_id=f"item-{i}") for i in range(2))
+
+        with patch("src.collectors.orchestrator.get_data_dir", return_value=tmp_path):
+            filepath = save_collected_items(items, timestamp="20250101_120000")
 
-        assert "日本語" in data["items"][0]["content"]
-        assert "🚀" in data["items"][0]["content"]
+        assert len(filepath.read_text(encoding="utf-8").splitlines()) == 2
 
 
 class TestDeduplicateItems:
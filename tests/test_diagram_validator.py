@@ -6,6 +6,16 @@ import pytest
 from openai import OpenAI
 
 from src.illustrations.diagram_validator import DiagramValidator, ValidationResult
+from src.utils.telemetry_ledger import TelemetryLedger
+
+
+@pytest.fixture(autouse=True)
+def isolated_telemetry(monkeypatch, tmp_path):
+    """Keep call telemetry out of the real data directory."""
+    monkeypatch.setattr(
+        "src.utils.openai_wrapper._LEDGER",
+        TelemetryLedger(tmp_path, "test", export_at_exit=False),
+    )
 
 
 class TestDiagramValidator:
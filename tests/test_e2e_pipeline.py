@@ -10,6 +10,7 @@ These tests verify:
 
 import json
 from contextlib import ExitStack, nullcontext
+from functools import partial
 from pathlib import Path
 from types import SimpleNamespace
 from typing import cast
@@ -18,10 +19,20 @@ from unittest.mock import MagicMock, patch
 import pytest
 from pydantic import HttpUrl
 
+from src.generators.voices.selector import VoiceSelector
 from src.models import CollectedItem, EnrichedItem, PipelineConfig, SourceType
 from src.pipeline import generate_articles_from_enriched
 
 
+@pytest.fixture(autouse=True)
+def isolated_voice_history(monkeypatch, tmp_path):
+    """Keep voice history out of the real data directory."""
+    monkeypatch.setattr(
+        "src.generators.voices.selector.VoiceSelector",
+        partial(VoiceSelector, history_file=str(tmp_path / "voice_history.json")),
+    )
+
+
 @pytest.fixture
 def sample_data_dir():
     """Get path to data directory with test files."""
@@ -0,0 +1,235 @@
+"""Tests for the asyncio enrichment engine against a local fake OpenAI endpoint."""
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.enrichment.orchestrator import enrich_collected_items_async
+from src.models import CollectedItem, PipelineConfig, RetryConfig, SourceType
+from src.utils.telemetry_ledger import TelemetryLedger
+from tests.utils.types import http_url
+
+
+class _SlowOpenAIHandler(BaseHTTPRequestHandler):
+    """Answers enrichment prompts after a short delay, tracking concurrency."""
+
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+    operations: list[str] = []
+
+    def do_POST(self):  # noqa: N802
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt = body["messages"][0]["content"]
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        time.sleep(0.05)
+
+        if "POSTS (JSON list" in prompt:
+            operation = "batch"
+            posts = next(
+                line for line in prompt.splitlines() if line.strip().startswith("[")
+            )
+            content = json.dumps(
+                {
+                    "results": [
+                        {
+                            "id": post["id"],
+                            "score": 0.8,
+                            "explanation": "batched",
+                            "topics": ["python"],
+                        }
+                        for post in json.loads(posts)
+                    ]
+                }
+            )
+        elif "realistic quality score" in prompt:
+            operation = "quality"
+            content = json.dumps({"score": 0.6, "explanation": "single"})
+        elif "Extract the main technical topics" in prompt:
+            operation = "topics"
+            content = json.dumps(["rust"])
+        else:
+            operation = "research"
+            content = "Research notes"
+
+        payload = json.dumps(
+            {
+                "id": "chatcmpl-test",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 10,
+                    "completion_tokens": 5,
+                    "total_tokens": 15,
+                },
+            }
+        ).encode()
+        with cls.lock:
+            cls.in_flight -= 1
+            cls.operations.append(operation)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *_args):
+        return None
+
+
+class _RecordingAdapter:
+    """ScoringAdapter stand-in that records which feedback gets merged."""
+
+    merged: list[str] = []
+
+    def __init__(self, use_empty: bool = False):
+        self.feedback: list[str] = []
+
+    @staticmethod
+    def get_shared_patterns() -> dict:
+        return {}
+
+    def record_feedback(self, item, heuristic_score, ai_score, explanation):
+        self.feedback.append(item.id)
+
+    def get_feedback_data(self) -> dict:
+        return {"items": self.feedback} if self.feedback else {}
+
+    def merge_feedback(self, data: dict) -> None:
+        type(self).merged.extend(data["items"])
+
+    def update_learned_patterns(self) -> None:
+        pass
+
+    def save_feedback(self) -> None:
+        pass
+
+    def print_analysis_report(self) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_openai(monkeypatch, tmp_path):
+    """Serve a slow fake OpenAI API and route async enrichment to it."""
+    _SlowOpenAIHandler.in_flight = 0
+    _SlowOpenAIHandler.max_in_flight = 0
+    _SlowOpenAIHandler.operations = []
+    _RecordingAdapter.merged = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowOpenAIHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    def use_config(**overrides) -> PipelineConfig:
+        config = PipelineConfig(
+            openai_api_key="test",
+            retries=RetryConfig(
+                max_attempts=1,
+                backoff_multiplier=1.0,
+                backoff_min=0.01,
+                backoff_max=0.01,
+                jitter=0.0,
+            ),
+            **overrides,
+        )
+        monkeypatch.setattr("src.config.get_config", lambda: config)
+        monkeypatch.setattr("src.enrichment.orchestrator.get_config", lambda: config)
+        return config
+
+    monkeypatch.setenv(
+        "OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}/v1"
+    )
+    monkeypatch.setattr("src.enrichment.orchestrator.ScoringAdapter", _RecordingAdapter)
+    monkeypatch.setattr(
+        "src.enrichment.orchestrator.calculate_heuristic_score",
+        lambda item, adapter: (0.5, "ok"),
+    )
+    # Keep call telemetry out of the real data directory
+    monkeypatch.setattr(
+        "src.utils.openai_wrapper._LEDGER",
+        TelemetryLedger(tmp_path, "test", export_at_exit=False),
+    )
+    yield use_config
+    server.shutdown()
+    server.server_close()
+
+
+def make_items(count: int) -> list[CollectedItem]:
+    return [
+        CollectedItem(
+            id=f"item-{i}",
+            title=f"Post {i}",
+            content=f"Content of post {i} about Python asyncio",
+            source=SourceType.MASTODON,
+            url=http_url(f"https://example.com/{i}"),
+            author="a",
+            metadata={},
+        )
+        for i in range(count)
+    ]
+
+
+class TestAsyncEnrichmentEngine:
+    """Test semaphore-bounded concurrent enrichment."""
+
+    def test_items_are_enriched_concurrently_up_to_the_limit(self, fake_openai):
+        fake_openai(enrichment_concurrency=4)
+
+        results = asyncio.run(enrich_collected_items_async(make_items(12)))
+
+        assert {r.original.id for r in results} == {f"item-{i}" for i in range(12)}
+        assert all(r.ai_score == 0.6 and r.topics == ["rust"] for r in results)
+        assert all(r.research_summary == "Research notes" for r in results)
+        assert 1 < _SlowOpenAIHandler.max_in_flight <= 4
+
+    def test_task_local_feedback_is_merged_once_per_item(self, fake_openai):
+        fake_openai(enrichment_concurrency=8)
+
+        asyncio.run(enrich_collected_items_async(make_items(6)))
+
+        assert sorted(_RecordingAdapter.merged) == [f"item-{i}" for i in range(6)]
+
+    def test_max_workers_caps_concurrency(self, fake_openai):
+        fake_openai(enrichment_concurrency=8)
+
+        asyncio.run(enrich_collected_items_async(make_items(4), max_workers=1))
+
+        assert _SlowOpenAIHandler.max_in_flight == 1
+
+    def test_batches_share_one_scoring_call(self, fake_openai):
+        fake_openai(enrichment_concurrency=4, enrichment_batch_size=3)
+
+        results = asyncio.run(enrich_collected_items_async(make_items(6)))
+
+        assert len(results) == 6
+        assert all(r.ai_score == 0.8 for r in results)
+        assert _SlowOpenAIHandler.operations.count("batch") == 2
+        assert _SlowOpenAIHandler.operations.count("quality") == 0
+        assert sorted(_RecordingAdapter.merged) == [f"item-{i}" for i in range(6)]
+
+    def test_early_stop_skips_items_once_enough_are_ready(self, fake_openai):
+        fake_openai(
+            enrichment_concurrency=1,
+            articles_per_run=1,
+            enrichment_early_stop=True,
+            enrichment_ready_margin=1,
+        )
+
+        results = asyncio.run(enrich_collected_items_async(make_items(6)))
+
+        assert len(results) == 2
+        assert _SlowOpenAIHandler.operations.count("quality") == 2
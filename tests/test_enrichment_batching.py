@@ -0,0 +1,253 @@
+"""Tests for batched enrichment against a local fake OpenAI endpoint."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock, patch
+
+import pytest
+from openai import OpenAI
+
+from src.enrichment.ai_analyzer import analyze_items_batch
+from src.enrichment.orchestrator import enrich_collected_items, enrich_item_batch
+from src.models import (
+    CollectedItem,
+    EnrichedItem,
+    PipelineConfig,
+    RetryConfig,
+    SourceType,
+)
+from src.utils.telemetry_ledger import TelemetryLedger
+from tests.utils.types import http_url
+
+
+class _FakeOpenAIHandler(BaseHTTPRequestHandler):
+    """Answers chat completions the way the enrichment prompts expect.
+
+    ``batch_mode`` controls batch responses: "ok" answers every item,
+    "partial" drops the last item and "garbage" returns unparseable text.
+    """
+
+    batch_mode = "ok"
+    operations: list[str] = []
+    batch_ids: list[list[str]] = []
+
+    def do_POST(self):  # noqa: N802
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt = body["messages"][0]["content"]
+
+        if "POSTS (JSON list" in prompt:
+            self.operations.append("batch")
+            posts = next(
+                line for line in prompt.splitlines() if line.strip().startswith("[")
+            )
+            ids = [post["id"] for post in json.loads(posts)]
+            self.batch_ids.append(ids)
+            if self.batch_mode == "garbage":
+                content = "Sorry, here are your scores: 0.7, 0.4"
+            else:
+                if self.batch_mode == "partial":
+                    ids = ids[:-1]
+                content = json.dumps(
+                    {
+                        "results": [
+                            {
+                                "id": item_id,
+                                "score": 0.8,
+                                "explanation": f"batched {item_id}",
+                                "topics": ["Python", " async "],
+                            }
+                            for item_id in ids
+                        ]
+                    }
+                )
+        elif "realistic quality score" in prompt:
+            self.operations.append("quality")
+            content = json.dumps({"score": 0.6, "explanation": "single"})
+        elif "Extract the main technical topics" in prompt:
+            self.operations.append("topics")
+            content = json.dumps(["rust"])
+        else:
+            self.operations.append("research")
+            content = "Research notes"
+
+        payload = json.dumps(
+            {
+                "id": "chatcmpl-test",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": content},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 10,
+                    "completion_tokens": 5,
+                    "total_tokens": 15,
+                },
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *_args):
+        return None
+
+
+@pytest.fixture
+def fake_openai(monkeypatch, tmp_path):
+    """Serve a fake OpenAI API and route enrichment calls to it."""
+    _FakeOpenAIHandler.batch_mode = "ok"
+    _FakeOpenAIHandler.operations = []
+    _FakeOpenAIHandler.batch_ids = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeOpenAIHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    config = PipelineConfig(
+        openai_api_key="test",
+        retries=RetryConfig(
+            max_attempts=1,
+            backoff_multiplier=1.0,
+            backoff_min=0.01,
+            backoff_max=0.01,
+            jitter=0.0,
+        ),
+    )
+    monkeypatch.setenv("OPENAI_BASE_URL", base_url)
+    monkeypatch.setattr("src.config.get_config", lambda: config)
+    # Keep call telemetry out of the real data directory
+    monkeypatch.setattr(
+        "src.utils.openai_wrapper._LEDGER",
+        TelemetryLedger(tmp_path, "test", export_at_exit=False),
+    )
+    yield config, base_url
+    server.shutdown()
+    server.server_close()
+
+
+def make_item(item_id: str) -> CollectedItem:
+    return CollectedItem(
+        id=item_id,
+        title=f"Post {item_id}",
+        content=f"Content of post {item_id} about Python asyncio",
+        source=SourceType.MASTODON,
+        url=http_url(f"https://example.com/{item_id}"),
+        author="a",
+        metadata={},
+    )
+
+
+class TestAnalyzeItemsBatch:
+    """Test one-call scoring and topic extraction."""
+
+    def test_results_are_mapped_back_by_id(self, fake_openai):
+        _config, base_url = fake_openai
+        client = OpenAI(api_key="test", base_url=base_url, max_retries=0)
+        items = [make_item(i) for i in ("a", "b", "c")]
+
+        analyses = analyze_items_batch(items, client)
+
+        assert _FakeOpenAIHandler.operations == ["batch"]
+        assert analyses == {
+            i: (0.8, f"batched {i}", ["python", "async"]) for i in ("a", "b", "c")
+        }
+
+    def test_unparseable_batch_returns_nothing(self, fake_openai):
+        _config, base_url = fake_openai
+        _FakeOpenAIHandler.batch_mode = "garbage"
+        client = OpenAI(api_key="test", base_url=base_url, max_retries=0)
+
+        assert analyze_items_batch([make_item("a"), make_item("b")], client) == {}
+
+
+@patch("src.enrichment.orchestrator.calculate_heuristic_score")
+class TestEnrichItemBatch:
+    """Test batched enrichment with per-item fallback."""
+
+    def test_batch_replaces_per_item_scoring_calls(self, mock_heuristic, fake_openai):
+        config, _base_url = fake_openai
+        mock_heuristic.return_value = (0.5, "ok")
+
+        results = enrich_item_batch([make_item("a"), make_item("b")], config)
+
+        assert [r.ai_score for r in results] == [0.8, 0.8]
+        assert results[0].topics == ["python", "async"]
+        # One scoring call for both items; research stays per item
+        assert _FakeOpenAIHandler.operations == ["batch", "research", "research"]
+
+    def test_unparseable_batch_falls_back_to_per_item_calls(
+        self, mock_heuristic, fake_openai
+    ):
+        config, _base_url = fake_openai
+        mock_heuristic.return_value = (0.5, "ok")
+        _FakeOpenAIHandler.batch_mode = "garbage"
+
+        results = enrich_item_batch([make_item("a"), make_item("b")], config)
+
+        assert [(r.ai_score, r.topics) for r in results] == [(0.6, ["rust"])] * 2
+        assert _FakeOpenAIHandler.operations.count("batch") == 1
+        assert _FakeOpenAIHandler.operations.count("quality") == 2
+
+    def test_only_missing_items_fall_back(self, mock_heuristic, fake_openai):
+        config, _base_url = fake_openai
+        mock_heuristic.return_value = (0.5, "ok")
+        _FakeOpenAIHandler.batch_mode = "partial"
+
+        results = enrich_item_batch([make_item(i) for i in ("a", "b", "c")], config)
+
+        assert [r.ai_score for r in results] == [0.8, 0.8, 0.6]
+        assert _FakeOpenAIHandler.operations.count("quality") == 1
+
+    def test_low_heuristic_items_stay_out_of_the_batch(
+        self, mock_heuristic, fake_openai
+    ):
+        config, _base_url = fake_openai
+        mock_heuristic.side_effect = lambda item, adapter: (
+            (0.05, "weak") if item.id == "weak" else (0.5, "ok")
+        )
+
+        results = enrich_item_batch(
+            [make_item("a"), make_item("weak"), make_item("b")], config
+        )
+
+        assert results[1].quality_score == 0.05
+        assert _FakeOpenAIHandler.batch_ids == [["a", "b"]]
+
+
+class TestEnrichCollectedItemsBatching:
+    """Test batch size wiring in sequential enrichment."""
+
+    @patch("src.enrichment.orchestrator.enrich_item_batch")
+    @patch("src.enrichment.orchestrator.get_config")
+    @patch("src.enrichment.orchestrator.ScoringAdapter")
+    def test_items_are_enriched_in_batches(
+        self, mock_adapter_class, mock_config, mock_batch
+    ):
+        items = [make_item(str(i)) for i in range(5)]
+        mock_config.return_value = PipelineConfig(
+            openai_api_key="test", enrichment_batch_size=2
+        )
+        mock_adapter_class.return_value = Mock()
+        mock_batch.side_effect = lambda batch, config, adapter: [
+            EnrichedItem(
+                original=item,
+                research_summary="Test",
+                topics=[],
+                quality_score=0.5,
+            )
+            for item in batch
+        ]
+
+        results = enrich_collected_items(items)
+
+        assert [len(call.args[0]) for call in mock_batch.call_args_list] == [2, 2, 1]
+        assert [r.original.id for r in results] == ["0", "1", "2", "3", "4"]
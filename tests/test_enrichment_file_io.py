@@ -3,13 +3,21 @@
 These tests ensure loading behavior is robust:
 - Validation/coercion errors are logged and skipped
 - Unexpected exceptions are not silently swallowed
+- NDJSON files stream in and out, with lazy skipping and seeking by id
 """
 
 import json
+from unittest.mock import patch
 
 import pytest
 
-from src.enrichment.file_io import load_collected_items, load_enriched_items
+from src.enrichment.file_io import (
+    iter_collected_items,
+    iter_enriched_items,
+    load_collected_items,
+    load_enriched_items,
+    save_enriched_items,
+)
 from src.models import CollectedItem, EnrichedItem, SourceType
 from tests.utils.types import http_url
 
@@ -91,3 +99,119 @@ def test_load_collected_items_does_not_swallow_unexpected_exceptions(
 
     with pytest.raises(RuntimeError, match="boom"):
         load_collected_items(path)
+
+
+def make_collected(item_id: str, title: str = "t") -> CollectedItem:
+    return CollectedItem(
+        id=item_id,
+        title=title,
+        content="c",
+        source=SourceType.REDDIT,
+        url=http_url(f"https://example.com/{item_id}"),
+        author="a",
+        metadata={},
+    )
+
+
+def write_ndjson(path, items):
+    path.write_text(
+        "".join(item.model_dump_json() + "\n" for item in items), encoding="utf-8"
+    )
+
+
+def test_save_and_load_enriched_items_ndjson_round_trip(tmp_path):
+    """Enriched items are written one per line and load back unchanged."""
+    enriched = [
+        EnrichedItem(
+            original=make_collected(str(i)),
+            research_summary="r",
+            topics=["python"],
+            quality_score=0.5,
+        )
+        for i in range(3)
+    ]
+
+    with patch("src.enrichment.file_io.get_data_dir", return_value=tmp_path):
+        path = save_enriched_items(enriched, timestamp="20250101_120000")
+
+    assert path.name == "enriched_20250101_120000.ndjson"
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 3
+    assert load_enriched_items(path) == enriched
+
+
+def test_iter_collected_items_skips_and_seeks_without_validating(tmp_path):
+    """Skipped lines are never validated, so broken ones don't matter."""
+    path = tmp_path / "collected.ndjson"
+    write_ndjson(path, [make_collected(str(i)) for i in range(5)])
+    # Corrupt an early line: it must not be parsed when seeking past it
+    lines = path.read_text(encoding="utf-8").splitlines()
+    lines[1] = lines[1].replace("https://", "not-a-url://")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    assert [i.id for i in iter_collected_items(path, skip=2)] == ["2", "3", "4"]
+    assert [i.id for i in iter_collected_items(path, start_after_id="2")] == [
+        "3",
+        "4",
+    ]
+    assert [i.id for i in iter_collected_items(path, ids={"0", "4"})] == ["0", "4"]
+    assert [i.id for i in iter_collected_items(path)] == ["0", "2", "3", "4"]
+
+
+def test_seek_ignores_id_text_inside_content(tmp_path):
+    """Only the item's own id is used for seeking, not quoted text."""
+    path = tmp_path / "collected.ndjson"
+    write_ndjson(
+        path,
+        [make_collected("a", title='{"id": "b"}'), make_collected("b")],
+    )
+
+    assert [i.id for i in iter_collected_items(path, start_after_id="a")] == ["b"]
+
+
+def test_iter_enriched_items_seeks_by_original_id(tmp_path):
+    """Enriched items are addressed by their original item's id."""
+    path = tmp_path / "enriched.ndjson"
+    write_ndjson(
+        path,
+        [
+            EnrichedItem(
+                original=make_collected(item_id),
+                research_summary="r",
+                quality_score=0.5,
+            )
+            for item_id in ("x", "y", "z")
+        ],
+    )
+
+    items = iter_enriched_items(path, start_after_id="x", ids={"z"})
+    assert [item.original.id for item in items] == ["z"]
+
+
+def test_truncated_final_line_is_skipped(tmp_path):
+    """A partially written last line (e.g. after a crash) is ignored."""
+    path = tmp_path / "collected.ndjson"
+    write_ndjson(path, [make_collected("1"), make_collected("2")])
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(make_collected("3").model_dump_json()[:20])
+
+    assert [item.id for item in load_collected_items(path)] == ["1", "2"]
+
+
+def test_legacy_json_supports_seeking(tmp_path):
+    """Old single-document JSON files still load through the iterator."""
+    path = tmp_path / "collected_20250101_120000.json"
+    path.write_text(
+        json.dumps(
+            {
+                "items": [
+                    make_collected(str(i)).model_dump(mode="json") for i in range(3)
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    assert [item.id for item in iter_collected_items(path, start_after_id="0")] == [
+        "1",
+        "2",
+    ]
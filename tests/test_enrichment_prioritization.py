@@ -0,0 +1,122 @@
+"""Tests for enrichment priority ordering and early stop."""
+
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+from pydantic import HttpUrl
+
+from src.enrichment.orchestrator import enrich_collected_items
+from src.enrichment.prioritization import ReadyTracker, prioritize_items
+from src.models import CollectedItem, EnrichedItem, PipelineConfig, SourceType
+
+
+def make_item(item_id: str, source: SourceType = SourceType.MASTODON) -> CollectedItem:
+    return CollectedItem(
+        id=item_id,
+        source=source,
+        author="testuser",
+        content=f"Content for {item_id}",
+        title=f"Title {item_id}",
+        url=HttpUrl(f"https://example.com/{item_id}"),
+        collected_at=datetime.now(UTC),
+        metadata={},
+    )
+
+
+def enriched(item: CollectedItem, score: float) -> EnrichedItem:
+    return EnrichedItem(
+        original=item,
+        research_summary="summary",
+        related_sources=[],
+        topics=[],
+        quality_score=score,
+        enriched_at=datetime.now(UTC),
+    )
+
+
+def fake_heuristics(scores: dict[str, float]):
+    return patch(
+        "src.enrichment.prioritization.calculate_heuristic_score",
+        side_effect=lambda item, adapter=None: (scores[item.id], "test"),
+    )
+
+
+class TestPrioritizeItems:
+    """Test tier-weighted heuristic ordering."""
+
+    def test_higher_heuristic_scores_come_first(self):
+        items = [make_item("low"), make_item("high"), make_item("mid")]
+
+        with fake_heuristics({"low": 0.2, "high": 0.9, "mid": 0.5}):
+            ordered = prioritize_items(items)
+
+        assert [item.id for item in ordered] == ["high", "mid", "low"]
+
+    def test_higher_tier_sources_win_ties(self):
+        items = [make_item(f"toot-{i}", SourceType.MASTODON) for i in range(20)] + [
+            make_item(f"story-{i}", SourceType.HACKERNEWS) for i in range(20)
+        ]
+
+        with fake_heuristics({item.id: 0.5 for item in items}):
+            ordered = prioritize_items(items)
+
+        # S-tier HN keeps 60% of 20 items, B-tier Mastodon 25%
+        assert {item.id for item in ordered[:20]} == {f"story-{i}" for i in range(20)}
+        assert [item.id for item in ordered[:2]] == ["story-0", "story-1"]
+
+
+class TestReadyTracker:
+    """Test the early-stop target."""
+
+    def test_target_is_articles_per_run_plus_margin(self):
+        config = PipelineConfig(
+            openai_api_key="test",
+            articles_per_run=2,
+            enrichment_early_stop=True,
+            enrichment_ready_margin=1,
+        )
+        tracker = ReadyTracker.from_config(config)
+        item = make_item("a")
+
+        for score in (0.9, 0.4, 0.5):
+            tracker.record(enriched(item, score))
+        tracker.record(None)
+        assert tracker.ready == 2
+        assert not tracker.reached
+
+        tracker.record(enriched(item, 0.7))
+        assert tracker.reached
+
+    def test_disabled_early_stop_never_stops(self):
+        tracker = ReadyTracker.from_config(PipelineConfig(openai_api_key="test"))
+        for _ in range(20):
+            tracker.record(enriched(make_item("a"), 1.0))
+
+        assert not tracker.reached
+
+
+class TestSequentialEarlyStop:
+    """Test early stop in enrich_collected_items()."""
+
+    @patch("src.enrichment.orchestrator.ScoringAdapter")
+    @patch("src.enrichment.orchestrator.enrich_single_item")
+    @patch("src.enrichment.orchestrator.get_config")
+    def test_stops_once_enough_items_are_ready(
+        self, mock_config, mock_enrich, _mock_adapter
+    ):
+        mock_config.return_value = PipelineConfig(
+            openai_api_key="test",
+            articles_per_run=1,
+            enrichment_early_stop=True,
+            enrichment_ready_margin=1,
+        )
+        mock_enrich.side_effect = lambda item, config, adapter: enriched(item, 0.8)
+        items = [make_item(f"item-{i}") for i in range(5)]
+        scores = {f"item-{i}": 0.1 * (i + 1) for i in range(5)}
+
+        with fake_heuristics(scores):
+            result = enrich_collected_items(items)
+
+        # The two highest-priority items were enriched, the rest skipped
+        assert [e.original.id for e in result] == ["item-4", "item-3"]
+        assert mock_enrich.call_count == 2
@@ -102,3 +102,206 @@ def test_validate_url_reachable_retries_on_timeout(monkeypatch):
 
     assert validate_url_reachable("https://example.com") is False
     assert calls["n"] == 2
+
+
+def _use_mock_link_client(monkeypatch, tmp_path, handler, **settings):
+    """Route check_urls() through a MockTransport with a temporary cache."""
+
+    from src.config import get_config
+    from src.enrichment import fact_check
+    from src.utils.http_cache import LinkStatusCache
+
+    config = get_config()
+    for name, value in {
+        "fact_check_retry_attempts": 1,
+        "fact_check_deadline_seconds": 5.0,
+        **settings,
+    }.items():
+        monkeypatch.setattr(config, name, value, raising=False)
+
+    transport = httpx.MockTransport(handler)
+    orig_client = httpx.Client
+
+    def client_factory(*args, **kwargs):
+        kwargs["transport"] = transport
+        return orig_client(*args, **kwargs)
+
+    monkeypatch.setattr(httpx, "Client", client_factory)
+    fact_check.close_link_check_client()
+    cache = LinkStatusCache(3600, 60, cache_dir=tmp_path)
+    monkeypatch.setattr(fact_check, "get_link_status_cache", lambda: cache)
+    return cache
+
+
+def test_check_urls_caches_results_across_calls(monkeypatch, tmp_path):
+    """URLs already checked are answered from the cache, also after reload."""
+
+    from src.enrichment.fact_check import check_urls, close_link_check_client
+    from src.utils.http_cache import LinkStatusCache
+
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(str(request.url))
+        status = 404 if request.url.path == "/missing" else 200
+        return httpx.Response(status_code=status, request=request)
+
+    _use_mock_link_client(monkeypatch, tmp_path, handler)
+    urls = ["https://a.example/ok", "https://b.example/missing", "https://a.example/ok"]
+
+    assert check_urls(urls) == {
+        "https://a.example/ok": True,
+        "https://b.example/missing": False,
+    }
+    assert len(seen) == 2
+
+    assert check_urls(urls[:2]) == {
+        "https://a.example/ok": True,
+        "https://b.example/missing": False,
+    }
+    assert len(seen) == 2
+
+    reloaded = LinkStatusCache(3600, 60, cache_dir=tmp_path)
+    assert reloaded.get("https://a.example/ok") is True
+    assert reloaded.get("https://b.example/missing") is False
+    close_link_check_client()
+
+
+def test_check_urls_limits_concurrency_per_host(monkeypatch, tmp_path):
+    """Checks run concurrently, but never more than the per-host limit."""
+
+    import threading
+    import time
+    from collections import Counter
+
+    from src.enrichment.fact_check import check_urls, close_link_check_client
+
+    lock = threading.Lock()
+    in_flight: Counter[str] = Counter()
+    peak: Counter[str] = Counter()
+    peak_total = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal peak_total
+        host = request.url.host
+        with lock:
+            in_flight[host] += 1
+            peak[host] = max(peak[host], in_flight[host])
+            peak_total = max(peak_total, sum(in_flight.values()))
+        time.sleep(0.05)
+        with lock:
+            in_flight[host] -= 1
+        return httpx.Response(status_code=200, request=request)
+
+    _use_mock_link_client(
+        monkeypatch,
+        tmp_path,
+        handler,
+        fact_check_max_concurrency=8,
+        fact_check_per_host_limit=1,
+    )
+    urls = [f"https://{host}.example/{i}" for host in "abc" for i in range(3)]
+
+    assert all(check_urls(urls).values())
+    assert max(peak.values()) == 1
+    assert peak_total > 1
+    close_link_check_client()
+
+
+def test_check_urls_reports_unfinished_checks_at_deadline(monkeypatch, tmp_path):
+    """Checks still running at the deadline are unchecked (None), not cached."""
+
+    import time
+
+    from src.enrichment.fact_check import check_urls, close_link_check_client
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "slow.example":
+            time.sleep(0.5)
+        return httpx.Response(status_code=200, request=request)
+
+    cache = _use_mock_link_client(
+        monkeypatch, tmp_path, handler, fact_check_deadline_seconds=0.2
+    )
+
+    assert check_urls(["https://slow.example/", "https://fast.example/"]) == {
+        "https://slow.example/": None,
+        "https://fast.example/": True,
+    }
+    assert cache.get("https://slow.example/") is None
+    close_link_check_client()
+
+
+def test_link_status_cache_expires_failures_sooner(tmp_path):
+    from src.utils.http_cache import LinkStatusCache
+
+    cache = LinkStatusCache(3600, -1, cache_dir=tmp_path)
+    cache.put("https://ok.example/", True, 200)
+    cache.put("https://down.example/", False, 503)
+
+    assert cache.get("https://ok.example/") is True
+    assert cache.get("https://down.example/") is None
+
+
+def test_validate_article_checks_all_urls_in_one_batch(monkeypatch):
+    """Sources and links go to check_urls() together; results map to warnings."""
+
+    from datetime import UTC, datetime
+
+    from src.enrichment import fact_check
+    from src.models import CollectedItem, EnrichedItem, GeneratedArticle
+
+    source = EnrichedItem(
+        original=CollectedItem(
+            id="item-1",
+            title="Source",
+            content="Source content",
+            source="hackernews",
+            url="https://source.example/post",
+            author="someone",
+            collected_at=datetime.now(UTC),
+        ),
+        research_summary="Summary",
+        related_sources=[],
+        topics=["Python"],
+        quality_score=0.8,
+        enriched_at=datetime.now(UTC),
+    )
+    article = GeneratedArticle(
+        title="Article",
+        content=(
+            "[ok](https://ok.example/) [broken](https://broken.example/) "
+            "[slow](https://slow.example/) [anchor](#refs)"
+        ),
+        summary="Summary",
+        sources=[source],
+        word_count=800,
+        filename="article.md",
+        generator_name="test",
+    )
+    batches = []
+
+    def fake_check_urls(urls):
+        batches.append(urls)
+        return {
+            "https://source.example/post": True,
+            "https://ok.example/": True,
+            "https://broken.example/": False,
+            "https://slow.example/": None,
+        }
+
+    monkeypatch.setattr(fact_check, "check_urls", fake_check_urls)
+
+    result = fact_check.validate_article(article, [source])
+
+    assert batches == [
+        [
+            "https://source.example/post",
+            "https://ok.example/",
+            "https://broken.example/",
+            "https://slow.example/",
+        ]
+    ]
+    assert result.unreachable_sources == []
+    assert result.broken_links == ["https://broken.example/"]
+    assert "Link not checked before deadline: https://slow.example/" in result.warnings
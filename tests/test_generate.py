@@ -13,6 +13,7 @@ Tests cover:
 
 import tempfile
 from datetime import UTC, datetime, timedelta
+from functools import partial
 from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
@@ -20,6 +21,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from src.generators.base import BaseGenerator
+from src.generators.voices.selector import VoiceSelector
 from src.models import CollectedItem, EnrichedItem, PipelineConfig, SourceType
 from src.pipeline import (
     calculate_image_cost,
@@ -34,6 +36,7 @@ from src.pipeline import (
     select_article_candidates,
     select_generator,
 )
+from src.utils.telemetry_ledger import TelemetryLedger
 from tests.utils.types import http_url
 
 # ============================================================================
@@ -41,6 +44,19 @@ from tests.utils.types import http_url
 # ============================================================================
 
 
+@pytest.fixture(autouse=True)
+def isolated_data_files(monkeypatch, tmp_path):
+    """Keep call telemetry and voice history out of the real data directory."""
+    monkeypatch.setattr(
+        "src.utils.openai_wrapper._LEDGER",
+        TelemetryLedger(tmp_path, "test", export_at_exit=False),
+    )
+    monkeypatch.setattr(
+        "src.generators.voices.selector.VoiceSelector",
+        partial(VoiceSelector, history_file=str(tmp_path / "voice_history.json")),
+    )
+
+
 @pytest.fixture
 def sample_collected_item():
     """Create a sample collected item for testing."""
@@ -0,0 +1,200 @@
+"""Tests for the conditional-request HTTP cache and item cache."""
+
+import asyncio
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+import requests
+
+from src.collectors.http_engine import CollectionHTTPEngine, HostLimit
+from src.enrichment.source_fetcher import fetch_article_content
+from src.utils.http_cache import CachedResponse, HTTPCache, ItemCache, conditional_get
+
+FAST_LIMIT = HostLimit(concurrency=4, rate_per_minute=60000, burst=100)
+ARTICLE = b"<html><body><article>Cached article body</article></body></html>"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Serves one page with an ETag and honours If-None-Match."""
+
+    etag = '"v1"'
+    hits: list[tuple[str, int]] = []
+
+    def do_GET(self):  # noqa: N802
+        if self.headers.get("If-None-Match") == self.etag:
+            self.hits.append((self.path, 304))
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.end_headers()
+            return
+        self.hits.append((self.path, 200))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html")
+        if self.path != "/no-validators":
+            self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(len(ARTICLE)))
+        self.end_headers()
+        self.wfile.write(ARTICLE)
+
+    def log_message(self, *_args):
+        return None
+
+
+@pytest.fixture
+def stub_server():
+    _StubHandler.hits = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestConditionalGet:
+    """Test ETag revalidation against a local stub server."""
+
+    def test_second_fetch_is_revalidated(self, stub_server, tmp_path):
+        """The second GET sends If-None-Match and replays the cached body."""
+        cache = HTTPCache(tmp_path)
+        url = f"{stub_server}/page"
+
+        first = conditional_get(requests.get, url, cache, timeout=5)
+        second = conditional_get(requests.get, url, cache, timeout=5)
+
+        assert first.content == ARTICLE
+        assert isinstance(second, CachedResponse)
+        assert second.content == ARTICLE
+        assert [status for _, status in _StubHandler.hits] == [200, 304]
+        assert cache.hits == 1
+
+    def test_responses_without_validators_are_not_stored(self, stub_server, tmp_path):
+        """Nothing is cached when the server sends no ETag/Last-Modified."""
+        cache = HTTPCache(tmp_path)
+        url = f"{stub_server}/no-validators"
+
+        conditional_get(requests.get, url, cache, timeout=5)
+        conditional_get(requests.get, url, cache, timeout=5)
+
+        assert [status for _, status in _StubHandler.hits] == [200, 200]
+        assert cache.get(url) is None
+
+    def test_params_are_part_of_the_key(self, tmp_path):
+        """Different query parameters are cached separately."""
+        assert HTTPCache.key("https://x.test", {"a": 1}) != HTTPCache.key(
+            "https://x.test", {"a": 2}
+        )
+        assert HTTPCache.key("https://x.test", {"a": 1, "b": 2}) == HTTPCache.key(
+            "https://x.test", {"b": 2, "a": 1}
+        )
+
+    def test_fetch_article_content_uses_cache(self, stub_server, tmp_path, monkeypatch):
+        """Source fetching revalidates instead of redownloading."""
+        monkeypatch.setattr("time.sleep", lambda _seconds: None)
+        cache = HTTPCache(tmp_path)
+        url = f"{stub_server}/article"
+
+        first = fetch_article_content(url, cache=cache)
+        second = fetch_article_content(url, cache=cache)
+
+        assert first == second == "Cached article body"
+        assert [status for _, status in _StubHandler.hits] == [200, 304]
+
+
+class TestHTTPCachePruning:
+    """Test age and size limits on stored responses."""
+
+    @staticmethod
+    def _store(cache: HTTPCache, url: str, age_seconds: float = 0) -> None:
+        cache.put(url, {"etag": '"v1"'}, b"body")
+        if age_seconds:
+            used = time.time() - age_seconds
+            for path in cache._paths(HTTPCache.key(url)):
+                os.utime(path, (used, used))
+
+    def test_prunes_unused_entries_by_age(self, tmp_path):
+        cache = HTTPCache(tmp_path, max_age_seconds=3600)
+        self._store(cache, "https://x.test/old", age_seconds=7200)
+        self._store(cache, "https://x.test/new")
+        (tmp_path / "link_status.json").write_text("{}", encoding="utf-8")
+
+        assert cache.prune() == 1
+        assert cache.get("https://x.test/old") is None
+        assert cache.get("https://x.test/new") is not None
+        assert (tmp_path / "link_status.json").exists()
+
+    def test_keeps_most_recently_used_entries(self, tmp_path):
+        cache = HTTPCache(tmp_path, max_entries=2)
+        self._store(cache, "https://x.test/a", age_seconds=300)
+        self._store(cache, "https://x.test/b", age_seconds=200)
+        self._store(cache, "https://x.test/c", age_seconds=100)
+        assert cache.get("https://x.test/a") is not None  # Touches entry a
+
+        assert cache.prune() == 1
+        assert len(cache) == 2
+        assert cache.get("https://x.test/b") is None
+
+    def test_put_prunes_periodically(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("src.utils.http_cache._PRUNE_EVERY_PUTS", 3)
+        cache = HTTPCache(tmp_path, max_entries=1)
+        for i in range(3):
+            self._store(cache, f"https://x.test/{i}", age_seconds=100 - i)
+
+        assert len(cache) == 1
+        assert cache.get("https://x.test/2") is not None
+
+
+class TestEngineCache:
+    """Test conditional requests through the async collection engine."""
+
+    def test_304_is_returned_as_cached_200(self, tmp_path):
+        seen_validators = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen_validators.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"abc"':
+                return httpx.Response(304, request=request)
+            return httpx.Response(
+                200, json=[1, 2, 3], headers={"ETag": '"abc"'}, request=request
+            )
+
+        async def run():
+            engine = CollectionHTTPEngine(
+                default_limit=FAST_LIMIT,
+                host_limits={},
+                transport=httpx.MockTransport(handler),
+                cache=HTTPCache(tmp_path),
+            )
+            async with engine:
+                first = await engine.get("https://api.test/top", params={"n": 3})
+                second = await engine.get("https://api.test/top", params={"n": 3})
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert seen_validators == [None, '"abc"']
+        assert first.json() == second.json() == [1, 2, 3]
+        assert second.status_code == 200
+
+
+class TestItemCache:
+    """Test TTL-bounded item cache."""
+
+    def test_round_trip_and_expiry(self, tmp_path):
+        cache = ItemCache("hackernews", ttl_seconds=60, cache_dir=tmp_path)
+        cache.put(42, {"id": 42, "type": "story"})
+        cache.save()
+
+        reloaded = ItemCache("hackernews", ttl_seconds=60, cache_dir=tmp_path)
+        assert reloaded.get(42) == {"id": 42, "type": "story"}
+        assert reloaded.get("42") == {"id": 42, "type": "story"}
+
+        expired = ItemCache("hackernews", ttl_seconds=0, cache_dir=tmp_path)
+        time.sleep(0.01)
+        assert expired.get(42) is None
+        expired.save()
+        assert ItemCache("hackernews", 60, cache_dir=tmp_path).get(42) is None
@@ -15,6 +15,16 @@ from openai import OpenAI
 
 from src.images.selector import CoverImage, CoverImageSelector
 from src.models import PipelineConfig
+from src.utils.telemetry_ledger import TelemetryLedger
+
+
+@pytest.fixture(autouse=True)
+def isolated_telemetry(monkeypatch, tmp_path):
+    """Keep call telemetry out of the real data directory."""
+    monkeypatch.setattr(
+        "src.utils.openai_wrapper._LEDGER",
+        TelemetryLedger(tmp_path, "test", export_at_exit=False),
+    )
 
 
 @pytest.fixture
@@ -0,0 +1,87 @@
+"""Tests for the precompiled multi-keyword matcher."""
+
+from src.collectors.base import is_political_content, is_relevant_content
+from src.models import PipelineConfig
+from src.utils.keyword_matcher import KeywordMatcher
+
+
+class TestBoundaries:
+    """Test word-bounded matching."""
+
+    def test_short_keyword_not_matched_inside_words(self):
+        matcher = KeywordMatcher({"tech": ["go", "ai", "nat"]})
+
+        assert matcher.keywords_in("A good plan, he said, for the nation") == set()
+        assert matcher.keywords_in("Go and AI behind NAT") == {"go", "ai", "nat"}
+
+    def test_plural_endings_match(self):
+        matcher = KeywordMatcher({"tech": ["api", "protocol", "process"]})
+
+        assert matcher.keywords_in("APIs, protocols and processes") == {
+            "api",
+            "protocol",
+            "process",
+        }
+
+    def test_punctuation_edged_keywords_are_not_bounded(self):
+        matcher = KeywordMatcher({"list": ["awesome-", "1/"]})
+
+        assert matcher.keywords_in("awesome-python thread 1/5") == {"awesome-", "1/"}
+
+
+class TestHits:
+    """Test hit reporting."""
+
+    def test_overlapping_and_nested_keywords_all_reported(self):
+        matcher = KeywordMatcher(
+            {"educational": ["how to", "how", "to do"], "news": ["to do list"]}
+        )
+
+        assert matcher.matches("How to do list management") == {
+            "educational": {"how to", "how", "to do"},
+            "news": {"to do list"},
+        }
+
+    def test_keyword_in_several_groups(self):
+        matcher = KeywordMatcher({"tech": ["privacy"], "policy": ["privacy", "gdpr"]})
+
+        assert matcher.matches("GDPR and privacy") == {
+            "tech": {"privacy"},
+            "policy": {"privacy", "gdpr"},
+        }
+
+    def test_counts_include_groups_without_hits(self):
+        matcher = KeywordMatcher({"tech": ["rust", "python"], "news": ["released"]})
+
+        assert matcher.counts("Rust and Python, again rust") == {"tech": 2, "news": 0}
+
+    def test_empty_matcher_and_text(self):
+        assert KeywordMatcher({"tech": []}).counts("anything") == {"tech": 0}
+        assert KeywordMatcher({"tech": ["rust"]}).matches("") == {}
+
+    def test_batch_api_preserves_order(self):
+        matcher = KeywordMatcher({"tech": ["rust"], "news": ["released"]})
+
+        assert matcher.counts_many(["Rust released", "", "released"]) == [
+            {"tech": 1, "news": 1},
+            {"tech": 0, "news": 0},
+            {"tech": 0, "news": 1},
+        ]
+        assert matcher.matches_many(["rust"]) == [{"tech": {"rust"}}]
+
+
+class TestContentFilters:
+    """Test the collector filters built on the matcher."""
+
+    def test_politics_needs_whole_word(self):
+        # "vote" inside "devoted" used to flag the item as political
+        assert not is_political_content("A devoted maintainer ships a new release")
+        assert is_political_content("The senate vote is tomorrow")
+
+    def test_relevance_negative_keywords_are_word_bounded(self):
+        config = PipelineConfig(
+            openai_api_key="test", relevance_negative_keywords="sport"
+        )
+
+        assert is_relevant_content("Python support lands", "", config)
+        assert not is_relevant_content("Python sport analytics", "", config)
@@ -0,0 +1,152 @@
+"""Tests for the content-addressed LLM response cache."""
+
+import time
+from unittest.mock import Mock
+
+import pytest
+from openai.types.chat import ChatCompletion
+
+from src.models import PipelineConfig
+from src.utils import openai_wrapper
+from src.utils.llm_cache import LLMResponseCache, is_cacheable_stage
+from src.utils.telemetry_ledger import TelemetryLedger
+
+MESSAGES = [{"role": "user", "content": "Score this post"}]
+
+
+def make_completion(content: str = '{"score": 0.7}') -> ChatCompletion:
+    return ChatCompletion.model_validate(
+        {
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4o-mini",
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": 1000,
+                "completion_tokens": 100,
+                "total_tokens": 1100,
+            },
+        }
+    )
+
+
+class TestLLMResponseCache:
+    """Test keys, TTL expiry and LRU eviction."""
+
+    def test_key_covers_model_messages_and_params(self):
+        base = LLMResponseCache.key("m", MESSAGES, {"temperature": 0.2})
+        assert base == LLMResponseCache.key("m", MESSAGES, {"temperature": 0.2})
+        assert base != LLMResponseCache.key("m2", MESSAGES, {"temperature": 0.2})
+        assert base != LLMResponseCache.key("m", MESSAGES, {"temperature": 0.3})
+        assert base != LLMResponseCache.key(
+            "m", [{"role": "user", "content": "Other"}], {"temperature": 0.2}
+        )
+
+    def test_round_trip_and_expiry(self, tmp_path):
+        cache = LLMResponseCache(tmp_path / "cache.sqlite3", ttl_seconds=60)
+        cache.put("k", make_completion(), stage="enrichment")
+
+        hit = cache.get("k")
+        assert hit is not None
+        assert hit.choices[0].message.content == '{"score": 0.7}'
+
+        expired = LLMResponseCache(tmp_path / "cache.sqlite3", ttl_seconds=0)
+        time.sleep(0.01)
+        assert expired.get("k") is None
+        assert len(expired) == 0
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = LLMResponseCache(tmp_path / "cache.sqlite3", max_entries=2)
+        cache.put("a", make_completion(), stage="s")
+        time.sleep(0.01)
+        cache.put("b", make_completion(), stage="s")
+        time.sleep(0.01)
+        assert cache.get("a") is not None  # "a" is now more recent than "b"
+        time.sleep(0.01)
+        cache.put("c", make_completion(), stage="s")
+
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+
+class TestStagePolicy:
+    """Test which calls the cache policy allows."""
+
+    def test_stage_or_operation_must_be_listed(self):
+        config = PipelineConfig(openai_api_key="test")
+        assert is_cacheable_stage("illustration_diagram_validate", None, config)
+        assert is_cacheable_stage(
+            "enrichment", {"operation": "quality_analysis"}, config
+        )
+        assert not is_cacheable_stage(
+            "enrichment", {"operation": "research_generation"}, config
+        )
+        assert not is_cacheable_stage("content", None, config)
+
+
+class TestChatCompletionCaching:
+    """Test cache hits and misses through chat_completion()."""
+
+    @pytest.fixture
+    def wrapper(self, monkeypatch, tmp_path):
+        config = PipelineConfig(openai_api_key="test", llm_cache_enabled=True)
+        cache = LLMResponseCache(tmp_path / "cache.sqlite3")
+        api = Mock(return_value=make_completion())
+        ledger = TelemetryLedger(tmp_path, "test", export_at_exit=False)
+        monkeypatch.setattr(openai_wrapper, "create_chat_completion", api)
+        monkeypatch.setattr(openai_wrapper, "get_llm_cache", lambda _config: cache)
+        monkeypatch.setattr(openai_wrapper, "_LEDGER", ledger)
+        return config, api, ledger
+
+    def call(self, config, stage, operation):
+        return openai_wrapper.chat_completion(
+            client=Mock(),
+            model="gpt-4o-mini",
+            messages=MESSAGES,
+            stage=stage,
+            config=config,
+            context={"operation": operation},
+            temperature=0.4,
+        )
+
+    def test_repeat_request_is_served_from_cache(self, wrapper):
+        config, api, ledger = wrapper
+
+        first = self.call(config, "enrichment", "quality_analysis")
+        second = self.call(config, "enrichment", "quality_analysis")
+
+        assert api.call_count == 1
+        assert second.choices[0].message.content == first.choices[0].message.content
+        assert second.usage.total_tokens == 0
+
+        calls = ledger.entries()
+        assert [c.get("cache_hit", False) for c in calls] == [False, True]
+        assert calls[0]["cost"] > 0
+        assert calls[1]["cost"] == 0.0
+        assert calls[1]["cached_total_tokens"] == 1100
+
+    def test_creative_stages_always_call_the_api(self, wrapper):
+        config, api, _ledger = wrapper
+
+        self.call(config, "content", "article_generation")
+        self.call(config, "content", "article_generation")
+
+        assert api.call_count == 2
+
+    def test_empty_responses_are_not_cached(self, wrapper):
+        config, api, _ledger = wrapper
+        api.return_value = make_completion(content="")
+
+        self.call(config, "enrichment", "quality_analysis")
+        self.call(config, "enrichment", "quality_analysis")
+
+        assert api.call_count == 2
@@ -0,0 +1,125 @@
+"""Tests for concurrent Mastodon multi-instance fan-out."""
+
+import asyncio
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+from pydantic import HttpUrl
+
+from src.collectors.instance_stats import InstanceStatsStore
+from src.collectors.mastodon import collect_from_mastodon_instances_async
+from src.models import CollectedItem, SourceType
+
+
+def make_items(instance: str, count: int) -> list[CollectedItem]:
+    return [
+        CollectedItem(
+            id=f"{instance}_{i}",
+            source=SourceType.MASTODON,
+            author="tester",
+            content="Test content",
+            title="Test",
+            url=HttpUrl(f"https://{instance}/{i}"),
+            collected_at=datetime.now(UTC),
+        )
+        for i in range(count)
+    ]
+
+
+def fake_collector(delays: dict[str, float], counts: dict[str, int], calls: list):
+    """Async stand-in for collect_from_mastodon_trending_async."""
+
+    async def collect(engine, instance, limit=30):
+        calls.append(instance)
+        await asyncio.sleep(delays[instance])
+        return make_items(instance, counts[instance])
+
+    return collect
+
+
+def run_fanout(collector, instances, **kwargs):
+    with patch(
+        "src.collectors.mastodon.collect_from_mastodon_trending_async", collector
+    ):
+        return asyncio.run(
+            collect_from_mastodon_instances_async(None, instances, **kwargs)
+        )
+
+
+class TestMastodonFanout:
+    """Test quota, deadlines and instance ordering."""
+
+    def test_stops_and_cancels_once_quota_met(self, tmp_path):
+        """Slow instances are cancelled once fast ones fill the quota."""
+        calls: list[str] = []
+        collector = fake_collector(
+            delays={"fast": 0.01, "also-fast": 0.02, "slow": 5.0},
+            counts={"fast": 50, "also-fast": 40, "slow": 10},
+            calls=calls,
+        )
+        stats = InstanceStatsStore(tmp_path / "stats.json")
+
+        items = run_fanout(
+            collector,
+            ["slow", "fast", "also-fast"],
+            quota=80,
+            deadline=10.0,
+            max_concurrent=3,
+            stats=stats,
+        )
+
+        assert len(items) == 90
+        assert {item.id.split("_")[0] for item in items} == {"fast", "also-fast"}
+        assert "slow" not in stats.stats
+        assert (tmp_path / "stats.json").exists()
+
+    def test_deadline_abandons_instance(self, tmp_path):
+        """An instance past its deadline is recorded as a failure."""
+        calls: list[str] = []
+        collector = fake_collector(
+            delays={"dead": 5.0, "ok": 0.01},
+            counts={"dead": 10, "ok": 5},
+            calls=calls,
+        )
+        stats = InstanceStatsStore(tmp_path / "stats.json")
+
+        items = run_fanout(
+            collector,
+            ["dead", "ok"],
+            quota=80,
+            deadline=0.05,
+            max_concurrent=2,
+            stats=stats,
+        )
+
+        assert [item.id for item in items] == [f"ok_{i}" for i in range(5)]
+        assert stats.stats["dead"].failures == 1
+        assert stats.stats["ok"].failures == 0
+
+    def test_slow_instances_deprioritised_on_next_run(self, tmp_path):
+        """Instances that were slow per item start last and may never start."""
+        stats = InstanceStatsStore(tmp_path / "stats.json")
+        stats.record("slow", latency_seconds=8.0, items=2)
+        stats.record("fast", latency_seconds=0.5, items=40)
+        stats.save()
+
+        reloaded = InstanceStatsStore(tmp_path / "stats.json")
+        assert reloaded.order(["slow", "fast", "new"]) == ["new", "fast", "slow"]
+
+        calls: list[str] = []
+        collector = fake_collector(
+            delays={"slow": 0.01, "fast": 0.01},
+            counts={"slow": 5, "fast": 80},
+            calls=calls,
+        )
+        items = run_fanout(
+            collector,
+            ["slow", "fast"],
+            quota=80,
+            deadline=1.0,
+            max_concurrent=1,
+            stats=reloaded,
+        )
+
+        assert calls == ["fast"]
+        assert len(items) == 80
@@ -0,0 +1,147 @@
+"""Tests for the MinHash LSH near-duplicate index."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from src.deduplication import near_dup_index
+from src.deduplication.near_dup_index import (
+    NearDuplicateIndex,
+    candidate_pairs,
+    minhash,
+)
+from src.deduplication.post_gen_dedup import find_duplicate_articles
+
+BODY = (
+    "Kubernetes operators let teams encode operational knowledge as code. "
+    "This article walks through reconciliation loops, custom resources and "
+    "the failure modes we hit when running stateful databases on clusters. "
+    "We finish with a checklist for upgrades and a note on observability."
+)
+OTHER_BODY = (
+    "Sourdough baking depends on a lively starter, patient fermentation and "
+    "a hot oven. Hydration, flour choice and shaping technique change crumb "
+    "and crust more than any single recipe tweak ever will in practice."
+)
+
+
+def _write_post(path: Path, title: str, tags: list[str], body: str) -> None:
+    path.write_text(
+        f"---\ntitle: {title}\nsummary: {title} explained\ntags: {tags}\n---\n{body}\n",
+        encoding="utf-8",
+    )
+
+
+def _bump_mtime(path: Path) -> None:
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+
+def test_minhash_is_stable_and_tracks_similarity() -> None:
+    words = {f"word{i}" for i in range(100)}
+    close = (words - {"word0", "word1"}) | {"extra0", "extra1"}
+    far = {f"other{i}" for i in range(100)}
+
+    signature = minhash(words)
+    assert signature == minhash(set(words))
+    assert len(signature) == near_dup_index.NUM_PERM
+    assert minhash(set()) == ()
+
+    def agreement(other: tuple[int, ...]) -> int:
+        return sum(a == b for a, b in zip(signature, other, strict=True))
+
+    assert agreement(minhash(close)) > agreement(minhash(far))
+
+
+def test_lsh_candidates_match_exhaustive_scoring() -> None:
+    articles = [
+        {"path": "a.md", "title": "Kubernetes Operators in Practice", "tags": ["k8s"]},
+        {"path": "b.md", "title": "Sourdough Starters at Home", "tags": ["baking"]},
+        {
+            "path": "c.md",
+            "title": "Kubernetes Operators in Production",
+            "tags": ["k8s"],
+        },
+    ]
+    for article, body in zip(articles, (BODY, OTHER_BODY, BODY), strict=True):
+        article["summary"] = f"{article['title']} explained"
+        article["content"] = body
+
+    assert candidate_pairs(articles) == [(0, 2)]
+    lsh = find_duplicate_articles(articles)
+    assert [(d.article1_path.name, d.article2_path.name) for d in lsh] == [
+        ("a.md", "c.md")
+    ]
+    assert lsh == find_duplicate_articles(articles, exhaustive=True)
+
+
+def test_update_matches_new_article_against_candidates(tmp_path: Path) -> None:
+    _write_post(tmp_path / "2025-01-01-ops.md", "Kubernetes Operators", ["k8s"], BODY)
+    _write_post(tmp_path / "2025-01-02-bread.md", "Sourdough", ["baking"], OTHER_BODY)
+    index = NearDuplicateIndex(tmp_path)
+    assert len(index) == 2
+
+    new_post = tmp_path / "2025-01-03-ops-again.md"
+    _write_post(new_post, "Kubernetes Operators Revisited", ["k8s"], BODY)
+
+    assert index.candidates(near_dup_index.load_article(new_post)) == [
+        "2025-01-01-ops.md"
+    ]
+    duplicates = index.update(new_post)
+    assert [d.article2_path.name for d in duplicates] == ["2025-01-01-ops.md"]
+    assert len(index) == 3
+    # Re-saving the same file does not match it against itself
+    assert [d.article2_path.name for d in index.update(new_post)] == [
+        "2025-01-01-ops.md"
+    ]
+
+
+def test_malformed_posts_are_skipped(tmp_path: Path) -> None:
+    ops = tmp_path / "2025-01-01-ops.md"
+    _write_post(ops, "Kubernetes Operators", ["k8s"], BODY)
+    _write_post(tmp_path / "2025-01-02-bread.md", "Sourdough", ["baking"], OTHER_BODY)
+    broken = tmp_path / "2025-01-03-broken.md"
+    broken.write_text("---\ntitle: [unclosed\n---\nBody\n", encoding="utf-8")
+
+    index = NearDuplicateIndex(tmp_path)
+    assert len(index) == 2
+    assert near_dup_index.load_article(broken) is None
+    assert index.update(broken) == []
+
+    # A post that stops parsing loses the signature of its old version
+    ops.write_text("---\ntitle: [unclosed\n---\n" + BODY, encoding="utf-8")
+    assert index.update(ops) == []
+    assert len(index) == 1
+
+
+def test_index_persists_and_only_resigns_changed_files(
+    tmp_path: Path, monkeypatch
+) -> None:
+    content_dir = tmp_path / "posts"
+    content_dir.mkdir()
+    index_file = tmp_path / "near_dup_index.json"
+    post = content_dir / "2025-01-01-ops.md"
+    _write_post(post, "Kubernetes Operators", ["k8s"], BODY)
+    _write_post(content_dir / "2025-01-02-bread.md", "Sourdough", ["baking"], "x")
+    NearDuplicateIndex(content_dir, index_file=index_file)
+    assert index_file.exists()
+
+    loaded: list[str] = []
+    original = near_dup_index.load_article
+
+    def counting_load(filepath: Path) -> dict | None:
+        loaded.append(Path(filepath).name)
+        return original(filepath)
+
+    monkeypatch.setattr(near_dup_index, "load_article", counting_load)
+    reloaded = NearDuplicateIndex(content_dir, index_file=index_file)
+    assert len(reloaded) == 2
+    assert loaded == []
+
+    _write_post(post, "Kubernetes Operators, updated", ["k8s"], BODY)
+    _bump_mtime(post)
+    (content_dir / "2025-01-02-bread.md").unlink()
+    assert reloaded.refresh() == 2
+    assert loaded == ["2025-01-01-ops.md"]
+    assert len(reloaded) == 1
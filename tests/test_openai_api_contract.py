@@ -24,6 +24,7 @@ from src.generators.general import GeneralArticleGenerator
 from src.generators.integrative import IntegrativeListGenerator
 from src.generators.specialized.self_hosted import SelfHostedGenerator
 from src.models import CollectedItem, EnrichedItem
+from src.utils.telemetry_ledger import TelemetryLedger
 
 # Valid OpenAI Chat Completions API parameters (as of Nov 2024)
 # NOTE: Includes model-specific parameters that wrapper may use
@@ -309,6 +310,15 @@ class TestOpenAIAPIContract:
             assert max_tokens <= 4096, f"max_tokens {max_tokens} seems too high (>4096)"
 
 
+@pytest.fixture(autouse=True)
+def isolated_telemetry(monkeypatch, tmp_path):
+    """Keep call telemetry out of the real data directory."""
+    monkeypatch.setattr(
+        "src.utils.openai_wrapper._LEDGER",
+        TelemetryLedger(tmp_path, "test", export_at_exit=False),
+    )
+
+
 @pytest.fixture
 def sample_collected_item():
     """Create a sample CollectedItem for testing."""
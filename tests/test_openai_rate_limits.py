@@ -0,0 +1,144 @@
+"""Tests for per-model rate limiting inside chat_completion()."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.models import PipelineConfig, RetryConfig
+from src.utils import openai_wrapper
+from src.utils.budget import CostBudget
+from src.utils.clients import OpenAIClientRegistry
+from src.utils.rate_limit import ModelRateLimiter
+from src.utils.telemetry_ledger import TelemetryLedger
+
+
+class _RateLimitedHandler(BaseHTTPRequestHandler):
+    """Chat completions endpoint, optionally reporting rate limit headers."""
+
+    send_limits = True
+
+    def do_POST(self):  # noqa: N802
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        payload = json.dumps(
+            {
+                "id": "chatcmpl-test",
+                "object": "chat.completion",
+                "created": 0,
+                "model": body["model"],
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "ok"},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 10,
+                    "completion_tokens": 5,
+                    "total_tokens": 15,
+                },
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        if self.send_limits:
+            self.send_header("x-ratelimit-limit-requests", "60")
+            self.send_header("x-ratelimit-remaining-requests", "59")
+            self.send_header("x-ratelimit-reset-requests", "1s")
+            self.send_header("x-ratelimit-limit-tokens", "10000")
+            self.send_header("x-ratelimit-remaining-tokens", "9000")
+            self.send_header("x-ratelimit-reset-tokens", "6s")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *_args):
+        return None
+
+
+@pytest.fixture
+def limiter(monkeypatch, tmp_path):
+    """Route a pooled client to a fake API with a fresh model limiter."""
+    _RateLimitedHandler.send_limits = True
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RateLimitedHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv(
+        "OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}/v1"
+    )
+    fresh = ModelRateLimiter()
+    monkeypatch.setattr("src.utils.rate_limit._MODEL_LIMITER", fresh)
+    monkeypatch.setattr(openai_wrapper, "_BUDGET", CostBudget())
+    monkeypatch.setattr(
+        openai_wrapper,
+        "_LEDGER",
+        TelemetryLedger(tmp_path, "test", export_at_exit=False),
+    )
+    yield fresh
+    server.shutdown()
+    server.server_close()
+
+
+def make_config(**overrides) -> PipelineConfig:
+    return PipelineConfig(
+        openai_api_key="test",
+        retries=RetryConfig(
+            max_attempts=1,
+            backoff_multiplier=1.0,
+            backoff_min=0.01,
+            backoff_max=0.01,
+            jitter=0.0,
+        ),
+        **overrides,
+    )
+
+
+def ask(client, config: PipelineConfig, max_tokens: int) -> None:
+    openai_wrapper.chat_completion(
+        client=client,
+        model="gpt-4o-mini",
+        messages=[{"role": "user", "content": "hi"}],
+        stage="content",
+        config=config,
+        max_tokens=max_tokens,
+    )
+
+
+class TestChatCompletionRateLimits:
+    """Test that chat calls share one per-model view of capacity."""
+
+    def test_usage_replaces_the_estimate(self, limiter):
+        _RateLimitedHandler.send_limits = False
+        config = make_config(openai_tokens_per_minute=5000)
+        registry = OpenAIClientRegistry()
+
+        ask(registry.get(config), config, max_tokens=4000)
+
+        # Charged ~4000 tokens up front, reconciled to the 15 actually used
+        assert 4985 <= limiter.remaining("gpt-4o-mini")[1] <= 5000
+        registry.close()
+
+    def test_api_headers_replace_configured_limits(self, limiter):
+        config = make_config(openai_tokens_per_minute=100000)
+        registry = OpenAIClientRegistry()
+
+        ask(registry.get(config), config, max_tokens=4000)
+
+        # The API's 9000 remaining already covers this call's charge
+        requests, tokens = limiter.remaining("gpt-4o-mini")
+        assert 59 <= requests <= 60
+        assert 9000 <= tokens < 9100
+        assert limiter.time_until_available("gpt-4o-mini", 10000) > 0
+        registry.close()
+
+    def test_disabled_rate_limiting_skips_the_limiter(self, limiter):
+        _RateLimitedHandler.send_limits = False
+        config = make_config(openai_rate_limiting=False, openai_tokens_per_minute=10)
+        registry = OpenAIClientRegistry()
+
+        ask(registry.get(config), config, max_tokens=4000)
+
+        assert limiter.remaining("gpt-4o-mini") == (None, None)
+        registry.close()
@@ -3,9 +3,11 @@
 import json
 from datetime import UTC, datetime
 from typing import cast
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import frontmatter
+import pytest
+import yaml
 from pydantic import HttpUrl, TypeAdapter
 
 from src.citations.extractor import Citation
@@ -21,6 +23,14 @@ from src.models import (
 from src.pipeline.file_io import load_enriched_items, save_article_to_file
 
 
+@pytest.fixture(autouse=True)
+def isolated_cover_images(monkeypatch, tmp_path):
+    """Write fallback cover variants under tmp_path, not site/static/images."""
+    images_dir = tmp_path / "images"
+    images_dir.mkdir()
+    monkeypatch.setattr("src.images.library._ensure_posts_dir", lambda: images_dir)
+
+
 def test_save_article_persists_external_cover_image(monkeypatch, tmp_path):
     """External cover URLs are persisted and frontmatter stores Hugo-local paths."""
 
@@ -29,7 +39,7 @@ def test_save_article_persists_external_cover_image(monkeypatch, tmp_path):
     from src.models import GeneratedArticle, PipelineConfig
 
     # Ensure we don't write into the real content dir
-    monkeypatch.setattr("src.config.get_content_dir", lambda: tmp_path)
+    monkeypatch.setattr("src.pipeline.file_io.get_content_dir", lambda: tmp_path)
     monkeypatch.setattr(
         "src.pipeline.file_io.find_article_by_slug", lambda *a, **k: None
     )
@@ -462,7 +472,7 @@ class TestSaveArticleToFile:
             confidence=0.9,
             source_uri="https://doi.org/10.1234/test",
         )
-        mock_resolver_instance.resolve.return_value = resolved_citation
+        mock_resolver_instance.resolve_many.return_value = [resolved_citation]
         mock_resolver.return_value = mock_resolver_instance
 
         # Create a proper FormattedCitation with metadata
@@ -482,8 +492,9 @@ class TestSaveArticleToFile:
         ]
         mock_formatter.return_value = mock_formatter_instance
 
-        mock_cache_instance = Mock()
+        mock_cache_instance = MagicMock()
         mock_cache_instance.get.return_value = None
+        mock_cache_instance.__enter__.return_value = mock_cache_instance
         mock_cache.return_value = mock_cache_instance
 
         with patch("src.pipeline.file_io.get_content_dir", return_value=tmp_path):
@@ -494,6 +505,7 @@ class TestSaveArticleToFile:
         mock_formatter_instance.format.assert_called()
         mock_formatter_instance.apply_to_text.assert_called_once()
         mock_formatter_instance.build_bibliography.assert_called_once()
+        mock_cache_instance.__exit__.assert_called_once()
 
     @patch("src.pipeline.file_io.CitationExtractor")
     @patch("src.pipeline.file_io.CitationResolver")
@@ -530,7 +542,7 @@ class TestSaveArticleToFile:
             confidence=0.0,
             source_uri=None,
         )
-        mock_resolver_instance.resolve.return_value = resolved_citation
+        mock_resolver_instance.resolve_many.return_value = [resolved_citation]
         mock_resolver.return_value = mock_resolver_instance
 
         formatted_citation = FormattedCitation(
@@ -549,8 +561,9 @@ class TestSaveArticleToFile:
         ]
         mock_formatter.return_value = mock_formatter_instance
 
-        mock_cache_instance = Mock()
+        mock_cache_instance = MagicMock()
         mock_cache_instance.get.return_value = None
+        mock_cache_instance.__enter__.return_value = mock_cache_instance
         mock_cache.return_value = mock_cache_instance
 
         with patch("src.pipeline.file_io.get_content_dir", return_value=tmp_path):
@@ -575,6 +588,20 @@ class TestSaveArticleToFile:
         # Article should still be saved
         assert filepath.exists()
 
+    def test_duplicate_check_errors_do_not_fail_save(self, tmp_path):
+        """A failing near-duplicate check only logs after the file is written."""
+        article = make_generated_article()
+        config = make_config()
+
+        with (
+            patch("src.pipeline.file_io.get_content_dir", return_value=tmp_path),
+            patch("src.pipeline.file_io.get_near_duplicate_index") as mock_index,
+        ):
+            mock_index.return_value.update.side_effect = yaml.YAMLError("bad")
+            filepath = save_article_to_file(article, config)
+
+        assert filepath.exists()
+
     def test_utf8_encoding(self, tmp_path):
         """Files are saved with UTF-8 encoding."""
         article = make_generated_article(
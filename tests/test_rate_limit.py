@@ -22,3 +22,85 @@ def test_exponential_backoff_bounded():
     assert delays[2] == 8.0
     assert delays[3] == 8.0  # capped
     assert delays[4] == 8.0  # capped
+
+
+def test_async_rate_limiter_shares_bucket_semantics():
+    import asyncio
+    import time
+
+    from src.utils.rate_limit import AsyncRateLimiter
+
+    limiter = AsyncRateLimiter(rate_per_minute=600, burst=2, jitter=0.0)
+
+    async def acquire_times():
+        start = time.monotonic()
+        times = []
+        for _ in range(3):
+            await limiter.acquire()
+            times.append(time.monotonic() - start)
+        return times
+
+    # Burst of 2 is immediate, the third token needs a refill at 10/s
+    times = asyncio.run(acquire_times())
+    assert times[1] < 0.05
+    assert times[2] >= 0.09
+
+
+def test_model_limiter_charges_estimated_tokens_per_model():
+    from src.utils.rate_limit import ModelRateLimiter
+
+    limiter = ModelRateLimiter(requests_per_minute=100, tokens_per_minute=1000)
+    limiter.acquire("gpt-4o", 900)
+
+    # A long call must wait for the TPM bucket; a short one still fits
+    assert limiter.time_until_available("gpt-4o", 200) > 0
+    assert limiter.time_until_available("gpt-4o", 50) == 0
+    # Other models have their own buckets
+    assert limiter.time_until_available("gpt-4o-mini", 900) == 0
+
+
+def test_model_limiter_reconciles_against_actual_usage():
+    import pytest
+
+    from src.utils.rate_limit import ModelRateLimiter
+
+    limiter = ModelRateLimiter(tokens_per_minute=1000)
+    lease = limiter.acquire("gpt-4o", 900)
+    limiter.reconcile(lease, 100)
+
+    assert limiter.remaining("gpt-4o")[1] == pytest.approx(900, abs=1)
+    limiter.release(limiter.acquire("gpt-4o", 500))
+    assert limiter.remaining("gpt-4o")[1] == pytest.approx(900, abs=1)
+
+
+def test_model_limiter_adopts_rate_limit_headers():
+    from src.utils.rate_limit import ModelRateLimiter
+
+    limiter = ModelRateLimiter()
+    assert limiter.remaining("gpt-4o") == (None, None)
+
+    limiter.update_from_headers(
+        "gpt-4o",
+        {
+            "x-ratelimit-limit-requests": "500",
+            "x-ratelimit-remaining-requests": "499",
+            "x-ratelimit-reset-requests": "120ms",
+            "x-ratelimit-limit-tokens": "30000",
+            "x-ratelimit-remaining-tokens": "100",
+            "x-ratelimit-reset-tokens": "59s",
+        },
+    )
+
+    requests, tokens = limiter.remaining("gpt-4o")
+    assert 499 <= requests <= 500
+    assert 100 <= tokens < 200
+    assert limiter.time_until_available("gpt-4o", 5000) > 0
+
+
+def test_parse_reset_duration():
+    from src.utils.rate_limit import parse_reset_duration
+
+    assert parse_reset_duration("6m0s") == 360.0
+    assert parse_reset_duration("1.5s") == 1.5
+    assert parse_reset_duration("20ms") == 0.02
+    assert parse_reset_duration("") is None
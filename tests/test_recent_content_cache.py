@@ -1,7 +1,8 @@
-"""Tests for recent-article cache date parsing.
+"""Tests for the recent-article cache.
 
 Regression coverage: avoid offset-naive vs offset-aware datetime comparisons
-when loading markdown frontmatter into the recent content cache.
+when loading markdown frontmatter into the recent content cache, and keep
+indexed lookups identical to a linear scan.
 """
 
 from __future__ import annotations
@@ -82,3 +83,60 @@ date: {old_date}""",
     for article in cache.cache:
         assert article.generated_at.tzinfo is not None
         assert article.generated_at.utcoffset() == timedelta(0)
+
+
+def _write_recent(path: Path, title: str, summary: str, tags: str) -> None:
+    today = datetime.now(UTC).date().isoformat()
+    _write_post(
+        path,
+        frontmatter_yaml=f"title: {title}\nsummary: {summary}\ntags: {tags}\n"
+        f"date: {today}",
+    )
+
+
+def test_shortlist_matches_linear_scan(tmp_path: Path) -> None:
+    _write_recent(
+        tmp_path / "docker.md",
+        "Docker Compose Tips for Local Development",
+        "Speed up local stacks",
+        "[docker]",
+    )
+    _write_recent(
+        tmp_path / "rust.md",
+        "Rust Async Runtimes Compared",
+        "Tokio versus smol",
+        "[rust]",
+    )
+    _write_recent(
+        tmp_path / "bread.md", "Sourdough Starters", "Flour and water", "[baking]"
+    )
+    cache = RecentContentCache(content_dir=tmp_path, cache_days=7)
+
+    candidates = [
+        # Near-identical title, no shared tag: found through trigrams
+        ("Docker Compose Tips for Local Developers", "Speed up local stacks", []),
+        # Shared tag, different title
+        ("Tokio Internals", "Tokio versus smol", ["rust"]),
+        ("Quantum Error Correction", "Qubits", ["physics"]),
+    ]
+    for title, summary, tags in candidates:
+        assert cache.check_similarity(title, summary, tags) == (
+            cache.check_similarity(title, summary, tags, indexed=False)
+        )
+
+    match = cache.check_similarity(*candidates[0])
+    assert match is not None
+    assert Path(match.cached_article.filepath).name == "docker.md"
+    assert list(cache._shortlist("Qubits", [])) == []
+
+
+def test_low_threshold_scans_every_article(tmp_path: Path) -> None:
+    _write_recent(tmp_path / "a.md", "Alpha", "Same summary", "[x]")
+    cache = RecentContentCache(
+        content_dir=tmp_path, cache_days=7, similarity_threshold=0.3
+    )
+
+    # Summary alone can reach 0.3, so nothing may be pruned
+    match = cache.check_similarity("Zeta", "Same summary", [])
+    assert match is not None
+    assert match == cache.check_similarity("Zeta", "Same summary", [], indexed=False)
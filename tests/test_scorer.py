@@ -1,5 +1,7 @@
 """Tests for enrichment scorer heuristic quality assessment."""
 
+import pytest
+
 from src.enrichment.scorer import calculate_heuristic_score
 from src.models import CollectedItem, SourceType
 
@@ -244,3 +246,49 @@ def test_returns_tuple_of_score_and_explanation():
     assert isinstance(score, float)
     assert isinstance(explanation, str)
     assert 0.0 <= score <= 1.0
+
+
+# ============================================================================
+# Test Baseline Parity
+# ============================================================================
+
+# Scores from the substring-matching scorer before keywords were word-bounded.
+# The texts use derived forms ("learning", "installed", "updated") but none of
+# the substring false positives ("go" in "algorithm") the matcher now rejects.
+BASELINE_SCORES = [
+    (
+        "Learning Rust: I installed the compiler and started reading the "
+        "guidelines. The borrow checker is useful for any user.",
+        0.65,
+    ),
+    (
+        "We updated our database design after benchmarking the new cache. "
+        "Importantly, the networking stack is critically faster.",
+        0.85,
+    ),
+    (
+        "Designing a cybersecurity guide: downloaded tools, tried the GitHub "
+        "workflow and learned a lot while seeing results.",
+        0.73,
+    ),
+    (
+        "Just had coffee and thought about the weather today. Nothing much "
+        "happened really, it was a calm and quiet afternoon with friends and "
+        "family around the house, nothing special to report at all here.",
+        0.4,
+    ),
+]
+
+
+def test_derived_forms_keep_baseline_scores():
+    """Derived keyword forms score the same as with substring matching."""
+    for content, expected in BASELINE_SCORES:
+        score, _ = calculate_heuristic_score(make_item(content))
+        assert score == pytest.approx(expected), content
+
+
+def test_derived_forms_count_once_with_their_base_keyword():
+    """A text using "learn" and "learning" has one educational keyword."""
+    once = make_item("Learn Rust here. " + "x" * 120)
+    twice = make_item("Learn Rust here while learning. " + "x" * 105)
+    assert calculate_heuristic_score(once) == calculate_heuristic_score(twice)
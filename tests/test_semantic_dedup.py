@@ -1,14 +1,22 @@
 """Tests for deduplication/semantic_dedup.py."""
 
 import json
+import random
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from src.deduplication.semantic_dedup import DuplicationPattern, SemanticDeduplicator
 
 
+@pytest.fixture(autouse=True)
+def isolated_patterns_file(monkeypatch, tmp_path):
+    """Resolve test.json under tmp_path so learned patterns stay out of the repo."""
+    monkeypatch.chdir(tmp_path)
+
+
 class MockContent:
     """Mock content object for testing."""
 
@@ -269,6 +277,49 @@ class TestFindDuplicates:
         assert groups == []
 
 
+class TestBlockedGrouping:
+    """Blocked candidate generation must match the exhaustive pairwise scan."""
+
+    @staticmethod
+    def _corpus(size: int, seed: int) -> list[MockContent]:
+        rng = random.Random(seed)
+        entities = ["OpenAI", "Python", "Rust", "Docker", "React", "Mozilla"]
+        words = ["memory", "safety", "release", "browser", "compiler", "cluster"]
+        words += ["latency", "tooling", "plugin", "runtime", "scheduler", "privacy"]
+        return [
+            MockContent(
+                " ".join(
+                    rng.sample(entities, rng.randint(0, 2))
+                    + rng.sample(words, rng.randint(1, 5))
+                )
+            )
+            for _ in range(size)
+        ]
+
+    @pytest.mark.parametrize("threshold", [0.1, 0.3, 0.5, 0.6, 0.7, 0.8])
+    def test_blocked_matches_exhaustive(self, tmp_path, threshold):
+        """Same groups, in the same order, for thresholds around the bounds."""
+        dedup = SemanticDeduplicator(tmp_path / "patterns.json")
+        items = self._corpus(120, seed=int(threshold * 100))
+
+        blocked = dedup.find_duplicates(items, threshold=threshold)
+        exhaustive = dedup.find_duplicates(items, threshold=threshold, blocked=False)
+
+        assert [[id(i) for i in g] for g in blocked] == [
+            [id(i) for i in g] for g in exhaustive
+        ]
+
+    def test_feature_similarity_matches_content_similarity(self):
+        """Precomputed features give the same score as the text API."""
+        dedup = SemanticDeduplicator(Path("test.json"))
+        a = "OpenAI shipped ChatGPT memory features for Python developers"
+        b = "Python developers get ChatGPT memory from OpenAI"
+
+        assert dedup.feature_similarity(
+            dedup.extract_features(a), dedup.extract_features(b)
+        ) == pytest.approx(dedup.calculate_content_similarity(a, b))
+
+
 class TestPatternLearning:
     """Test learning patterns from duplicates."""
 
@@ -329,6 +380,57 @@ class TestPatternLearning:
             max_freq = max(p.frequency for p in dedup.patterns)
             assert max_freq >= initial_freq
 
+    def test_patterns_flushed_once_per_call(self, tmp_path):
+        """Many duplicate groups are learned in memory and saved once."""
+        dedup = SemanticDeduplicator(tmp_path / "patterns.json")
+        items = [
+            MockContent("OpenAI ChatGPT Python API support."),
+            MockContent("OpenAI ChatGPT new features."),
+            MockContent("Rust Mozilla memory safety ownership."),
+            MockContent("Rust Mozilla memory management safety."),
+        ]
+
+        with patch.object(
+            dedup, "save_patterns", wraps=dedup.save_patterns
+        ) as save_patterns:
+            groups = dedup.find_duplicates(items, threshold=0.5)
+
+        assert len(groups) == 2
+        assert save_patterns.call_count == 1
+        assert (tmp_path / "patterns.json").exists()
+
+    def test_similar_pattern_lookup_matches_linear_scan(self, tmp_path):
+        """Entity-indexed lookup returns the first matching pattern in order."""
+        dedup = SemanticDeduplicator(tmp_path / "patterns.json")
+        now = datetime.now()
+
+        def make(entities, keywords):
+            return DuplicationPattern(
+                entities=set(entities),
+                keywords=set(keywords),
+                confidence=0.8,
+                examples=[],
+                created_at=now,
+                last_seen=now,
+            )
+
+        dedup.patterns = [
+            make({"rust"}, {"memory"}),
+            make({"python", "django"}, {"web"}),
+            make({"rust"}, {"memory", "safety", "ownership"}),
+        ]
+
+        django = make({"python", "django"}, set())
+        rust = make({"rust"}, {"memory", "safety", "ownership"})
+        assert dedup._find_similar_pattern(django) is dedup.patterns[1]
+        assert dedup._find_similar_pattern(rust) is dedup.patterns[2]
+        assert dedup._find_similar_pattern(make({"go"}, {"memory"})) is None
+
+        # Index follows direct appends to the public list
+        dedup.patterns.append(make({"go", "docker"}, set()))
+        go = make({"go", "docker"}, set())
+        assert dedup._find_similar_pattern(go) is dedup.patterns[3]
+
 
 class TestPatternPersistence:
     """Test saving and loading patterns."""
@@ -0,0 +1,70 @@
+"""Tests for the stage dependency graph executor."""
+
+import threading
+
+import pytest
+
+from src.utils.stage_graph import StageGraph
+
+
+def test_stages_receive_dependency_results_in_order() -> None:
+    graph = StageGraph("test")
+    graph.add("content", lambda: "body")
+    graph.add("title", lambda content: content.upper(), after=["content"])
+    graph.add("length", len, after=["content"])
+    graph.add("article", lambda t, n: f"{t}:{n}", after=["title", "length"])
+
+    for concurrent in (True, False):
+        results = graph.run(concurrent=concurrent)
+        assert results == {
+            "content": "body",
+            "title": "BODY",
+            "length": 4,
+            "article": "BODY:4",
+        }
+        assert list(graph.critical_path()[0]) in (
+            ["content", "title", "article"],
+            ["content", "length", "article"],
+        )
+        assert set(graph.spans) == set(results)
+        assert all(span.seconds >= 0 for span in graph.spans.values())
+
+
+def test_independent_stages_overlap() -> None:
+    # Each branch waits for the other: this only finishes if they run together
+    barrier = threading.Barrier(2, timeout=5)
+    graph = StageGraph("test")
+    graph.add("content", lambda: "body")
+    graph.add("title", lambda _: barrier.wait(), after=["content"])
+    graph.add("illustrations", lambda _: barrier.wait(), after=["content"])
+
+    results = graph.run()
+
+    assert sorted([results["title"], results["illustrations"]]) == [0, 1]
+    assert graph.spans["title"].start >= graph.spans["content"].end
+
+
+def test_failure_skips_dependents_and_reraises() -> None:
+    ran: list[str] = []
+
+    def fail() -> None:
+        raise RuntimeError("title failed")
+
+    graph = StageGraph("test")
+    graph.add("title", fail)
+    graph.add("metadata", lambda _: ran.append("metadata"), after=["title"])
+    graph.add("illustrations", lambda: ran.append("illustrations"))
+
+    with pytest.raises(RuntimeError, match="title failed"):
+        graph.run()
+    assert "metadata" not in ran
+    assert "title" in graph.spans
+
+
+def test_add_rejects_unknown_dependencies_and_duplicates() -> None:
+    graph = StageGraph("test")
+    graph.add("content", lambda: None)
+    with pytest.raises(ValueError, match="unknown stages"):
+        graph.add("title", lambda _: None, after=["missing"])
+    with pytest.raises(ValueError, match="already added"):
+        graph.add("content", lambda: None)
@@ -0,0 +1,179 @@
+"""Tests for story clustering across sources."""
+
+import random
+from datetime import UTC, datetime, timedelta
+
+from src.deduplication.story_clustering import (
+    StoryCluster,
+    StoryClusterer,
+    StoryFeatures,
+    calculate_story_similarity,
+    extract_story_entities,
+    filter_duplicate_stories,
+    find_story_clusters,
+)
+from src.models import CollectedItem, EnrichedItem, SourceType
+from tests.utils.types import http_url
+
+NAMES = ["Affinity", "Docker", "Kubernetes", "Rust", "Python", "Firefox", "Qt"]
+WORDS = ["free", "release", "studio", "security", "subscription", "cloud", "shift"]
+TOPICS = ["design", "containers", "languages", "browsers", "open-source", "ai"]
+NOW = datetime(2025, 6, 1, tzinfo=UTC)
+
+
+def make_item(
+    item_id: str,
+    title: str,
+    summary: str,
+    topics: list[str],
+    quality: float,
+    hours_ago: float = 0,
+) -> EnrichedItem:
+    return EnrichedItem(
+        original=CollectedItem(
+            id=item_id,
+            title=title,
+            content="c",
+            source=SourceType.HACKERNEWS,
+            url=http_url(f"https://example.com/{item_id}"),
+            author="a",
+            collected_at=NOW - timedelta(hours=hours_ago),
+            metadata={},
+        ),
+        research_summary=summary,
+        topics=topics,
+        quality_score=quality,
+    )
+
+
+def random_items(rng: random.Random, count: int) -> list[EnrichedItem]:
+    items = []
+    for i in range(count):
+        title = " ".join(rng.sample(NAMES, 2) + rng.sample(WORDS, 2))
+        items.append(
+            make_item(
+                str(i),
+                title.title(),
+                " ".join(rng.sample(NAMES + WORDS, 3)),
+                rng.sample(TOPICS, rng.randint(0, 3)),
+                round(rng.random(), 3),
+                hours_ago=rng.choice([0, 5, 30, 60]),
+            )
+        )
+    return items
+
+
+def reference_clusters(
+    items: list[EnrichedItem], min_similarity: float
+) -> list[StoryCluster]:
+    """The original all-clusters greedy loop."""
+    clusters: list[StoryCluster] = []
+    for item in sorted(items, key=lambda x: x.quality_score, reverse=True):
+        best_cluster = None
+        best_similarity = 0.0
+        for cluster in clusters:
+            similarity = calculate_story_similarity(item, cluster.primary_item)
+            if similarity > best_similarity and similarity >= min_similarity:
+                best_similarity = similarity
+                best_cluster = cluster
+        if best_cluster:
+            best_cluster.items.append(item)
+            best_cluster.consolidation_score = max(
+                best_cluster.consolidation_score, best_similarity
+            )
+            existing_sig = set(best_cluster.story_signature.split(", "))
+            combined = existing_sig | extract_story_entities(item)
+            best_cluster.story_signature = ", ".join(sorted(combined)[:5])
+        else:
+            entities = extract_story_entities(item)
+            clusters.append(
+                StoryCluster(
+                    items=[item],
+                    primary_item=item,
+                    story_signature=", ".join(sorted(entities)[:5]),
+                    consolidation_score=1.0,
+                )
+            )
+    clusters.sort(key=lambda c: (len(c.items), c.consolidation_score), reverse=True)
+    return clusters
+
+
+def summarize(clusters: list[StoryCluster]) -> list[tuple]:
+    return [
+        (
+            [item.original.id for item in cluster.items],
+            cluster.primary_item.original.id,
+            cluster.story_signature,
+            cluster.consolidation_score,
+        )
+        for cluster in clusters
+    ]
+
+
+class TestFindStoryClusters:
+    """Test the indexed clustering engine against the original algorithm."""
+
+    def test_matches_reference_greedy_clustering(self):
+        rng = random.Random(7)
+        for min_similarity in (0.15, 0.35, 0.5, 0.65):
+            items = random_items(rng, 60)
+            assert summarize(find_story_clusters(items, min_similarity)) == summarize(
+                reference_clusters(items, min_similarity)
+            )
+
+    def test_same_story_from_two_sources(self):
+        items = [
+            make_item(
+                "hn",
+                "Affinity Studio Goes Free",
+                "Affinity drops its subscription for a freemium model",
+                ["design", "freemium"],
+                0.9,
+            ),
+            make_item(
+                "masto",
+                "Affinity Software's Freemium Shift",
+                "What artists need to know about Affinity going freemium",
+                ["design", "freemium"],
+                0.7,
+            ),
+            make_item(
+                "other", "Rust 2.0 Released", "The Rust team ships", ["languages"], 0.8
+            ),
+        ]
+
+        clusters = find_story_clusters(items)
+
+        assert [item.original.id for item in clusters[0].items] == ["hn", "masto"]
+        assert filter_duplicate_stories(items, clusters=clusters) == [
+            items[0],
+            items[2],
+        ]
+
+    def test_precomputed_features_are_used(self, monkeypatch):
+        items = random_items(random.Random(3), 10)
+        features = {item.original.id: StoryFeatures.from_item(item) for item in items}
+        expected = summarize(find_story_clusters(items))
+
+        def fail(item):
+            raise AssertionError("features should not be recomputed")
+
+        monkeypatch.setattr(
+            "src.deduplication.story_clustering.extract_story_entities", fail
+        )
+        assert summarize(find_story_clusters(items, features=features)) == expected
+
+
+class TestStoryClusterer:
+    """Test incremental insertion."""
+
+    def test_add_returns_joined_cluster(self):
+        clusterer = StoryClusterer(min_similarity=0.5)
+        first = make_item("1", "Docker Cloud Release", "Docker", ["containers"], 0.9)
+        second = make_item("2", "Docker Cloud Released", "Docker", ["containers"], 0.8)
+        unrelated = make_item("3", "Sourdough", "Baking bread", [], 0.7)
+
+        cluster = clusterer.add(first)
+        assert clusterer.add(second) is cluster
+        assert clusterer.add(unrelated) is not cluster
+        assert [len(c.items) for c in clusterer.clusters] == [2, 1]
@@ -0,0 +1,242 @@
+"""Tests for the streaming collect → enrich → select pipeline."""
+
+import asyncio
+import threading
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from pydantic import HttpUrl
+
+from src.collectors.orchestrator import StreamingDeduplicator
+from src.enrichment.file_io import load_enriched_items
+from src.models import CollectedItem, EnrichedItem, SourceType
+from src.pipeline.candidate_selector import IncrementalCandidateSelector
+from src.pipeline.streaming import _next_batch, run_streaming_pipeline
+
+
+def make_item(item_id: str, content: str | None = None) -> CollectedItem:
+    return CollectedItem(
+        id=item_id,
+        source=SourceType.HACKERNEWS,
+        author="tester",
+        content=content or f"Unique content number {item_id}",
+        title=f"Story {item_id}",
+        url=HttpUrl(f"https://example.com/{item_id}"),
+        collected_at=datetime.now(UTC),
+    )
+
+
+def enrich(item: CollectedItem, quality: float = 0.8) -> EnrichedItem:
+    return EnrichedItem(
+        original=item,
+        research_summary="summary",
+        topics=["python"],
+        quality_score=quality,
+    )
+
+
+class RecordingSelector:
+    """Selector stand-in that accepts everything and records arrival."""
+
+    def __init__(self):
+        self.offered: list[str] = []
+        self.first_offer = threading.Event()
+
+    def offer(self, item: EnrichedItem) -> bool:
+        self.offered.append(item.original.id)
+        self.first_offer.set()
+        return True
+
+    def finalize(self) -> list[EnrichedItem]:
+        return []
+
+
+def run_pipeline(tmp_path: Path, source, enrich_fn, selector, **kwargs):
+    with (
+        patch("src.pipeline.streaming.stream_all_sources", source),
+        patch("src.pipeline.streaming.enrich_single_item", enrich_fn),
+        patch("src.pipeline.streaming.ScoringAdapter", MagicMock()),
+        patch("src.collectors.orchestrator.get_data_dir", return_value=tmp_path),
+        patch("src.enrichment.file_io.get_data_dir", return_value=tmp_path),
+    ):
+        return asyncio.run(
+            run_streaming_pipeline(
+                selector=selector, timestamp="20250101_120000", **kwargs
+            )
+        )
+
+
+class TestRunStreamingPipeline:
+    """Test stage overlap, backpressure and outputs."""
+
+    def test_selection_starts_before_collection_finishes(self, tmp_path):
+        """The first item is selected while the source is still collecting."""
+        selector = RecordingSelector()
+
+        async def source(engine=None):
+            yield make_item("early")
+            # Only continue once the early item has reached the selector;
+            # a batch pipeline would never get there
+            assert await asyncio.to_thread(selector.first_offer.wait, 5)
+            yield make_item("late")
+
+        result = run_pipeline(
+            tmp_path,
+            source,
+            lambda item, config, adapter: enrich(item),
+            selector,
+            queue_size=4,
+            enrich_workers=2,
+        )
+
+        assert selector.offered == ["early", "late"]
+        assert result.collected == 2
+        assert result.enriched == 2
+        assert result.first_candidate_seconds is not None
+
+    def test_bounded_queues_apply_backpressure(self, tmp_path):
+        """Collection waits for slow enrichment instead of buffering."""
+        produced = 0
+        consumed = 0
+        max_in_flight = 0
+        lock = threading.Lock()
+
+        async def source(engine=None):
+            nonlocal produced, max_in_flight
+            for i in range(20):
+                produced += 1
+                with lock:
+                    max_in_flight = max(max_in_flight, produced - consumed)
+                yield make_item(str(i))
+
+        def slow_enrich(item, config, adapter):
+            nonlocal consumed
+            time.sleep(0.005)
+            with lock:
+                consumed += 1
+            return enrich(item)
+
+        result = run_pipeline(
+            tmp_path,
+            source,
+            slow_enrich,
+            RecordingSelector(),
+            queue_size=2,
+            enrich_workers=1,
+        )
+
+        assert result.enriched == 20
+        # Queue capacity + item being enriched + item being yielded
+        assert max_in_flight <= 2 + 1 + 1
+
+    def test_failures_are_counted_and_outputs_streamed(self, tmp_path):
+        """Failed enrichments are skipped; enriched items land in NDJSON."""
+
+        async def source(engine=None):
+            for item_id in ("ok", "none", "boom"):
+                yield make_item(item_id)
+
+        def flaky_enrich(item, config, adapter):
+            if item.id == "boom":
+                raise ValueError("API error")
+            return enrich(item) if item.id == "ok" else None
+
+        result = run_pipeline(
+            tmp_path,
+            source,
+            flaky_enrich,
+            RecordingSelector(),
+            queue_size=2,
+            enrich_workers=2,
+        )
+
+        assert (result.enriched, result.failed) == (1, 2)
+        assert result.enriched_path == tmp_path / "enriched_20250101_120000.ndjson"
+        assert [i.original.id for i in load_enriched_items(result.enriched_path)] == [
+            "ok"
+        ]
+        assert len(result.collected_path.read_text().splitlines()) == 3
+
+    def test_next_batch_never_waits_to_fill(self):
+        """Batches take only items already queued and stop at the sentinel."""
+
+        async def drain():
+            queue = asyncio.Queue()
+            for item in (make_item("a"), make_item("b"), make_item("c"), None):
+                queue.put_nowait(item)
+            batches = []
+            done = False
+            while not done:
+                batch, done = await _next_batch(queue, 2)
+                batches.append([item.id for item in batch])
+            return batches
+
+        assert asyncio.run(drain()) == [["a", "b"], ["c"]]
+
+
+class TestStreamingDeduplicator:
+    """Test online deduplication of collected items."""
+
+    def test_rejects_url_and_semantic_duplicates(self):
+        dedup = StreamingDeduplicator(threshold=0.6)
+        story = "OpenAI releases GPT-5 with Microsoft Azure support for developers"
+
+        first = make_item("a", content=story)
+        same_url = make_item("a", content="Something else entirely about gardening")
+        same_story = make_item("b", content=story)
+        different = make_item("c", content="Rust 1.80 ships new borrow checker")
+
+        assert dedup.accept(first)
+        assert not dedup.accept(same_url)
+        assert not dedup.accept(same_story)
+        assert dedup.accept(different)
+        assert (dedup.url_duplicates, dedup.semantic_duplicates) == (1, 1)
+
+
+class TestIncrementalCandidateSelector:
+    """Test per-item candidate selection."""
+
+    def test_offer_filters_and_finalize_ranks(self, tmp_path):
+        good = enrich(
+            make_item(
+                "good",
+                content="Python 3.14 ships free-threading https://python.org " * 5,
+            ),
+            quality=0.7,
+        )
+        better = enrich(
+            make_item(
+                "better", content="CPython JIT lands in 3.14 https://python.org " * 5
+            ),
+            quality=0.9,
+        )
+        weak = enrich(make_item("weak"), quality=0.1)
+
+        with (
+            patch(
+                "src.pipeline.candidate_selector.get_content_dir",
+                return_value=tmp_path,
+            ),
+            patch(
+                "src.pipeline.candidate_selector.check_article_exists_for_source",
+                return_value=None,
+            ),
+            patch(
+                "src.pipeline.candidate_selector.is_source_in_cooldown",
+                return_value=False,
+            ),
+        ):
+            selector = IncrementalCandidateSelector(
+                min_quality=0.5,
+                use_adaptive_filtering=False,
+                deduplicate_stories=False,
+            )
+            assert selector.offer(good)
+            assert not selector.offer(weak)
+            assert selector.offer(better)
+            candidates = selector.finalize()
+
+        assert [c.original.id for c in candidates] == ["better", "good"]
+        assert selector.seen == 3
@@ -0,0 +1,88 @@
+"""Tests for the append-only telemetry ledger."""
+
+import json
+import threading
+
+from src.utils.telemetry_ledger import (
+    BufferedNDJSONAppender,
+    TelemetryLedger,
+    iter_ledger,
+)
+
+
+def call_entry(n: int, article_id: str | None = None) -> dict:
+    entry = {"stage": "enrichment", "model": "gpt-4o-mini", "cost": 0.001, "n": n}
+    if article_id:
+        entry["article_id"] = article_id
+    return entry
+
+
+class TestBufferedNDJSONAppender:
+    """Test buffering and flush triggers."""
+
+    def test_flushes_when_buffer_is_full(self, tmp_path):
+        writer = BufferedNDJSONAppender(
+            tmp_path / "ledger.ndjson", max_buffer=3, flush_interval=3600
+        )
+        writer.append({"n": 1})
+        writer.append({"n": 2})
+        assert not writer.filepath.exists()
+
+        writer.append({"n": 3})
+        assert [e["n"] for e in iter_ledger(writer.filepath)] == [1, 2, 3]
+
+    def test_flushes_when_buffer_is_stale(self, tmp_path):
+        writer = BufferedNDJSONAppender(
+            tmp_path / "ledger.ndjson", max_buffer=100, flush_interval=0
+        )
+        writer.append({"n": 1})
+        assert [e["n"] for e in iter_ledger(writer.filepath)] == [1]
+
+    def test_concurrent_appends_lose_nothing(self, tmp_path):
+        writer = BufferedNDJSONAppender(tmp_path / "ledger.ndjson", max_buffer=7)
+
+        def worker(offset: int):
+            for i in range(250):
+                writer.append({"n": offset + i})
+
+        threads = [threading.Thread(target=worker, args=(t * 1000,)) for t in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        writer.flush()
+
+        seen = sorted(e["n"] for e in iter_ledger(writer.filepath))
+        assert seen == sorted(t * 1000 + i for t in range(8) for i in range(250))
+
+    def test_corrupt_trailing_line_is_skipped(self, tmp_path):
+        path = tmp_path / "ledger.ndjson"
+        path.write_text('{"n": 1}\n{"n": 2', encoding="utf-8")
+        assert [e["n"] for e in iter_ledger(path)] == [1]
+
+
+class TestTelemetryLedgerExport:
+    """Test compaction into the model_usage.json / article ledger shape."""
+
+    def test_export_produces_legacy_json_shape(self, tmp_path):
+        ledger = TelemetryLedger(tmp_path, "run-1", export_at_exit=False)
+        ledger.record(call_entry(1))
+        ledger.record(call_entry(2, "post-a"), article_id="post-a", artifacts={"v": 1})
+        ledger.record(call_entry(3, "post-a"), article_id="post-a")
+
+        usage_path = ledger.export()
+
+        usage = json.loads(usage_path.read_text())
+        assert usage["run_id"] == "run-1"
+        assert [c["n"] for c in usage["calls"]] == [1, 2, 3]
+        assert all("artifacts" not in c for c in usage["calls"])
+
+        article = json.loads((tmp_path / "articles" / "post-a.json").read_text())
+        assert article["article_id"] == "post-a"
+        assert [e["n"] for e in article["entries"]] == [2, 3]
+        assert article["entries"][0]["artifacts"] == {"v": 1}
+
+    def test_export_without_calls_writes_nothing(self, tmp_path):
+        ledger = TelemetryLedger(tmp_path, "run-1", export_at_exit=False)
+        assert ledger.export() is None
+        assert not (tmp_path / "model_usage.json").exists()